@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Event canonicalization benchmark (V10).
+
+Splits every corpus document into small overlapping chunks (so events
+really do repeat across chunks), runs Prompt A once per chunk, then
+canonicalizes the same chunk events twice:
+- prompt_b: the whole event list through Prompt B (pre-V10 path)
+- local: clear duplicates merged locally, only ambiguous clusters sent to
+  Prompt B
+
+Reports Prompt B calls per job for each path and how closely the local
+output agrees with the Prompt B output. Events are matched one-to-one on
+category and narrative token overlap; agreement is 2 * matched / (n_prompt_b
++ n_local).
+
+Needs OPENAI_API_KEY; every document costs one Prompt A call per chunk plus
+up to two Prompt B calls.
+
+Usage:
+    python canonicalization_benchmark.py
+    python canonicalization_benchmark.py --chunk-chars 400 --overlap 120 --model gpt-4o-mini
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "implementation" / "mcp-server" / "src"))
+
+from services.event_canonicalizer import jaccard, narrative_tokens, normalize_name  # noqa: E402
+from services.event_extraction_service import EventExtractionService  # noqa: E402
+
+CORPUS_DIR = Path(__file__).parent / "corpus"
+MATCH_THRESHOLD = 0.5
+
+
+def split_chunks(doc_id: str, text: str, chunk_chars: int, overlap: int) -> list:
+    """(text, index, chunk_id, start_char) chunks on word boundaries."""
+    words = [(m.start(), m.end()) for m in re.finditer(r"\S+", text)]
+    chunks, i = [], 0
+    while i < len(words):
+        j = i + 1
+        while j < len(words) and words[j][1] - words[i][0] <= chunk_chars:
+            j += 1
+        start, end = words[i][0], words[j - 1][1]
+        chunks.append((text[start:end], len(chunks), f"{doc_id}::chunk::{len(chunks):03d}", start))
+        if j == len(words):
+            break
+        i = next(k for k in range(i + 1, j + 1) if k == j or words[k][0] >= end - overlap)
+    return chunks
+
+
+def match_events(reference: list, candidate: list) -> int:
+    """Greedy one-to-one matches on category and narrative overlap."""
+    unmatched = list(range(len(candidate)))
+    matched = 0
+    for ref in reference:
+        best, best_score = None, MATCH_THRESHOLD
+        for i in unmatched:
+            if normalize_name(candidate[i].get("category")) != normalize_name(ref.get("category")):
+                continue
+            score = jaccard(narrative_tokens(ref.get("narrative")), narrative_tokens(candidate[i].get("narrative")))
+            if score >= best_score:
+                best, best_score = i, score
+        if best is not None:
+            unmatched.remove(best)
+            matched += 1
+    return matched
+
+
+async def run_document(service: EventExtractionService, path: Path, chunk_chars: int, overlap: int) -> dict:
+    doc_id = path.stem
+    chunks = split_chunks(doc_id, path.read_text(), chunk_chars, overlap)
+    results = await service.extract_chunks_v4(chunks, max_concurrency=4)
+    chunk_events = [events for events, _, _ in results]
+
+    service.local_canonicalization = False
+    calls = service.prompt_b_calls
+    prompt_b = await service.canonicalize_events_async(chunk_events)
+    prompt_b_calls = service.prompt_b_calls - calls
+
+    service.local_canonicalization = True
+    calls = service.prompt_b_calls
+    local = await service.canonicalize_events_async(chunk_events)
+    local_calls = service.prompt_b_calls - calls
+
+    matched = match_events(prompt_b, local)
+    total = len(prompt_b) + len(local)
+    return {
+        "document": doc_id,
+        "chunks": len(chunks),
+        "input_events": sum(len(events) for events in chunk_events),
+        "prompt_b_events": len(prompt_b),
+        "local_events": len(local),
+        "prompt_b_calls": prompt_b_calls,
+        "local_calls": local_calls,
+        "calls_saved": prompt_b_calls - local_calls,
+        "agreement": round(2 * matched / total, 3) if total else 1.0,
+    }
+
+
+async def run_benchmark(model: str, chunk_chars: int, overlap: int) -> dict:
+    service = EventExtractionService(api_key=os.environ["OPENAI_API_KEY"], model=model)
+
+    print("=" * 60)
+    print("EVENT CANONICALIZATION BENCHMARK")
+    print("=" * 60)
+    print(f"model {model}, {chunk_chars}-char chunks with {overlap}-char overlap")
+    print()
+
+    documents = []
+    for path in sorted(CORPUS_DIR.glob("*/*.txt")):
+        result = await run_document(service, path, chunk_chars, overlap)
+        documents.append(result)
+        print(f"  {result['document']:<18} chunks {result['chunks']:>2}  events "
+              f"{result['input_events']:>3} -> prompt_b {result['prompt_b_events']:>3} / local {result['local_events']:>3}  "
+              f"calls {result['prompt_b_calls']} -> {result['local_calls']}  agreement {result['agreement']}")
+
+    jobs = len(documents)
+    metrics = {
+        "jobs": jobs,
+        "prompt_b_calls_per_job": round(sum(d["prompt_b_calls"] for d in documents) / jobs, 3),
+        "local_calls_per_job": round(sum(d["local_calls"] for d in documents) / jobs, 3),
+        "calls_saved_per_job": round(sum(d["calls_saved"] for d in documents) / jobs, 3),
+        "mean_agreement": round(sum(d["agreement"] for d in documents) / jobs, 3),
+        "documents": documents,
+    }
+
+    print()
+    print(f"Prompt B calls per job: {metrics['prompt_b_calls_per_job']} -> {metrics['local_calls_per_job']} "
+          f"(saved {metrics['calls_saved_per_job']}), mean agreement {metrics['mean_agreement']}")
+    print()
+    print("METRICS_JSON:")
+    print(json.dumps(metrics, indent=2))
+    return metrics
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Event canonicalization benchmark")
+    parser.add_argument("--model", default=os.getenv("OPENAI_EVENT_MODEL", "gpt-4o-mini"))
+    parser.add_argument("--chunk-chars", type=int, default=500, help="Characters per chunk")
+    parser.add_argument("--overlap", type=int, default=150, help="Characters shared by neighbouring chunks")
+    args = parser.parse_args()
+
+    if not os.getenv("OPENAI_API_KEY"):
+        print("OPENAI_API_KEY is not set")
+        sys.exit(1)
+
+    try:
+        asyncio.run(run_benchmark(args.model, args.chunk_chars, args.overlap))
+    except KeyboardInterrupt:
+        print("\nAborted")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\nError: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
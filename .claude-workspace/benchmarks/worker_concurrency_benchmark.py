@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Event worker throughput benchmark (V10).
+
+Runs the real EventWorker scheduling loop and extract_events job path
+(V3 extraction: per-chunk extraction, canonicalization, atomic write) and
+the real EventExtractionService against stubs: an in-memory job queue, a
+Postgres/Chroma stand-in with small async latencies, and an async OpenAI
+client stand-in with a fixed latency per completion. Reports jobs/minute
+per process for each WORKER_CONCURRENCY value, and for each
+EXTRACTION_CHUNK_CONCURRENCY value when documents have several chunks.
+
+Usage:
+    python worker_concurrency_benchmark.py
+    python worker_concurrency_benchmark.py --concurrency 1 4 16 --jobs 64 --llm-latency 0.5
+    python worker_concurrency_benchmark.py --concurrency 1 --chunks 30 --chunk-concurrency 1 4 8
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "implementation" / "mcp-server" / "src"))
+
+from services.event_extraction_service import EventExtractionService  # noqa: E402
+from worker.event_worker import EventWorker  # noqa: E402
+
+DB_LATENCY = 0.003
+
+
+def stub_extraction_service(latency: float) -> EventExtractionService:
+    """Real service whose async client answers every completion after `latency` seconds."""
+    service = EventExtractionService(api_key="bench")
+    service.validate_event = lambda event: True
+    response = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps({
+        "events": [{"category": "Decision", "narrative": "Alice decided to ship on Friday.", "evidence": []}]
+    })))])
+
+    async def create(**kwargs):
+        await asyncio.sleep(latency)
+        return response
+
+    service.async_client = MagicMock()
+    service.async_client.chat.completions.create = AsyncMock(side_effect=create)
+    return service
+
+
+class StubQueue:
+    """In-memory job queue with the JobQueueService calls the worker makes."""
+
+    def __init__(self, worker: EventWorker, jobs: int):
+        self.worker = worker
+        self.pending = [
+            {"job_id": f"00000000-0000-0000-0000-{i:012d}", "artifact_uid": f"uid_{i}", "revision_id": "rev_1"}
+            for i in range(jobs)
+        ]
+        self.done = 0
+
+    async def claim_jobs(self, worker_id, job_type, n):
+        await asyncio.sleep(DB_LATENCY)
+        if not self.pending:
+            self.worker.running = False
+            return []
+        claimed = self.pending[:n]
+        del self.pending[:n]
+        return claimed
+
+    async def write_events_atomic(self, **kwargs):
+        await asyncio.sleep(DB_LATENCY * 3)
+
+    async def mark_job_done(self, job_id):
+        await asyncio.sleep(DB_LATENCY)
+        self.done += 1
+
+    async def mark_job_failed(self, **kwargs):
+        await asyncio.sleep(DB_LATENCY)
+
+
+async def fetch_text(artifact_id):
+    await asyncio.sleep(DB_LATENCY)
+    return f"Alice decided to ship {artifact_id} on Friday."
+
+
+async def measure(concurrency: int, jobs: int, llm_latency: float, chunks: int, chunk_concurrency: int) -> dict:
+    config = SimpleNamespace(
+        worker_id="bench", poll_interval_ms=50, worker_concurrency=concurrency,
+        job_notify_enabled=False, worker_idle_poll_ms=30000,
+        extraction_chunk_concurrency=chunk_concurrency
+    )
+    worker = EventWorker(config, enable_v4=False)
+    worker.job_service = StubQueue(worker, jobs)
+    worker.extraction_service = stub_extraction_service(llm_latency)
+
+    async def fetch_revision(sql, artifact_uid, revision_id):
+        await asyncio.sleep(DB_LATENCY)
+        return {"artifact_id": f"art_{artifact_uid}", "is_chunked": chunks > 1, "chunk_count": chunks,
+                "title": artifact_uid}
+
+    async def fetch_chunks(artifact_id, chunk_count):
+        await asyncio.sleep(DB_LATENCY)
+        return [(f"Chunk {i} of {artifact_id}.", i, f"{artifact_id}::chunk::{i:03d}", i * 1000)
+                for i in range(chunk_count)]
+
+    worker.pg_client = MagicMock()
+    worker.pg_client.fetch_one = fetch_revision
+    worker.fetch_artifact_text = fetch_text
+    worker.fetch_chunk_texts = fetch_chunks
+
+    worker.running = True
+    start = time.perf_counter()
+    await worker.run_jobs()
+    elapsed = time.perf_counter() - start
+
+    return {
+        "concurrency": concurrency,
+        "chunks": chunks,
+        "chunk_concurrency": chunk_concurrency,
+        "jobs": worker.job_service.done,
+        "seconds": round(elapsed, 2),
+        "jobs_per_minute": round(worker.job_service.done / elapsed * 60, 1),
+    }
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Event worker concurrency benchmark")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--jobs", type=int, default=48, help="Jobs per run")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Seconds per stubbed LLM call")
+    parser.add_argument("--chunks", type=int, default=1, help="Chunks per document")
+    parser.add_argument("--chunk-concurrency", type=int, nargs="+", default=[4])
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("EVENT WORKER CONCURRENCY BENCHMARK")
+    print("=" * 60)
+    print(f"{args.jobs} jobs per run, {args.chunks} chunks per document, "
+          f"stubbed LLM latency {args.llm_latency}s")
+    print()
+
+    results = []
+    for concurrency in args.concurrency:
+        for chunk_concurrency in args.chunk_concurrency:
+            result = asyncio.run(measure(concurrency, args.jobs, args.llm_latency, args.chunks, chunk_concurrency))
+            results.append(result)
+            print(f"  concurrency {concurrency:>3}, chunk concurrency {chunk_concurrency:>3}: "
+                  f"{result['jobs_per_minute']:>8} jobs/min ({result['jobs']} jobs in {result['seconds']}s)")
+
+    print()
+    print("METRICS_JSON:")
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -155,7 +155,10 @@ CREATE TABLE IF NOT EXISTS semantic_event (
     created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
 
     -- V9: Cached embedding for triplet scoring (narrative embedding)
-    embedding vector(3072) NULL
+    embedding vector(3072) NULL,
+
+    -- V10: Stored full-text vector (event_search filters and ranks on it)
+    narrative_tsv tsvector GENERATED ALWAYS AS (to_tsvector('english', narrative)) STORED
 );
 
 -- Indexes
@@ -169,8 +172,13 @@ CREATE INDEX IF NOT EXISTS idx_semantic_event_extraction
     ON semantic_event (extraction_run_id);
 
 -- Full-Text Search (Postgres FTS)
-CREATE INDEX IF NOT EXISTS idx_semantic_event_narrative_fts
-    ON semantic_event USING GIN (to_tsvector('english', narrative));
+CREATE INDEX IF NOT EXISTS idx_semantic_event_narrative_tsv
+    ON semantic_event USING GIN (narrative_tsv);
+
+-- V10: ANN index for vector event search (halfvec projection: HNSW on
+-- vector is limited to 2000 dimensions)
+CREATE INDEX IF NOT EXISTS idx_semantic_event_embedding_hnsw
+    ON semantic_event USING hnsw ((embedding::halfvec(3072)) halfvec_cosine_ops);
 
 -- JSONB Indexes (for fast filtering)
 CREATE INDEX IF NOT EXISTS idx_semantic_event_subject_type
@@ -267,6 +275,8 @@ CREATE TABLE IF NOT EXISTS entity (
     organization TEXT,
     email TEXT,
     context_embedding vector(3072),
+    -- V10: Canonical name embedding (triplet scoring, no per-recall embedding call)
+    name_embedding vector(3072),
     first_seen_artifact_uid TEXT NOT NULL,
     first_seen_revision_id TEXT NOT NULL,
     needs_review BOOLEAN DEFAULT false,
@@ -389,6 +399,142 @@ CREATE INDEX IF NOT EXISTS idx_entity_edge_artifact ON entity_edge(artifact_uid,
 
 \echo 'Entity edge table created successfully (V8)'
 
+-- ============================================================================
+-- SECTION 7.3: Entity Event Index (V10)
+-- ============================================================================
+
+-- Flattened event_actor/event_subject with the event columns graph expansion
+-- filters on. Maintained by write_events_atomic_v4; cascades with event/entity.
+CREATE TABLE IF NOT EXISTS entity_event_index (
+    entity_id UUID NOT NULL REFERENCES entity(entity_id) ON DELETE CASCADE,
+    event_id UUID NOT NULL REFERENCES semantic_event(event_id) ON DELETE CASCADE,
+    role TEXT NOT NULL CHECK (role IN ('actor', 'subject')),
+    artifact_uid TEXT NOT NULL,
+    category TEXT NOT NULL,
+    event_time TIMESTAMPTZ NULL,
+    PRIMARY KEY (entity_id, event_id, role)
+);
+
+CREATE INDEX IF NOT EXISTS idx_entity_event_index_event ON entity_event_index(event_id);
+CREATE INDEX IF NOT EXISTS idx_entity_event_index_artifact ON entity_event_index(artifact_uid);
+
+\echo 'Entity event index created successfully (V10)'
+
+-- ============================================================================
+-- SECTION 7.4: Conversation Turn Index (V10)
+-- ============================================================================
+
+-- (conversation_id, turn_index) -> art_ id for paged conversation history.
+-- Maintained by remember/forget; only the requested page is read from Chroma.
+CREATE TABLE IF NOT EXISTS conversation_turn (
+    conversation_id TEXT NOT NULL,
+    turn_index INT NOT NULL,
+    artifact_id TEXT NOT NULL,
+    role TEXT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (conversation_id, turn_index)
+);
+
+CREATE INDEX IF NOT EXISTS idx_conversation_turn_artifact ON conversation_turn(artifact_id);
+
+\echo 'Conversation turn index created successfully (V10)'
+
+-- ============================================================================
+-- SECTION 7.5: Extraction Cache (V10)
+-- ============================================================================
+
+-- Parsed Prompt A results keyed by chunk content hash, model and prompt
+-- version (hash of the prompt templates; prompt changes miss automatically).
+-- Hit rate = SUM(hit_count) / (SUM(hit_count) + COUNT(*)).
+CREATE TABLE IF NOT EXISTS extraction_cache (
+    content_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    result JSONB NOT NULL,
+    hit_count BIGINT NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    last_hit_at TIMESTAMPTZ NULL,
+    PRIMARY KEY (content_hash, model, prompt_version)
+);
+
+\echo 'Extraction cache created successfully (V10)'
+
+-- ============================================================================
+-- SECTION 7.6: Entity Merge Decision Cache (V10)
+-- ============================================================================
+
+-- Confident LLM merge decisions keyed by candidate entity, mention name and a
+-- hash of the mention's type/context clues/model. Expire after a TTL; deleted
+-- when the candidate is renamed by a merge. No FK: in-document candidates are
+-- decided before they are inserted.
+CREATE TABLE IF NOT EXISTS entity_merge_decision (
+    candidate_entity_id UUID NOT NULL,
+    normalized_name TEXT NOT NULL,
+    context_hash TEXT NOT NULL,
+    decision TEXT NOT NULL CHECK (decision IN ('same', 'different')),
+    canonical_name TEXT NOT NULL,
+    reason TEXT,
+    confidence REAL NOT NULL,
+    hit_count BIGINT NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    expires_at TIMESTAMPTZ NOT NULL,
+    last_hit_at TIMESTAMPTZ NULL,
+    PRIMARY KEY (candidate_entity_id, normalized_name, context_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_entity_merge_decision_expires
+    ON entity_merge_decision (expires_at);
+
+\echo 'Entity merge decision cache created successfully (V10)'
+
+-- ============================================================================
+-- SECTION 7.7: Entity Name Change Feed (V10)
+-- ============================================================================
+
+-- Workers keep entity names and aliases in memory for exact-match resolution;
+-- new names, renames and aliases are published on the entity_names channel.
+CREATE OR REPLACE FUNCTION notify_entity_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('entity_names', json_build_object(
+        'kind', 'name',
+        'entity_id', NEW.entity_id,
+        'entity_type', NEW.entity_type,
+        'name', NEW.normalized_name,
+        'canonical_name', NEW.canonical_name,
+        'old_name', CASE WHEN TG_OP = 'UPDATE' THEN OLD.normalized_name END
+    )::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION notify_entity_alias()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('entity_names', json_build_object(
+        'kind', 'alias',
+        'entity_id', NEW.entity_id,
+        'entity_type', (SELECT entity_type FROM entity WHERE entity_id = NEW.entity_id),
+        'name', NEW.normalized_alias
+    )::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS entity_name_notify ON entity;
+CREATE TRIGGER entity_name_notify
+AFTER INSERT OR UPDATE OF canonical_name, normalized_name ON entity
+FOR EACH ROW
+EXECUTE FUNCTION notify_entity_name();
+
+DROP TRIGGER IF EXISTS entity_alias_notify ON entity_alias;
+CREATE TRIGGER entity_alias_notify
+AFTER INSERT ON entity_alias
+FOR EACH ROW
+EXECUTE FUNCTION notify_entity_alias();
+
+\echo 'Entity name notifications created successfully (V10)'
+
 -- ============================================================================
 -- SECTION 8: Verify Installation
 -- ============================================================================
@@ -438,7 +584,12 @@ UNION ALL
 SELECT
     'entity_edge' AS table_name,
     COUNT(*) AS row_count
-FROM entity_edge;
+FROM entity_edge
+UNION ALL
+SELECT
+    'entity_event_index' AS table_name,
+    COUNT(*) AS row_count
+FROM entity_event_index;
 
 \echo ''
 \echo 'Database ready for use!'
@@ -0,0 +1,15 @@
+-- migrations/010_entity_name_embedding.sql
+-- V10: Persist entity name embeddings for triplet scoring
+--
+-- Triplet scoring compares the recall query against the connecting entity's
+-- canonical name. Storing the name embedding alongside the entity removes the
+-- per-recall embedding call for entity names. Existing rows are filled by the
+-- worker's name-embedding backfill on startup.
+
+ALTER TABLE entity
+ADD COLUMN IF NOT EXISTS name_embedding vector(3072) NULL;
+
+COMMENT ON COLUMN entity.name_embedding IS 'Embedding of canonical_name, used by recall triplet scoring';
+
+-- Confirm migration
+SELECT 'entity.name_embedding column added successfully' AS status;
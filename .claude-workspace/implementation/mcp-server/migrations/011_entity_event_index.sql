@@ -0,0 +1,43 @@
+-- migrations/011_entity_event_index.sql
+-- V10: Materialized entity -> event adjacency for graph expansion
+--
+-- Graph expansion previously joined semantic_event against the full set of
+-- connected entities with LEFT JOINs to event_actor/event_subject on every
+-- recall. entity_event_index flattens both relationship tables into one row
+-- per (entity, event, role) with the event columns expansion filters on, so
+-- expansion becomes index lookups on entity_id and event_id.
+--
+-- Maintained by write_events_atomic_v4 in the same transaction as the
+-- event_actor/event_subject writes; rows cascade away with their event or entity.
+
+CREATE TABLE IF NOT EXISTS entity_event_index (
+    entity_id UUID NOT NULL REFERENCES entity(entity_id) ON DELETE CASCADE,
+    event_id UUID NOT NULL REFERENCES semantic_event(event_id) ON DELETE CASCADE,
+    role TEXT NOT NULL CHECK (role IN ('actor', 'subject')),
+    artifact_uid TEXT NOT NULL,
+    category TEXT NOT NULL,
+    event_time TIMESTAMPTZ NULL,
+    PRIMARY KEY (entity_id, event_id, role)
+);
+
+-- Seed lookup (event -> entities) and artifact-scoped cleanup
+CREATE INDEX IF NOT EXISTS idx_entity_event_index_event ON entity_event_index(event_id);
+CREATE INDEX IF NOT EXISTS idx_entity_event_index_artifact ON entity_event_index(artifact_uid);
+
+-- Backfill from existing relationships
+INSERT INTO entity_event_index (entity_id, event_id, role, artifact_uid, category, event_time)
+SELECT ea.entity_id, se.event_id, 'actor', se.artifact_uid, se.category, se.event_time
+FROM event_actor ea
+JOIN semantic_event se ON se.event_id = ea.event_id
+ON CONFLICT DO NOTHING;
+
+INSERT INTO entity_event_index (entity_id, event_id, role, artifact_uid, category, event_time)
+SELECT es.entity_id, se.event_id, 'subject', se.artifact_uid, se.category, se.event_time
+FROM event_subject es
+JOIN semantic_event se ON se.event_id = es.event_id
+ON CONFLICT DO NOTHING;
+
+ANALYZE entity_event_index;
+
+-- Confirm migration
+SELECT 'entity_event_index table created successfully' AS status;
@@ -0,0 +1,26 @@
+-- migrations/012_conversation_turn_index.sql
+-- V10: Conversation turn index for windowed history retrieval
+--
+-- recall(conversation_id=...) previously loaded every turn of a conversation
+-- from Chroma with a metadata filter and sorted in Python. conversation_turn
+-- maps (conversation_id, turn_index) -> art_ id, so a page of turns is a
+-- primary-key range scan and only that page is fetched from Chroma by ID.
+--
+-- Maintained by remember (context="conversation") and forget. Turns stored
+-- before this migration are indexed from Chroma by the server at startup
+-- while the table is empty.
+
+CREATE TABLE IF NOT EXISTS conversation_turn (
+    conversation_id TEXT NOT NULL,
+    turn_index INT NOT NULL,
+    artifact_id TEXT NOT NULL,
+    role TEXT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (conversation_id, turn_index)
+);
+
+-- forget() cleanup by content ID
+CREATE INDEX IF NOT EXISTS idx_conversation_turn_artifact ON conversation_turn(artifact_id);
+
+-- Confirm migration
+SELECT 'conversation_turn table created successfully' AS status;
@@ -0,0 +1,16 @@
+-- migrations/013_event_embedding_hnsw.sql
+-- V10: ANN index for semantic event search
+--
+-- semantic_event.embedding (narrative embedding, written by the worker) had
+-- no index: pgvector's HNSW is limited to 2000 dimensions for vector, and
+-- embeddings are 3072. A halfvec projection (up to 4000 dimensions, half
+-- the index size) is indexed instead; event_search orders by the same
+-- expression so the planner can use it. Requires pgvector >= 0.7.
+
+CREATE INDEX IF NOT EXISTS idx_semantic_event_embedding_hnsw
+    ON semantic_event USING hnsw ((embedding::halfvec(3072)) halfvec_cosine_ops);
+
+ANALYZE semantic_event;
+
+-- Confirm migration
+SELECT 'semantic_event embedding HNSW index created successfully' AS status;
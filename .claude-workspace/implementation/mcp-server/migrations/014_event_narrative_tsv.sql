@@ -0,0 +1,22 @@
+-- migrations/014_event_narrative_tsv.sql
+-- V10: Stored tsvector for event full-text search
+--
+-- event_search matched to_tsvector('english', narrative) computed in the
+-- predicate, which only used the GIN expression index while the SQL text
+-- matched it exactly, and re-parsed narratives to rank. narrative_tsv is
+-- computed once on write; search filters and ranks (ts_rank_cd) on it.
+
+ALTER TABLE semantic_event
+    ADD COLUMN IF NOT EXISTS narrative_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector('english', narrative)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_semantic_event_narrative_tsv
+    ON semantic_event USING GIN (narrative_tsv);
+
+-- Superseded by idx_semantic_event_narrative_tsv
+DROP INDEX IF EXISTS idx_semantic_event_narrative_fts;
+
+ANALYZE semantic_event;
+
+-- Confirm migration
+SELECT 'semantic_event narrative_tsv column created successfully' AS status;
@@ -0,0 +1,27 @@
+-- migrations/015_extraction_cache.sql
+-- V10: Extraction result cache
+--
+-- Identical chunks recur across re-ingested revisions, forwarded emails and
+-- duplicate uploads, and each one paid for a full Prompt A call.
+-- extraction_cache stores the parsed Prompt A result (events,
+-- entities_mentioned, relationships, with chunk-relative offsets) keyed by
+-- the chunk's sha256 content hash, the model, and a hash of the prompt
+-- templates. Changing a prompt changes prompt_version, so old entries are
+-- simply never read again (and are pruned by the worker at startup).
+--
+-- hit_count is bumped by the lookup itself; every row was one miss, so the
+-- cache hit rate is SUM(hit_count) / (SUM(hit_count) + COUNT(*)).
+
+CREATE TABLE IF NOT EXISTS extraction_cache (
+    content_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    result JSONB NOT NULL,
+    hit_count BIGINT NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    last_hit_at TIMESTAMPTZ NULL,
+    PRIMARY KEY (content_hash, model, prompt_version)
+);
+
+-- Confirm migration
+SELECT 'extraction_cache table created successfully' AS status;
@@ -0,0 +1,38 @@
+-- migrations/016_entity_merge_decision.sql
+-- V10: Entity merge decision cache
+--
+-- Entity resolution asks the LLM whether a new mention and its closest
+-- existing entity are the same, and the same pair ("Alex" at Acme vs
+-- "Alex Chen") came back in every document that mentioned it.
+-- entity_merge_decision keeps confident "same"/"different" answers keyed by
+-- the candidate entity, the mention's normalized name and a hash of the
+-- mention's type, context clues and model. Entries expire after
+-- MERGE_DECISION_CACHE_TTL_DAYS and are deleted when the candidate entity is
+-- renamed by a merge.
+--
+-- No foreign key: candidates created earlier in the same document are
+-- decided before they are inserted. Entities are never deleted.
+--
+-- hit_count is bumped by the lookup itself; every hit is one LLM
+-- confirmation that was not made.
+
+CREATE TABLE IF NOT EXISTS entity_merge_decision (
+    candidate_entity_id UUID NOT NULL,
+    normalized_name TEXT NOT NULL,
+    context_hash TEXT NOT NULL,
+    decision TEXT NOT NULL CHECK (decision IN ('same', 'different')),
+    canonical_name TEXT NOT NULL,
+    reason TEXT,
+    confidence REAL NOT NULL,
+    hit_count BIGINT NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    expires_at TIMESTAMPTZ NOT NULL,
+    last_hit_at TIMESTAMPTZ NULL,
+    PRIMARY KEY (candidate_entity_id, normalized_name, context_hash)
+);
+
+CREATE INDEX IF NOT EXISTS idx_entity_merge_decision_expires
+    ON entity_merge_decision (expires_at);
+
+-- Confirm migration
+SELECT 'entity_merge_decision table created successfully' AS status;
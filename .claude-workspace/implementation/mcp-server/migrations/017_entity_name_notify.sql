@@ -0,0 +1,55 @@
+-- migrations/017_entity_name_notify.sql
+-- V10: Entity name change feed
+--
+-- Event workers keep every entity name and alias in memory so exact-match
+-- resolution needs no query. These triggers publish each new name on the
+-- entity_names channel so every worker's dictionary picks up entities and
+-- aliases written by the others:
+-- - entity insert, or a rename by a merge (old_name is set)
+-- - entity_alias insert (aliases are never updated)
+--
+-- Payload: {"kind": "name"|"alias", "entity_id", "entity_type", "name",
+-- "canonical_name", "old_name"}. Notifications are delivered on commit.
+
+CREATE OR REPLACE FUNCTION notify_entity_name()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('entity_names', json_build_object(
+        'kind', 'name',
+        'entity_id', NEW.entity_id,
+        'entity_type', NEW.entity_type,
+        'name', NEW.normalized_name,
+        'canonical_name', NEW.canonical_name,
+        'old_name', CASE WHEN TG_OP = 'UPDATE' THEN OLD.normalized_name END
+    )::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION notify_entity_alias()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM pg_notify('entity_names', json_build_object(
+        'kind', 'alias',
+        'entity_id', NEW.entity_id,
+        'entity_type', (SELECT entity_type FROM entity WHERE entity_id = NEW.entity_id),
+        'name', NEW.normalized_alias
+    )::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS entity_name_notify ON entity;
+CREATE TRIGGER entity_name_notify
+AFTER INSERT OR UPDATE OF canonical_name, normalized_name ON entity
+FOR EACH ROW
+EXECUTE FUNCTION notify_entity_name();
+
+DROP TRIGGER IF EXISTS entity_alias_notify ON entity_alias;
+CREATE TRIGGER entity_alias_notify
+AFTER INSERT ON entity_alias
+FOR EACH ROW
+EXECUTE FUNCTION notify_entity_alias();
+
+-- Confirm migration
+SELECT 'entity_names notification triggers created successfully' AS status;
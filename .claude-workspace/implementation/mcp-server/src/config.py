@@ -46,6 +46,47 @@ class Config:
     # RRF Configuration
     rrf_constant: int
 
+    # V10: In-memory graph cache for multi-hop expansion
+    graph_cache_enabled: bool = True
+    graph_cache_refresh_seconds: int = 30
+
+    # V10: Per-call timeout for recall enrichment (evidence, entities, edges, events)
+    enrichment_timeout_ms: int = 2000
+
+    # V10: Local in-process ANN read replica of content/chunks (Chroma stays the source of truth)
+    local_replica_enabled: bool = False
+    local_replica_snapshot_path: Optional[str] = None
+
+    # V10: In-process BM25 index for lexical / identifier queries (opt-in: keeps
+    # a second copy of all text in memory and makes "auto" recall RRF-fuse
+    # BM25 with vector results)
+    lexical_index_enabled: bool = False
+
+    # V10: Jobs each event worker process keeps in flight
+    worker_concurrency: int = 1
+
+    # V10: LISTEN/NOTIFY job wakeups; polling becomes a slow safety net
+    job_notify_enabled: bool = True
+    worker_idle_poll_ms: int = 30000
+
+    # V10: Concurrent chunk extractions per job, and the per-process LLM budget (0 = unlimited)
+    extraction_chunk_concurrency: int = 4
+    openai_requests_per_minute: int = 0
+
+    # V10: Cache Prompt A results by chunk content hash, model and prompt version
+    extraction_cache_enabled: bool = True
+    extraction_cache_max_idle_days: int = 90
+
+    # V10: Merge clear duplicate events locally; only ambiguous clusters go to Prompt B
+    local_canonicalization_enabled: bool = True
+
+    # V10: Reuse confident LLM entity merge decisions across documents
+    merge_decision_cache_enabled: bool = True
+    merge_decision_cache_ttl_days: int = 30
+
+    # V10: Worker-side name/alias dictionary for exact-match entity resolution
+    entity_name_index_enabled: bool = True
+
 
 def load_config() -> Config:
     """
@@ -102,6 +143,45 @@ def load_config() -> Config:
 
         # RRF
         rrf_constant=int(os.getenv("RRF_CONSTANT", "60")),
+
+        # V10: Graph cache
+        graph_cache_enabled=os.getenv("GRAPH_CACHE_ENABLED", "true").lower() == "true",
+        graph_cache_refresh_seconds=int(os.getenv("GRAPH_CACHE_REFRESH_SECONDS", "30")),
+
+        # V10: Recall enrichment
+        enrichment_timeout_ms=int(os.getenv("ENRICHMENT_TIMEOUT_MS", "2000")),
+
+        # V10: Local read replica
+        local_replica_enabled=os.getenv("LOCAL_REPLICA_ENABLED", "false").lower() == "true",
+        local_replica_snapshot_path=os.getenv("LOCAL_REPLICA_SNAPSHOT_PATH"),
+
+        # V10: Lexical index
+        lexical_index_enabled=os.getenv("LEXICAL_INDEX_ENABLED", "false").lower() == "true",
+
+        # V10: Worker concurrency
+        worker_concurrency=int(os.getenv("WORKER_CONCURRENCY", "1")),
+
+        # V10: Job wakeups
+        job_notify_enabled=os.getenv("JOB_NOTIFY_ENABLED", "true").lower() == "true",
+        worker_idle_poll_ms=int(os.getenv("WORKER_IDLE_POLL_MS", "30000")),
+
+        # V10: Parallel chunk extraction
+        extraction_chunk_concurrency=int(os.getenv("EXTRACTION_CHUNK_CONCURRENCY", "4")),
+        openai_requests_per_minute=int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "0")),
+
+        # V10: Extraction cache
+        extraction_cache_enabled=os.getenv("EXTRACTION_CACHE_ENABLED", "true").lower() == "true",
+        extraction_cache_max_idle_days=int(os.getenv("EXTRACTION_CACHE_MAX_IDLE_DAYS", "90")),
+
+        # V10: Local event canonicalization
+        local_canonicalization_enabled=os.getenv("LOCAL_CANONICALIZATION_ENABLED", "true").lower() == "true",
+
+        # V10: Merge decision cache
+        merge_decision_cache_enabled=os.getenv("MERGE_DECISION_CACHE_ENABLED", "true").lower() == "true",
+        merge_decision_cache_ttl_days=int(os.getenv("MERGE_DECISION_CACHE_TTL_DAYS", "30")),
+
+        # V10: Entity name index
+        entity_name_index_enabled=os.getenv("ENTITY_NAME_INDEX_ENABLED", "true").lower() == "true",
     )
 
 
@@ -141,6 +221,30 @@ def validate_config(config: Config) -> None:
             f"OPENAI_BATCH_SIZE ({config.openai_batch_size}) exceeds OpenAI limit of 2048"
         )
 
+    # Validate worker concurrency
+    if config.worker_concurrency < 1:
+        raise ValueError(
+            f"WORKER_CONCURRENCY ({config.worker_concurrency}) must be at least 1"
+        )
+
+    # Validate chunk extraction concurrency
+    if config.extraction_chunk_concurrency < 1:
+        raise ValueError(
+            f"EXTRACTION_CHUNK_CONCURRENCY ({config.extraction_chunk_concurrency}) must be at least 1"
+        )
+
+    # Validate extraction cache retention
+    if config.extraction_cache_max_idle_days < 1:
+        raise ValueError(
+            f"EXTRACTION_CACHE_MAX_IDLE_DAYS ({config.extraction_cache_max_idle_days}) must be at least 1"
+        )
+
+    # Validate merge decision TTL
+    if config.merge_decision_cache_ttl_days < 1:
+        raise ValueError(
+            f"MERGE_DECISION_CACHE_TTL_DAYS ({config.merge_decision_cache_ttl_days}) must be at least 1"
+        )
+
     # Validate log level
     valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
     if config.log_level.upper() not in valid_log_levels:
@@ -1,9 +1,10 @@
 """
 MCP Memory Server v6.1 - Simplified Interface
 
-A Model Context Protocol server with 4 tools for persistent memory and context:
+A Model Context Protocol server with 5 tools for persistent memory and context:
 - remember() - Store content with automatic chunking, embedding, and event extraction
 - recall() - Find content with semantic search and graph expansion
+- recall_batch() - Run several related recalls with one embedding call and shared expansion
 - forget() - Delete content with cascade (chunks, events, entities)
 - status() - Check system health and job status
 
@@ -24,6 +25,7 @@ Configuration via .env file (see .env.example)
 __version__ = "6.1.0"
 
 import os
+import asyncio
 import logging
 import hashlib
 from datetime import datetime, date
@@ -38,7 +40,7 @@ from starlette.middleware import Middleware
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 from dotenv import load_dotenv
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import FastMCP, Context
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 
 # Load environment variables
@@ -50,22 +52,43 @@ from services.embedding_service import EmbeddingService
 from services.chunking_service import ChunkingService
 from services.retrieval_service import RetrievalService
 from services.privacy_service import PrivacyFilterService
+from services.graph_cache import GraphCache
+from services.local_vector_replica import LocalVectorReplica
+from services.lexical_index import LexicalIndex
 from storage.chroma_client import ChromaClientManager
+from storage.models import Chunk
 from storage.collections import (
     get_content_collection,
     get_chunks_collection,
     get_content_by_id,
     get_v5_chunks_by_content,
-    delete_v5_content_cascade
+    get_v5_chunk_neighbors,
+    neighbor_chunk_metadata,
+    delete_v5_content_cascade,
+    build_filter_metadata,
+    sync_chunk_filter_metadata,
+    backfill_filter_metadata,
 )
 from utils.errors import (
     ValidationError,
     EmbeddingError,
 )
+from utils.concurrency import gather_with_timeouts
+from utils.progress import ProgressStream
+from utils.snippets import shape_result, payload_bytes
 
 # V3: Postgres and event extraction imports
 from storage.postgres_client import PostgresClient
+from storage.conversation_index import (
+    record_turn,
+    fetch_turn_window,
+    window_turns,
+    delete_turns_for_artifact,
+    backfill_from_chroma as backfill_conversation_index,
+)
 from services.job_queue_service import JobQueueService
+from services.extraction_cache import extraction_cache_stats
+from services.merge_decision_cache import merge_decision_cache_stats
 from tools.event_tools import event_search, event_get
 
 # Graph expansion uses Postgres SQL joins (no external graph database)
@@ -87,6 +110,9 @@ chroma_manager: Optional[ChromaClientManager] = None
 # V6: Postgres for events and graph expansion via SQL joins
 pg_client: Optional[PostgresClient] = None
 job_queue_service: Optional[JobQueueService] = None
+graph_cache: Optional[GraphCache] = None
+local_replica: Optional[LocalVectorReplica] = None
+lexical_index: Optional[LexicalIndex] = None
 
 
 def parse_date_string(date_str: Optional[str]) -> Optional[date]:
@@ -122,6 +148,35 @@ V6_VALID_CONTEXTS = [
 ]
 
 
+async def index_conversation_turn(
+    conversation_id: str,
+    turn_index: int,
+    artifact_id: str,
+    role: Optional[str]
+) -> Optional[str]:
+    """
+    Record a turn in the Postgres turn index (V10).
+
+    recall pages conversation history from this index, so an unindexed turn
+    is missing from it. Retries once; on failure remember reports an error
+    (remembering the same turn again re-indexes it).
+
+    Returns:
+        Error message, or None once indexed (or without Postgres)
+    """
+    if not pg_client:
+        return None
+    error = None
+    for attempt in range(2):
+        try:
+            await record_turn(pg_client, conversation_id, turn_index, artifact_id, role)
+            return None
+        except Exception as e:
+            logger.warning(f"V10 remember: Failed to index conversation turn (attempt {attempt + 1}): {e}")
+            error = e
+    return f"Stored {artifact_id} but could not index conversation turn: {error}. Call remember again to retry"
+
+
 @mcp.tool()
 async def remember(
     content: str,
@@ -244,11 +299,34 @@ async def remember(
             if source:
                 updated_meta["source_system"] = source
 
+            # V10: Refresh filterable fields and keep chunks in step with the parent
+            filter_metadata = build_filter_metadata(updated_meta)
+            updated_meta.update(filter_metadata)
+
             content_col.update(
                 ids=[artifact_id],
                 metadatas=[updated_meta]
             )
 
+            if existing_meta.get("is_chunked"):
+                sync_chunk_filter_metadata(client, [artifact_id], {artifact_id: filter_metadata})
+
+            # V10: Apply the same delta to the local read replica
+            if local_replica:
+                local_replica.update_metadata("content", [artifact_id], [updated_meta])
+                if existing_meta.get("is_chunked"):
+                    local_replica.update_chunk_metadata(artifact_id, filter_metadata)
+            if lexical_index:
+                lexical_index.update_metadata("content", [artifact_id], [updated_meta])
+                if existing_meta.get("is_chunked"):
+                    lexical_index.update_chunk_metadata(artifact_id, filter_metadata)
+
+            # V10: Same text can be a turn of another conversation
+            if context == "conversation":
+                index_error = await index_conversation_turn(conversation_id, turn_index, artifact_id, role)
+                if index_error:
+                    return {"error": index_error, "id": artifact_id}
+
             return {
                 "id": artifact_id,
                 "summary": f"Updated existing content ({context})",
@@ -310,6 +388,10 @@ async def remember(
             if role:
                 metadata["role"] = role
 
+        # V10: Filterable fields (numeric ts_epoch) so recall filters run inside Chroma
+        filter_metadata = build_filter_metadata(metadata)
+        metadata.update(filter_metadata)
+
         # Chunk if needed (use ChunkingService threshold, default 1200 tokens)
         should_chunk_result, _ = chunking_service.should_chunk(content)
         is_chunked = should_chunk_result
@@ -323,23 +405,33 @@ async def remember(
             # Store each chunk in V6 chunks collection with full metadata
             # Including start_char/end_char for evidence pipeline
             chunks_col = get_chunks_collection(client)
-            for chunk in chunks:
+            chunk_ids = [chunk.chunk_id for chunk in chunks]
+            for position, chunk in enumerate(chunks):
                 # Use stable chunk_id from ChunkingService (includes content hash)
                 chunk_embedding = embedding_service.generate_embedding(chunk.content)
+                chunk_metadata = {
+                    "content_id": artifact_id,
+                    "chunk_index": chunk.chunk_index,
+                    "total_chunks": num_chunks,
+                    "token_count": chunk.token_count,
+                    "start_char": chunk.start_char,
+                    "end_char": chunk.end_char,
+                    "content_hash": chunk.content_hash,
+                    **neighbor_chunk_metadata(chunk_ids, position),  # V10: ±1 lookup by id
+                    **filter_metadata,
+                }
                 chunks_col.add(
                     ids=[chunk.chunk_id],
                     documents=[chunk.content],
-                    metadatas=[{
-                        "content_id": artifact_id,
-                        "chunk_index": chunk.chunk_index,
-                        "total_chunks": num_chunks,
-                        "token_count": chunk.token_count,
-                        "start_char": chunk.start_char,
-                        "end_char": chunk.end_char,
-                        "content_hash": chunk.content_hash,
-                    }],
+                    metadatas=[chunk_metadata],
                     embeddings=[chunk_embedding]
                 )
+                if local_replica:
+                    local_replica.upsert(
+                        "chunks", [chunk.chunk_id], [chunk_embedding], [chunk.content], [chunk_metadata]
+                    )
+                if lexical_index:
+                    lexical_index.upsert("chunks", [chunk.chunk_id], [chunk.content], [chunk_metadata])
 
             metadata["is_chunked"] = True
             metadata["num_chunks"] = num_chunks
@@ -356,6 +448,16 @@ async def remember(
             metadatas=[metadata],
             embeddings=[embedding]
         )
+        if local_replica:
+            local_replica.upsert("content", [artifact_id], [embedding], [content], [metadata])
+        if lexical_index:
+            lexical_index.upsert("content", [artifact_id], [content], [metadata])
+
+        # V10: Conversation turn index for paged history (reported after the
+        # extraction job is queued, so a retried remember only re-indexes)
+        index_error = None
+        if context == "conversation":
+            index_error = await index_conversation_turn(conversation_id, turn_index, artifact_id, role)
 
         # Queue event extraction (Decision 1: Semantic Unification)
         # Exception: Short conversation turns < 100 tokens skip extraction
@@ -409,6 +511,9 @@ async def remember(
             except Exception as e:
                 logger.warning(f"V6 remember: Failed to queue event extraction: {e}")
 
+        if index_error:
+            return {"error": index_error, "id": artifact_id, "events_queued": events_queued}
+
         # Generate summary
         summary = content[:100] + "..." if len(content) > 100 else content
 
@@ -433,6 +538,45 @@ async def remember(
         return {"error": f"Internal server error: {str(e)}"}
 
 
+def expand_chunk_hits(client, results: List[dict]) -> None:
+    """
+    Replace each chunk hit's content with the chunk plus its ±1 neighbors,
+    joined with [CHUNK BOUNDARY] markers (V10: neighbors fetched by ID).
+    """
+    chunk_hits = [r for r in results if r.get("collection") == "chunks"]
+    if not chunk_hits:
+        return
+
+    neighbors = get_v5_chunk_neighbors(client, [(r["id"], r.get("metadata") or {}) for r in chunk_hits])
+
+    def to_chunk(chunk_id: str, content: str, meta: dict) -> Chunk:
+        return Chunk(
+            chunk_id=chunk_id,
+            artifact_id=meta.get("content_id", chunk_id.split("::")[0]),
+            chunk_index=int(meta.get("chunk_index", 0)),
+            content=content or "",
+            start_char=meta.get("start_char", 0),
+            end_char=meta.get("end_char", 0),
+            token_count=meta.get("token_count", 0),
+            content_hash=meta.get("content_hash", ""),
+        )
+
+    for result in chunk_hits:
+        meta = result.get("metadata") or {}
+        window = [to_chunk(result["id"], result.get("content"), meta)]
+        for side in ("prev", "next"):
+            neighbor = neighbors.get(result["id"], {}).get(side)
+            if neighbor:
+                window.append(to_chunk(neighbor["chunk_id"], neighbor["content"], neighbor["metadata"] or {}))
+        if len(window) > 1:
+            result["content"] = chunking_service.expand_chunk_neighbors(
+                artifact_id=window[0].artifact_id,
+                chunk_index=window[0].chunk_index,
+                all_chunks=window
+            )
+            result["neighbor_chunk_ids"] = [c.chunk_id for c in window[1:]]
+
+
 @mcp.tool()
 async def recall(
     query: Optional[str] = None,
@@ -444,8 +588,14 @@ async def recall(
     date_from: Optional[str] = None,
     date_to: Optional[str] = None,
     conversation_id: Optional[str] = None,
+    # V10: Conversation paging
+    tail: bool = False,
+    from_turn: Optional[int] = None,
+    to_turn: Optional[int] = None,
+    cursor: Optional[str] = None,
     # Advanced graph parameters
     graph_budget: int = 10,
+    graph_depth: int = 1,
     graph_filters: Optional[List[str]] = None,
     include_entities: bool = True,
     expand_neighbors: bool = False,
@@ -456,6 +606,14 @@ async def recall(
     min_importance: float = 0.0,
     source: Optional[str] = None,
     sensitivity: Optional[str] = None,
+    # V10: Retrieval mode
+    search_mode: str = "auto",
+    # V10: Progressive responses
+    stream: bool = False,
+    # V10: Response shaping
+    snippet_tokens: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    ctx: Context = None,
 ) -> dict:
     """
     Find and retrieve stored content.
@@ -472,16 +630,36 @@ async def recall(
         include_events: Include extracted events (default True)
         date_from: Filter by date range start
         date_to: Filter by date range end
-        conversation_id: Get specific conversation history
+        conversation_id: Get specific conversation history (a page of `limit` turns)
+        tail: With conversation_id, return the most recent turns instead of the first
+        from_turn: With conversation_id, inclusive lower turn_index bound
+        to_turn: With conversation_id, inclusive upper turn_index bound
+        cursor: With conversation_id, continue from a previous page's next_cursor
         graph_budget: Max related items from graph expansion (1-50)
+        graph_depth: Graph expansion hops (1-3)
         graph_filters: Event categories for graph expansion
         include_entities: Include entity information in response
-        expand_neighbors: Include +/-1 adjacent chunks for context
+        expand_neighbors: Include +/-1 adjacent chunks for context (chunk hits;
+            ignored when snippet_tokens is set)
         edge_types: Filter graph expansion by relationship types (e.g., ["MANAGES", "DECIDED"])
         include_edges: Include edge/relationship details in response
         min_importance: Minimum importance threshold (0.0-1.0)
         source: Filter by source system
         sensitivity: Filter by sensitivity level
+        search_mode: "auto" (default), "hybrid", "semantic" or "lexical".
+            Lexical matches exact terms/identifiers without an embedding call;
+            auto uses it for identifier-like queries (e.g., "JIRA-1234").
+            Needs LEXICAL_INDEX_ENABLED; without it every mode is semantic
+        stream: Send partial results as progress notifications while the search
+            runs: "primary" hits first, then "events", "related", "entities" and
+            "edges" as each is ready. Each message is JSON
+            {stage, elapsed_ms, data}. The final response is unchanged, plus
+            "timings" (first_result_ms, per-stage and total ms)
+        snippet_tokens: Return only the best-matching window of about this many
+            tokens per result instead of the whole document (16-1200). Results
+            gain "snippet": {start_char, end_char, truncated} in document offsets
+        fields: Metadata keys to keep per result (e.g., ["title", "context", "ts"]);
+            other metadata is dropped
 
     Returns:
         {
@@ -498,12 +676,20 @@ async def recall(
         recall(context="meeting", limit=5)
         recall("what did Alice decide?", expand=True)
         recall(conversation_id="conv_123", limit=20)
+        recall(conversation_id="conv_123", tail=True, limit=20)
+        recall("JIRA-1234", search_mode="lexical")
+        recall("launch date", snippet_tokens=80, fields=["title", "ts"])
     """
     try:
         # Validate limit
         if limit < 1 or limit > 50:
             return {"error": "Limit must be between 1 and 50"}
 
+        if snippet_tokens is not None and not 16 <= snippet_tokens <= 1200:
+            return {"error": "snippet_tokens must be between 16 and 1200"}
+
+        t_start = asyncio.get_running_loop().time()
+
         client = chroma_manager.get_client()
 
         # Direct ID lookup
@@ -570,6 +756,7 @@ async def recall(
                 "metadata": content_data["metadata"],
                 "events": events
             }
+            shape_result(result, query=query, snippet_tokens=snippet_tokens, fields=fields)
 
             return {
                 "results": [result],
@@ -579,50 +766,81 @@ async def recall(
             }
 
         # Conversation history retrieval (Decision 5: Structured return)
+        # V10: Page through the Postgres turn index; fetch only that page from Chroma
         if conversation_id:
             content_col = get_content_collection(client)
 
             try:
-                results = content_col.get(
-                    where={
-                        "$and": [
-                            {"context": "conversation"},
-                            {"conversation_id": conversation_id},
-                        ]
-                    },
-                    include=["documents", "metadatas"]
-                )
-
-                turns = []
-                ids = results.get("ids", [])
-                docs = results.get("documents", [])
-                metas = results.get("metadatas", [])
-
-                for doc_id, doc, meta in zip(ids, docs, metas):
-                    turns.append({
-                        "id": doc_id,
-                        "role": meta.get("role", "user") if meta else "user",
-                        "turn_index": meta.get("turn_index", 0) if meta else 0,
-                        "ts": meta.get("ts", meta.get("ingested_at")) if meta else None,
-                        "content": doc,
-                    })
+                if pg_client:
+                    rows, next_cursor = await fetch_turn_window(
+                        pg_client, conversation_id, limit,
+                        tail=tail, from_turn=from_turn, to_turn=to_turn, cursor=cursor
+                    )
+                    results = content_col.get(
+                        ids=[row["artifact_id"] for row in rows],
+                        include=["documents", "metadatas"]
+                    ) if rows else {}
+                    by_id = {
+                        doc_id: (doc, meta or {})
+                        for doc_id, doc, meta in zip(
+                            results.get("ids", []), results.get("documents", []), results.get("metadatas", [])
+                        )
+                    }
+
+                    turns = []
+                    for row in rows:
+                        if row["artifact_id"] not in by_id:
+                            continue
+                        doc, meta = by_id[row["artifact_id"]]
+                        turns.append({
+                            "id": row["artifact_id"],
+                            "role": row["role"] or meta.get("role", "user"),
+                            "turn_index": row["turn_index"],
+                            "ts": meta.get("ts", meta.get("ingested_at")),
+                            "content": doc,
+                        })
+                else:
+                    # No Postgres: filter the whole conversation in Chroma
+                    results = content_col.get(
+                        where={
+                            "$and": [
+                                {"context": "conversation"},
+                                {"conversation_id": conversation_id},
+                            ]
+                        },
+                        include=["documents", "metadatas"]
+                    )
 
-                # Sort by turn_index
-                turns.sort(key=lambda t: t["turn_index"])
+                    turns = []
+                    for doc_id, doc, meta in zip(
+                        results.get("ids", []), results.get("documents", []), results.get("metadatas", [])
+                    ):
+                        turns.append({
+                            "id": doc_id,
+                            "role": meta.get("role", "user") if meta else "user",
+                            "turn_index": meta.get("turn_index", 0) if meta else 0,
+                            "ts": meta.get("ts", meta.get("ingested_at")) if meta else None,
+                            "content": doc,
+                        })
 
-                # Apply limit
-                if limit:
-                    turns = turns[:limit]
+                    # Sort by turn_index, then apply the same paging as the index
+                    turns.sort(key=lambda t: t["turn_index"])
+                    turns, next_cursor = window_turns(
+                        turns, limit, tail=tail, from_turn=from_turn, to_turn=to_turn, cursor=cursor
+                    )
 
                 return {
                     "turns": turns,
                     "total_turns": len(turns),
                     "conversation_id": conversation_id,
+                    "next_cursor": next_cursor,
                     "results": [],
                     "related": [],
                     "entities": []
                 }
 
+            except ValueError as e:
+                return {"error": str(e)}
             except Exception as e:
                 logger.error(f"V6 recall: Failed to get conversation history: {e}")
                 return {"error": f"Failed to get conversation history: {str(e)}"}
@@ -632,6 +850,12 @@ async def recall(
             if not query or len(query) > 500:
                 return {"error": "Query must be between 1 and 500 characters"}
 
+            if not 1 <= graph_depth <= 3:
+                return {"error": "graph_depth must be between 1 and 3"}
+
+            if search_mode not in ("auto", "hybrid", "semantic", "lexical"):
+                return {"error": "search_mode must be one of: auto, hybrid, semantic, lexical"}
+
             # Use graph_filters default if not provided
             if graph_filters is None:
                 graph_filters = ["Decision", "Commitment", "QualityRisk"]
@@ -644,39 +868,86 @@ async def recall(
             if edge_types:
                 gf["edge_types"] = edge_types
 
-            v5_result = await retrieval_service.hybrid_search_v5(
-                query=query,
-                limit=limit,
-                expand=expand,
-                graph_budget=graph_budget,
-                graph_filters=gf if gf else None,
-                include_entities=include_entities,
-                context_filter=context,
-                min_importance=min_importance,
-                date_from=date_from,
-                date_to=date_to,
+            # V10: Streamed recall emits each stage as it completes
+            progress = None
+            if stream:
+                total_stages = (
+                    1
+                    + (1 if include_events and pg_client else 0)
+                    + ((1 + int(include_entities) + int(include_edges)) if expand else 0)
+                )
+                progress = ProgressStream(ctx, total_stages=total_stages)
+
+            async def on_stage(stage: str, payload) -> None:
+                if stage == "primary":
+                    payload = [
+                        shape_result(r, query=query, snippet_tokens=snippet_tokens, fields=fields)
+                        for r in payload
+                    ]
+                await progress.emit(stage, payload)
+
+            # V10: Embed the query once; content search and vector event
+            # search share it. Lexical-mode queries stay embedding-free.
+            query_embedding = None
+            if retrieval_service.resolve_search_mode(query, search_mode) != "lexical":
+                try:
+                    query_embedding = embedding_service.generate_embedding(query)
+                except Exception as e:
+                    logger.warning(f"V10 recall: Query embedding failed, retrying in search: {e}")
+
+            # V10: Event search is independent of content search - run them
+            # concurrently. Event search is bounded by the enrichment timeout;
+            # a failure there yields partial results, not a failed recall.
+            async def search_events() -> dict:
+                if not (include_events and pg_client):
+                    return {}
+                results, failed = await gather_with_timeouts(
+                    {"events": event_search(
+                        pg_client, query=query, limit=limit, include_evidence=True,
+                        query_embedding=query_embedding, rrf_constant=config.rrf_constant
+                    )},
+                    timeout=config.enrichment_timeout_ms / 1000.0,
+                    defaults={"events": {}}
+                )
+                response = results["events"] or {}
+                if progress and not failed:
+                    await progress.emit("events", response.get("events", []))
+                return {"response": response, "failed": failed}
+
+            v5_result, event_outcome = await asyncio.gather(
+                retrieval_service.hybrid_search_v5(
+                    query=query,
+                    limit=limit,
+                    expand=expand,
+                    graph_budget=graph_budget,
+                    graph_filters=gf if gf else None,
+                    include_entities=include_entities,
+                    context_filter=context,
+                    min_importance=min_importance,
+                    date_from=date_from,
+                    date_to=date_to,
+                    graph_depth=graph_depth,
+                    include_edges=include_edges,
+                    search_mode=search_mode,
+                    on_stage=on_stage if progress else None,
+                    query_embedding=query_embedding,
+                ),
+                search_events()
             )
 
             v4_dict = v5_result.to_dict()
+            partial = list(v4_dict.get("partial", [])) + event_outcome.get("failed", [])
+            event_results = event_outcome.get("response", {}).get("events", [])
 
-            # Also search semantic events if requested
-            event_results = []
-            if include_events and pg_client:
-                try:
-                    from tools.event_tools import event_search
-                    event_response = await event_search(
-                        pg_client,
-                        query=query,
-                        limit=limit,
-                        include_evidence=True
-                    )
-                    if "events" in event_response:
-                        event_results = event_response["events"]
-                except Exception as e:
-                    logger.warning(f"V6 recall: Event search failed: {e}")
+            # V10: Neighbor expansion - one get() for the ±1 chunks of every chunk hit
+            if expand_neighbors and not snippet_tokens:
+                expand_chunk_hits(client, v4_dict.get("primary_results", []))
 
-            # Combine results
-            primary_results = v4_dict.get("primary_results", [])
+            # Combine results (V10: snippets / field projection for content hits)
+            primary_results = [
+                shape_result(r, query=query, snippet_tokens=snippet_tokens, fields=fields)
+                for r in v4_dict.get("primary_results", [])
+            ]
 
             # Add events to results
             for ev in event_results:
@@ -690,66 +961,8 @@ async def recall(
                     "evidence": ev.get("evidence", [])
                 })
 
-            # V9: Fetch edges if requested
-            edges = []
-            if include_edges and pg_client:
-                try:
-                    # Get entity IDs from results
-                    entity_ids = []
-                    for ent in v4_dict.get("entities", []):
-                        if ent.get("entity_id"):
-                            entity_ids.append(ent["entity_id"])
-
-                    if entity_ids:
-                        # Build edge type filter
-                        edge_type_clause = ""
-                        params = entity_ids + entity_ids  # For source and target
-                        if edge_types:
-                            placeholders = ", ".join(f"${i}" for i in range(len(entity_ids) * 2 + 1, len(entity_ids) * 2 + 1 + len(edge_types)))
-                            edge_type_clause = f"AND ee.relationship_type IN ({placeholders})"
-                            params = params + edge_types
-
-                        source_placeholders = ", ".join(f"${i}" for i in range(1, len(entity_ids) + 1))
-                        target_placeholders = ", ".join(f"${i}" for i in range(len(entity_ids) + 1, len(entity_ids) * 2 + 1))
-
-                        edge_rows = await pg_client.fetch_all(
-                            f"""
-                            SELECT
-                                ee.edge_id,
-                                ee.relationship_type,
-                                ee.relationship_name,
-                                ee.confidence,
-                                ee.evidence_quote,
-                                e1.canonical_name AS source_name,
-                                e1.entity_type AS source_type,
-                                e2.canonical_name AS target_name,
-                                e2.entity_type AS target_type
-                            FROM entity_edge ee
-                            JOIN entity e1 ON e1.entity_id = ee.source_entity_id
-                            JOIN entity e2 ON e2.entity_id = ee.target_entity_id
-                            WHERE (ee.source_entity_id IN ({source_placeholders})
-                                   OR ee.target_entity_id IN ({target_placeholders}))
-                            {edge_type_clause}
-                            ORDER BY ee.confidence DESC
-                            LIMIT 50
-                            """,
-                            *params
-                        )
-
-                        for row in edge_rows:
-                            edges.append({
-                                "edge_id": str(row["edge_id"]),
-                                "source": row["source_name"],
-                                "source_type": row["source_type"],
-                                "target": row["target_name"],
-                                "target_type": row["target_type"],
-                                "type": row["relationship_type"],
-                                "name": row["relationship_name"],
-                                "confidence": float(row["confidence"]) if row["confidence"] else None,
-                                "evidence": row["evidence_quote"]
-                            })
-                except Exception as e:
-                    logger.warning(f"V9 recall: Failed to fetch edges: {e}")
+            # V9: Edges (V10: fetched concurrently with evidence/entities during expansion)
+            edges = v4_dict.get("edges", [])
 
             result = {
                 "results": primary_results,
@@ -761,6 +974,23 @@ async def recall(
             if include_edges:
                 result["edges"] = edges
 
+            if partial:
+                result["partial"] = partial
+
+            if progress:
+                result["timings"] = progress.timings()
+                logger.info(
+                    f"V10 recall (streamed): first result {progress.first_result_ms}ms, "
+                    f"total {result['timings']['total_ms']}ms"
+                )
+
+            if snippet_tokens or fields is not None:
+                logger.info(
+                    f"V10 recall: {payload_bytes(result)} bytes "
+                    f"(snippet_tokens={snippet_tokens}, fields={fields}) in "
+                    f"{(asyncio.get_running_loop().time() - t_start) * 1000:.0f}ms"
+                )
+
             return result
 
         # No query, id, or conversation_id - return error
@@ -771,6 +1001,163 @@ async def recall(
         return {"error": f"Search failed: {str(e)}"}
 
 
+@mcp.tool()
+async def recall_batch(
+    queries: List[str],
+    context: Optional[str] = None,
+    limit: int = 10,
+    expand: bool = True,
+    include_events: bool = True,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    graph_budget: int = 10,
+    graph_depth: int = 1,
+    graph_filters: Optional[List[str]] = None,
+    include_entities: bool = True,
+    edge_types: Optional[List[str]] = None,
+    include_edges: bool = False,
+    min_importance: float = 0.0,
+    snippet_tokens: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+) -> dict:
+    """
+    Run several related searches in one call.
+
+    Cheaper than separate recall() calls: all queries are embedded together,
+    each collection is searched once for all of them, and graph expansion
+    runs once from the combined seeds. Entities and edges are shared across
+    queries and returned once.
+
+    Args:
+        queries: Search queries (1-10), e.g. one per sub-question
+        snippet_tokens: Best-matching window per result instead of whole documents
+        fields: Metadata keys to keep per result
+        (other arguments as for recall, applied to every query)
+
+    Returns:
+        {
+            results: [                # One entry per query, same order
+                {query, results: [...], related: [...], total_count}
+            ],
+            entities: [...],          # Shared across queries
+            edges: [...],             # If include_edges=True
+            latency_ms: float
+        }
+
+    Examples:
+        recall_batch(["who owns the launch?", "launch risks", "launch date"])
+    """
+    try:
+        if not queries or len(queries) > 10:
+            return {"error": "queries must contain between 1 and 10 items"}
+        if any(not q or len(q) > 500 for q in queries):
+            return {"error": "Each query must be between 1 and 500 characters"}
+        if limit < 1 or limit > 50:
+            return {"error": "Limit must be between 1 and 50"}
+        if not 1 <= graph_depth <= 3:
+            return {"error": "graph_depth must be between 1 and 3"}
+        if snippet_tokens is not None and not 16 <= snippet_tokens <= 1200:
+            return {"error": "snippet_tokens must be between 16 and 1200"}
+
+        if graph_filters is None:
+            graph_filters = ["Decision", "Commitment", "QualityRisk"]
+        gf = {}
+        if graph_filters:
+            gf["categories"] = graph_filters
+        if edge_types:
+            gf["edge_types"] = edge_types
+
+        t_start = asyncio.get_running_loop().time()
+
+        # V10: One embedding call for all queries, shared with event search
+        query_embeddings = None
+        try:
+            query_embeddings = embedding_service.generate_embeddings_batch(queries)
+        except Exception as e:
+            logger.warning(f"V10 recall_batch: Query embedding failed, retrying in search: {e}")
+
+        async def search_events() -> tuple:
+            if not (include_events and pg_client):
+                return {}, []
+            return await gather_with_timeouts(
+                {
+                    str(i): event_search(
+                        pg_client, query=q, limit=limit, include_evidence=True,
+                        query_embedding=query_embeddings[i] if query_embeddings else None,
+                        rrf_constant=config.rrf_constant
+                    )
+                    for i, q in enumerate(queries)
+                },
+                timeout=config.enrichment_timeout_ms / 1000.0,
+                defaults={str(i): {} for i in range(len(queries))}
+            )
+
+        batch_result, (event_responses, events_failed) = await asyncio.gather(
+            retrieval_service.hybrid_search_batch(
+                queries=queries,
+                limit=limit,
+                expand=expand,
+                graph_budget=graph_budget,
+                graph_filters=gf if gf else None,
+                include_entities=include_entities,
+                context_filter=context,
+                min_importance=min_importance,
+                date_from=date_from,
+                date_to=date_to,
+                graph_depth=graph_depth,
+                include_edges=include_edges,
+                query_embeddings=query_embeddings,
+            ),
+            search_events()
+        )
+
+        batch_dict = batch_result.to_dict()
+        per_query = []
+        for i, (query, v4_dict) in enumerate(zip(queries, batch_dict["results"])):
+            primary_results = [
+                shape_result(r, query=query, snippet_tokens=snippet_tokens, fields=fields)
+                for r in v4_dict.get("primary_results", [])
+            ]
+            for ev in (event_responses.get(str(i)) or {}).get("events", []):
+                primary_results.append({
+                    "type": "event",
+                    "id": ev.get("event_id"),
+                    "category": ev.get("category"),
+                    "narrative": ev.get("narrative"),
+                    "event_time": ev.get("event_time"),
+                    "confidence": ev.get("confidence"),
+                    "evidence": ev.get("evidence", [])
+                })
+            per_query.append({
+                "query": query,
+                "results": primary_results,
+                "related": v4_dict.get("related_context", []) if expand else [],
+                "total_count": len(primary_results)
+            })
+
+        latency_ms = (asyncio.get_running_loop().time() - t_start) * 1000
+        result = {
+            "results": per_query,
+            "entities": batch_dict.get("entities", []) if include_entities else [],
+            "latency_ms": round(latency_ms, 1)
+        }
+        if include_edges:
+            result["edges"] = batch_dict.get("edges", [])
+
+        partial = batch_dict.get("partial", []) + [f"events[{i}]" for i in events_failed]
+        if partial:
+            result["partial"] = partial
+
+        logger.info(f"V10 recall_batch: {len(queries)} queries in {latency_ms:.0f}ms "
+                    f"({latency_ms / len(queries):.0f}ms/query, {payload_bytes(result)} bytes)")
+
+        return result
+
+    except Exception as e:
+        logger.error(f"V10 recall_batch error: {e}", exc_info=True)
+        return {"error": f"Batch search failed: {str(e)}"}
+
+
 @mcp.tool()
 async def forget(
     id: str,
@@ -840,68 +1227,25 @@ async def forget(
 
         # Delete from V6 content collection and chunks
         chroma_deleted = delete_v5_content_cascade(client, id)
+        if local_replica:
+            local_replica.delete_content(id)
+        if lexical_index:
+            lexical_index.delete_content(id)
 
         # Delete events and entities from PostgreSQL
         events_deleted = 0
         entities_deleted = 0
 
-        if pg_client:
+        if pg_client and job_queue_service:
             try:
                 content_hash = id.replace("art_", "")
                 artifact_uid = f"uid_{content_hash}"
 
-                # Delete events and related data
-                # First, get event IDs for this artifact
-                event_rows = await pg_client.fetch_all(
-                    "SELECT event_id FROM semantic_event WHERE artifact_uid = $1",
-                    artifact_uid
-                )
-                event_ids = [row["event_id"] for row in event_rows]
-
-                if event_ids:
-                    # Delete event_evidence
-                    placeholders = ", ".join(f"${i+1}" for i in range(len(event_ids)))
-                    await pg_client.execute(
-                        f"DELETE FROM event_evidence WHERE event_id IN ({placeholders})",
-                        *event_ids
-                    )
-
-                    # Delete event_actor
-                    await pg_client.execute(
-                        f"DELETE FROM event_actor WHERE event_id IN ({placeholders})",
-                        *event_ids
-                    )
-
-                    # Delete event_subject
-                    await pg_client.execute(
-                        f"DELETE FROM event_subject WHERE event_id IN ({placeholders})",
-                        *event_ids
-                    )
-
-                    # Delete semantic_event
-                    result = await pg_client.execute(
-                        f"DELETE FROM semantic_event WHERE event_id IN ({placeholders})",
-                        *event_ids
-                    )
-                    events_deleted = len(event_ids)
-
-                # Delete entity_mention for this artifact
-                mention_result = await pg_client.execute(
-                    "DELETE FROM entity_mention WHERE artifact_uid = $1",
-                    artifact_uid
-                )
-
-                # Delete artifact_revision
-                await pg_client.execute(
-                    "DELETE FROM artifact_revision WHERE artifact_uid = $1",
-                    artifact_uid
-                )
+                # Events, their index rows, mentions, revisions and jobs
+                events_deleted = await job_queue_service.delete_artifact_data(artifact_uid)
 
-                # Delete event_jobs
-                await pg_client.execute(
-                    "DELETE FROM event_jobs WHERE artifact_uid = $1",
-                    artifact_uid
-                )
+                # V10: Conversation turn index rows
+                await delete_turns_for_artifact(pg_client, id)
 
                 logger.info(f"V6 forget: Deleted Postgres data for {artifact_uid}")
 
@@ -979,13 +1323,25 @@ async def status(
                 result["counts"]["content"] = 0
                 result["counts"]["chunks"] = 0
 
+            # V10: Local read replica size (drift vs the counts above means it needs reconcile())
+            if local_replica and local_replica.is_ready:
+                result["services"]["local_replica"] = {
+                    "content": len(local_replica.indexes["content"]),
+                    "chunks": len(local_replica.indexes["chunks"]),
+                    "vector_mb": round(local_replica.nbytes() / 1e6, 1)
+                }
+
+            if lexical_index and lexical_index.is_ready:
+                result["services"]["lexical_index"] = lexical_index.stats()
+
         # Postgres health and counts
         if pg_client:
             try:
                 pg_health = await pg_client.health_check()
                 result["services"]["postgres"] = {
                     "status": pg_health.get("status", "unknown"),
-                    "pool_size": pg_health.get("pool_size", 0)
+                    "pool_size": pg_health.get("pool_size", 0),
+                    "statements": pg_client.statement_stats()  # V10: SQL text reuse vs statement cache size
                 }
                 if pg_health.get("status") != "healthy":
                     result["healthy"] = False
@@ -996,6 +1352,18 @@ async def status(
                 entity_count = await pg_client.fetch_one("SELECT COUNT(*) as count FROM entity")
                 pending_count = await pg_client.fetch_one("SELECT COUNT(*) as count FROM event_jobs WHERE status = 'PENDING'")
 
+                # V10: Extraction cache hit rate across all workers
+                try:
+                    result["services"]["extraction_cache"] = await extraction_cache_stats(pg_client)
+                except Exception as e:
+                    logger.warning(f"V10 status: extraction cache stats unavailable: {e}")
+
+                # V10: LLM merge confirmations avoided by the decision cache
+                try:
+                    result["services"]["merge_decision_cache"] = await merge_decision_cache_stats(pg_client)
+                except Exception as e:
+                    logger.warning(f"V10 status: merge decision cache stats unavailable: {e}")
+
                 result["counts"]["artifacts"] = artifact_count["count"] if artifact_count else 0
                 result["counts"]["events"] = event_count["count"] if event_count else 0
                 result["counts"]["entities"] = entity_count["count"] if entity_count else 0
@@ -1056,12 +1424,50 @@ async def status(
 session_manager: Optional[StreamableHTTPSessionManager] = None
 
 
+def apply_filter_metadata_backfill(content_ids, metadatas, chunk_filter_meta) -> None:
+    """V10: Mirror one page of the filter metadata backfill into the in-process indexes."""
+    for index in (local_replica, lexical_index):
+        if index:
+            index.update_metadata("content", content_ids, metadatas)
+            for content_id, filter_meta in chunk_filter_meta.items():
+                index.update_chunk_metadata(content_id, filter_meta)
+
+
+async def run_filter_metadata_backfill(client) -> None:
+    """
+    V10: Backfill filter metadata off the event loop.
+
+    Pages are applied to the local replica / lexical index on the loop as
+    they complete. Until it finishes, filtered recalls can miss content
+    stored before V10.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        await asyncio.to_thread(
+            backfill_filter_metadata,
+            client,
+            on_update=lambda *page: loop.call_soon_threadsafe(apply_filter_metadata_backfill, *page)
+        )
+    except Exception as e:
+        logger.warning(f"Filter metadata backfill failed: {e}")
+
+
+async def run_conversation_index_backfill(client) -> None:
+    """V10: Backfill the conversation turn index (failures are logged)."""
+    try:
+        await backfill_conversation_index(pg_client, client)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning(f"Conversation turn index backfill failed: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app):
     """Application lifespan - startup/shutdown."""
     global config, embedding_service, chunking_service, retrieval_service
     global privacy_service, chroma_manager, session_manager
-    global pg_client, job_queue_service
+    global pg_client, job_queue_service, graph_cache, local_replica, lexical_index
 
     logger.info("=" * 60)
     logger.info(f"Starting MCP Memory Server v{__version__}")
@@ -1091,6 +1497,33 @@ async def lifespan(app):
 
         logger.info(f"  ChromaDB: OK (latency={chroma_health.get('latency_ms')}ms)")
 
+        # V10: Optional local read replica (snapshot + reconcile, or full warm from Chroma)
+        if config.local_replica_enabled:
+            logger.info("Initializing local read replica...")
+            local_replica = LocalVectorReplica(dimensions=config.openai_embed_dims)
+            try:
+                snapshot = config.local_replica_snapshot_path
+                if snapshot and os.path.exists(snapshot):
+                    local_replica.load_snapshot(snapshot)
+                    local_replica.reconcile(chroma_manager.get_client())
+                else:
+                    local_replica.warm_from_chroma(chroma_manager.get_client())
+                logger.info("  Local replica: OK")
+            except Exception as e:
+                logger.warning(f"  Local replica: UNAVAILABLE ({e}) - querying Chroma directly")
+                local_replica = None
+
+        # V10: BM25 lexical index over content/chunks text
+        if config.lexical_index_enabled:
+            logger.info("Initializing lexical index...")
+            lexical_index = LexicalIndex()
+            try:
+                lexical_index.warm_from_chroma(chroma_manager.get_client())
+                logger.info("  Lexical index: OK")
+            except Exception as e:
+                logger.warning(f"  Lexical index: UNAVAILABLE ({e}) - vector search only")
+                lexical_index = None
+
         # Initialize embedding service
         logger.info("Initializing EmbeddingService...")
         embedding_service = EmbeddingService(
@@ -1148,6 +1581,17 @@ async def lifespan(app):
             pg_client = None
             job_queue_service = None
 
+        # V10: In-memory graph cache (SQL expansion remains the fallback)
+        if pg_client and config.graph_cache_enabled:
+            logger.info("Initializing GraphCache...")
+            graph_cache = GraphCache(refresh_seconds=config.graph_cache_refresh_seconds)
+            try:
+                await graph_cache.build(pg_client)
+                logger.info(f"  GraphCache: OK (refresh every {config.graph_cache_refresh_seconds}s)")
+            except Exception as e:
+                logger.warning(f"  GraphCache: initial build failed ({e}) - retrying in background")
+            graph_cache.start(pg_client)
+
         # Initialize retrieval service (graph expansion via SQL joins)
         logger.info("Initializing RetrievalService...")
         retrieval_service = RetrievalService(
@@ -1155,10 +1599,28 @@ async def lifespan(app):
             chunking_service=chunking_service,
             chroma_client=chroma_manager.get_client(),
             k=config.rrf_constant,
-            pg_client=pg_client
+            pg_client=pg_client,
+            graph_cache=graph_cache,
+            enrichment_timeout=config.enrichment_timeout_ms / 1000.0,
+            local_replica=local_replica,
+            lexical_index=lexical_index
         )
         logger.info(f"  RetrievalService: OK (graph_expand={'enabled' if pg_client else 'disabled'})")
 
+        # V10: Add importance/ts_epoch and chunk filter fields to content stored
+        # before V10, in the background (after the in-process indexes are warm)
+        filter_backfill_task = asyncio.create_task(
+            run_filter_metadata_backfill(chroma_manager.get_client())
+        )
+
+        # V10: Index conversation turns missing from the turn index (stored
+        # before it existed or while Postgres was down), in the background
+        conversation_backfill_task = None
+        if pg_client:
+            conversation_backfill_task = asyncio.create_task(
+                run_conversation_index_backfill(chroma_manager.get_client())
+            )
+
         # Create session manager
         session_manager = StreamableHTTPSessionManager(
             app=mcp._mcp_server,
@@ -1173,6 +1635,19 @@ async def lifespan(app):
             logger.info("=" * 60)
             yield
 
+        filter_backfill_task.cancel()
+        if conversation_backfill_task:
+            conversation_backfill_task.cancel()
+
+        if graph_cache:
+            await graph_cache.stop()
+
+        if local_replica and config.local_replica_snapshot_path:
+            try:
+                local_replica.save_snapshot(config.local_replica_snapshot_path)
+            except Exception as e:
+                logger.warning(f"Failed to save local replica snapshot: {e}")
+
     except Exception as e:
         logger.error(f"Failed to start server: {e}", exc_info=True)
         raise
@@ -129,7 +129,8 @@ class ChunkingService:
         Args:
             artifact_id: Artifact ID
             chunk_index: Index of target chunk
-            all_chunks: All chunks for artifact (sorted by chunk_index)
+            all_chunks: Chunks for the artifact - all of them, or (V10) just the
+                target and its neighbors as fetched by get_v5_chunk_neighbors
 
         Returns:
             Combined text with [CHUNK BOUNDARY] markers
@@ -137,34 +138,18 @@ class ChunkingService:
         if not all_chunks:
             return ""
 
-        # Find target chunk
-        target = None
-        for chunk in all_chunks:
-            if chunk.chunk_index == chunk_index:
-                target = chunk
-                break
+        # V10: Index by chunk_index once; neighbors are O(1) lookups
+        by_index = {chunk.chunk_index: chunk for chunk in all_chunks}
 
+        target = by_index.get(chunk_index)
         if target is None:
             logger.warning(
                 f"Chunk index {chunk_index} not found for artifact {artifact_id}"
             )
             return ""
 
-        # Find neighbors
-        prev_chunk = None
-        next_chunk = None
-
-        if chunk_index > 0:
-            for chunk in all_chunks:
-                if chunk.chunk_index == chunk_index - 1:
-                    prev_chunk = chunk
-                    break
-
-        if chunk_index < len(all_chunks) - 1:
-            for chunk in all_chunks:
-                if chunk.chunk_index == chunk_index + 1:
-                    next_chunk = chunk
-                    break
+        prev_chunk = by_index.get(chunk_index - 1)
+        next_chunk = by_index.get(chunk_index + 1)
 
         # Build combined text
         parts = []
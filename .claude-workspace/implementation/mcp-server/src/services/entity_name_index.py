@@ -0,0 +1,196 @@
+"""
+In-process entity name and alias dictionary (V10).
+
+Maps (entity_type, normalized name) -> entity for every canonical name and
+alias, so exact-match resolution needs no query. Loaded from Postgres when
+the worker starts and kept current by the entity_names NOTIFY channel
+(triggers on entity inserts/renames and entity_alias inserts), so entities
+created by other workers show up within one notification round trip.
+
+Lookups follow the SQL exact match:
+- canonical names win over aliases; the oldest entity wins a shared name
+- an alias shared by several entities is ambiguous and never matches
+- a miss falls through to Postgres, so the dictionary only ever saves I/O
+
+While the listening connection is down the dictionary is not used; it is
+reloaded once the connection is back.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+
+logger = logging.getLogger("entity_resolution.name_index")
+
+# V10: NOTIFY channel fed by the entity/entity_alias triggers (migration 017)
+ENTITY_NAMES_CHANNEL = "entity_names"
+
+# Alias claimed by more than one entity
+_AMBIGUOUS = None
+
+
+class EntityNameIndex:
+    """Normalized names and aliases -> (entity_id, canonical_name), per entity type."""
+
+    def __init__(self, pg_client):
+        """
+        Initialize entity name index.
+
+        Args:
+            pg_client: Postgres client instance (async)
+        """
+        self.pg = pg_client
+        self._names: Dict[Tuple[str, str], UUID] = {}
+        self._aliases: Dict[Tuple[str, str], Optional[UUID]] = {}
+        self._canonical: Dict[UUID, str] = {}
+        self._listen_conn = None
+        self._pending: Optional[list] = None
+        self.ready = False
+        self.hits = 0
+        self.misses = 0
+
+    async def start(self) -> None:
+        """
+        Listen for name changes, then load the dictionary.
+
+        Listening starts first; notifications that arrive during the load are
+        replayed on top of it.
+        """
+        self._pending = []
+        self._listen_conn = await self.pg.listen(ENTITY_NAMES_CHANNEL, self._on_notification)
+        try:
+            await self._load()
+        except Exception:
+            await self.stop()
+            raise
+
+    async def stop(self) -> None:
+        """Stop listening; lookups miss until start() runs again."""
+        self.ready = False
+        if self._listen_conn is not None:
+            try:
+                await self._listen_conn.close()
+            except Exception as e:
+                logger.warning(f"Failed to close entity name listener: {e}")
+            self._listen_conn = None
+
+    async def ensure_current(self) -> bool:
+        """
+        Reconnect and reload if the listening connection was lost.
+
+        Returns:
+            True if lookups can be served from memory
+        """
+        if self._listen_conn is not None and self._listen_conn.is_closed():
+            logger.warning("Entity name listener connection lost, reloading")
+            self.ready = False
+            self._listen_conn = None
+            try:
+                await self.start()
+            except Exception as e:
+                logger.warning(f"Entity name index unavailable, using Postgres: {e}")
+        return self.ready
+
+    async def _load(self) -> None:
+        names: Dict[Tuple[str, str], UUID] = {}
+        canonical: Dict[UUID, str] = {}
+        rows = await self.pg.fetch_all(
+            """
+            SELECT entity_id, entity_type, canonical_name, normalized_name
+            FROM entity
+            ORDER BY created_at
+            """
+        )
+        for row in rows:
+            names.setdefault((row["entity_type"], row["normalized_name"]), row["entity_id"])
+            canonical[row["entity_id"]] = row["canonical_name"]
+
+        aliases: Dict[Tuple[str, str], Optional[UUID]] = {}
+        alias_rows = await self.pg.fetch_all(
+            """
+            SELECT a.entity_id, e.entity_type, a.normalized_alias
+            FROM entity_alias a
+            JOIN entity e ON e.entity_id = a.entity_id
+            """
+        )
+        for row in alias_rows:
+            self._add_alias(aliases, (row["entity_type"], row["normalized_alias"]), row["entity_id"])
+
+        self._names, self._aliases, self._canonical = names, aliases, canonical
+        pending, self._pending = self._pending or [], None
+        for change in pending:
+            self._apply(change)
+        self.ready = True
+        logger.info(f"Entity name index loaded: {len(names)} names, {len(aliases)} aliases")
+
+    def lookup(self, entity_type: str, normalized_name: str) -> Optional[Tuple[UUID, str]]:
+        """
+        Exact match on a canonical name, then on an unambiguous alias.
+
+        Args:
+            entity_type: Entity type
+            normalized_name: Normalized mention name
+
+        Returns:
+            (entity_id, canonical_name) or None (not loaded, unknown or ambiguous)
+        """
+        if not self.ready:
+            return None
+        key = (entity_type, normalized_name)
+        entity_id = self._names.get(key) or self._aliases.get(key)
+        canonical_name = self._canonical.get(entity_id) if entity_id else None
+        if canonical_name is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entity_id, canonical_name
+
+    def _on_notification(self, payload: str) -> None:
+        try:
+            change = json.loads(payload)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Bad entity name notification: {e}")
+            return
+        if self._pending is not None:
+            self._pending.append(change)
+        self._apply(change)
+
+    def _apply(self, change: Dict[str, Any]) -> None:
+        """Apply one entity_names notification."""
+        try:
+            entity_id = UUID(change["entity_id"])
+            key = (change["entity_type"], change["name"])
+            if change["kind"] == "alias":
+                self._add_alias(self._aliases, key, entity_id)
+                return
+
+            old_name = change.get("old_name")
+            if old_name and old_name != change["name"]:
+                old_key = (change["entity_type"], old_name)
+                if self._names.get(old_key) == entity_id:
+                    del self._names[old_key]
+            self._names.setdefault(key, entity_id)
+            self._canonical[entity_id] = change["canonical_name"]
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Bad entity name notification {change}: {e}")
+
+    @staticmethod
+    def _add_alias(aliases: Dict, key: Tuple[str, str], entity_id: UUID) -> None:
+        if key not in aliases:
+            aliases[key] = entity_id
+        elif aliases[key] != entity_id:
+            aliases[key] = _AMBIGUOUS
+
+    def stats(self) -> Dict[str, Any]:
+        """Dictionary size and in-process hit counters since startup."""
+        total = self.hits + self.misses
+        return {
+            "ready": self.ready,
+            "names": len(self._names),
+            "aliases": len(self._aliases),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
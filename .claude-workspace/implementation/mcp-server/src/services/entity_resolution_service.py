@@ -9,10 +9,14 @@ Key features:
 - Quality-first approach: conservative merges, uncertain cases flagged for review
 - Embedding-based candidate search reduces LLM calls to O(candidates), not O(n^2)
 - Full evidence trail preserved via entity_mention table
+- V10: Confident LLM merge decisions are cached and reused across documents
+- V10: Exact matches (names and aliases) served from an in-memory dictionary
 """
 
+import asyncio
 import json
 import logging
+import math
 import re
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
@@ -20,6 +24,9 @@ from uuid import UUID, uuid4
 
 from openai import OpenAI
 
+from services.entity_name_index import EntityNameIndex
+from services.merge_decision_cache import MergeDecisionCache, context_hash
+
 logger = logging.getLogger("entity_resolution")
 
 
@@ -71,6 +78,7 @@ class MergeDecision:
     decision: str       # "same" | "different" | "uncertain"
     canonical_name: str # Best name to use (if "same")
     reason: str         # Explanation for the decision
+    confidence: float = 0.0  # V10: LLM confidence; only confident decisions are cached
 
 
 @dataclass
@@ -153,7 +161,8 @@ Return JSON:
 {
   "decision": "same|different|uncertain",
   "canonical_name": "Full name to use if same, otherwise the name from entity A",
-  "reason": "Brief explanation (1-2 sentences)"
+  "reason": "Brief explanation (1-2 sentences)",
+  "confidence": 0.0-1.0
 }"""
 
 
@@ -198,7 +207,9 @@ class EntityResolutionService:
         openai_api_key: Optional[str] = None,
         similarity_threshold: float = 0.85,
         max_candidates: int = 5,
-        model: str = "gpt-4o-mini"
+        model: str = "gpt-4o-mini",
+        decision_cache: Optional[MergeDecisionCache] = None,
+        name_index: Optional[EntityNameIndex] = None
     ):
         """
         Initialize entity resolution service.
@@ -211,6 +222,8 @@ class EntityResolutionService:
             similarity_threshold: Minimum similarity for candidates (default: 0.85)
             max_candidates: Maximum candidates to consider (default: 5)
             model: LLM model for confirmation (default: gpt-4o-mini)
+            decision_cache: V10: Merge decisions reused before calling the LLM
+            name_index: V10: In-memory names and aliases consulted before Postgres
         """
         self.pg = pg_client
         self.embedding_service = embedding_service
@@ -218,6 +231,8 @@ class EntityResolutionService:
         self.similarity_threshold = similarity_threshold
         self.max_candidates = max_candidates
         self.model = model
+        self.decision_cache = decision_cache
+        self.name_index = name_index
 
         # Track uncertain pairs to create POSSIBLY_SAME edges
         self._uncertain_pairs: List[Tuple[UUID, UUID, float, str]] = []
@@ -455,6 +470,232 @@ class EntityResolutionService:
             doc_title=doc_title
         )
 
+    async def resolve_entities_batch(
+        self,
+        entities: List[ExtractedEntity],
+        artifact_uid: str,
+        revision_id: str,
+        doc_title: Optional[str] = None
+    ) -> List[EntityResolutionResult]:
+        """
+        V10: Resolve all entities of one document with set-based queries.
+
+        Same decisions as calling resolve_extracted_entity for each entity in
+        order, but with one exact-match query, one embedding call (context
+        and name embeddings together), one candidate query, concurrent LLM
+        confirmations, and multi-row inserts for entities, aliases and
+        mentions.
+
+        Entities created earlier in the batch are candidates for later ones,
+        as they would be when resolving one at a time. An entity whose nearby
+        earlier entities are still undecided waits for them: confirmations
+        run in waves, each wave concurrently.
+
+        Args:
+            entities: Entities extracted from the document (deduplicated)
+            artifact_uid: Document identifier
+            revision_id: Document version
+            doc_title: Document title for LLM context
+
+        Returns:
+            One EntityResolutionResult per entity, in input order
+
+        Raises:
+            EntityResolutionError: If resolution fails (nothing is written
+                before the embedding and candidate steps succeed)
+        """
+        if not entities:
+            return []
+
+        normalized = [self._normalize_name(e.canonical_suggestion) for e in entities]
+
+        # Entities sharing (type, normalized name) follow the first one: when
+        # resolving one at a time the later ones exact-match the earlier one
+        leader: Dict[Tuple[str, str], int] = {}
+        for i, e in enumerate(entities):
+            leader.setdefault((e.entity_type, normalized[i]), i)
+        leaders = sorted(leader.values())
+
+        results: Dict[int, EntityResolutionResult] = {}
+        creates: List[Tuple[Entity, str, Optional[str]]] = []
+        merges: List[Tuple[str, UUID, str]] = []
+        aliases: List[Tuple[UUID, str]] = []
+
+        try:
+            # Step 1: Exact normalized name matches for all leaders (V10: name index first)
+            exact = await self._find_exact_matches(
+                [(entities[i].entity_type, normalized[i]) for i in leaders]
+            )
+            pending = []
+            for i in leaders:
+                existing = exact.get((entities[i].entity_type, normalized[i]))
+                if existing:
+                    results[i] = EntityResolutionResult(
+                        entity_id=existing.entity_id,
+                        is_new=False,
+                        merged_from=existing.entity_id,
+                        canonical_name=existing.canonical_name
+                    )
+                else:
+                    pending.append(i)
+
+            if pending:
+                # Step 2: Context and name embeddings in one call
+                texts = [
+                    self._context_text(
+                        entities[i].canonical_suggestion,
+                        entities[i].entity_type,
+                        entities[i].context_clues.role,
+                        entities[i].context_clues.organization
+                    )
+                    for i in pending
+                ] + [entities[i].canonical_suggestion for i in pending]
+                try:
+                    embeddings = await asyncio.to_thread(self.embedding_service.generate_embeddings_batch, texts)
+                except Exception as e:
+                    raise EmbeddingGenerationError(f"Embedding generation failed: {e}")
+                context_embeddings = dict(zip(pending, embeddings[:len(pending)]))
+                name_embeddings = dict(zip(pending, embeddings[len(pending):]))
+
+                # Step 3: Candidates for every pending entity in one query
+                db_candidates = await self.find_dedup_candidates_batch(
+                    [(entities[i].entity_type, context_embeddings[i]) for i in pending]
+                )
+                db_candidates = dict(zip(pending, db_candidates))
+
+                # Earlier pending entities close enough to become candidates
+                distance_threshold = 1 - self.similarity_threshold
+                depends_on: Dict[int, List[Tuple[int, float]]] = {}
+                for pos, i in enumerate(pending):
+                    depends_on[i] = []
+                    for j in pending[:pos]:
+                        if entities[j].entity_type != entities[i].entity_type:
+                            continue
+                        distance = self._cosine_distance(context_embeddings[i], context_embeddings[j])
+                        if distance < distance_threshold:
+                            depends_on[i].append((j, distance))
+
+                # Step 4: LLM confirmation in waves
+                created: Dict[int, Entity] = {}
+                unresolved = list(pending)
+                while unresolved:
+                    ready = [i for i in unresolved if all(j in results for j, _ in depends_on[i])]
+                    unresolved = [i for i in unresolved if i not in ready]
+
+                    candidates = {}
+                    for i in ready:
+                        ranked = list(db_candidates[i]) + [
+                            (created[j], distance) for j, distance in depends_on[i] if j in created
+                        ]
+                        ranked.sort(key=lambda c: c[1])
+                        candidates[i] = [entity for entity, _ in ranked[:self.max_candidates]]
+
+                    to_confirm = [i for i in ready if candidates[i]]
+                    decisions = dict(zip(to_confirm, await asyncio.gather(*(
+                        self._evaluate_candidates(
+                            new_name=entities[i].canonical_suggestion,
+                            new_type=entities[i].entity_type,
+                            new_context=entities[i].context_clues,
+                            candidates=candidates[i],
+                            doc_title=doc_title or artifact_uid
+                        )
+                        for i in to_confirm
+                    ))))
+
+                    for i in ready:
+                        e = entities[i]
+                        decision = decisions.get(i)
+
+                        if decision and decision.decision == "same":
+                            best_candidate = candidates[i][0]
+                            merges.append((e.surface_form, best_candidate.entity_id, decision.canonical_name))
+                            if self._normalize_name(e.surface_form) != best_candidate.normalized_name:
+                                aliases.append((best_candidate.entity_id, e.surface_form))
+                            results[i] = EntityResolutionResult(
+                                entity_id=best_candidate.entity_id,
+                                is_new=False,
+                                merged_from=best_candidate.entity_id,
+                                canonical_name=decision.canonical_name
+                            )
+                            continue
+
+                        needs_review = bool(decision and decision.decision == "uncertain")
+                        entity = Entity(
+                            entity_id=uuid4(),
+                            entity_type=e.entity_type,
+                            canonical_name=e.canonical_suggestion,
+                            normalized_name=normalized[i],
+                            role=e.context_clues.role,
+                            organization=e.context_clues.organization,
+                            email=e.context_clues.email,
+                            first_seen_artifact_uid=artifact_uid,
+                            first_seen_revision_id=revision_id,
+                            needs_review=needs_review
+                        )
+                        created[i] = entity
+                        creates.append((
+                            entity,
+                            self._vector_literal(context_embeddings[i]),
+                            self._vector_literal(name_embeddings[i]) if name_embeddings[i] else None
+                        ))
+
+                        if needs_review:
+                            # Track uncertain pair for POSSIBLY_SAME edge
+                            self._uncertain_pairs.append((
+                                entity.entity_id,
+                                candidates[i][0].entity_id,
+                                self.similarity_threshold,
+                                decision.reason
+                            ))
+
+                        results[i] = EntityResolutionResult(
+                            entity_id=entity.entity_id,
+                            is_new=True,
+                            uncertain_match=candidates[i][0].entity_id if needs_review else None,
+                            canonical_name=e.canonical_suggestion
+                        )
+
+            # Aliases from the document (not for exact matches, as in resolve_entity)
+            for i in pending:
+                for alias in entities[i].aliases_in_doc:
+                    if self._normalize_name(alias) != self._normalize_name(results[i].canonical_name):
+                        aliases.append((results[i].entity_id, alias))
+
+            for i, e in enumerate(entities):
+                if i not in results:
+                    lead = results[leader[(e.entity_type, normalized[i])]]
+                    results[i] = EntityResolutionResult(
+                        entity_id=lead.entity_id,
+                        is_new=False,
+                        merged_from=lead.entity_id,
+                        canonical_name=lead.canonical_name
+                    )
+
+            # Step 5: Writes - new entities, then merges (which may target
+            # them), then aliases and mentions together
+            if creates:
+                await self._insert_entities(creates)
+            for surface_form, entity_id, canonical_name in merges:
+                await self.merge_entity(surface_form, entity_id, canonical_name)
+            await self._insert_aliases_and_mentions(
+                aliases,
+                [(results[i].entity_id, e) for i, e in enumerate(entities)],
+                artifact_uid,
+                revision_id
+            )
+
+        except EntityResolutionError:
+            raise
+        except Exception as e:
+            logger.error(f"Batch entity resolution failed: {e}", exc_info=True)
+            raise EntityResolutionError(f"Failed to resolve {len(entities)} entities: {e}")
+
+        logger.info(
+            f"Resolved {len(entities)} entities in batch: {len(creates)} new, "
+            f"{len(merges)} merged, {len(entities) - len(creates) - len(merges)} exact"
+        )
+        return [results[i] for i in range(len(entities))]
+
     def get_uncertain_pairs(self) -> List[Tuple[UUID, UUID, float, str]]:
         """
         Get uncertain entity pairs for POSSIBLY_SAME edges.
@@ -488,22 +729,122 @@ class EntityResolutionService:
         Returns:
             Embedding vector (3072 dimensions for text-embedding-3-large)
         """
-        # Build context string
-        parts = [canonical_name, entity_type]
-        if role:
-            parts.append(role)
-        if organization:
-            parts.append(organization)
-
-        context_text = ", ".join(parts)
+        context_text = self._context_text(canonical_name, entity_type, role, organization)
 
         try:
-            embedding = self.embedding_service.generate_embedding(context_text)
+            # V10: Blocking client off the event loop (concurrent worker jobs)
+            embedding = await asyncio.to_thread(self.embedding_service.generate_embedding, context_text)
             return embedding
         except Exception as e:
             logger.error(f"Failed to generate context embedding: {e}")
             raise EmbeddingGenerationError(f"Embedding generation failed: {e}")
 
+    async def generate_name_embedding(self, canonical_name: str) -> Optional[List[float]]:
+        """
+        Generate embedding for an entity's canonical name.
+
+        Stored in entity.name_embedding so recall triplet scoring can compare
+        the query against connecting entity names without an embedding call.
+        Failure is non-fatal: the entity is created without it and picked up
+        by the backfill later.
+
+        Args:
+            canonical_name: Entity's canonical name
+
+        Returns:
+            Embedding vector, or None if generation failed
+        """
+        try:
+            return await asyncio.to_thread(self.embedding_service.generate_embedding, canonical_name)
+        except Exception as e:
+            logger.warning(f"Failed to generate name embedding for '{canonical_name}': {e}")
+            return None
+
+    async def _embed_names(self, names: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embed names with one batched call, falling back to one call per name.
+
+        The fallback runs when the batch fails or returns the wrong number of
+        vectors, so one bad name cannot block the rest of its batch.
+
+        Returns:
+            One embedding (or None if that name failed) per input name
+        """
+        try:
+            embeddings = await asyncio.to_thread(self.embedding_service.generate_embeddings_batch, names)
+            if len(embeddings) == len(names):
+                return embeddings
+            logger.warning(f"Name embedding batch returned {len(embeddings)} vectors for {len(names)} names")
+        except Exception as e:
+            logger.warning(f"Name embedding batch failed, embedding one by one: {e}")
+
+        return [await self.generate_name_embedding(name) for name in names]
+
+    async def backfill_name_embeddings(self, batch_size: int = 100) -> int:
+        """
+        Fill entity.name_embedding for entities created before it existed.
+
+        Walks the entities still missing one in (created_at, entity_id) order
+        with one batched embedding call per page. Entities with a blank name or
+        whose embedding fails are skipped (and retried on the next run), so they
+        never hold up the rest. Stops early if a whole page fails.
+
+        Args:
+            batch_size: Entities per embedding call
+
+        Returns:
+            Number of entities updated
+        """
+        updated = 0
+        skipped = 0
+        after_created_at, after_entity_id = None, None
+
+        while True:
+            rows = await self.pg.fetch_all(
+                """
+                SELECT entity_id, canonical_name, created_at
+                FROM entity
+                WHERE name_embedding IS NULL
+                  AND ($2::timestamptz IS NULL OR (created_at, entity_id) > ($2, $3::uuid))
+                ORDER BY created_at, entity_id
+                LIMIT $1
+                """,
+                batch_size,
+                after_created_at,
+                after_entity_id
+            )
+
+            if not rows:
+                break
+            after_created_at, after_entity_id = rows[-1]["created_at"], rows[-1]["entity_id"]
+
+            named = [row for row in rows if (row["canonical_name"] or "").strip()]
+            embeddings = await self._embed_names([row["canonical_name"] for row in named]) if named else []
+            updates = [
+                (self._vector_literal(embedding), row["entity_id"])
+                for row, embedding in zip(named, embeddings)
+                if embedding is not None
+            ]
+            skipped += len(rows) - len(updates)
+
+            if updates:
+                async with self.pg.acquire() as conn:
+                    await conn.executemany(
+                        "UPDATE entity SET name_embedding = $1::vector WHERE entity_id = $2",
+                        updates
+                    )
+                updated += len(updates)
+            elif named:
+                logger.warning(f"Name embedding backfill stopped after {updated} entities: no embeddings returned")
+                break
+
+            if len(rows) < batch_size:
+                break
+
+        if updated or skipped:
+            logger.info(f"Backfilled name embeddings for {updated} entities ({skipped} skipped)")
+        return updated
+
     async def find_dedup_candidates(
         self,
         entity_type: str,
@@ -543,7 +884,7 @@ class EntityResolutionService:
             """
 
             # Convert embedding to string format for pgvector
-            embedding_str = "[" + ",".join(str(x) for x in context_embedding) + "]"
+            embedding_str = self._vector_literal(context_embedding)
 
             rows = await self.pg.fetch_all(
                 query,
@@ -553,20 +894,7 @@ class EntityResolutionService:
                 self.max_candidates
             )
 
-            candidates = []
-            for row in rows:
-                candidates.append(Entity(
-                    entity_id=row["entity_id"],
-                    entity_type=row["entity_type"],
-                    canonical_name=row["canonical_name"],
-                    normalized_name=row["normalized_name"],
-                    role=row.get("role"),
-                    organization=row.get("organization"),
-                    email=row.get("email"),
-                    first_seen_artifact_uid=row["first_seen_artifact_uid"],
-                    first_seen_revision_id=row["first_seen_revision_id"],
-                    needs_review=row.get("needs_review", False)
-                ))
+            candidates = [self._entity_from_row(row) for row in rows]
 
             logger.info(f"Found {len(candidates)} dedup candidates for {entity_type}")
             return candidates
@@ -575,6 +903,69 @@ class EntityResolutionService:
             logger.error(f"Failed to find dedup candidates: {e}")
             raise DedupCandidateError(f"Candidate search failed: {e}")
 
+    async def find_dedup_candidates_batch(
+        self,
+        queries: List[Tuple[str, List[float]]],
+        threshold: Optional[float] = None
+    ) -> List[List[Tuple[Entity, float]]]:
+        """
+        V10: find_dedup_candidates for many embeddings in one query.
+
+        Args:
+            queries: (entity_type, context_embedding) pairs
+            threshold: Similarity threshold (default: self.similarity_threshold)
+
+        Returns:
+            Per query, (candidate, cosine distance) pairs ordered by distance
+        """
+        if not queries:
+            return []
+
+        threshold = threshold or self.similarity_threshold
+        distance_threshold = 1 - threshold
+
+        try:
+            query = """
+            WITH q AS (
+                SELECT u.idx, u.entity_type, u.embedding::vector AS embedding
+                FROM unnest($1::text[], $2::text[]) WITH ORDINALITY AS u(entity_type, embedding, idx)
+            )
+            SELECT q.idx, c.*
+            FROM q
+            CROSS JOIN LATERAL (
+                SELECT entity_id, entity_type, canonical_name, normalized_name,
+                       role, organization, email,
+                       first_seen_artifact_uid, first_seen_revision_id, needs_review,
+                       (context_embedding <=> q.embedding) AS distance
+                FROM entity
+                WHERE entity_type = q.entity_type
+                  AND context_embedding IS NOT NULL
+                  AND (context_embedding <=> q.embedding) < $3
+                ORDER BY context_embedding <=> q.embedding
+                LIMIT $4
+            ) c
+            ORDER BY q.idx, c.distance
+            """
+
+            rows = await self.pg.fetch_all(
+                query,
+                [entity_type for entity_type, _ in queries],
+                [self._vector_literal(embedding) for _, embedding in queries],
+                distance_threshold,
+                self.max_candidates
+            )
+
+            candidates: List[List[Tuple[Entity, float]]] = [[] for _ in queries]
+            for row in rows:
+                candidates[row["idx"] - 1].append((self._entity_from_row(row), row["distance"]))
+
+            logger.info(f"Found {len(rows)} dedup candidates for {len(queries)} entities")
+            return candidates
+
+        except Exception as e:
+            logger.error(f"Failed to find dedup candidates: {e}")
+            raise DedupCandidateError(f"Candidate search failed: {e}")
+
     async def confirm_merge_with_llm(
         self,
         entity_a_name: str,
@@ -625,7 +1016,8 @@ class EntityResolutionService:
         )
 
         try:
-            response = self.openai_client.chat.completions.create(
+            response = await asyncio.to_thread(
+                self.openai_client.chat.completions.create,
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.0,
@@ -640,10 +1032,16 @@ class EntityResolutionService:
             if decision not in ["same", "different", "uncertain"]:
                 decision = "uncertain"
 
+            try:
+                confidence = float(result.get("confidence", 0.0))
+            except (TypeError, ValueError):
+                confidence = 0.0
+
             return MergeDecision(
                 decision=decision,
                 canonical_name=result.get("canonical_name", entity_a_name),
-                reason=result.get("reason", "No reason provided")
+                reason=result.get("reason", "No reason provided"),
+                confidence=confidence
             )
 
         except json.JSONDecodeError as e:
@@ -685,14 +1083,19 @@ class EntityResolutionService:
             New entity_id
         """
         entity_id = uuid4()
-        embedding_str = "[" + ",".join(str(x) for x in context_embedding) + "]"
+        embedding_str = self._vector_literal(context_embedding)
+
+        # V10: Name embedding for triplet scoring (NULL is backfilled later)
+        name_embedding = await self.generate_name_embedding(canonical_name)
+        name_embedding_str = self._vector_literal(name_embedding) if name_embedding else None
 
         query = """
         INSERT INTO entity (
             entity_id, entity_type, canonical_name, normalized_name,
             role, organization, email, context_embedding,
-            first_seen_artifact_uid, first_seen_revision_id, needs_review
-        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8::vector, $9, $10, $11)
+            first_seen_artifact_uid, first_seen_revision_id, needs_review,
+            name_embedding
+        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8::vector, $9, $10, $11, $12::vector)
         RETURNING entity_id
         """
 
@@ -708,7 +1111,8 @@ class EntityResolutionService:
             embedding_str,
             artifact_uid,
             revision_id,
-            needs_review
+            needs_review,
+            name_embedding_str
         )
 
         logger.info(f"Created entity: {entity_id} ({canonical_name})")
@@ -741,18 +1145,25 @@ class EntityResolutionService:
             )
 
             if current and len(new_canonical_name) > len(current["canonical_name"]):
+                # Keep name_embedding in step with the name (NULL is backfilled later)
+                name_embedding = await self.generate_name_embedding(new_canonical_name)
                 await self.pg.execute(
                     """
                     UPDATE entity
-                    SET canonical_name = $1, normalized_name = $2
-                    WHERE entity_id = $3
+                    SET canonical_name = $1, normalized_name = $2, name_embedding = $3::vector
+                    WHERE entity_id = $4
                     """,
                     new_canonical_name,
                     self._normalize_name(new_canonical_name),
+                    self._vector_literal(name_embedding) if name_embedding else None,
                     existing_entity_id
                 )
                 logger.info(f"Updated entity {existing_entity_id} canonical name to '{new_canonical_name}'")
 
+                # V10: Cached decisions were made against the old name
+                if self.decision_cache:
+                    await self.decision_cache.invalidate(existing_entity_id)
+
         return existing_entity_id
 
     async def add_alias(
@@ -825,32 +1236,176 @@ class EntityResolutionService:
         return mention_id
 
     async def _find_exact_match(self, entity_type: str, normalized_name: str) -> Optional[Entity]:
-        """Find entity by exact normalized name match."""
+        """Find entity by exact normalized name or unambiguous alias match."""
+        found = await self._find_exact_matches([(entity_type, normalized_name)])
+        return found.get((entity_type, normalized_name))
+
+    async def _find_exact_matches(
+        self,
+        keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Entity]:
+        """
+        V10: Exact matches for many (entity_type, normalized_name) keys in one query.
+
+        Same rules as the name index (which is consulted first): a canonical
+        name wins over an alias, the oldest entity wins a shared name, and an
+        alias claimed by more than one entity of the type never matches.
+        """
+        found = await self._find_indexed_matches(keys)
+        keys = [key for key in keys if key not in found]
+        if not keys:
+            return found
+
         query = """
-        SELECT entity_id, entity_type, canonical_name, normalized_name,
-               role, organization, email,
-               first_seen_artifact_uid, first_seen_revision_id, needs_review
-        FROM entity
-        WHERE entity_type = $1 AND normalized_name = $2
-        LIMIT 1
-        """
-
-        row = await self.pg.fetch_one(query, entity_type, normalized_name)
-
-        if row:
-            return Entity(
-                entity_id=row["entity_id"],
-                entity_type=row["entity_type"],
-                canonical_name=row["canonical_name"],
-                normalized_name=row["normalized_name"],
-                role=row.get("role"),
-                organization=row.get("organization"),
-                email=row.get("email"),
-                first_seen_artifact_uid=row["first_seen_artifact_uid"],
-                first_seen_revision_id=row["first_seen_revision_id"],
-                needs_review=row.get("needs_review", False)
+        WITH k AS (
+            SELECT * FROM unnest($1::text[], $2::text[]) AS k(entity_type, normalized_name)
+        ),
+        matches AS (
+            SELECT k.normalized_name AS key_name, 0 AS priority, e.entity_id
+            FROM k
+            JOIN entity e ON e.entity_type = k.entity_type AND e.normalized_name = k.normalized_name
+            UNION ALL
+            SELECT k.normalized_name, 1, a.entity_id
+            FROM k
+            JOIN entity_alias a ON a.normalized_alias = k.normalized_name
+            JOIN entity e ON e.entity_id = a.entity_id AND e.entity_type = k.entity_type
+            WHERE NOT EXISTS (
+                SELECT 1
+                FROM entity_alias a2
+                JOIN entity e2 ON e2.entity_id = a2.entity_id
+                WHERE a2.normalized_alias = a.normalized_alias
+                  AND e2.entity_type = k.entity_type
+                  AND a2.entity_id <> a.entity_id
             )
-        return None
+        )
+        SELECT DISTINCT ON (e.entity_type, m.key_name)
+               m.key_name,
+               e.entity_id, e.entity_type, e.canonical_name, e.normalized_name,
+               e.role, e.organization, e.email,
+               e.first_seen_artifact_uid, e.first_seen_revision_id, e.needs_review
+        FROM matches m
+        JOIN entity e ON e.entity_id = m.entity_id
+        ORDER BY e.entity_type, m.key_name, m.priority, e.created_at
+        """
+
+        rows = await self.pg.fetch_all(
+            query,
+            [entity_type for entity_type, _ in keys],
+            [normalized_name for _, normalized_name in keys]
+        )
+        found.update(
+            ((row["entity_type"], row["key_name"]), self._entity_from_row(row)) for row in rows
+        )
+        return found
+
+    async def _find_indexed_matches(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Entity]:
+        """V10: Exact matches served by the name index without I/O (empty if it is not current)."""
+        if not self.name_index or not await self.name_index.ensure_current():
+            return {}
+
+        found = {}
+        for entity_type, normalized_name in keys:
+            match = self.name_index.lookup(entity_type, normalized_name)
+            if match:
+                entity_id, canonical_name = match
+                found[(entity_type, normalized_name)] = Entity(
+                    entity_id=entity_id,
+                    entity_type=entity_type,
+                    canonical_name=canonical_name,
+                    normalized_name=self._normalize_name(canonical_name)
+                )
+        return found
+
+    async def _insert_entities(self, creates: List[Tuple[Entity, str, Optional[str]]]) -> None:
+        """V10: Multi-row insert of new entities as (entity, context vector literal, name vector literal)."""
+        query = """
+        INSERT INTO entity (
+            entity_id, entity_type, canonical_name, normalized_name,
+            role, organization, email, context_embedding,
+            first_seen_artifact_uid, first_seen_revision_id, needs_review,
+            name_embedding
+        )
+        SELECT u.entity_id, u.entity_type, u.canonical_name, u.normalized_name,
+               u.role, u.organization, u.email, u.context_embedding::vector,
+               u.artifact_uid, u.revision_id, u.needs_review,
+               u.name_embedding::vector
+        FROM unnest(
+            $1::uuid[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[],
+            $7::text[], $8::text[], $9::text[], $10::text[], $11::bool[], $12::text[]
+        ) AS u(
+            entity_id, entity_type, canonical_name, normalized_name, role, organization,
+            email, context_embedding, artifact_uid, revision_id, needs_review, name_embedding
+        )
+        """
+
+        entities = [entity for entity, _, _ in creates]
+        await self.pg.execute(
+            query,
+            [e.entity_id for e in entities],
+            [e.entity_type for e in entities],
+            [e.canonical_name for e in entities],
+            [e.normalized_name for e in entities],
+            [e.role for e in entities],
+            [e.organization for e in entities],
+            [e.email for e in entities],
+            [context for _, context, _ in creates],
+            [e.first_seen_artifact_uid for e in entities],
+            [e.first_seen_revision_id for e in entities],
+            [e.needs_review for e in entities],
+            [name for _, _, name in creates]
+        )
+        logger.info(f"Created {len(entities)} entities")
+
+    async def _insert_aliases_and_mentions(
+        self,
+        aliases: List[Tuple[UUID, str]],
+        mentions: List[Tuple[UUID, ExtractedEntity]],
+        artifact_uid: str,
+        revision_id: str
+    ) -> None:
+        """V10: Multi-row alias (idempotent) and mention inserts in one transaction."""
+        alias_rows = {}
+        for entity_id, alias in aliases:
+            alias_rows.setdefault((entity_id, self._normalize_name(alias)), alias)
+
+        queries = []
+        if alias_rows:
+            queries.append((
+                """
+                INSERT INTO entity_alias (entity_id, alias, normalized_alias)
+                SELECT * FROM unnest($1::uuid[], $2::text[], $3::text[])
+                ON CONFLICT (entity_id, normalized_alias) DO NOTHING
+                """,
+                (
+                    [entity_id for entity_id, _ in alias_rows],
+                    list(alias_rows.values()),
+                    [normalized_alias for _, normalized_alias in alias_rows]
+                )
+            ))
+        if mentions:
+            queries.append((
+                """
+                INSERT INTO entity_mention (
+                    mention_id, entity_id, artifact_uid, revision_id,
+                    surface_form, start_char, end_char
+                )
+                SELECT u.mention_id, u.entity_id, $6, $7, u.surface_form, u.start_char, u.end_char
+                FROM unnest($1::uuid[], $2::uuid[], $3::text[], $4::int[], $5::int[])
+                     AS u(mention_id, entity_id, surface_form, start_char, end_char)
+                """,
+                (
+                    [uuid4() for _ in mentions],
+                    [entity_id for entity_id, _ in mentions],
+                    [e.surface_form for _, e in mentions],
+                    [e.start_char for _, e in mentions],
+                    [e.end_char for _, e in mentions],
+                    artifact_uid,
+                    revision_id
+                )
+            ))
+
+        if queries:
+            await self.pg.transaction(queries)
 
     async def _evaluate_candidates(
         self,
@@ -878,6 +1433,18 @@ class EntityResolutionService:
             email=best_candidate.email
         )
 
+        # V10: Reuse an earlier confident decision for the same pair and context
+        cache_key = None
+        if self.decision_cache:
+            cache_key = (
+                best_candidate.entity_id,
+                self._normalize_name(new_name),
+                context_hash(new_type, new_context.role, new_context.organization, new_context.email, self.model)
+            )
+            cached = await self.decision_cache.get(*cache_key)
+            if cached:
+                return MergeDecision(**cached)
+
         try:
             decision = await self.confirm_merge_with_llm(
                 entity_a_name=new_name,
@@ -890,6 +1457,14 @@ class EntityResolutionService:
                 doc_title_b=best_candidate.first_seen_artifact_uid
             )
 
+            if cache_key:
+                await self.decision_cache.put(
+                    *cache_key,
+                    decision=decision.decision,
+                    canonical_name=decision.canonical_name,
+                    reason=decision.reason,
+                    confidence=decision.confidence
+                )
             return decision
 
         except LLMConfirmationError:
@@ -900,6 +1475,46 @@ class EntityResolutionService:
                 reason="LLM confirmation failed, creating separate entity for safety"
             )
 
+    def _entity_from_row(self, row: Dict[str, Any]) -> Entity:
+        """Build an Entity from an entity table row."""
+        return Entity(
+            entity_id=row["entity_id"],
+            entity_type=row["entity_type"],
+            canonical_name=row["canonical_name"],
+            normalized_name=row["normalized_name"],
+            role=row.get("role"),
+            organization=row.get("organization"),
+            email=row.get("email"),
+            first_seen_artifact_uid=row["first_seen_artifact_uid"],
+            first_seen_revision_id=row["first_seen_revision_id"],
+            needs_review=row.get("needs_review", False)
+        )
+
+    def _context_text(
+        self,
+        canonical_name: str,
+        entity_type: str,
+        role: Optional[str] = None,
+        organization: Optional[str] = None
+    ) -> str:
+        """Context string embedded for dedup: "{name}, {type}, {role}, {org}"."""
+        parts = [canonical_name, entity_type]
+        if role:
+            parts.append(role)
+        if organization:
+            parts.append(organization)
+        return ", ".join(parts)
+
+    def _cosine_distance(self, a: List[float], b: List[float]) -> float:
+        """Cosine distance (pgvector <=>) between two embeddings."""
+        dot = sum(x * y for x, y in zip(a, b))
+        norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+        return 1 - dot / norm if norm else 1.0
+
+    def _vector_literal(self, embedding: List[float]) -> str:
+        """Format an embedding as a pgvector text literal."""
+        return "[" + ",".join(str(x) for x in embedding) + "]"
+
     def _normalize_name(self, name: str) -> str:
         """Normalize entity name for matching."""
         # Lowercase
@@ -0,0 +1,269 @@
+"""
+Local event canonicalization (V10).
+
+Prompt B used to receive every event of every document, even when nothing
+could overlap. This module settles the obvious cases without the LLM:
+- events are blocked by category and compared on normalized subject,
+  actors and narrative token overlap (Jaccard)
+- clear duplicates (same subject and actors, compatible times, near-identical
+  narrative) are merged deterministically the way Prompt B merges them:
+  highest confidence wins, evidence is unioned, the most specific time is kept
+- events from different chunks that overlap but are not clear duplicates
+  (aliases, paraphrases) form ambiguous clusters; only those go to Prompt B
+
+Single-chunk documents never have ambiguous clusters, so they never reach
+the LLM.
+"""
+
+import copy
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+DUPLICATE_THRESHOLD = 0.8
+AMBIGUOUS_THRESHOLD = 0.35
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have",
+    "in", "is", "it", "its", "of", "on", "or", "that", "the", "their", "to", "was",
+    "were", "will", "with"
+}
+
+# Name comparison outcomes
+SAME, ALIAS, DIFFERENT = "same", "alias", "different"
+
+
+@dataclass
+class CanonicalizationPlan:
+    """Events settled locally plus the ambiguous ones that still need Prompt B."""
+    events: List[Dict[str, Any]]
+    ambiguous: List[Dict[str, Any]] = field(default_factory=list)
+    ambiguous_chunks: int = 0
+    input_events: int = 0
+    merged: int = 0
+
+
+def normalize_name(name: Optional[str]) -> str:
+    """Lowercase, punctuation-free, single-spaced form of a name or ref."""
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", (name or "").lower()).split())
+
+
+def narrative_tokens(narrative: Optional[str]) -> Set[str]:
+    """Content words of a narrative."""
+    return {token for token in normalize_name(narrative).split() if token not in _STOPWORDS}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two token sets (1.0 when both are empty)."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def compare_names(a: str, b: str) -> str:
+    """
+    Compare two normalized names.
+
+    Returns:
+        SAME if equal, ALIAS if one is missing or its tokens are a subset of
+        the other's ("alice" / "alice chen"), DIFFERENT otherwise
+    """
+    if a == b:
+        return SAME
+    if not a or not b:
+        return ALIAS
+    tokens_a, tokens_b = set(a.split()), set(b.split())
+    if tokens_a <= tokens_b or tokens_b <= tokens_a:
+        return ALIAS
+    return DIFFERENT
+
+
+def compare_actor_sets(a: Set[str], b: Set[str]) -> str:
+    """SAME for equal actor sets, ALIAS if every actor of the smaller set has a match, else DIFFERENT."""
+    if a == b:
+        return SAME
+    smaller, larger = (a, b) if len(a) <= len(b) else (b, a)
+    if all(any(compare_names(x, y) != DIFFERENT for y in larger) for x in smaller):
+        return ALIAS
+    return DIFFERENT
+
+
+def _times_compatible(a: Optional[str], b: Optional[str]) -> bool:
+    """Times agree if either is missing or they share a date."""
+    if not a or not b:
+        return True
+    return a[:10] == b[:10]
+
+
+class _Features:
+    """Comparison features of one extracted event."""
+
+    def __init__(self, event: Dict[str, Any], chunk_index: int):
+        self.event = event
+        self.chunk_index = chunk_index
+        self.category = normalize_name(event.get("category"))
+        subject = event.get("subject") or {}
+        self.subject = normalize_name(subject.get("ref") if isinstance(subject, dict) else None)
+        self.actors = {
+            normalize_name(actor.get("ref"))
+            for actor in event.get("actors") or []
+            if isinstance(actor, dict) and actor.get("ref")
+        }
+        self.tokens = narrative_tokens(event.get("narrative"))
+        self.event_time = event.get("event_time")
+
+
+def classify_pair(
+    a: _Features,
+    b: _Features,
+    duplicate_threshold: float = DUPLICATE_THRESHOLD,
+    ambiguous_threshold: float = AMBIGUOUS_THRESHOLD
+) -> Optional[str]:
+    """
+    Decide whether two events of the same category are the same event.
+
+    Returns:
+        "duplicate", "ambiguous" or None (distinct)
+    """
+    similarity = jaccard(a.tokens, b.tokens)
+    if (
+        similarity >= duplicate_threshold
+        and a.subject == b.subject
+        and compare_actor_sets(a.actors, b.actors) == SAME
+        and _times_compatible(a.event_time, b.event_time)
+    ):
+        return "duplicate"
+    if similarity >= ambiguous_threshold:
+        return "ambiguous"
+    # Short paraphrases about the same subject and people share few words
+    if (
+        similarity > 0
+        and a.subject and compare_names(a.subject, b.subject) != DIFFERENT
+        and compare_actor_sets(a.actors, b.actors) != DIFFERENT
+    ):
+        return "ambiguous"
+    return None
+
+
+def merge_events(events: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge duplicates the way Prompt B does.
+
+    The highest-confidence event (first on ties) is the base; evidence and
+    actors are unioned in order and the most specific event_time is kept.
+
+    Args:
+        events: Duplicate events in document order
+
+    Returns:
+        Merged event (inputs are not modified)
+    """
+    base = max(events, key=lambda e: e.get("confidence") or 0.0)
+    merged = copy.deepcopy(base)
+
+    times = [e.get("event_time") for e in events if e.get("event_time")]
+    if times:
+        merged["event_time"] = max(times, key=len)
+
+    actors, seen_actors = [], set()
+    for event in [base] + events:
+        for actor in event.get("actors") or []:
+            key = normalize_name(actor.get("ref")) if isinstance(actor, dict) else None
+            if key and key not in seen_actors:
+                seen_actors.add(key)
+                actors.append(copy.deepcopy(actor))
+    if actors:
+        merged["actors"] = actors
+
+    evidence, seen_spans = [], set()
+    for event in events:
+        for span in event.get("evidence") or []:
+            key = (span.get("chunk_id"), span.get("start_char"), span.get("end_char"))
+            if key not in seen_spans:
+                seen_spans.add(key)
+                evidence.append(copy.deepcopy(span))
+    merged["evidence"] = evidence
+    return merged
+
+
+def _find(parent: List[int], i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _components(n: int, pairs: List[Tuple[int, int]]) -> List[List[int]]:
+    """Connected components (members and components in index order)."""
+    parent = list(range(n))
+    for i, j in pairs:
+        root_i, root_j = _find(parent, i), _find(parent, j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    groups: Dict[int, List[int]] = {}
+    for i in range(n):
+        groups.setdefault(_find(parent, i), []).append(i)
+    return list(groups.values())
+
+
+def plan_canonicalization(
+    chunk_events: List[List[Dict[str, Any]]],
+    duplicate_threshold: float = DUPLICATE_THRESHOLD,
+    ambiguous_threshold: float = AMBIGUOUS_THRESHOLD
+) -> CanonicalizationPlan:
+    """
+    Canonicalize what can be decided locally.
+
+    Args:
+        chunk_events: List of event lists (one per chunk)
+        duplicate_threshold: Narrative Jaccard above which same-subject,
+            same-actor events are merged without the LLM
+        ambiguous_threshold: Narrative Jaccard above which cross-chunk events
+            are sent to Prompt B
+
+    Returns:
+        CanonicalizationPlan; ambiguous is empty when Prompt B can be skipped
+    """
+    features = [
+        _Features(event, chunk_index)
+        for chunk_index, events in enumerate(chunk_events)
+        for event in events
+    ]
+
+    by_category: Dict[str, List[int]] = {}
+    for i, f in enumerate(features):
+        by_category.setdefault(f.category, []).append(i)
+
+    duplicates, ambiguous_pairs = [], []
+    for members in by_category.values():
+        for x, i in enumerate(members):
+            for j in members[x + 1:]:
+                verdict = classify_pair(features[i], features[j], duplicate_threshold, ambiguous_threshold)
+                if verdict == "duplicate":
+                    duplicates.append((i, j))
+                elif verdict == "ambiguous" and features[i].chunk_index != features[j].chunk_index:
+                    ambiguous_pairs.append((i, j))
+
+    # Merge clear duplicates first, then cluster the merged groups by ambiguity
+    groups = _components(len(features), duplicates)
+    group_of = {i: g for g, members in enumerate(groups) for i in members}
+    merged = [merge_events([features[i].event for i in members]) for members in groups]
+
+    group_pairs = [(group_of[i], group_of[j]) for i, j in ambiguous_pairs if group_of[i] != group_of[j]]
+    resolved, ambiguous, chunks = [], [], set()
+    for cluster in _components(len(groups), group_pairs):
+        if len(cluster) == 1:
+            resolved.append(merged[cluster[0]])
+            continue
+        for g in cluster:
+            ambiguous.append(merged[g])
+            chunks.update(features[i].chunk_index for i in groups[g])
+
+    return CanonicalizationPlan(
+        events=resolved,
+        ambiguous=ambiguous,
+        ambiguous_chunks=len(chunks),
+        input_events=len(features),
+        merged=len(features) - len(groups)
+    )
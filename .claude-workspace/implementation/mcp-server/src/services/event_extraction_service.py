@@ -7,12 +7,23 @@ V4 additions:
 - entities_mentioned extraction with context clues (role, org, email)
 - Character offsets for entity mentions
 - Aliases within document
+
+V10: async client; a job's chunks are extracted concurrently (bounded per
+job, rate limited per process) and reassembled in chunk order. Prompt A
+results are cached by chunk content hash, model and prompt version.
+Clear duplicates are merged locally; only ambiguous clusters go to Prompt B.
 """
 
+import asyncio
+import copy
 import json
 import logging
 from typing import List, Dict, Any, Optional, Tuple
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from services.event_canonicalizer import plan_canonicalization
+from services.extraction_cache import ExtractionCache, content_hash, prompt_version
+from utils.concurrency import RateLimiter
 
 logger = logging.getLogger("event_extraction")
 
@@ -247,6 +258,10 @@ Deduplicate and merge these events, returning the canonical list with all eviden
 """
 
 
+# V10: Extraction cache key component; any edit to Prompt A changes it
+PROMPT_A_VERSION = prompt_version(PROMPT_A_SYSTEM, PROMPT_A_USER_TEMPLATE)
+
+
 class EventExtractionService:
     """Service for extracting semantic events from artifact text using OpenAI."""
 
@@ -255,7 +270,10 @@ class EventExtractionService:
         api_key: str,
         model: str = "gpt-4o-mini",
         temperature: float = 0.0,
-        timeout: int = 60
+        timeout: int = 60,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ExtractionCache] = None,
+        local_canonicalization: bool = True
     ):
         """
         Initialize event extraction service.
@@ -265,11 +283,22 @@ class EventExtractionService:
             model: Model to use (gpt-4o-mini, gpt-4-turbo-preview, etc.)
             temperature: Temperature for generation (0.0 = deterministic)
             timeout: Request timeout in seconds
+            rate_limiter: V10: Limiter shared by all async completions in the process
+            cache: V10: Prompt A result cache consulted by extract_chunks_v4
+            local_canonicalization: V10: Settle clear duplicates locally and
+                send only ambiguous clusters to Prompt B
         """
         self.client = OpenAI(api_key=api_key, timeout=timeout)
+        self.async_client = AsyncOpenAI(api_key=api_key, timeout=timeout)
         self.model = model
         self.temperature = temperature
         self.timeout = timeout  # Store for per-request override if needed
+        self.rate_limiter = rate_limiter or RateLimiter(0)
+        self.cache = cache
+        self.local_canonicalization = local_canonicalization
+        # V10: Prompt B calls made and skipped by canonicalize_events_async
+        self.prompt_b_calls = 0
+        self.prompt_b_calls_saved = 0
 
     def extract_from_chunk(
         self,
@@ -312,69 +341,234 @@ class EventExtractionService:
         Returns:
             Tuple of (events, entities_mentioned, relationships)
         """
+        content = None
+        try:
+            response = self.client.chat.completions.create(
+                **self._prompt_a_request(chunk_text, chunk_index, chunk_id, start_char)
+            )
+            content = response.choices[0].message.content
+            return self._parse_prompt_a(content, chunk_index, chunk_id, start_char)
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON from Prompt A: {e}")
+            logger.error(f"Raw response: {content}")
+            return [], [], []
+        except Exception as e:
+            logger.error(f"Error in extract_from_chunk_v4: {e}")
+            raise
+
+    async def _complete_prompt_a_async(
+        self,
+        chunk_text: str,
+        chunk_index: int,
+        chunk_id: str,
+        start_char: int
+    ) -> Optional[Dict[str, Any]]:
+        """Run Prompt A; the parsed result with chunk-relative offsets, or None if unparseable."""
+        content = None
+        try:
+            await self.rate_limiter.acquire()
+            response = await self.async_client.chat.completions.create(
+                **self._prompt_a_request(chunk_text, chunk_index, chunk_id, start_char)
+            )
+            content = response.choices[0].message.content
+            result = json.loads(content)
+            return {
+                "events": result.get("events", []),
+                "entities_mentioned": result.get("entities_mentioned", []),
+                "relationships": result.get("relationships", [])
+            }
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON from Prompt A: {e}")
+            logger.error(f"Raw response: {content}")
+            return None
+        except Exception as e:
+            logger.error(f"Error in _complete_prompt_a_async: {e}")
+            raise
+
+    async def extract_chunks_v4(
+        self,
+        chunk_texts: List[Tuple],
+        max_concurrency: int = 4
+    ) -> List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        V10: Run Prompt A on every chunk concurrently.
+
+        At most `max_concurrency` of this call's chunks are in flight at once;
+        the rate limiter bounds the process as a whole. The first failure
+        cancels the remaining chunks and is raised.
+
+        Chunks found in the extraction cache (by content hash) skip the LLM,
+        and identical chunks in one call share a single completion.
+
+        Args:
+            chunk_texts: List of (text, chunk_index, chunk_id, start_char) tuples
+            max_concurrency: Chunk extractions in flight for this call
+
+        Returns:
+            One (events, entities_mentioned, relationships) tuple per chunk,
+            in the order of chunk_texts
+        """
+        hashes = [content_hash(chunk[0]) for chunk in chunk_texts]
+        cached = {}
+        if self.cache:
+            cached = await self.cache.get_many(hashes, self.model, PROMPT_A_VERSION)
+
+        # One completion per distinct uncached chunk text
+        misses: Dict[str, Tuple] = {}
+        for chunk_hash, chunk in zip(hashes, chunk_texts):
+            if chunk_hash not in cached:
+                misses.setdefault(chunk_hash, chunk)
+
+        slots = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def complete(chunk: Tuple):
+            chunk_text, chunk_index, chunk_id, start_char = chunk
+            async with slots:
+                return await self._complete_prompt_a_async(chunk_text, chunk_index, chunk_id, start_char)
+
+        tasks = [asyncio.ensure_future(complete(chunk)) for chunk in misses.values()]
+        try:
+            fresh = dict(zip(misses, await asyncio.gather(*tasks)))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if self.cache:
+            self.cache.record(hits=len(cached), misses=len(misses))
+            await self.cache.put_many(
+                {h: result for h, result in fresh.items() if result is not None},
+                self.model,
+                PROMPT_A_VERSION
+            )
+            logger.info(f"Extraction cache: {len(cached)}/{len(cached) + len(misses)} distinct chunks hit")
+
+        # Reassemble in chunk order, rebasing each copy onto its own chunk
+        results = []
+        for chunk_hash, (_, chunk_index, chunk_id, start_char) in zip(hashes, chunk_texts):
+            result = cached[chunk_hash] if chunk_hash in cached else fresh[chunk_hash]
+            if result is None:
+                results.append(([], [], []))
+            else:
+                results.append(self._rebase_prompt_a(copy.deepcopy(result), chunk_index, chunk_id, start_char))
+        return results
+
+    def _prompt_a_request(
+        self,
+        chunk_text: str,
+        chunk_index: int,
+        chunk_id: str,
+        start_char: int
+    ) -> Dict[str, Any]:
+        """Build the chat completion arguments for Prompt A."""
         user_prompt = PROMPT_A_USER_TEMPLATE.format(
             chunk_index=chunk_index,
             chunk_id=chunk_id,
             start_char=start_char,
             text=chunk_text
         )
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": PROMPT_A_SYSTEM},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": self.temperature,
+            "response_format": {"type": "json_object"},
+            "timeout": self.timeout
+        }
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": PROMPT_A_SYSTEM},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=self.temperature,
-                response_format={"type": "json_object"},
-                timeout=self.timeout
-            )
-
-            content = response.choices[0].message.content
-            result = json.loads(content)
+    def _parse_prompt_a(
+        self,
+        content: str,
+        chunk_index: int,
+        chunk_id: str,
+        start_char: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Parse a Prompt A response and rebase its offsets onto the full artifact."""
+        return self._rebase_prompt_a(json.loads(content), chunk_index, chunk_id, start_char)
 
-            events = result.get("events", [])
-            entities = result.get("entities_mentioned", [])
-            relationships = result.get("relationships", [])
+    def _rebase_prompt_a(
+        self,
+        result: Dict[str, Any],
+        chunk_index: int,
+        chunk_id: str,
+        start_char: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Rebase a parsed Prompt A result (chunk-relative offsets) onto the full artifact, in place."""
+        events = result.get("events", [])
+        entities = result.get("entities_mentioned", [])
+        relationships = result.get("relationships", [])
+
+        # Adjust character offsets to be relative to full artifact
+        for event in events:
+            if "evidence" in event:
+                for ev in event["evidence"]:
+                    ev["start_char"] += start_char
+                    ev["end_char"] += start_char
+                    ev["chunk_id"] = chunk_id
+
+        # Adjust entity character offsets
+        for entity in entities:
+            if entity.get("start_char") is not None:
+                entity["start_char"] += start_char
+            if entity.get("end_char") is not None:
+                entity["end_char"] += start_char
+            entity["chunk_id"] = chunk_id
+
+        # Add chunk_id to relationships for tracking
+        for rel in relationships:
+            rel["chunk_id"] = chunk_id
+
+        logger.info(f"Extracted {len(events)} events, {len(entities)} entities, {len(relationships)} relationships from chunk {chunk_index}")
+        return events, entities, relationships
 
-            # Adjust character offsets to be relative to full artifact
-            for event in events:
-                if "evidence" in event:
-                    for ev in event["evidence"]:
-                        ev["start_char"] += start_char
-                        ev["end_char"] += start_char
-                        ev["chunk_id"] = chunk_id
+    def canonicalize_events(
+        self,
+        chunk_events: List[List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Canonicalize events across chunks using Prompt B.
 
-            # Adjust entity character offsets
-            for entity in entities:
-                if entity.get("start_char") is not None:
-                    entity["start_char"] += start_char
-                if entity.get("end_char") is not None:
-                    entity["end_char"] += start_char
-                entity["chunk_id"] = chunk_id
+        Args:
+            chunk_events: List of event lists (one per chunk)
 
-            # Add chunk_id to relationships for tracking
-            for rel in relationships:
-                rel["chunk_id"] = chunk_id
+        Returns:
+            Canonical list of deduplicated events with merged evidence
+        """
+        all_events = [event for events in chunk_events for event in events]
+        if not all_events:
+            return []
 
-            logger.info(f"Extracted {len(events)} events, {len(entities)} entities, {len(relationships)} relationships from chunk {chunk_index}")
-            return events, entities, relationships
+        content = None
+        try:
+            response = self.client.chat.completions.create(
+                **self._prompt_b_request(all_events, len(chunk_events))
+            )
+            content = response.choices[0].message.content
+            return self._parse_prompt_b(content, all_events)
 
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON from Prompt A: {e}")
+            logger.error(f"Failed to parse JSON from Prompt B: {e}")
             logger.error(f"Raw response: {content}")
-            return [], [], []
+            # Fallback: return all events without deduplication
+            return all_events
         except Exception as e:
-            logger.error(f"Error in extract_from_chunk_v4: {e}")
+            logger.error(f"Error in canonicalize_events: {e}")
             raise
 
-    def canonicalize_events(
+    async def canonicalize_events_async(
         self,
         chunk_events: List[List[Dict[str, Any]]]
     ) -> List[Dict[str, Any]]:
         """
-        Canonicalize events across chunks using Prompt B.
+        V10: canonicalize_events on the async client, through the rate limiter.
+
+        With local canonicalization, clear duplicates are merged here and
+        Prompt B only sees the ambiguous clusters; it is skipped entirely
+        when there are none (always for single-chunk documents).
 
         Args:
             chunk_events: List of event lists (one per chunk)
@@ -382,50 +576,78 @@ class EventExtractionService:
         Returns:
             Canonical list of deduplicated events with merged evidence
         """
-        # Flatten all events
-        all_events = []
-        for chunk_idx, events in enumerate(chunk_events):
-            for event in events:
-                all_events.append(event)
-
+        all_events = [event for events in chunk_events for event in events]
         if not all_events:
             return []
 
-        events_json = json.dumps(all_events, indent=2)
-        user_prompt = PROMPT_B_USER_TEMPLATE.format(
-            num_chunks=len(chunk_events),
-            events_json=events_json
+        if not self.local_canonicalization:
+            return await self._canonicalize_llm_async(all_events, len(chunk_events))
+
+        plan = plan_canonicalization(chunk_events)
+        if not plan.ambiguous:
+            self.prompt_b_calls_saved += 1
+            logger.info(
+                f"Canonicalized {plan.input_events} events → {len(plan.events)} unique events "
+                f"locally ({plan.merged} merged, Prompt B skipped)"
+            )
+            return plan.events
+
+        logger.info(
+            f"Canonicalization: {plan.merged} of {plan.input_events} events merged locally, "
+            f"{len(plan.ambiguous)} ambiguous events sent to Prompt B"
         )
+        return plan.events + await self._canonicalize_llm_async(plan.ambiguous, plan.ambiguous_chunks)
 
+    async def _canonicalize_llm_async(
+        self,
+        events: List[Dict[str, Any]],
+        num_chunks: int
+    ) -> List[Dict[str, Any]]:
+        """Run Prompt B over events; returns them unmerged if the response is not JSON."""
+        self.prompt_b_calls += 1
+        content = None
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": PROMPT_B_SYSTEM},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=self.temperature,
-                response_format={"type": "json_object"},
-                timeout=self.timeout
+            await self.rate_limiter.acquire()
+            response = await self.async_client.chat.completions.create(
+                **self._prompt_b_request(events, num_chunks)
             )
-
             content = response.choices[0].message.content
-            result = json.loads(content)
-
-            canonical_events = result.get("events", [])
-
-            logger.info(f"Canonicalized {len(all_events)} events → {len(canonical_events)} unique events")
-            return canonical_events
+            return self._parse_prompt_b(content, events)
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from Prompt B: {e}")
             logger.error(f"Raw response: {content}")
             # Fallback: return all events without deduplication
-            return all_events
+            return events
         except Exception as e:
-            logger.error(f"Error in canonicalize_events: {e}")
+            logger.error(f"Error in canonicalize_events_async: {e}")
             raise
 
+    def _prompt_b_request(self, all_events: List[Dict[str, Any]], num_chunks: int) -> Dict[str, Any]:
+        """Build the chat completion arguments for Prompt B."""
+        user_prompt = PROMPT_B_USER_TEMPLATE.format(
+            num_chunks=num_chunks,
+            events_json=json.dumps(all_events, indent=2)
+        )
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": PROMPT_B_SYSTEM},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": self.temperature,
+            "response_format": {"type": "json_object"},
+            "timeout": self.timeout
+        }
+
+    def _parse_prompt_b(self, content: str, all_events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Parse a Prompt B response into the canonical event list."""
+        result = json.loads(content)
+        canonical_events = result.get("events", [])
+
+        logger.info(f"Canonicalized {len(all_events)} events → {len(canonical_events)} unique events")
+        return canonical_events
+
     def validate_event(self, event: Dict[str, Any]) -> bool:
         """
         Validate extracted event structure.
@@ -637,7 +859,7 @@ class EventExtractionService:
             return False
 
         # Validate relationship type (normalize to uppercase)
-        rel_type = relationship.get("relationship_type", "").upper()
+        rel_type = str(relationship.get("relationship_type") or "").upper()
         if rel_type not in RELATIONSHIP_TYPES:
             # Accept but normalize unknown types
             logger.debug(f"Unknown relationship type: {rel_type}, accepting anyway")
@@ -647,8 +869,7 @@ class EventExtractionService:
         if "confidence" in relationship:
             try:
                 conf = float(relationship["confidence"])
-                if not (0.0 <= conf <= 1.0):
-                    relationship["confidence"] = 0.8
+                relationship["confidence"] = conf if 0.0 <= conf <= 1.0 else 0.8
             except (ValueError, TypeError):
                 relationship["confidence"] = 0.8
         else:
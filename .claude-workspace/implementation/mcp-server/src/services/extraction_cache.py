@@ -0,0 +1,196 @@
+"""
+Persistent Prompt A result cache (V10).
+
+Identical chunks (re-ingested revisions, forwarded emails, duplicate
+uploads) get the same extraction, so the parsed LLM result is stored in
+Postgres keyed by (content_hash, model, prompt_version):
+- content_hash is the sha256 of the chunk text (the same hash the chunking
+  service stores on chunks)
+- prompt_version is a hash of the prompt templates, so editing a prompt
+  invalidates every entry without a manual version bump (old entries stay
+  readable by workers still on the old prompts during a rolling deploy)
+- entries not written or hit for a while are pruned by age, whatever
+  their prompt version
+
+Results are stored with chunk-relative offsets and no chunk ID; the
+extraction service rebases them onto the artifact on every read. Cache
+errors are logged and treated as misses - extraction never fails because
+of the cache.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, List
+
+
+logger = logging.getLogger("mcp-memory.extraction_cache")
+
+
+def content_hash(text: str) -> str:
+    """sha256 of chunk text, as stored in chunk metadata."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def prompt_version(*templates: str) -> str:
+    """Short hash identifying a set of prompt templates."""
+    return hashlib.sha256("\x00".join(templates).encode()).hexdigest()[:16]
+
+
+class ExtractionCache:
+    """Prompt A results in the extraction_cache table, with in-process hit counters."""
+
+    def __init__(self, pg_client):
+        """
+        Initialize extraction cache.
+
+        Args:
+            pg_client: Postgres client instance (async)
+        """
+        self.pg = pg_client
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(
+        self,
+        content_hashes: List[str],
+        model: str,
+        prompt_version: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up cached results, counting the hits in the same statement.
+
+        Args:
+            content_hashes: Chunk content hashes
+            model: Extraction model
+            prompt_version: Current prompt version
+
+        Returns:
+            content_hash -> parsed result for the hashes that were cached
+        """
+        if not content_hashes:
+            return {}
+
+        try:
+            rows = await self.pg.fetch_all(
+                """
+                UPDATE extraction_cache
+                SET hit_count = hit_count + 1, last_hit_at = now()
+                WHERE content_hash = ANY($1::text[]) AND model = $2 AND prompt_version = $3
+                RETURNING content_hash, result
+                """,
+                list(set(content_hashes)),
+                model,
+                prompt_version
+            )
+        except Exception as e:
+            logger.warning(f"Extraction cache lookup failed: {e}")
+            return {}
+
+        return {row["content_hash"]: json.loads(row["result"]) for row in rows}
+
+    async def put_many(
+        self,
+        results: Dict[str, Dict[str, Any]],
+        model: str,
+        prompt_version: str
+    ) -> None:
+        """
+        Store results for chunks that missed (first writer wins).
+
+        Args:
+            results: content_hash -> parsed result
+            model: Extraction model
+            prompt_version: Current prompt version
+        """
+        if not results:
+            return
+
+        try:
+            await self.pg.execute(
+                """
+                INSERT INTO extraction_cache (content_hash, model, prompt_version, result)
+                SELECT u.content_hash, $3, $4, u.result::jsonb
+                FROM unnest($1::text[], $2::text[]) AS u(content_hash, result)
+                ON CONFLICT (content_hash, model, prompt_version) DO NOTHING
+                """,
+                list(results),
+                [json.dumps(result) for result in results.values()],
+                model,
+                prompt_version
+            )
+        except Exception as e:
+            logger.warning(f"Extraction cache write failed: {e}")
+
+    async def prune_idle(self, max_idle_days: int) -> int:
+        """
+        Delete entries not written or hit within max_idle_days.
+
+        Args:
+            max_idle_days: Days since the last write or hit
+
+        Returns:
+            Number of entries deleted
+        """
+        try:
+            deleted = await self.pg.fetch_val(
+                """
+                WITH deleted AS (
+                    DELETE FROM extraction_cache
+                    WHERE COALESCE(last_hit_at, created_at) < now() - make_interval(days => $1)
+                    RETURNING 1
+                )
+                SELECT count(*) FROM deleted
+                """,
+                max_idle_days
+            )
+        except Exception as e:
+            logger.warning(f"Extraction cache prune failed: {e}")
+            return 0
+
+        if deleted:
+            logger.info(f"Pruned {deleted} extraction cache entries idle for {max_idle_days}+ days")
+        return deleted or 0
+
+    def record(self, hits: int, misses: int) -> None:
+        """
+        Count distinct chunk texts served from the cache and distinct texts that needed an LLM call.
+
+        Counted per distinct text per lookup, like the table's hit_count and
+        entries, so stats() and extraction_cache_stats() agree.
+        """
+        self.hits += hits
+        self.misses += misses
+
+    def stats(self) -> Dict[str, Any]:
+        """In-process hit counters since startup."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
+
+
+async def extraction_cache_stats(pg_client) -> Dict[str, Any]:
+    """
+    Hit rate across all workers, from the table itself.
+
+    Every entry was written by one miss and counts its own hits.
+
+    Args:
+        pg_client: Postgres client instance (async)
+
+    Returns:
+        {entries, hits, hit_rate}
+    """
+    row = await pg_client.fetch_one(
+        "SELECT count(*) AS entries, COALESCE(sum(hit_count), 0) AS hits FROM extraction_cache"
+    )
+    entries = row["entries"] if row else 0
+    hits = int(row["hits"]) if row else 0
+    return {
+        "entries": entries,
+        "hits": hits,
+        "hit_rate": round(hits / (hits + entries), 3) if hits + entries else None,
+    }
@@ -0,0 +1,549 @@
+"""
+In-process entity/event graph cache (V10).
+
+Holds the entity<->event adjacency (entity_event_index) and entity<->entity
+edges (entity_edge) in compressed-sparse-row arrays so graph expansion can run
+bounded multi-hop BFS in memory instead of a Postgres CTE per recall.
+
+The cache is eventually consistent:
+- Additions are applied incrementally from rows created since the last
+  refresh (semantic_event.created_at / entity_edge.created_at).
+- Deletions (forget, re-extraction) are picked up by the periodic full
+  rebuild. Until then, stale event IDs are dropped when expansion results are
+  hydrated from Postgres, so they only cost budget, never correctness.
+
+RetrievalService falls back to the SQL expansion path when the cache is not
+built or fails.
+"""
+
+import asyncio
+import logging
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+
+logger = logging.getLogger("mcp-memory.graph_cache")
+
+# Role labels on entity<->event edges
+ROLE_ACTOR = 0
+ROLE_SUBJECT = 1
+
+# Re-read rows created slightly before the watermark to cover transactions
+# that were still open when the previous refresh ran (duplicates are skipped)
+REFRESH_OVERLAP_SECONDS = 60
+
+
+class CSRAdjacency:
+    """
+    Immutable compressed-sparse-row adjacency with an int label per edge.
+
+    Neighbors of node n are targets[offsets[n]:offsets[n+1]], with the
+    matching labels at the same positions.
+    """
+
+    __slots__ = ("offsets", "targets", "labels")
+
+    def __init__(self, num_nodes: int, edges: Iterable[Tuple[int, int, int]]):
+        edge_list = list(edges)
+
+        counts = [0] * (num_nodes + 1)
+        for src, _, _ in edge_list:
+            counts[src + 1] += 1
+        for i in range(num_nodes):
+            counts[i + 1] += counts[i]
+
+        self.offsets = array("i", counts)
+        self.targets = array("i", bytes(4 * len(edge_list)))
+        self.labels = array("H", bytes(2 * len(edge_list)))
+
+        cursor = counts[:-1]
+        for src, dst, label in edge_list:
+            pos = cursor[src]
+            self.targets[pos] = dst
+            self.labels[pos] = label
+            cursor[src] = pos + 1
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def neighbors(self, node: int) -> List[Tuple[int, int]]:
+        """Return (target, label) pairs for a node (empty if out of range)."""
+        if node >= self.num_nodes:
+            return []
+        start, end = self.offsets[node], self.offsets[node + 1]
+        return list(zip(self.targets[start:end], self.labels[start:end]))
+
+    def nbytes(self) -> int:
+        return sum(a.itemsize * len(a) for a in (self.offsets, self.targets, self.labels))
+
+
+@dataclass
+class GraphExpansionHit:
+    """One event reached by in-memory graph expansion."""
+    event_id: UUID
+    entity_id: UUID
+    connection_type: str
+    hop: int
+
+
+class GraphCache:
+    """
+    In-memory CSR graph of entities, events and entity edges.
+
+    Nodes are interned to dense ints. Each refresh applies new rows to a small
+    delta overlay; the CSR base is rebuilt on the full-rebuild schedule.
+    """
+
+    def __init__(self, refresh_seconds: int = 30, full_rebuild_every: int = 20):
+        """
+        Args:
+            refresh_seconds: Interval between incremental refreshes
+            full_rebuild_every: Full rebuild after this many incremental refreshes
+        """
+        self.refresh_seconds = refresh_seconds
+        self.full_rebuild_every = full_rebuild_every
+
+        self._reset()
+        self.is_ready = False
+        self._watermark = None
+        self._refreshes_since_rebuild = 0
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def _reset(self) -> None:
+        self._entity_ids: List[UUID] = []
+        self._entity_index: Dict[UUID, int] = {}
+        self._event_ids: List[UUID] = []
+        self._event_index: Dict[UUID, int] = {}
+
+        # Interned strings (categories, artifact UIDs)
+        self._strings: List[str] = []
+        self._string_index: Dict[str, int] = {}
+        # Relationship types get their own small table: they are CSR labels
+        # (unsigned 16-bit), so their indices must not grow with artifacts
+        self._rel_types: List[str] = []
+        self._rel_type_index: Dict[str, int] = {}
+        self._event_category = array("i")
+        self._event_artifact = array("i")
+
+        self._entity_events = CSRAdjacency(0, [])
+        self._event_entities = CSRAdjacency(0, [])
+        self._entity_entities = CSRAdjacency(0, [])
+
+        # Delta overlay: node -> [(target, label)]
+        self._delta_entity_events: Dict[int, List[Tuple[int, int]]] = {}
+        self._delta_event_entities: Dict[int, List[Tuple[int, int]]] = {}
+        self._delta_entity_entities: Dict[int, List[Tuple[int, int]]] = {}
+        self._delta_count = 0
+
+    # =========================================================================
+    # Interning
+    # =========================================================================
+
+    def _intern(self, value: str) -> int:
+        idx = self._string_index.get(value)
+        if idx is None:
+            idx = len(self._strings)
+            self._strings.append(value)
+            self._string_index[value] = idx
+        return idx
+
+    def _intern_rel_type(self, value: str) -> int:
+        idx = self._rel_type_index.get(value)
+        if idx is None:
+            idx = len(self._rel_types)
+            self._rel_types.append(value)
+            self._rel_type_index[value] = idx
+        return idx
+
+    def _entity_node(self, entity_id: UUID) -> int:
+        idx = self._entity_index.get(entity_id)
+        if idx is None:
+            idx = len(self._entity_ids)
+            self._entity_ids.append(entity_id)
+            self._entity_index[entity_id] = idx
+        return idx
+
+    def _event_node(self, event_id: UUID, category: str, artifact_uid: str) -> int:
+        idx = self._event_index.get(event_id)
+        if idx is None:
+            idx = len(self._event_ids)
+            self._event_ids.append(event_id)
+            self._event_index[event_id] = idx
+            self._event_category.append(self._intern(category))
+            self._event_artifact.append(self._intern(artifact_uid))
+        return idx
+
+    # =========================================================================
+    # Loading
+    # =========================================================================
+
+    def load(
+        self,
+        event_rows: Iterable[Dict[str, Any]],
+        edge_rows: Iterable[Dict[str, Any]]
+    ) -> None:
+        """
+        Replace the graph with the given rows.
+
+        Args:
+            event_rows: entity_event_index rows (entity_id, event_id, role,
+                artifact_uid, category)
+            edge_rows: entity_edge rows (source_entity_id, target_entity_id,
+                relationship_type)
+        """
+        self._reset()
+
+        entity_event_edges = []
+        for row in event_rows:
+            entity = self._entity_node(row["entity_id"])
+            event = self._event_node(row["event_id"], row["category"], row["artifact_uid"])
+            role = ROLE_ACTOR if row["role"] == "actor" else ROLE_SUBJECT
+            entity_event_edges.append((entity, event, role))
+
+        entity_entity_edges = []
+        for row in edge_rows:
+            source = self._entity_node(row["source_entity_id"])
+            target = self._entity_node(row["target_entity_id"])
+            rel = self._intern_rel_type(row["relationship_type"])
+            entity_entity_edges.append((source, target, rel))
+            entity_entity_edges.append((target, source, rel))
+
+        num_entities = len(self._entity_ids)
+        self._entity_events = CSRAdjacency(num_entities, entity_event_edges)
+        self._event_entities = CSRAdjacency(
+            len(self._event_ids), ((ev, ent, role) for ent, ev, role in entity_event_edges)
+        )
+        self._entity_entities = CSRAdjacency(num_entities, entity_entity_edges)
+        self.is_ready = True
+
+    def apply(
+        self,
+        event_rows: Iterable[Dict[str, Any]],
+        edge_rows: Iterable[Dict[str, Any]]
+    ) -> int:
+        """
+        Add rows to the delta overlay, skipping ones already present.
+
+        Returns:
+            Number of new edges added
+        """
+        added = 0
+
+        for row in event_rows:
+            entity = self._entity_node(row["entity_id"])
+            event = self._event_node(row["event_id"], row["category"], row["artifact_uid"])
+            role = ROLE_ACTOR if row["role"] == "actor" else ROLE_SUBJECT
+            if self._has_edge(self._entity_events, self._delta_entity_events, entity, event, role):
+                continue
+            self._delta_entity_events.setdefault(entity, []).append((event, role))
+            self._delta_event_entities.setdefault(event, []).append((entity, role))
+            added += 1
+
+        for row in edge_rows:
+            source = self._entity_node(row["source_entity_id"])
+            target = self._entity_node(row["target_entity_id"])
+            rel = self._intern_rel_type(row["relationship_type"])
+            if self._has_edge(self._entity_entities, self._delta_entity_entities, source, target, rel):
+                continue
+            self._delta_entity_entities.setdefault(source, []).append((target, rel))
+            self._delta_entity_entities.setdefault(target, []).append((source, rel))
+            added += 1
+
+        self._delta_count += added
+        return added
+
+    @staticmethod
+    def _has_edge(
+        base: CSRAdjacency,
+        delta: Dict[int, List[Tuple[int, int]]],
+        node: int,
+        target: int,
+        label: int
+    ) -> bool:
+        pair = (target, label)
+        return pair in base.neighbors(node) or pair in delta.get(node, ())
+
+    def _neighbors(
+        self,
+        base: CSRAdjacency,
+        delta: Dict[int, List[Tuple[int, int]]],
+        node: int
+    ) -> List[Tuple[int, int]]:
+        neighbors = base.neighbors(node)
+        extra = delta.get(node)
+        return neighbors + extra if extra else neighbors
+
+    # =========================================================================
+    # Refresh from Postgres
+    # =========================================================================
+
+    _EVENT_ROWS_SQL = """
+        SELECT eei.entity_id, eei.event_id, eei.role, eei.artifact_uid, eei.category
+        FROM entity_event_index eei
+    """
+
+    _EDGE_ROWS_SQL = """
+        SELECT source_entity_id, target_entity_id, relationship_type
+        FROM entity_edge
+    """
+
+    async def build(self, pg_client) -> None:
+        """Full rebuild from entity_event_index and entity_edge."""
+        t_start = time.perf_counter()
+
+        watermark = await pg_client.fetch_val("SELECT now()")
+        event_rows = await pg_client.fetch_all(self._EVENT_ROWS_SQL)
+        edge_rows = await pg_client.fetch_all(self._EDGE_ROWS_SQL)
+
+        self.load(event_rows, edge_rows)
+        self._watermark = watermark
+        self._refreshes_since_rebuild = 0
+
+        stats = self.stats()
+        logger.info(
+            f"Graph cache built: {stats['entities']} entities, {stats['events']} events, "
+            f"{stats['edges']} edges, {stats['bytes'] / 1e6:.1f}MB "
+            f"({stats['bytes_per_million_edges'] / 1e6:.0f}MB per 1M edges) "
+            f"in {(time.perf_counter() - t_start) * 1000:.0f}ms"
+        )
+
+    async def refresh(self, pg_client) -> None:
+        """Incremental refresh, or full rebuild when due."""
+        if not self.is_ready or self._refreshes_since_rebuild >= self.full_rebuild_every:
+            await self.build(pg_client)
+            return
+
+        watermark = await pg_client.fetch_val("SELECT now()")
+        overlap = f"interval '{REFRESH_OVERLAP_SECONDS} seconds'"
+        event_rows = await pg_client.fetch_all(
+            self._EVENT_ROWS_SQL + f"""
+        JOIN semantic_event se ON se.event_id = eei.event_id
+        WHERE se.created_at > $1 - {overlap}
+            """,
+            self._watermark
+        )
+        edge_rows = await pg_client.fetch_all(
+            self._EDGE_ROWS_SQL + f"""
+        WHERE created_at > $1 - {overlap}
+            """,
+            self._watermark
+        )
+
+        added = self.apply(event_rows, edge_rows)
+        self._watermark = watermark
+        self._refreshes_since_rebuild += 1
+
+        if added:
+            logger.info(f"Graph cache refreshed: +{added} edges (delta={self._delta_count})")
+
+    async def _refresh_loop(self, pg_client) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh(pg_client)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Graph cache refresh failed: {e}")
+
+    def start(self, pg_client) -> None:
+        """Start the background refresh loop."""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop(pg_client))
+
+    async def stop(self) -> None:
+        """Stop the background refresh loop."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    # =========================================================================
+    # Expansion
+    # =========================================================================
+
+    def expand(
+        self,
+        seed_event_ids: List[UUID],
+        depth: int = 1,
+        budget: int = 10,
+        hop_budget: Optional[int] = None,
+        category_filter: Optional[List[str]] = None,
+        candidate_artifact_uids: Optional[List[str]] = None,
+        edge_types: Optional[List[str]] = None
+    ) -> List[GraphExpansionHit]:
+        """
+        Bounded BFS from seed events through shared entities.
+
+        Each hop collects the entities of the frontier events (plus their
+        entity_edge neighbors) and the unvisited events those entities touch.
+        Hop 1 matches the SQL expansion: best connection per event, ranked
+        same_actor > same_subject > edge.
+
+        Args:
+            seed_event_ids: Event IDs to expand from
+            depth: Number of hops (1-3)
+            budget: Maximum events returned across all hops
+            hop_budget: Maximum new events per hop (default: budget)
+            category_filter: Only return events in these categories
+            candidate_artifact_uids: Only return events from these artifacts
+            edge_types: Only traverse entity_edge with these relationship types
+
+        Returns:
+            Hits ordered by hop, then connection rank
+        """
+        hop_budget = hop_budget or budget
+
+        allowed_categories = self._lookup_strings(category_filter)
+        allowed_artifacts = self._lookup_strings(candidate_artifact_uids)
+        allowed_rel_types = self._lookup_rel_types(edge_types)
+
+        visited_events = {self._event_index[e] for e in seed_event_ids if e in self._event_index}
+        visited_entities: Set[int] = set()
+        frontier = list(visited_events)
+        hits: List[GraphExpansionHit] = []
+
+        for hop in range(1, depth + 1):
+            if not frontier or len(hits) >= budget:
+                break
+
+            # Entities directly on frontier events
+            hop_entities: Dict[int, None] = {}
+            for event in frontier:
+                for entity, _ in self._neighbors(self._event_entities, self._delta_event_entities, event):
+                    if entity not in visited_entities:
+                        hop_entities[entity] = None
+
+            # Entities one entity_edge away
+            edge_entities: Dict[int, int] = {}
+            for entity in hop_entities:
+                for other, rel in self._neighbors(self._entity_entities, self._delta_entity_entities, entity):
+                    if allowed_rel_types is not None and rel not in allowed_rel_types:
+                        continue
+                    if other not in hop_entities and other not in visited_entities:
+                        edge_entities.setdefault(other, rel)
+
+            # Best connection per candidate event: (rank, entity, connection_type)
+            best: Dict[int, Tuple[int, int, str]] = {}
+            for entity in hop_entities:
+                for event, role in self._neighbors(self._entity_events, self._delta_entity_events, entity):
+                    rank = 1 if role == ROLE_ACTOR else 2
+                    self._consider(best, event, rank, entity, visited_events,
+                                   allowed_categories, allowed_artifacts)
+            for entity, rel in edge_entities.items():
+                for event, _ in self._neighbors(self._entity_events, self._delta_entity_events, entity):
+                    self._consider(best, event, 3, entity, visited_events,
+                                   allowed_categories, allowed_artifacts,
+                                   connection_type=f"edge:{self._rel_types[rel]}")
+
+            take = min(hop_budget, budget - len(hits))
+            chosen = sorted(best.items(), key=lambda item: item[1][0])[:take]
+
+            for event, (rank, entity, connection_type) in chosen:
+                hits.append(GraphExpansionHit(
+                    event_id=self._event_ids[event],
+                    entity_id=self._entity_ids[entity],
+                    connection_type=connection_type,
+                    hop=hop
+                ))
+
+            visited_entities.update(hop_entities)
+            visited_entities.update(edge_entities)
+            frontier = [event for event, _ in chosen]
+            visited_events.update(frontier)
+
+        return hits
+
+    def _consider(
+        self,
+        best: Dict[int, Tuple[int, int, str]],
+        event: int,
+        rank: int,
+        entity: int,
+        visited_events: Set[int],
+        allowed_categories: Optional[Set[int]],
+        allowed_artifacts: Optional[Set[int]],
+        connection_type: Optional[str] = None
+    ) -> None:
+        if event in visited_events:
+            return
+        if allowed_categories is not None and self._event_category[event] not in allowed_categories:
+            return
+        if allowed_artifacts is not None and self._event_artifact[event] not in allowed_artifacts:
+            return
+
+        current = best.get(event)
+        if current is None or rank < current[0]:
+            if connection_type is None:
+                connection_type = "same_actor" if rank == 1 else "same_subject"
+            best[event] = (rank, entity, connection_type)
+
+    def _lookup_strings(self, values: Optional[List[str]]) -> Optional[Set[int]]:
+        if not values:
+            return None
+        return {self._string_index[v] for v in values if v in self._string_index}
+
+    def _lookup_rel_types(self, values: Optional[List[str]]) -> Optional[Set[int]]:
+        if not values:
+            return None
+        return {self._rel_type_index[v] for v in values if v in self._rel_type_index}
+
+    # =========================================================================
+    # Stats
+    # =========================================================================
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Report graph size and approximate memory footprint.
+
+        Bytes cover the CSR/attribute arrays plus the ID lists, lookup dicts
+        and UUID objects (estimated from one sample each).
+        """
+        edges = (
+            self._entity_events.num_edges
+            + self._entity_entities.num_edges // 2
+            + self._delta_count
+        )
+
+        array_bytes = (
+            self._entity_events.nbytes()
+            + self._event_entities.nbytes()
+            + self._entity_entities.nbytes()
+            + self._event_category.itemsize * len(self._event_category)
+            + self._event_artifact.itemsize * len(self._event_artifact)
+        )
+
+        num_ids = len(self._entity_ids) + len(self._event_ids)
+        uuid_size = sys.getsizeof(self._event_ids[0]) if self._event_ids else 0
+        index_bytes = (
+            sys.getsizeof(self._entity_ids) + sys.getsizeof(self._event_ids)
+            + sys.getsizeof(self._entity_index) + sys.getsizeof(self._event_index)
+            + num_ids * uuid_size
+        )
+        delta_bytes = sum(
+            sys.getsizeof(d) + sum(sys.getsizeof(v) for v in d.values())
+            for d in (self._delta_entity_events, self._delta_event_entities, self._delta_entity_entities)
+        )
+
+        total_bytes = array_bytes + index_bytes + delta_bytes
+
+        return {
+            "entities": len(self._entity_ids),
+            "events": len(self._event_ids),
+            "edges": edges,
+            "delta_edges": self._delta_count,
+            "bytes": total_bytes,
+            "bytes_per_million_edges": int(total_bytes / edges * 1_000_000) if edges else 0,
+        }
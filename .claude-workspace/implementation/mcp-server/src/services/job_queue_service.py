@@ -3,7 +3,7 @@ Job queue service for async event extraction using Postgres as queue.
 """
 
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from uuid import UUID, uuid4
 import json
@@ -13,6 +13,9 @@ from storage.postgres_models import EventJob, SemanticEvent, EventEvidence, job_
 
 logger = logging.getLogger("job_queue")
 
+# V10: NOTIFY channel for newly claimable jobs; the payload is the job type
+JOB_NOTIFY_CHANNEL = "event_jobs_pending"
+
 
 class JobQueueService:
     """Service for managing event extraction job queue."""
@@ -46,11 +49,16 @@ class JobQueueService:
             Job ID if created, None if already exists
         """
         try:
+            # V10: Wake listening workers in the same statement; the
+            # notification is only sent for a new row, and on commit
             query = """
-            INSERT INTO event_jobs (artifact_uid, revision_id, job_type, status, max_attempts)
-            VALUES ($1, $2, $3, 'PENDING', $4)
-            ON CONFLICT (artifact_uid, revision_id, job_type) DO NOTHING
-            RETURNING job_id
+            WITH inserted AS (
+                INSERT INTO event_jobs (artifact_uid, revision_id, job_type, status, max_attempts)
+                VALUES ($1, $2, $3, 'PENDING', $4)
+                ON CONFLICT (artifact_uid, revision_id, job_type) DO NOTHING
+                RETURNING job_id
+            )
+            SELECT job_id, pg_notify($5, $3) FROM inserted
             """
 
             job_id = await self.pg.fetch_val(
@@ -58,7 +66,8 @@ class JobQueueService:
                 artifact_uid,
                 revision_id,
                 job_type,
-                self.max_attempts
+                self.max_attempts,
+                JOB_NOTIFY_CHANNEL
             )
 
             if job_id:
@@ -91,6 +100,18 @@ class JobQueueService:
         # Delegate to the safe typed method (extract_events).
         return await self.claim_job_by_type(worker_id, "extract_events")
 
+    async def listen_for_jobs(self, callback: Callable[[str], None]):
+        """
+        V10: Subscribe to new-job notifications on a dedicated connection.
+
+        Args:
+            callback: Called with the job type of each newly claimable job
+
+        Returns:
+            The listening connection (caller closes it)
+        """
+        return await self.pg.listen(JOB_NOTIFY_CHANNEL, callback)
+
     async def mark_job_done(self, job_id: UUID) -> None:
         """
         Mark job as successfully completed.
@@ -274,57 +295,8 @@ class JobQueueService:
 
                     logger.info(f"Deleted old events for {artifact_uid}/{revision_id}")
 
-                    # Insert new events
-                    for event in events:
-                        event_query = """
-                        INSERT INTO semantic_event (
-                            artifact_uid, revision_id, category, event_time,
-                            narrative, subject_json, actors_json, confidence,
-                            extraction_run_id
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                        RETURNING event_id
-                        """
-
-                        event_time = None
-                        if event.get("event_time"):
-                            # Parse ISO8601 or leave as None
-                            try:
-                                event_time = datetime.fromisoformat(event["event_time"].replace("Z", "+00:00"))
-                            except (ValueError, TypeError) as e:
-                                logger.warning(f"Invalid event_time format: {event.get('event_time')}: {e}")
-
-                        event_id = await conn.fetchval(
-                            event_query,
-                            artifact_uid,
-                            revision_id,
-                            event["category"],
-                            event_time,
-                            event["narrative"],
-                            json.dumps(event["subject"]),
-                            json.dumps(event["actors"]),
-                            event["confidence"],
-                            extraction_run_id
-                        )
-
-                        # Insert evidence
-                        for ev in event.get("evidence", []):
-                            evidence_query = """
-                            INSERT INTO event_evidence (
-                                event_id, artifact_uid, revision_id, chunk_id,
-                                start_char, end_char, quote
-                            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-                            """
-
-                            await conn.execute(
-                                evidence_query,
-                                event_id,
-                                artifact_uid,
-                                revision_id,
-                                ev.get("chunk_id"),
-                                ev["start_char"],
-                                ev["end_char"],
-                                ev["quote"]
-                            )
+                    # V10: Bulk insert new events and evidence
+                    await self._insert_event_rows(conn, artifact_uid, revision_id, extraction_run_id, events)
 
                     logger.info(f"Wrote {len(events)} events for {artifact_uid}/{revision_id}")
 
@@ -393,7 +365,10 @@ class JobQueueService:
                     updated_at = now()
                 WHERE artifact_uid = $1 AND revision_id = $2
                 """
-                await self.pg.execute(reset_query, artifact_uid, revision_id)
+                await self.pg.transaction([
+                    (reset_query, (artifact_uid, revision_id)),
+                    ("SELECT pg_notify($1, 'extract_events')", (JOB_NOTIFY_CHANNEL,)),
+                ])
 
                 logger.info(f"Reset job for {artifact_uid}/{revision_id}")
 
@@ -417,6 +392,47 @@ class JobQueueService:
             logger.error(f"Failed to force reextract: {e}")
             raise
 
+    async def delete_artifact_data(self, artifact_uid: str) -> int:
+        """
+        Delete all event data for an artifact (used by forget).
+
+        Removes semantic events with their evidence, actors, subjects and
+        entity_event_index rows, then the artifact's entity mentions,
+        revisions and jobs.
+
+        Args:
+            artifact_uid: Artifact UID
+
+        Returns:
+            Number of events deleted
+        """
+        event_rows = await self.pg.fetch_all(
+            "SELECT event_id FROM semantic_event WHERE artifact_uid = $1",
+            artifact_uid
+        )
+        event_ids = [row["event_id"] for row in event_rows]
+
+        if event_ids:
+            # V10: Delete entity_event_index rows (also cascades from semantic_event)
+            await self.pg.execute(
+                "DELETE FROM entity_event_index WHERE artifact_uid = $1",
+                artifact_uid
+            )
+            for table in ("event_evidence", "event_actor", "event_subject", "semantic_event"):
+                await self.pg.execute(
+                    f"DELETE FROM {table} WHERE event_id = ANY($1::uuid[])",
+                    event_ids
+                )
+
+        for table in ("entity_mention", "artifact_revision", "event_jobs"):
+            await self.pg.execute(
+                f"DELETE FROM {table} WHERE artifact_uid = $1",
+                artifact_uid
+            )
+
+        logger.info(f"Deleted {len(event_ids)} events and related data for {artifact_uid}")
+        return len(event_ids)
+
     # =========================================================================
     # V4: Enhanced methods for entity resolution and graph support
     # =========================================================================
@@ -429,7 +445,8 @@ class JobQueueService:
         events: List[Dict[str, Any]],
         entity_event_map: Dict[str, List[Dict[str, Any]]] = None,
         enqueue_graph_upsert: bool = False,  # V5: Disabled - AGE graph removed
-        event_embeddings: List[Optional[List[float]]] = None  # V9: Cached embeddings
+        event_embeddings: List[Optional[List[float]]] = None,  # V9: Cached embeddings
+        edges: Optional[List[Dict[str, Any]]] = None  # V10: Explicit entity edges
     ) -> None:
         """
         Write events with V4 entity relationships (replace-on-success).
@@ -437,8 +454,14 @@ class JobQueueService:
         This extended version:
         1. Writes events and evidence (V3)
         2. Writes event_actor and event_subject relationships (V4)
+           and their entity_event_index rows (V10)
         3. Optionally enqueues graph_upsert job (V4) - DISABLED in V5
         4. Stores narrative embeddings for triplet scoring cache (V9)
+        5. Upserts explicit entity_edge rows (V10: same transaction)
+
+        V10: Event IDs are generated client-side, so the whole result is a
+        handful of bulk statements (executemany / COPY) instead of one
+        round trip per row.
 
         Args:
             artifact_uid: Artifact UID
@@ -448,13 +471,22 @@ class JobQueueService:
             entity_event_map: Map of event index -> list of {entity_id, role, is_actor}
             enqueue_graph_upsert: Whether to enqueue graph materialization job (V5: disabled)
             event_embeddings: Pre-computed embeddings for each event narrative (V9)
+            edges: Resolved relationships as {source_entity_id, target_entity_id,
+                relationship_type, confidence, evidence_quote} (V10)
         """
         entity_event_map = entity_event_map or {}
 
+        # V10: Bad edges are dropped here, so they cannot fail the event write
+        edge_rows = [
+            row for row in (self._edge_row(edge, artifact_uid, revision_id) for edge in edges or [])
+            if row is not None
+        ]
+
         try:
             async with self.pg.acquire() as conn:
                 async with conn.transaction():
-                    # Delete old events (cascade deletes evidence, event_actor, event_subject)
+                    # Delete old events (cascade deletes evidence, event_actor, event_subject,
+                    # entity_event_index)
                     delete_query = """
                     DELETE FROM semantic_event
                     WHERE artifact_uid = $1 AND revision_id = $2
@@ -463,102 +495,32 @@ class JobQueueService:
 
                     logger.info(f"Deleted old events for {artifact_uid}/{revision_id}")
 
-                    event_ids = []
-                    event_embeddings = event_embeddings or []
-
-                    # Insert new events
-                    for idx, event in enumerate(events):
-                        # V9: Get embedding for this event (if available)
-                        embedding = event_embeddings[idx] if idx < len(event_embeddings) else None
-
-                        event_query = """
-                        INSERT INTO semantic_event (
-                            artifact_uid, revision_id, category, event_time,
-                            narrative, subject_json, actors_json, confidence,
-                            extraction_run_id, embedding
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                        RETURNING event_id
-                        """
-
-                        event_time = None
-                        if event.get("event_time"):
-                            try:
-                                event_time = datetime.fromisoformat(
-                                    event["event_time"].replace("Z", "+00:00")
-                                )
-                            except (ValueError, TypeError) as e:
-                                logger.warning(f"Invalid event_time: {event.get('event_time')}: {e}")
-
-                        # V9: Convert embedding to string format for pgvector
-                        embedding_str = None
-                        if embedding:
-                            embedding_str = "[" + ",".join(str(x) for x in embedding) + "]"
-
-                        event_id = await conn.fetchval(
-                            event_query,
-                            artifact_uid,
-                            revision_id,
-                            event["category"],
-                            event_time,
-                            event["narrative"],
-                            json.dumps(event["subject"]),
-                            json.dumps(event["actors"]),
-                            event["confidence"],
-                            extraction_run_id,
-                            embedding_str
-                        )
-
-                        event_ids.append(event_id)
+                    # V10: Bulk insert events, evidence, actors, subjects and index rows
+                    await self._insert_event_rows(
+                        conn, artifact_uid, revision_id, extraction_run_id, events,
+                        event_embeddings=event_embeddings,
+                        entity_event_map=entity_event_map
+                    )
 
-                        # Insert evidence
-                        for ev in event.get("evidence", []):
-                            evidence_query = """
-                            INSERT INTO event_evidence (
-                                event_id, artifact_uid, revision_id, chunk_id,
-                                start_char, end_char, quote
-                            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+                    # V10: Explicit entity edges land in the same transaction
+                    if edge_rows:
+                        await conn.executemany(
                             """
+                            INSERT INTO entity_edge (
+                                source_entity_id, target_entity_id, relationship_type,
+                                artifact_uid, revision_id, confidence, evidence_quote
+                            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+                            ON CONFLICT (source_entity_id, target_entity_id, relationship_type, artifact_uid)
+                            DO UPDATE SET
+                                confidence = GREATEST(entity_edge.confidence, EXCLUDED.confidence),
+                                evidence_quote = COALESCE(EXCLUDED.evidence_quote, entity_edge.evidence_quote)
+                            """,
+                            edge_rows
+                        )
 
-                            await conn.execute(
-                                evidence_query,
-                                event_id,
-                                artifact_uid,
-                                revision_id,
-                                ev.get("chunk_id"),
-                                ev["start_char"],
-                                ev["end_char"],
-                                ev["quote"]
-                            )
-
-                        # V4: Insert event_actor and event_subject relationships
-                        event_entities = entity_event_map.get(str(idx), [])
-                        for rel in event_entities:
-                            entity_id = rel.get("entity_id")
-                            if not entity_id:
-                                continue
-
-                            if rel.get("is_actor", False):
-                                # Insert event_actor
-                                actor_query = """
-                                INSERT INTO event_actor (event_id, entity_id, role)
-                                VALUES ($1, $2, $3)
-                                ON CONFLICT (event_id, entity_id) DO UPDATE SET role = $3
-                                """
-                                role = rel.get("role", "other")
-                                # Normalize role to allowed values
-                                if role not in ("owner", "contributor", "reviewer", "stakeholder", "other"):
-                                    role = "other"
-                                await conn.execute(actor_query, event_id, entity_id, role)
-                            else:
-                                # Insert event_subject
-                                subject_query = """
-                                INSERT INTO event_subject (event_id, entity_id)
-                                VALUES ($1, $2)
-                                ON CONFLICT (event_id, entity_id) DO NOTHING
-                                """
-                                await conn.execute(subject_query, event_id, entity_id)
-
-                    logger.info(f"Wrote {len(events)} events for {artifact_uid}/{revision_id}")
+                    logger.info(
+                        f"Wrote {len(events)} events and {len(edge_rows)} edges for {artifact_uid}/{revision_id}"
+                    )
 
                     # V4: Enqueue graph_upsert job in same transaction
                     if enqueue_graph_upsert:
@@ -586,6 +548,193 @@ class JobQueueService:
             logger.error(f"Failed to write events (V4): {e}")
             raise
 
+    @staticmethod
+    def _edge_row(edge: Dict[str, Any], artifact_uid: str, revision_id: str) -> Optional[Tuple]:
+        """
+        V10: entity_edge insert parameters for one edge, or None (logged) if invalid.
+
+        Requires both entity IDs, a non-empty string relationship_type
+        (truncated to 50 chars) and a confidence that is a number in 0-1
+        (0.8 when missing).
+        """
+        source_id = edge.get("source_entity_id")
+        target_id = edge.get("target_entity_id")
+        rel_type = edge.get("relationship_type", "RELATES_TO")
+        confidence = edge.get("confidence")
+        try:
+            confidence = 0.8 if confidence is None else float(confidence)
+        except (TypeError, ValueError):
+            confidence = None
+
+        if not source_id or not target_id:
+            problem = "missing entity id"
+        elif not isinstance(rel_type, str) or not rel_type.strip():
+            problem = f"invalid relationship_type {rel_type!r}"
+        elif confidence is None or not 0.0 <= confidence <= 1.0:
+            problem = f"invalid confidence {edge.get('confidence')!r}"
+        else:
+            quote = edge.get("evidence_quote")
+            return (
+                source_id,
+                target_id,
+                rel_type.strip()[:50],
+                artifact_uid,
+                revision_id,
+                confidence,
+                str(quote) if quote is not None else None
+            )
+
+        logger.warning(f"Dropping edge for {artifact_uid}/{revision_id}: {problem}")
+        return None
+
+    async def _insert_event_rows(
+        self,
+        conn,
+        artifact_uid: str,
+        revision_id: str,
+        extraction_run_id: UUID,
+        events: List[Dict[str, Any]],
+        event_embeddings: Optional[List[Optional[List[float]]]] = None,
+        entity_event_map: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ) -> List[UUID]:
+        """
+        V10: Insert events and their child rows in bulk on a transaction's connection.
+
+        Events go in with one executemany (the embedding needs a ::vector
+        cast, which COPY cannot do). Evidence, actors, subjects and
+        entity_event_index rows reference the client-generated event IDs and
+        are COPYed; the events are new, so the ON CONFLICT clauses of the
+        row-at-a-time inserts reduce to de-duplicating within the batch.
+
+        Args:
+            conn: Connection inside the caller's transaction
+            artifact_uid: Artifact UID
+            revision_id: Revision ID
+            extraction_run_id: Job ID for traceability
+            events: Extracted events with evidence
+            event_embeddings: Narrative embedding per event (optional)
+            entity_event_map: Map of event index -> list of {entity_id, role, is_actor}
+
+        Returns:
+            Event IDs in event order
+        """
+        event_embeddings = event_embeddings or []
+        entity_event_map = entity_event_map or {}
+
+        event_ids = [uuid4() for _ in events]
+        event_rows = []
+        evidence_rows = []
+        actor_roles: Dict[Tuple[UUID, UUID], str] = {}
+        subject_keys: Dict[Tuple[UUID, UUID], None] = {}
+        index_rows: Dict[Tuple[UUID, UUID, str], Tuple] = {}
+
+        for idx, (event_id, event) in enumerate(zip(event_ids, events)):
+            event_time = None
+            if event.get("event_time"):
+                try:
+                    event_time = datetime.fromisoformat(event["event_time"].replace("Z", "+00:00"))
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Invalid event_time: {event.get('event_time')}: {e}")
+
+            # V9: Convert embedding to string format for pgvector
+            embedding = event_embeddings[idx] if idx < len(event_embeddings) else None
+            embedding_str = "[" + ",".join(str(x) for x in embedding) + "]" if embedding else None
+
+            event_rows.append((
+                event_id,
+                artifact_uid,
+                revision_id,
+                event["category"],
+                event_time,
+                event["narrative"],
+                json.dumps(event["subject"]),
+                json.dumps(event["actors"]),
+                event["confidence"],
+                extraction_run_id,
+                embedding_str
+            ))
+
+            for ev in event.get("evidence", []):
+                evidence_rows.append((
+                    uuid4(),
+                    event_id,
+                    artifact_uid,
+                    revision_id,
+                    ev.get("chunk_id"),
+                    ev["start_char"],
+                    ev["end_char"],
+                    ev["quote"]
+                ))
+
+            # V4: event_actor / event_subject relationships
+            for rel in entity_event_map.get(str(idx), []):
+                entity_id = rel.get("entity_id")
+                if not entity_id:
+                    continue
+
+                if rel.get("is_actor", False):
+                    role = rel.get("role", "other")
+                    # Normalize role to allowed values
+                    if role not in ("owner", "contributor", "reviewer", "stakeholder", "other"):
+                        role = "other"
+                    # Last role wins, as ON CONFLICT ... DO UPDATE SET role did
+                    actor_roles[(event_id, entity_id)] = role
+                    index_role = "actor"
+                else:
+                    subject_keys[(event_id, entity_id)] = None
+                    index_role = "subject"
+
+                # V10: Maintain entity_event_index for graph expansion
+                index_rows.setdefault(
+                    (entity_id, event_id, index_role),
+                    (entity_id, event_id, index_role, artifact_uid, event["category"], event_time)
+                )
+
+        if event_rows:
+            await conn.executemany(
+                """
+                INSERT INTO semantic_event (
+                    event_id, artifact_uid, revision_id, category, event_time,
+                    narrative, subject_json, actors_json, confidence,
+                    extraction_run_id, embedding
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11::vector)
+                """,
+                event_rows
+            )
+
+        if evidence_rows:
+            await conn.copy_records_to_table(
+                "event_evidence",
+                records=evidence_rows,
+                columns=[
+                    "evidence_id", "event_id", "artifact_uid", "revision_id",
+                    "chunk_id", "start_char", "end_char", "quote"
+                ]
+            )
+
+        if actor_roles:
+            await conn.copy_records_to_table(
+                "event_actor",
+                records=[(event_id, entity_id, role) for (event_id, entity_id), role in actor_roles.items()],
+                columns=["event_id", "entity_id", "role"]
+            )
+
+        if subject_keys:
+            await conn.copy_records_to_table(
+                "event_subject",
+                records=list(subject_keys),
+                columns=["event_id", "entity_id"]
+            )
+
+        if index_rows:
+            await conn.copy_records_to_table(
+                "entity_event_index",
+                records=list(index_rows.values()),
+                columns=["entity_id", "event_id", "role", "artifact_uid", "category", "event_time"]
+            )
+
+        return event_ids
+
     async def claim_job_by_type(
         self,
         worker_id: str,
@@ -601,51 +750,73 @@ class JobQueueService:
         Returns:
             Job dict or None if no jobs available
         """
-        try:
-            async with self.pg.acquire() as conn:
-                async with conn.transaction():
-                    select_query = """
-                    SELECT job_id, artifact_uid, revision_id, attempts
-                    FROM event_jobs
-                    WHERE status = 'PENDING'
-                      AND job_type = $1
-                      AND next_run_at <= now()
-                    ORDER BY created_at ASC
-                    FOR UPDATE SKIP LOCKED
-                    LIMIT 1
-                    """
-
-                    row = await conn.fetchrow(select_query, job_type)
+        jobs = await self.claim_jobs(worker_id, job_type, 1)
+        return jobs[0] if jobs else None
 
-                    if not row:
-                        return None
-
-                    job_id = row["job_id"]
+    async def claim_jobs(
+        self,
+        worker_id: str,
+        job_type: str = "extract_events",
+        n: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        V10: Atomically claim up to n pending jobs in one statement.
 
-                    update_query = """
-                    UPDATE event_jobs
-                    SET status = 'PROCESSING',
-                        locked_at = now(),
-                        locked_by = $1,
-                        attempts = attempts + 1,
-                        updated_at = now()
-                    WHERE job_id = $2
-                    """
+        The inner SELECT ... FOR UPDATE SKIP LOCKED picks jobs no other worker
+        holds; the UPDATE marks them PROCESSING and returns them, so a claim
+        is a single round trip regardless of n.
 
-                    await conn.execute(update_query, worker_id, job_id)
+        Args:
+            worker_id: Worker ID claiming the jobs
+            job_type: Job type to claim (extract_events, graph_upsert)
+            n: Maximum number of jobs to claim
 
-                    logger.info(f"Worker {worker_id} claimed {job_type} job {job_id}")
+        Returns:
+            Job dicts, oldest first (empty if no jobs available)
+        """
+        try:
+            query = """
+            UPDATE event_jobs j
+            SET status = 'PROCESSING',
+                locked_at = now(),
+                locked_by = $1,
+                attempts = j.attempts + 1,
+                updated_at = now()
+            WHERE j.job_id IN (
+                SELECT job_id
+                FROM event_jobs
+                WHERE status = 'PENDING'
+                  AND job_type = $2
+                  AND next_run_at <= now()
+                ORDER BY created_at ASC
+                LIMIT $3
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING j.job_id, j.artifact_uid, j.revision_id, j.attempts, j.created_at
+            """
 
-                    return {
-                        "job_id": str(job_id),
-                        "job_type": job_type,
-                        "artifact_uid": row["artifact_uid"],
-                        "revision_id": row["revision_id"],
-                        "attempts": row["attempts"] + 1
-                    }
+            rows = await self.pg.fetch_all(query, worker_id, job_type, n)
+            rows.sort(key=lambda row: row["created_at"])
+
+            if rows:
+                logger.info(
+                    f"Worker {worker_id} claimed {len(rows)} {job_type} job(s): "
+                    f"{', '.join(str(row['job_id']) for row in rows)}"
+                )
+
+            return [
+                {
+                    "job_id": str(row["job_id"]),
+                    "job_type": job_type,
+                    "artifact_uid": row["artifact_uid"],
+                    "revision_id": row["revision_id"],
+                    "attempts": row["attempts"]
+                }
+                for row in rows
+            ]
 
         except Exception as e:
-            logger.error(f"Failed to claim {job_type} job: {e}")
+            logger.error(f"Failed to claim {job_type} jobs: {e}")
             raise
 
     async def get_entities_for_revision(
@@ -0,0 +1,349 @@
+"""
+In-process BM25 lexical index over the content and chunks collections (V10).
+
+Serves exact-identifier lookups (ticket numbers, names, source_ids) without
+an embedding round trip, and supplies a second ranked list that
+hybrid_search_v5 fuses with vector results via RRF.
+
+Like the local vector replica, Chroma stays the system of record: the index
+is warmed from Chroma documents at startup and kept current by
+remember/forget in this process.
+"""
+
+import heapq
+import logging
+import math
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Set
+
+from services.local_vector_replica import COLLECTIONS, matches_where
+
+
+logger = logging.getLogger("mcp-memory.lexical_index")
+
+# Metadata fields indexed alongside the document text, so identifier queries
+# match on source_id/title/author even when the body never mentions them
+INDEXED_METADATA_FIELDS = ("title", "source_id", "author", "participants", "source_url")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[._\-/#:][a-z0-9]+)*")
+_SPLIT_RE = re.compile(r"[._\-/#:]")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase word tokenizer that keeps identifiers intact.
+
+    "JIRA-1234" yields "jira-1234" plus its parts "jira" and "1234", so both
+    the full identifier and its pieces match.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens (with repeats, for term frequency)
+    """
+    tokens: List[str] = []
+    for match in _TOKEN_RE.findall((text or "").lower()):
+        tokens.append(match)
+        if _SPLIT_RE.search(match):
+            tokens.extend(part for part in _SPLIT_RE.split(match) if part)
+    return tokens
+
+
+def looks_like_identifier(query: str) -> bool:
+    """
+    Heuristic for queries that should take the lexical-only path.
+
+    True for short queries made of identifier-like tokens: quoted strings,
+    tokens mixing letters and digits, or tokens with separators (art_abc,
+    JIRA-1234, v2.1).
+    """
+    stripped = (query or "").strip()
+    if not stripped:
+        return False
+    if len(stripped) > 2 and stripped[0] == stripped[-1] and stripped[0] in "\"'":
+        return True
+
+    words = stripped.split()
+    if len(words) > 3:
+        return False
+    return all(
+        re.search(r"\d", word) or _SPLIT_RE.search(word.strip(".,;:?!"))
+        for word in words
+    )
+
+
+class BM25Index:
+    """
+    Incrementally maintained inverted index with BM25 scoring.
+
+    Postings map term -> {doc slot: term frequency}. Each document keeps its
+    term counts so delete/upsert can retract its postings without a rebuild.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._slots: Dict[str, int] = {}
+        self._ids: List[Optional[str]] = []
+        self._terms: List[Optional[Counter]] = []
+        self._lengths: List[int] = []
+        self._metadatas: List[Optional[Dict[str, Any]]] = []
+        self._documents: List[Optional[str]] = []
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._by_content: Dict[str, Set[str]] = {}  # content_id metadata -> document IDs (chunks)
+        self._total_length = 0
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def ids(self) -> List[str]:
+        return list(self._slots)
+
+    def upsert(
+        self,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        """Add or replace documents."""
+        for item_id, document, metadata in zip(ids, documents, metadatas):
+            if item_id in self._slots:
+                self._remove(item_id)
+
+            metadata = dict(metadata or {})
+            extra = " ".join(str(metadata[f]) for f in INDEXED_METADATA_FIELDS if metadata.get(f))
+            terms = Counter(tokenize(f"{document or ''} {extra}"))
+            length = sum(terms.values())
+
+            slot = self._free.pop() if self._free else len(self._ids)
+            if slot == len(self._ids):
+                self._ids.append(None)
+                self._terms.append(None)
+                self._lengths.append(0)
+                self._metadatas.append(None)
+                self._documents.append(None)
+
+            self._slots[item_id] = slot
+            self._ids[slot] = item_id
+            self._terms[slot] = terms
+            self._lengths[slot] = length
+            self._metadatas[slot] = metadata
+            self._documents[slot] = document
+            self._total_length += length
+            if metadata.get("content_id") is not None:
+                self._by_content.setdefault(metadata["content_id"], set()).add(item_id)
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[slot] = tf
+
+    def update_metadata(self, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Merge metadata into existing documents, re-indexing indexed fields."""
+        for item_id, metadata in zip(ids, metadatas):
+            slot = self._slots.get(item_id)
+            if slot is None:
+                continue
+            merged = {**self._metadatas[slot], **metadata}
+            self.upsert([item_id], [self._documents[slot]], [merged])
+
+    def delete(self, ids: List[str]) -> int:
+        """Delete documents by ID. Returns the number removed."""
+        removed = 0
+        for item_id in ids:
+            if item_id in self._slots:
+                self._remove(item_id)
+                removed += 1
+        return removed
+
+    def ids_for_content(self, content_id: str) -> List[str]:
+        """IDs of documents (chunks) whose content_id is content_id, without a scan."""
+        return list(self._by_content.get(content_id, ()))
+
+    def ids_where(self, where: Dict[str, Any]) -> List[str]:
+        """IDs of documents whose metadata matches a where clause."""
+        return [
+            item_id for item_id, slot in self._slots.items()
+            if matches_where(self._metadatas[slot], where)
+        ]
+
+    def _remove(self, item_id: str) -> None:
+        slot = self._slots.pop(item_id)
+        content_id = self._metadatas[slot].get("content_id")
+        members = self._by_content.get(content_id)
+        if members is not None:
+            members.discard(item_id)
+            if not members:
+                del self._by_content[content_id]
+        for term in self._terms[slot]:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(slot, None)
+                if not postings:
+                    del self._postings[term]
+        self._total_length -= self._lengths[slot]
+        self._ids[slot] = None
+        self._terms[slot] = None
+        self._lengths[slot] = 0
+        self._metadatas[slot] = None
+        self._documents[slot] = None
+        self._free.append(slot)
+
+    def query(
+        self,
+        text: str,
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Top-k documents by BM25 score.
+
+        Args:
+            text: Query text
+            n_results: Maximum hits
+            where: Optional Chroma-style metadata filter
+
+        Returns:
+            Hits as dicts with id, document, metadata, score (highest first)
+        """
+        n_docs = len(self._slots)
+        if not n_docs or n_results <= 0:
+            return []
+
+        avg_length = self._total_length / n_docs or 1.0
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(text)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            for slot, tf in postings.items():
+                norm = self.k1 * (1.0 - self.b + self.b * self._lengths[slot] / avg_length)
+                scores[slot] = scores.get(slot, 0.0) + idf * tf * (self.k1 + 1.0) / (tf + norm)
+
+        if where:
+            scores = {s: v for s, v in scores.items() if matches_where(self._metadatas[s], where)}
+
+        top = heapq.nlargest(n_results, scores.items(), key=lambda item: item[1])
+        return [
+            {
+                "id": self._ids[slot],
+                "document": self._documents[slot],
+                "metadata": self._metadatas[slot],
+                "score": score,
+            }
+            for slot, score in top
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        return {"documents": len(self._slots), "terms": len(self._postings)}
+
+
+class LexicalIndex:
+    """BM25 indexes for the content and chunks collections."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.indexes: Dict[str, BM25Index] = {name: BM25Index(k1, b) for name in COLLECTIONS}
+        self.is_ready = False
+
+    def warm_from_chroma(self, client, page_size: int = 1000) -> Dict[str, int]:
+        """
+        Index every document in both Chroma collections.
+
+        Args:
+            client: ChromaDB client
+            page_size: Items per get() page
+
+        Returns:
+            Document counts per collection
+        """
+        from storage.collections import get_content_collection, get_chunks_collection
+
+        t_start = time.perf_counter()
+        collections = {
+            "content": get_content_collection(client),
+            "chunks": get_chunks_collection(client),
+        }
+
+        for name, collection in collections.items():
+            index = BM25Index(self.k1, self.b)
+            offset = 0
+            while True:
+                page = collection.get(
+                    include=["documents", "metadatas"],
+                    limit=page_size,
+                    offset=offset
+                )
+                ids = page.get("ids", [])
+                if not ids:
+                    break
+                index.upsert(ids, page["documents"], page["metadatas"])
+                if len(ids) < page_size:
+                    break
+                offset += page_size
+            self.indexes[name] = index
+
+        self.is_ready = True
+        counts = {name: len(index) for name, index in self.indexes.items()}
+        logger.info(
+            f"Lexical index warmed from Chroma: {counts} "
+            f"in {(time.perf_counter() - t_start) * 1000:.0f}ms"
+        )
+        return counts
+
+    # -------------------------------------------------------------------------
+    # Deltas from remember/forget
+    # -------------------------------------------------------------------------
+
+    def upsert(
+        self,
+        collection: str,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ) -> None:
+        if self.is_ready:
+            self.indexes[collection].upsert(ids, documents, metadatas)
+
+    def update_metadata(self, collection: str, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        if self.is_ready:
+            self.indexes[collection].update_metadata(ids, metadatas)
+
+    def update_chunk_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        """Merge metadata into every chunk of a content item."""
+        if self.is_ready:
+            chunks = self.indexes["chunks"]
+            ids = chunks.ids_for_content(content_id)
+            chunks.update_metadata(ids, [metadata] * len(ids))
+
+    def delete_content(self, content_id: str) -> Dict[str, int]:
+        """Delete a content item and its chunks."""
+        if not self.is_ready:
+            return {"content": 0, "chunks": 0}
+        chunks = self.indexes["chunks"]
+        return {
+            "content": self.indexes["content"].delete([content_id]),
+            "chunks": chunks.delete(chunks.ids_for_content(content_id)),
+        }
+
+    # -------------------------------------------------------------------------
+    # Query
+    # -------------------------------------------------------------------------
+
+    def query(
+        self,
+        collection: str,
+        text: str,
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """BM25 hits for one collection, highest score first."""
+        return self.indexes[collection].query(text, n_results, where)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {name: index.stats() for name, index in self.indexes.items()}
@@ -0,0 +1,608 @@
+"""
+Local in-process ANN read replica of the content and chunks collections (V10).
+
+Chroma stays the system of record. The replica is warmed from Chroma (or a
+snapshot file) at startup, kept current by remember/forget in this process,
+and answers hybrid_search_v5 queries without the HTTP hop.
+
+Search uses hnswlib when it is installed, otherwise exact cosine search over
+a NumPy matrix. Results are returned in Chroma's query() shape with cosine
+distances, and `where` filters use Chroma's operator semantics for the
+subset recall uses ($and, $or, $eq, $ne, $gt, $gte, $lt, $lte, $in, $nin).
+
+Writes from other processes are not seen until reconcile() runs; the
+consistency check reports drift and can repair it.
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+
+try:
+    import hnswlib
+except ImportError:  # Optional: exact NumPy search is used instead
+    hnswlib = None
+
+
+logger = logging.getLogger("mcp-memory.local_replica")
+
+COLLECTIONS = ("content", "chunks")
+
+
+# =============================================================================
+# Where-filter evaluation (Chroma semantics)
+# =============================================================================
+
+_COMPARATORS = {
+    "$eq": lambda a, b: a == b,
+    "$ne": lambda a, b: a != b,
+    "$gt": lambda a, b: a is not None and a > b,
+    "$gte": lambda a, b: a is not None and a >= b,
+    "$lt": lambda a, b: a is not None and a < b,
+    "$lte": lambda a, b: a is not None and a <= b,
+    "$in": lambda a, b: a in b,
+    "$nin": lambda a, b: a not in b,
+}
+
+
+def matches_where(metadata: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """
+    Evaluate a Chroma `where` clause against one metadata dict.
+
+    As in Chroma, a field condition on a missing key does not match
+    (except $ne / $nin).
+
+    Args:
+        metadata: Item metadata
+        where: Chroma where dict, or None
+
+    Returns:
+        True if the item matches
+    """
+    if not where:
+        return True
+
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(matches_where(metadata, sub) for sub in condition):
+                return False
+        elif key == "$or":
+            if not any(matches_where(metadata, sub) for sub in condition):
+                return False
+        else:
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+            for op, expected in condition.items():
+                if key not in metadata and op not in ("$ne", "$nin"):
+                    return False
+                try:
+                    if not _COMPARATORS[op](metadata.get(key), expected):
+                        return False
+                except TypeError:
+                    return False
+
+    return True
+
+
+# =============================================================================
+# Single-collection index
+# =============================================================================
+
+class LocalVectorIndex:
+    """
+    In-memory vectors, documents and metadata for one collection.
+
+    Vectors are stored L2-normalised so cosine distance is 1 - dot product,
+    in a preallocated matrix whose capacity doubles as items are added, so
+    warm-up and per-remember upserts copy the matrix O(log n) times in total.
+    """
+
+    def __init__(self, dimensions: int, use_hnsw: bool = True, hnsw_ef: int = 200):
+        self.dimensions = dimensions
+        self.use_hnsw = use_hnsw and hnswlib is not None
+        self.hnsw_ef = hnsw_ef
+
+        self._ids: List[Optional[str]] = []  # slot -> id (None = deleted)
+        self._slots: Dict[str, int] = {}
+        self._documents: List[Optional[str]] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._vectors = np.zeros((0, dimensions), dtype=np.float32)  # rows >= len(_ids) are spare capacity
+        self._by_content: Dict[str, Set[str]] = {}  # content_id metadata -> item IDs (chunks)
+        self._hnsw = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    @property
+    def ids(self) -> List[str]:
+        return list(self._slots)
+
+    def get_metadata(self, item_id: str) -> Optional[Dict[str, Any]]:
+        slot = self._slots.get(item_id)
+        return self._metadatas[slot] if slot is not None else None
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def upsert(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[Optional[str]],
+        metadatas: List[Optional[Dict[str, Any]]]
+    ) -> None:
+        """Add or replace items."""
+        if not ids:
+            return
+
+        vectors = self._normalise(np.asarray(embeddings, dtype=np.float32))
+        self._reserve(len(self._ids) + len(ids))
+        new_slots = []
+
+        for item_id, vector, document, metadata in zip(ids, vectors, documents, metadatas):
+            slot = self._slots.get(item_id)
+            metadata = dict(metadata or {})
+            if slot is None:
+                slot = len(self._ids)
+                self._ids.append(item_id)
+                self._documents.append(document)
+                self._metadatas.append(metadata)
+                self._slots[item_id] = slot
+                self._vectors[slot] = vector
+                new_slots.append((slot, vector))
+            else:
+                self._unlink_content(item_id, self._metadatas[slot])
+                self._documents[slot] = document
+                self._metadatas[slot] = metadata
+                self._vectors[slot] = vector
+                if self._hnsw is not None:
+                    self._hnsw.add_items(vector.reshape(1, -1), [slot])
+            self._link_content(item_id, metadata)
+
+        if new_slots:
+            if self._hnsw is not None:
+                self._ensure_hnsw_capacity(len(self._ids))
+                self._hnsw.add_items(
+                    np.stack([v for _, v in new_slots]),
+                    [slot for slot, _ in new_slots]
+                )
+
+    def update_metadata(self, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Merge metadata into existing items (unknown IDs are ignored)."""
+        for item_id, metadata in zip(ids, metadatas):
+            slot = self._slots.get(item_id)
+            if slot is not None:
+                self._unlink_content(item_id, self._metadatas[slot])
+                self._metadatas[slot].update(metadata or {})
+                self._link_content(item_id, self._metadatas[slot])
+
+    def delete(self, ids: List[str]) -> int:
+        """Delete items by ID. Returns the number removed."""
+        removed = 0
+        for item_id in ids:
+            slot = self._slots.pop(item_id, None)
+            if slot is None:
+                continue
+            self._unlink_content(item_id, self._metadatas[slot])
+            self._ids[slot] = None
+            self._documents[slot] = None
+            self._metadatas[slot] = {}
+            self._vectors[slot] = 0.0
+            if self._hnsw is not None:
+                self._hnsw.mark_deleted(slot)
+            removed += 1
+        return removed
+
+    def ids_for_content(self, content_id: str) -> List[str]:
+        """IDs of items (chunks) whose content_id is content_id, without a scan."""
+        return list(self._by_content.get(content_id, ()))
+
+    def ids_where(self, where: Dict[str, Any]) -> List[str]:
+        """IDs of items whose metadata matches a where clause."""
+        return [
+            item_id for item_id, slot in self._slots.items()
+            if matches_where(self._metadatas[slot], where)
+        ]
+
+    # -------------------------------------------------------------------------
+    # Search
+    # -------------------------------------------------------------------------
+
+    def build_hnsw(self) -> None:
+        """(Re)build the HNSW graph from the stored vectors, if hnswlib is available."""
+        if not self.use_hnsw:
+            return
+
+        live = [slot for slot, item_id in enumerate(self._ids) if item_id is not None]
+        self._hnsw = hnswlib.Index(space="ip", dim=self.dimensions)
+        self._hnsw.init_index(max_elements=max(len(self._ids), 1024), ef_construction=200, M=16)
+        self._hnsw.set_ef(self.hnsw_ef)
+        if live:
+            self._hnsw.add_items(self._vectors[live], live)
+
+    def query(
+        self,
+        query_embedding: List[float],
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Nearest neighbours by cosine distance.
+
+        Returns:
+            List of {id, document, metadata, distance}, nearest first
+        """
+        if not self._slots or n_results <= 0:
+            return []
+
+        query = self._normalise(np.asarray([query_embedding], dtype=np.float32))[0]
+        allowed = None
+        if where:
+            allowed = {
+                slot for slot in self._slots.values()
+                if matches_where(self._metadatas[slot], where)
+            }
+            if not allowed:
+                return []
+
+        k = min(n_results, len(allowed) if allowed is not None else len(self._slots))
+
+        pairs = None
+        if self._hnsw is not None:
+            try:
+                labels, distances = self._hnsw.knn_query(
+                    query.reshape(1, -1),
+                    k=k,
+                    filter=(lambda slot: slot in allowed) if allowed is not None else None
+                )
+                pairs = list(zip(labels[0].tolist(), distances[0].tolist()))
+            except RuntimeError:
+                # Highly selective filters can leave HNSW short of k results
+                pairs = None
+
+        if pairs is None:
+            pairs = self._exact_search(query, k, allowed)
+
+        return [
+            {
+                "id": self._ids[slot],
+                "document": self._documents[slot],
+                "metadata": self._metadatas[slot],
+                "distance": float(distance),
+            }
+            for slot, distance in pairs
+            if self._ids[slot] is not None
+        ]
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _exact_search(self, query: np.ndarray, k: int, allowed: Optional[set]) -> List[tuple]:
+        """Exact top-k by dot product over live (optionally filtered) slots."""
+        source = allowed if allowed is not None else self._slots.values()
+        slots = np.fromiter(source, dtype=np.int64)
+        scores = self._vectors[slots] @ query
+        top = np.argpartition(-scores, k - 1)[:k] if k < len(slots) else np.arange(len(slots))
+        top = top[np.argsort(-scores[top])]
+        return [(int(slots[i]), 1.0 - float(scores[i])) for i in top]
+
+    @staticmethod
+    def _normalise(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _reserve(self, size: int) -> None:
+        """Grow the vector matrix to hold size rows, at least doubling it."""
+        capacity = self._vectors.shape[0]
+        if size <= capacity:
+            return
+        grown = np.zeros((max(size, 2 * capacity), self.dimensions), dtype=np.float32)
+        used = len(self._ids)
+        grown[:used] = self._vectors[:used]
+        self._vectors = grown
+
+    def _link_content(self, item_id: str, metadata: Dict[str, Any]) -> None:
+        content_id = metadata.get("content_id")
+        if content_id is not None:
+            self._by_content.setdefault(content_id, set()).add(item_id)
+
+    def _unlink_content(self, item_id: str, metadata: Dict[str, Any]) -> None:
+        content_id = metadata.get("content_id")
+        members = self._by_content.get(content_id)
+        if members is not None:
+            members.discard(item_id)
+            if not members:
+                del self._by_content[content_id]
+
+    def _ensure_hnsw_capacity(self, size: int) -> None:
+        if self._hnsw is not None and size > self._hnsw.get_max_elements():
+            self._hnsw.resize_index(max(size, 2 * self._hnsw.get_max_elements()))
+
+    def nbytes(self) -> int:
+        return int(self._vectors.nbytes)
+
+
+# =============================================================================
+# Replica of both collections
+# =============================================================================
+
+class LocalVectorReplica:
+    """
+    Read replica of the content and chunks collections.
+
+    query() mirrors Collection.query() output for a single query embedding,
+    so callers can swap it in for Chroma transparently.
+    """
+
+    def __init__(self, dimensions: int = 3072, use_hnsw: bool = True):
+        self.dimensions = dimensions
+        self.indexes: Dict[str, LocalVectorIndex] = {
+            name: LocalVectorIndex(dimensions, use_hnsw=use_hnsw) for name in COLLECTIONS
+        }
+        self.is_ready = False
+
+    # -------------------------------------------------------------------------
+    # Warm-up and snapshots
+    # -------------------------------------------------------------------------
+
+    def warm_from_chroma(self, client, page_size: int = 1000) -> Dict[str, int]:
+        """
+        Load every item from both Chroma collections.
+
+        Args:
+            client: ChromaDB client
+            page_size: Items per get() page
+
+        Returns:
+            Item counts per collection
+        """
+        from storage.collections import get_content_collection, get_chunks_collection
+
+        t_start = time.perf_counter()
+        collections = {
+            "content": get_content_collection(client),
+            "chunks": get_chunks_collection(client),
+        }
+
+        for name, collection in collections.items():
+            index = LocalVectorIndex(self.dimensions, use_hnsw=self.indexes[name].use_hnsw)
+            offset = 0
+            while True:
+                page = collection.get(
+                    include=["embeddings", "documents", "metadatas"],
+                    limit=page_size,
+                    offset=offset
+                )
+                ids = page.get("ids", [])
+                if not ids:
+                    break
+                index.upsert(ids, page["embeddings"], page["documents"], page["metadatas"])
+                if len(ids) < page_size:
+                    break
+                offset += page_size
+            index.build_hnsw()
+            self.indexes[name] = index
+
+        self.is_ready = True
+        counts = {name: len(index) for name, index in self.indexes.items()}
+        logger.info(
+            f"Local replica warmed from Chroma: {counts} "
+            f"({self.nbytes() / 1e6:.0f}MB vectors, "
+            f"{'hnsw' if self.indexes['content'].use_hnsw else 'exact'}) "
+            f"in {(time.perf_counter() - t_start) * 1000:.0f}ms"
+        )
+        return counts
+
+    def save_snapshot(self, path: str) -> None:
+        """Write both collections to a .npz snapshot."""
+        arrays = {}
+        for name, index in self.indexes.items():
+            ids = index.ids
+            slots = [index._slots[item_id] for item_id in ids]
+            arrays[f"{name}_vectors"] = index._vectors[slots] if slots else np.zeros((0, self.dimensions), np.float32)
+            arrays[f"{name}_items"] = np.array(json.dumps({
+                "ids": ids,
+                "documents": [index._documents[s] for s in slots],
+                "metadatas": [index._metadatas[s] for s in slots],
+            }))
+        np.savez(path, **arrays)
+        logger.info(f"Local replica snapshot saved to {path}")
+
+    def load_snapshot(self, path: str) -> Dict[str, int]:
+        """
+        Load both collections from a snapshot written by save_snapshot().
+
+        The snapshot may be stale; run reconcile() against Chroma afterwards.
+        """
+        with np.load(path) as data:
+            for name in COLLECTIONS:
+                items = json.loads(str(data[f"{name}_items"]))
+                index = LocalVectorIndex(self.dimensions, use_hnsw=self.indexes[name].use_hnsw)
+                index.upsert(items["ids"], data[f"{name}_vectors"], items["documents"], items["metadatas"])
+                index.build_hnsw()
+                self.indexes[name] = index
+
+        self.is_ready = True
+        counts = {name: len(index) for name, index in self.indexes.items()}
+        logger.info(f"Local replica loaded snapshot {path}: {counts}")
+        return counts
+
+    # -------------------------------------------------------------------------
+    # Deltas from remember/forget
+    # -------------------------------------------------------------------------
+
+    def upsert(
+        self,
+        collection: str,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ) -> None:
+        if self.is_ready:
+            self.indexes[collection].upsert(ids, embeddings, documents, metadatas)
+
+    def update_metadata(self, collection: str, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        if self.is_ready:
+            self.indexes[collection].update_metadata(ids, metadatas)
+
+    def update_chunk_metadata(self, content_id: str, metadata: Dict[str, Any]) -> None:
+        """Merge metadata into every chunk of a content item."""
+        if self.is_ready:
+            chunks = self.indexes["chunks"]
+            ids = chunks.ids_for_content(content_id)
+            chunks.update_metadata(ids, [metadata] * len(ids))
+
+    def delete_content(self, content_id: str) -> Dict[str, int]:
+        """Delete a content item and its chunks (mirrors delete_v5_content_cascade)."""
+        if not self.is_ready:
+            return {"content": 0, "chunks": 0}
+        chunks = self.indexes["chunks"]
+        return {
+            "content": self.indexes["content"].delete([content_id]),
+            "chunks": chunks.delete(chunks.ids_for_content(content_id)),
+        }
+
+    # -------------------------------------------------------------------------
+    # Query
+    # -------------------------------------------------------------------------
+
+    def query(
+        self,
+        collection: str,
+        query_embedding: List[float],
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, List[List[Any]]]:
+        """Query one collection; output matches Chroma's query() for one embedding."""
+        hits = self.indexes[collection].query(query_embedding, n_results, where)
+        return {
+            "ids": [[h["id"] for h in hits]],
+            "documents": [[h["document"] for h in hits]],
+            "metadatas": [[h["metadata"] for h in hits]],
+            "distances": [[h["distance"] for h in hits]],
+        }
+
+    def nbytes(self) -> int:
+        return sum(index.nbytes() for index in self.indexes.values())
+
+    # -------------------------------------------------------------------------
+    # Consistency and comparison against Chroma
+    # -------------------------------------------------------------------------
+
+    def check_consistency(self, client, repair: bool = False, sample_size: int = 100) -> Dict[str, Any]:
+        """
+        Compare the replica with Chroma.
+
+        Checks ID sets for both collections and metadata for a sample of
+        shared IDs. With repair=True, missing items are fetched from Chroma,
+        extra items are dropped and mismatched metadata is overwritten.
+
+        Args:
+            client: ChromaDB client
+            repair: Reconcile differences after checking
+            sample_size: Shared IDs per collection to compare metadata for
+
+        Returns:
+            Report per collection: missing, extra, metadata_mismatches, consistent
+        """
+        from storage.collections import get_content_collection, get_chunks_collection
+
+        collections = {
+            "content": get_content_collection(client),
+            "chunks": get_chunks_collection(client),
+        }
+        report: Dict[str, Any] = {}
+
+        for name, collection in collections.items():
+            index = self.indexes[name]
+            chroma_ids = set(collection.get(include=[]).get("ids", []))
+            local_ids = set(index.ids)
+
+            missing = sorted(chroma_ids - local_ids)
+            extra = sorted(local_ids - chroma_ids)
+
+            sample = sorted(chroma_ids & local_ids)[:sample_size]
+            mismatched = []
+            if sample:
+                chroma_sample = collection.get(ids=sample, include=["metadatas"])
+                for item_id, metadata in zip(chroma_sample["ids"], chroma_sample["metadatas"]):
+                    if (metadata or {}) != index.get_metadata(item_id):
+                        mismatched.append(item_id)
+
+            if repair:
+                to_fetch = missing + mismatched
+                if to_fetch:
+                    fetched = collection.get(ids=to_fetch, include=["embeddings", "documents", "metadatas"])
+                    index.upsert(fetched["ids"], fetched["embeddings"], fetched["documents"], fetched["metadatas"])
+                if extra:
+                    index.delete(extra)
+
+            report[name] = {
+                "chroma_count": len(chroma_ids),
+                "local_count": len(local_ids),
+                "missing": len(missing),
+                "extra": len(extra),
+                "metadata_mismatches": len(mismatched),
+                "consistent": not (missing or extra or mismatched),
+                "repaired": repair,
+            }
+
+        logger.info(f"Local replica consistency: {report}")
+        return report
+
+    def reconcile(self, client) -> Dict[str, Any]:
+        """Repair drift against Chroma (e.g. after loading a snapshot)."""
+        return self.check_consistency(client, repair=True)
+
+    def compare_with_chroma(
+        self,
+        client,
+        query_embeddings: List[List[float]],
+        n_results: int = 10,
+        collection: str = "content"
+    ) -> Dict[str, Any]:
+        """
+        Latency and recall@k of the replica against Chroma for the same queries.
+
+        Args:
+            client: ChromaDB client
+            query_embeddings: Queries to run against both
+            n_results: k
+            collection: Collection to compare
+
+        Returns:
+            Mean latency per backend (ms) and mean recall@k of local vs Chroma
+        """
+        from storage.collections import get_content_collection, get_chunks_collection
+
+        chroma_col = get_content_collection(client) if collection == "content" else get_chunks_collection(client)
+        chroma_ms, local_ms, recalls = [], [], []
+
+        for embedding in query_embeddings:
+            t0 = time.perf_counter()
+            expected = chroma_col.query(query_embeddings=[embedding], n_results=n_results, include=["distances"])
+            chroma_ms.append((time.perf_counter() - t0) * 1000)
+
+            t0 = time.perf_counter()
+            actual = self.query(collection, embedding, n_results)
+            local_ms.append((time.perf_counter() - t0) * 1000)
+
+            expected_ids = set(expected["ids"][0])
+            if expected_ids:
+                recalls.append(len(expected_ids & set(actual["ids"][0])) / len(expected_ids))
+
+        count = len(query_embeddings) or 1
+        return {
+            "queries": len(query_embeddings),
+            "k": n_results,
+            "chroma_ms": sum(chroma_ms) / count,
+            "local_ms": sum(local_ms) / count,
+            "recall_at_k": sum(recalls) / len(recalls) if recalls else None,
+        }
@@ -0,0 +1,220 @@
+"""
+Persistent entity merge decision cache (V10).
+
+The same ambiguous pair ("Alex" at Acme vs the existing "Alex Chen") used to
+go to the LLM again in every document that mentioned it. Confident
+"same"/"different" decisions are stored in Postgres keyed by
+(candidate entity_id, normalized mention name, context hash):
+- the context hash covers the mention's type and context clues and the
+  model, so a mention with other clues is decided afresh
+- entries expire after a TTL and are deleted when the candidate entity is
+  renamed by a merge (the pair the LLM saw no longer exists)
+- "uncertain" and low-confidence decisions are never stored
+
+Cache errors are logged and treated as misses - resolution never fails
+because of the cache.
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+
+logger = logging.getLogger("entity_resolution.decision_cache")
+
+MIN_CONFIDENCE = 0.8
+
+
+def context_hash(entity_type: str, role: Optional[str], organization: Optional[str],
+                 email: Optional[str], model: str) -> str:
+    """Short hash of the mention context the LLM decision depended on."""
+    parts = [entity_type, role or "", organization or "", email or "", model]
+    return hashlib.sha256("\x00".join(p.strip().lower() for p in parts).encode()).hexdigest()[:32]
+
+
+class MergeDecisionCache:
+    """LLM merge decisions in the entity_merge_decision table, with in-process hit counters."""
+
+    def __init__(self, pg_client, ttl_days: int = 30):
+        """
+        Initialize merge decision cache.
+
+        Args:
+            pg_client: Postgres client instance (async)
+            ttl_days: Days a decision is reused before the LLM is asked again
+        """
+        self.pg = pg_client
+        self.ttl_days = ttl_days
+        self.hits = 0
+        self.misses = 0
+
+    async def get(
+        self,
+        candidate_entity_id: UUID,
+        normalized_name: str,
+        context_hash: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up an unexpired decision, counting the hit in the same statement.
+
+        Args:
+            candidate_entity_id: Existing entity the mention was compared with
+            normalized_name: Normalized name of the mention
+            context_hash: context_hash() of the mention
+
+        Returns:
+            {decision, canonical_name, reason, confidence} or None
+        """
+        try:
+            row = await self.pg.fetch_one(
+                """
+                UPDATE entity_merge_decision
+                SET hit_count = hit_count + 1, last_hit_at = now()
+                WHERE candidate_entity_id = $1 AND normalized_name = $2
+                  AND context_hash = $3 AND expires_at > now()
+                RETURNING decision, canonical_name, reason, confidence
+                """,
+                candidate_entity_id,
+                normalized_name,
+                context_hash
+            )
+        except Exception as e:
+            logger.warning(f"Merge decision cache lookup failed: {e}")
+            row = None
+
+        if row:
+            self.hits += 1
+            return row
+        self.misses += 1
+        return None
+
+    async def put(
+        self,
+        candidate_entity_id: UUID,
+        normalized_name: str,
+        context_hash: str,
+        decision: str,
+        canonical_name: str,
+        reason: str,
+        confidence: float
+    ) -> None:
+        """
+        Store a decision if it is confident enough (the latest decision wins).
+
+        Args:
+            candidate_entity_id: Existing entity the mention was compared with
+            normalized_name: Normalized name of the mention
+            context_hash: context_hash() of the mention
+            decision: "same" or "different" ("uncertain" is not stored)
+            canonical_name: Canonical name the LLM chose
+            reason: LLM explanation
+            confidence: LLM confidence (below MIN_CONFIDENCE is not stored)
+        """
+        if decision not in ("same", "different") or confidence < MIN_CONFIDENCE:
+            return
+
+        try:
+            await self.pg.execute(
+                """
+                INSERT INTO entity_merge_decision (
+                    candidate_entity_id, normalized_name, context_hash,
+                    decision, canonical_name, reason, confidence, expires_at
+                ) VALUES ($1, $2, $3, $4, $5, $6, $7, now() + make_interval(days => $8))
+                ON CONFLICT (candidate_entity_id, normalized_name, context_hash) DO UPDATE SET
+                    decision = EXCLUDED.decision,
+                    canonical_name = EXCLUDED.canonical_name,
+                    reason = EXCLUDED.reason,
+                    confidence = EXCLUDED.confidence,
+                    created_at = now(),
+                    expires_at = EXCLUDED.expires_at
+                """,
+                candidate_entity_id,
+                normalized_name,
+                context_hash,
+                decision,
+                canonical_name,
+                reason,
+                confidence,
+                self.ttl_days
+            )
+        except Exception as e:
+            logger.warning(f"Merge decision cache write failed: {e}")
+
+    async def invalidate(self, entity_id: UUID) -> None:
+        """
+        Drop every decision made against an entity.
+
+        Args:
+            entity_id: Entity whose identity changed
+        """
+        try:
+            await self.pg.execute(
+                "DELETE FROM entity_merge_decision WHERE candidate_entity_id = $1",
+                entity_id
+            )
+        except Exception as e:
+            logger.warning(f"Merge decision cache invalidation failed: {e}")
+
+    async def prune_expired(self) -> int:
+        """
+        Delete expired decisions.
+
+        Returns:
+            Number of entries deleted
+        """
+        try:
+            deleted = await self.pg.fetch_val(
+                """
+                WITH deleted AS (
+                    DELETE FROM entity_merge_decision WHERE expires_at <= now() RETURNING 1
+                )
+                SELECT count(*) FROM deleted
+                """
+            )
+        except Exception as e:
+            logger.warning(f"Merge decision cache prune failed: {e}")
+            return 0
+
+        if deleted:
+            logger.info(f"Pruned {deleted} expired merge decisions")
+        return deleted or 0
+
+    def stats(self) -> Dict[str, Any]:
+        """In-process hit counters since startup."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else None,
+        }
+
+
+async def merge_decision_cache_stats(pg_client) -> Dict[str, Any]:
+    """
+    LLM confirmations avoided across all workers, from the table itself.
+
+    Every hit is one confirmation call that was not made.
+
+    Args:
+        pg_client: Postgres client instance (async)
+
+    Returns:
+        {entries, llm_calls_avoided, avoided_per_1k_documents}
+    """
+    row = await pg_client.fetch_one(
+        """
+        SELECT
+            (SELECT count(*) FROM entity_merge_decision) AS entries,
+            (SELECT COALESCE(sum(hit_count), 0) FROM entity_merge_decision) AS hits,
+            (SELECT count(*) FROM artifact_revision) AS documents
+        """
+    )
+    entries = row["entries"] if row else 0
+    hits = int(row["hits"]) if row else 0
+    documents = row["documents"] if row else 0
+    return {
+        "entries": entries,
+        "llm_calls_avoided": hits,
+        "avoided_per_1k_documents": round(hits * 1000 / documents, 1) if documents else None,
+    }
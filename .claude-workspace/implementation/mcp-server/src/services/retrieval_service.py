@@ -12,7 +12,7 @@ import logging
 import math
 import os
 import time
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Tuple, Callable, Awaitable
 from dataclasses import dataclass, field
 from uuid import UUID
 
@@ -23,15 +23,24 @@ from storage.collections import (
     get_content_collection,
     get_chunks_collection,
     get_content_by_id,
-    get_v5_chunks_by_content
+    get_v5_chunks_by_content,
+    to_epoch_seconds,
+    UNDATED_TS_EPOCH,
 )
 from services.embedding_service import EmbeddingService
 from services.chunking_service import ChunkingService
+from services.graph_cache import GraphCache, GraphExpansionHit
+from services.local_vector_replica import LocalVectorReplica
+from services.lexical_index import LexicalIndex, looks_like_identifier
 from utils.errors import RetrievalError
+from utils.concurrency import gather_with_timeouts
 
 
 logger = logging.getLogger("mcp-memory.retrieval")
 
+# V10: Async callback receiving (stage name, JSON-ready payload) as results become available
+StageCallback = Callable[[str, Any], Awaitable[None]]
+
 
 # ============================================================================
 # V6 Data Structures
@@ -94,6 +103,8 @@ class V4SearchResult:
     related_context: List[RelatedContextItem] = field(default_factory=list)
     entities: List[EntityInfo] = field(default_factory=list)
     expand_options: Dict[str, Any] = field(default_factory=dict)
+    edges: List[Dict[str, Any]] = field(default_factory=list)  # V10
+    partial: List[str] = field(default_factory=list)  # V10: Enrichments that failed/timed out
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -110,7 +121,9 @@ class V4SearchResult:
             ],
             "related_context": [rc.to_dict() for rc in self.related_context],
             "entities": [e.to_dict() for e in self.entities],
-            "expand_options": self.expand_options
+            "expand_options": self.expand_options,
+            "edges": self.edges,
+            "partial": self.partial
         }
 
     def _get_artifact_uid(self, result: MergedResult) -> Optional[str]:
@@ -122,6 +135,23 @@ class V4SearchResult:
         return result.result.artifact_id
 
 
+@dataclass
+class BatchSearchResult:
+    """V10: Per-query results from hybrid_search_batch with shared enrichment."""
+    results: List[V4SearchResult]
+    entities: List[EntityInfo] = field(default_factory=list)
+    edges: List[Dict[str, Any]] = field(default_factory=list)
+    partial: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "results": [r.to_dict() for r in self.results],
+            "entities": [e.to_dict() for e in self.entities],
+            "edges": self.edges,
+            "partial": self.partial
+        }
+
+
 class RetrievalService:
     """V6 retrieval service with RRF merging and SQL-based graph expansion."""
 
@@ -131,7 +161,11 @@ class RetrievalService:
         chunking_service: ChunkingService,
         chroma_client: HttpClient,
         k: int = 60,
-        pg_client=None
+        pg_client=None,
+        graph_cache: Optional[GraphCache] = None,
+        enrichment_timeout: float = 2.0,
+        local_replica: Optional[LocalVectorReplica] = None,
+        lexical_index: Optional[LexicalIndex] = None
     ):
         """
         Initialize retrieval service.
@@ -142,12 +176,20 @@ class RetrievalService:
             chroma_client: ChromaDB client
             k: RRF constant (standard value: 60)
             pg_client: Postgres client for graph expansion via SQL joins
+            graph_cache: V10 in-memory graph for multi-hop expansion (SQL fallback)
+            enrichment_timeout: V10 per-call timeout (seconds) for evidence/entity/edge fetches
+            local_replica: V10 in-process read replica of content/chunks (Chroma fallback)
+            lexical_index: V10 in-process BM25 index of content/chunks text
         """
         self.embedding_service = embedding_service
         self.chunking_service = chunking_service
         self.chroma_client = chroma_client
         self.k = k
         self.pg_client = pg_client
+        self.graph_cache = graph_cache
+        self.enrichment_timeout = enrichment_timeout
+        self.local_replica = local_replica
+        self.lexical_index = lexical_index
 
     # =========================================================================
     # V7.3: Triplet Scoring Helpers
@@ -190,11 +232,14 @@ class RetrievalService:
         - entity_distance: cosine distance of connecting entity name to query
         - event_distance: cosine distance of event narrative to query
 
-        V9: Uses cached embeddings from semantic_event.embedding when available,
-        only generating embeddings for entity names (which aren't cached).
+        V9: Uses cached embeddings from semantic_event.embedding when available.
+        V10: Uses cached entity.name_embedding as well, so scoring is local math
+        only. Texts are embedded (in one batch) only for legacy rows whose
+        embeddings have not been backfilled yet.
 
         Args:
-            events: List of related events with 'narrative', 'reason', and optional 'embedding' fields
+            events: List of related events with 'narrative', 'reason', and optional
+                'embedding' / 'entity_embedding' fields
             query_embedding: Pre-computed query embedding
             event_weight: Weight for event narrative (default 1.5)
 
@@ -206,129 +251,115 @@ class RetrievalService:
 
         # V9: Latency instrumentation
         t_start = time.perf_counter()
-        t_embed_start = 0.0
-        t_embed_end = 0.0
+        embed_ms = 0.0
 
-        # V9: Separate events with cached embeddings from those needing generation
-        cached_narrative_embeddings = {}
-        texts_to_embed = []  # Only entity names (narratives use cache)
-        text_to_event_idx = []  # Track which event each text belongs to
+        narrative_embeddings: Dict[int, List[float]] = {}
+        entity_embeddings: Dict[int, List[float]] = {}
+        texts_to_embed: List[str] = []
+        # (event index, "narrative" | "entity") per text in texts_to_embed
+        text_targets: List[Tuple[int, str]] = []
 
         for i, event in enumerate(events):
-            # Check for cached narrative embedding
-            cached_emb = event.get("embedding")
-            if cached_emb:
-                # pgvector returns string format "[0.1,0.2,...]" - parse if needed
-                if isinstance(cached_emb, str):
-                    try:
-                        cached_emb = [float(x) for x in cached_emb.strip("[]").split(",")]
-                    except (ValueError, AttributeError):
-                        cached_emb = None
-                if cached_emb:
-                    cached_narrative_embeddings[i] = cached_emb
-
-            # Always need to embed entity names (not cached)
-            reason = event.get("reason", "")
-            entity_name = reason.split(":", 1)[1] if ":" in reason else reason
-            if entity_name and entity_name.strip():
-                texts_to_embed.append(entity_name)
-                text_to_event_idx.append(i)
-
-        # Track cache hit rate
-        cache_hits = len(cached_narrative_embeddings)
-        cache_misses = len(events) - cache_hits
-
-        # For events without cached embeddings, add narratives to embed list
-        narrative_indices = {}  # Maps event index to position in texts_to_embed
-        for i, event in enumerate(events):
-            if i not in cached_narrative_embeddings:
+            narrative_emb = self._parse_vector(event.get("embedding"))
+            if narrative_emb:
+                narrative_embeddings[i] = narrative_emb
+            else:
                 narrative = event.get("narrative", "")
                 if narrative and narrative.strip():
-                    narrative_indices[i] = len(texts_to_embed)
                     texts_to_embed.append(narrative)
-                    text_to_event_idx.append(i)
+                    text_targets.append((i, "narrative"))
 
-        if not texts_to_embed and not cached_narrative_embeddings:
-            # No valid texts and no cached embeddings
-            for event in events:
-                event["triplet_score"] = 2.0
-            return events
+            entity_emb = self._parse_vector(event.get("entity_embedding"))
+            if entity_emb:
+                entity_embeddings[i] = entity_emb
+            else:
+                reason = event.get("reason", "")
+                entity_name = reason.split(":", 1)[1] if ":" in reason else reason
+                if entity_name and entity_name.strip():
+                    texts_to_embed.append(entity_name)
+                    text_targets.append((i, "entity"))
+
+        cache_hits = len(narrative_embeddings) + len(entity_embeddings)
+        cache_total = cache_hits + len(texts_to_embed)
 
-        # Generate embeddings only for non-cached texts
-        generated_embeddings = []
         if texts_to_embed:
             try:
                 t_embed_start = time.perf_counter()
-                generated_embeddings = self.embedding_service.generate_embeddings_batch(texts_to_embed)
-                t_embed_end = time.perf_counter()
+                generated = self.embedding_service.generate_embeddings_batch(texts_to_embed)
+                embed_ms = (time.perf_counter() - t_embed_start) * 1000
             except Exception as e:
                 logger.warning(f"Triplet scoring embedding failed: {e}, using default scores")
                 for event in events:
                     event["triplet_score"] = 2.0
                 return events
 
-        # Score each event
-        scored_events = []
-        entity_emb_idx = 0  # Track position in generated embeddings for entity names
-
-        for i, event in enumerate(events):
-            # Get narrative embedding (from cache or generated)
-            if i in cached_narrative_embeddings:
-                narrative_emb = cached_narrative_embeddings[i]
-            elif i in narrative_indices:
-                narrative_emb = generated_embeddings[narrative_indices[i]]
-            else:
-                narrative_emb = []
+            for (i, kind), embedding in zip(text_targets, generated):
+                if kind == "narrative":
+                    narrative_embeddings[i] = embedding
+                else:
+                    entity_embeddings[i] = embedding
 
-            # Get entity embedding (always generated)
-            # Find the entity embedding for this event
-            entity_emb = []
-            for j, evt_idx in enumerate(text_to_event_idx):
-                if evt_idx == i and j < len(generated_embeddings):
-                    # Check if this is an entity (not a narrative)
-                    if i not in narrative_indices or j != narrative_indices[i]:
-                        entity_emb = generated_embeddings[j]
-                        break
+        if not narrative_embeddings and not entity_embeddings:
+            # No valid texts and no cached embeddings
+            for event in events:
+                event["triplet_score"] = 2.0
+            return events
 
-            event_dist = self._cosine_distance(query_embedding, narrative_emb)
-            entity_dist = self._cosine_distance(query_embedding, entity_emb)
+        # Score each event
+        for i, event in enumerate(events):
+            event_dist = self._cosine_distance(query_embedding, narrative_embeddings.get(i, []))
+            entity_dist = self._cosine_distance(query_embedding, entity_embeddings.get(i, []))
 
             # Triplet score: lower is better
-            triplet_score = entity_dist + (event_dist * event_weight)
-
-            event["triplet_score"] = triplet_score
+            event["triplet_score"] = entity_dist + (event_dist * event_weight)
             event["event_distance"] = event_dist
             event["entity_distance"] = entity_dist
-            scored_events.append(event)
 
         # Sort by triplet score (ascending = most relevant first)
-        scored_events.sort(key=lambda x: x["triplet_score"])
+        scored_events = sorted(events, key=lambda x: x["triplet_score"])
+
+        total_ms = (time.perf_counter() - t_start) * 1000
+        logger.info(
+            f"Triplet scoring: {len(scored_events)} events, "
+            f"cache={cache_hits}/{cache_total}, "
+            f"embedded={len(texts_to_embed)}, "
+            f"latency={total_ms:.0f}ms (embed={embed_ms:.0f}ms)"
+        )
 
-        # V9: Calculate and log latency metrics
-        t_end = time.perf_counter()
-        total_ms = (t_end - t_start) * 1000
-        embed_ms = (t_embed_end - t_embed_start) * 1000 if t_embed_start > 0 else 0
+        return scored_events
 
-        # Calculate what latency would be without cache (for comparison)
-        # Without cache: would embed entity names + narratives = 2x texts
-        texts_without_cache = len(texts_to_embed) + cache_hits
-        estimated_no_cache_ms = (embed_ms * texts_without_cache / len(texts_to_embed)) if texts_to_embed else 0
-        speedup = estimated_no_cache_ms / embed_ms if embed_ms > 0 else 1.0
+    @staticmethod
+    def _parse_vector(value: Any) -> Optional[List[float]]:
+        """
+        Parse a cached pgvector value into a list of floats.
 
-        if scored_events:
-            logger.info(
-                f"Triplet scoring: {len(scored_events)} events, "
-                f"cache={cache_hits}/{cache_hits + cache_misses}, "
-                f"texts={len(texts_to_embed)}/{texts_without_cache}, "
-                f"latency={total_ms:.0f}ms (embed={embed_ms:.0f}ms, est_no_cache={estimated_no_cache_ms:.0f}ms, speedup={speedup:.1f}x)"
-            )
+        pgvector columns come back from asyncpg as "[0.1,0.2,...]" strings
+        unless a codec is registered.
 
-        return scored_events
+        Args:
+            value: String, sequence, or None
+
+        Returns:
+            List of floats, or None if missing or malformed
+        """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            try:
+                return [float(x) for x in value.strip("[]").split(",")]
+            except ValueError:
+                return None
+        try:
+            parsed = [float(x) for x in value]
+        except (TypeError, ValueError):
+            return None
+        return parsed or None
 
     def merge_results_rrf(
         self,
         results_by_collection: Dict[str, List[SearchResult]],
-        limit: int
+        limit: int,
+        key_by_artifact: bool = False
     ) -> List[MergedResult]:
         """
         Merge multi-collection results using Reciprocal Rank Fusion.
@@ -336,6 +367,9 @@ class RetrievalService:
         Args:
             results_by_collection: Search results keyed by collection name
             limit: Maximum results to return
+            key_by_artifact: V10 fuse on parent artifact instead of result ID, so a
+                chunk hit in one list and its content hit in another reinforce
+                each other (the first list's result is kept)
 
         Returns:
             List of merged results sorted by RRF score
@@ -346,6 +380,8 @@ class RetrievalService:
         for collection, results in results_by_collection.items():
             for rank, result in enumerate(results):
                 result_id = result.id
+                if key_by_artifact:
+                    result_id = (result.artifact_id or result.id).split("::")[0]
                 rrf_score = 1.0 / (self.k + rank + 1)
 
                 if result_id not in merged_scores:
@@ -437,8 +473,10 @@ class RetrievalService:
         query_embedding: Optional[List[float]] = None,
         use_triplet_scoring: bool = True,
         candidate_artifact_uids: Optional[List[str]] = None,
-        edge_types: Optional[List[str]] = None  # V9: Filter by relationship type
-    ) -> Tuple[List[RelatedContextItem], List[EntityInfo]]:
+        edge_types: Optional[List[str]] = None,  # V9: Filter by relationship type
+        include_edges: bool = False,
+        on_stage: Optional[StageCallback] = None
+    ) -> Tuple[List[RelatedContextItem], List[EntityInfo], List[Dict[str, Any]], List[str]]:
         """
         Perform graph expansion from primary results.
 
@@ -448,19 +486,26 @@ class RetrievalService:
         3. Use graph service to expand from those events
         4. Return related events as RelatedContextItem
 
+        V10: Uses the in-memory graph cache (multi-hop, honours depth) when it
+        is built; otherwise the single-hop SQL expansion.
+
         Args:
             primary_results: Seed results for expansion
-            depth: Expansion depth (1-2 hops)
+            depth: Expansion depth (1-3 hops; SQL fallback is always 1 hop)
             budget: Maximum related items
             category_filter: Event categories to include
             include_entities: Whether to include entity information
+            include_edges: V10 - also fetch entity_edge rows for the events' entities
+            on_stage: V10 - called with "related", "entities" and "edges" as each
+                enrichment finishes (for streamed recall)
 
         Returns:
-            Tuple of (related_context, entities)
+            Tuple of (related_context, entities, edges, partial) where partial
+            names enrichments that failed or timed out
         """
         # V6: Only requires pg_client (uses SQL joins, no AGE/graph_service)
         if not self.pg_client:
-            return [], []
+            return [], [], [], []
 
         try:
             # Step 1: Get seed event IDs either from explicit seeds (preferred) or
@@ -470,17 +515,18 @@ class RetrievalService:
 
             if not seed_event_ids:
                 logger.info("No seed events found for graph expansion")
-                return [], []
+                return [], [], [], []
 
-            # Step 2: Perform graph expansion via SQL joins (V5 - no AGE required)
+            # Step 2: Perform graph expansion (V10: graph cache, else SQL joins)
             # Fetch more than budget if using triplet scoring, to allow for re-ranking
             fetch_budget = budget * 2 if (use_triplet_scoring and query_embedding) else budget
-            related_events = await self._expand_from_events_sql(
+            related_events = await self._expand_related_events(
                 seed_event_ids=seed_event_ids,
+                depth=depth,
                 budget=fetch_budget,
                 category_filter=category_filter,
-                candidate_artifact_uids=candidate_artifact_uids,  # V7.3: Two-phase filter
-                edge_types=edge_types  # V9: Edge type filter
+                candidate_artifact_uids=candidate_artifact_uids,
+                edge_types=edge_types
             )
 
             # Step 2.5: V7.3 Triplet scoring - re-rank events by semantic relevance
@@ -497,46 +543,368 @@ class RetrievalService:
             # Events are already deduplicated in the SQL query
             related_event_ids = [UUID(event["event_id"]) if isinstance(event["event_id"], str) else event["event_id"]
                                  for event in related_events]
-            evidence_map = await self._fetch_evidence_for_events(related_event_ids)
+
+            # V10: Evidence, entities and edges are independent - fetch concurrently
+            # (seed + related events, capped at 50, scope entities and edges)
+            enrichment_event_ids = (seed_event_ids + related_event_ids)[:50]
+            calls = {
+                "evidence": self._staged(
+                    on_stage, "related", self._fetch_evidence_for_events(related_event_ids),
+                    lambda evidence: [rc.to_dict() for rc in self._build_related_context(related_events, evidence)]
+                )
+            }
+            if include_entities:
+                calls["entities"] = self._staged(
+                    on_stage, "entities", self._fetch_entities_for_events(enrichment_event_ids),
+                    lambda entities: [e.to_dict() for e in entities]
+                )
+            if include_edges:
+                calls["edges"] = self._staged(
+                    on_stage, "edges", self._fetch_edges_for_events(enrichment_event_ids, edge_types),
+                    lambda edges: edges
+                )
+            enrichment, partial = await gather_with_timeouts(
+                calls,
+                timeout=self.enrichment_timeout,
+                defaults={"evidence": {}, "entities": [], "edges": []}
+            )
+            evidence_map = enrichment["evidence"]
 
             # Step 3: Convert to RelatedContextItem (with evidence)
-            related_context = []
-            for event in related_events:
-                event_id = UUID(event["event_id"]) if isinstance(event["event_id"], str) else event["event_id"]
-                related_context.append(RelatedContextItem(
-                    type="event",
-                    id=str(event_id),
-                    category=event["category"],
-                    reason=event["reason"],
-                    summary=event["narrative"],
-                    artifact_uid=event["artifact_uid"],
-                    revision_id=event["revision_id"],
-                    event_time=str(event["event_time"]) if event["event_time"] else None,
-                    evidence=evidence_map.get(event_id, [])
-                ))
+            related_context = self._build_related_context(related_events, evidence_map)
 
-            # Step 4: Get entities if requested (from Postgres, includes aliases + mention counts)
-            entities = []
-            if include_entities:
-                # Get entities from both seed and related events
-                all_event_ids = (seed_event_ids + related_event_ids)[:50]
-                entities = await self._fetch_entities_for_events(all_event_ids)
+            # Step 4: Entities (aliases + mention counts) and edges, if requested
+            entities = enrichment.get("entities", [])
+            edges = enrichment.get("edges", [])
 
             logger.info(
                 f"Graph expansion: {len(seed_event_ids)} seeds -> "
-                f"{len(related_context)} related, {len(entities)} entities"
+                f"{len(related_context)} related, {len(entities)} entities, {len(edges)} edges"
+                + (f" (partial: {', '.join(partial)})" if partial else "")
             )
 
-            return related_context, entities
+            return related_context, entities, edges, partial
 
         except Exception as e:
             logger.error(f"Graph expansion failed: {e}")
-            return [], []
+            return [], [], [], ["graph_expansion"]
+
+    @staticmethod
+    async def _emit_stage(on_stage: StageCallback, stage: str, payload: Any) -> None:
+        """Report a stage to on_stage (V10). Callback errors are logged, never raised."""
+        try:
+            await on_stage(stage, payload)
+        except Exception as e:
+            logger.warning(f"Stage callback '{stage}' failed: {e}")
+
+    async def _staged(
+        self,
+        on_stage: Optional[StageCallback],
+        stage: str,
+        awaitable: Awaitable[Any],
+        to_payload: Callable[[Any], Any]
+    ) -> Any:
+        """Await a fetch, then report its result to on_stage (V10)."""
+        value = await awaitable
+        if on_stage:
+            await self._emit_stage(on_stage, stage, to_payload(value))
+        return value
+
+    async def _expand_related_events(
+        self,
+        seed_event_ids: List[UUID],
+        depth: int,
+        budget: int,
+        category_filter: Optional[List[str]] = None,
+        candidate_artifact_uids: Optional[List[str]] = None,
+        edge_types: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Related events for a seed set: graph cache when built, else SQL (V10).
+
+        Returns:
+            Event dicts (event_id, category, narrative, reason, artifact_uid, ...)
+        """
+        related_events = None
+        if self.graph_cache and self.graph_cache.is_ready:
+            related_events = await self._expand_from_graph_cache(
+                seed_event_ids=seed_event_ids,
+                depth=depth,
+                budget=budget,
+                category_filter=category_filter,
+                candidate_artifact_uids=candidate_artifact_uids,
+                edge_types=edge_types
+            )
+        if related_events is None:
+            related_events = await self._expand_from_events_sql(
+                seed_event_ids=seed_event_ids,
+                budget=budget,
+                category_filter=category_filter,
+                candidate_artifact_uids=candidate_artifact_uids,  # V7.3: Two-phase filter
+                edge_types=edge_types  # V9: Edge type filter
+            )
+        return related_events
+
+    @staticmethod
+    def _build_related_context(
+        related_events: List[Dict[str, Any]],
+        evidence_map: Dict[UUID, List[Dict[str, Any]]]
+    ) -> List[RelatedContextItem]:
+        """Convert expanded event rows into RelatedContextItems with evidence."""
+        related_context = []
+        for event in related_events:
+            event_id = UUID(event["event_id"]) if isinstance(event["event_id"], str) else event["event_id"]
+            related_context.append(RelatedContextItem(
+                type="event",
+                id=str(event_id),
+                category=event["category"],
+                reason=event["reason"],
+                summary=event["narrative"],
+                artifact_uid=event["artifact_uid"],
+                revision_id=event["revision_id"],
+                event_time=str(event["event_time"]) if event["event_time"] else None,
+                evidence=evidence_map.get(event_id, [])
+            ))
+        return related_context
 
     # =========================================================================
     # V6: Unified Search over Content/Chunks Collections
     # =========================================================================
 
+    def _query_collection(
+        self,
+        name: str,
+        collection,
+        query_embeddings: List[List[float]],
+        n_results: int,
+        where: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Query one collection, from the local replica when it is ready (V10).
+
+        Accepts several query embeddings (one Chroma request for all of them);
+        output has one row per embedding, as in Collection.query().
+        Falls back to Chroma if the replica is disabled, still warming, or errors.
+        """
+        if self.local_replica and self.local_replica.is_ready:
+            try:
+                rows = [
+                    self.local_replica.query(name, embedding, n_results, where)
+                    for embedding in query_embeddings
+                ]
+                return {
+                    key: [row[key][0] for row in rows]
+                    for key in ("ids", "documents", "metadatas", "distances")
+                }
+            except Exception as e:
+                logger.warning(f"Local replica query failed for {name}, using Chroma: {e}")
+
+        return collection.query(
+            query_embeddings=query_embeddings,
+            n_results=n_results,
+            where=where,
+            include=["documents", "metadatas", "distances"]
+        )
+
+    def _vector_candidates(
+        self,
+        query_embeddings: List[List[float]],
+        limit: int,
+        where: Optional[Dict[str, Any]]
+    ) -> List[List[SearchResult]]:
+        """
+        Vector hits from both collections per query embedding, each list
+        sorted by distance (lower = better).
+
+        One multi-vector query per collection covers all embeddings.
+        """
+        content_col = get_content_collection(self.chroma_client)
+        chunks_col = get_chunks_collection(self.chroma_client)
+
+        candidates: List[List[SearchResult]] = [[] for _ in query_embeddings]
+        for name, collection in (("content", content_col), ("chunks", chunks_col)):
+            results = self._query_collection(name, collection, query_embeddings, limit, where)
+            rows = zip(
+                results.get("ids") or [],
+                results.get("documents") or [],
+                results.get("metadatas") or [],
+                results.get("distances") or []
+            )
+            for query_candidates, (ids, docs, metas, dists) in zip(candidates, rows):
+                for id, doc, metadata, distance in zip(ids, docs, metas, dists):
+                    metadata = metadata or {}
+                    is_chunk = name == "chunks"
+                    query_candidates.append(SearchResult(
+                        id=id,
+                        content=doc,
+                        metadata=metadata,
+                        collection=name,
+                        rank=0,
+                        distance=distance,
+                        is_chunk=is_chunk,
+                        # Chunks point at their parent content item
+                        artifact_id=metadata.get("content_id", id.split("::")[0]) if is_chunk else id
+                    ))
+
+        for query_candidates in candidates:
+            query_candidates.sort(key=lambda c: c.distance)
+            for rank, candidate in enumerate(query_candidates):
+                candidate.rank = rank
+        return candidates
+
+    def _lexical_candidates(
+        self,
+        query: str,
+        limit: int,
+        where: Optional[Dict[str, Any]]
+    ) -> List[SearchResult]:
+        """
+        V10: BM25 hits from both collections, sorted by score (higher = better).
+
+        distance is 1 / (1 + score) so it orders the same way as vector distances.
+        """
+        t_start = time.perf_counter()
+        candidates = []
+        for name in ("content", "chunks"):
+            for hit in self.lexical_index.query(name, query, limit, where):
+                metadata = hit["metadata"] or {}
+                is_chunk = name == "chunks"
+                candidates.append(SearchResult(
+                    id=hit["id"],
+                    content=hit["document"],
+                    metadata=metadata,
+                    collection=name,
+                    rank=0,
+                    distance=1.0 / (1.0 + hit["score"]),
+                    is_chunk=is_chunk,
+                    artifact_id=metadata.get("content_id", hit["id"].split("::")[0]) if is_chunk else hit["id"]
+                ))
+
+        candidates.sort(key=lambda c: c.distance)
+        for rank, candidate in enumerate(candidates):
+            candidate.rank = rank
+
+        logger.info(
+            f"Lexical search: {len(candidates)} hits in "
+            f"{(time.perf_counter() - t_start) * 1000:.1f}ms"
+        )
+        return candidates
+
+    def _rank_primary_results(
+        self,
+        vector_candidates: List[SearchResult],
+        lexical_candidates: List[SearchResult],
+        limit: int
+    ) -> List[MergedResult]:
+        """
+        One result per artifact, RRF-fused when both rankings are present (V10).
+
+        A single ranking keeps its own order with rrf_score = 1 / (rank + 1).
+        """
+        if vector_candidates and lexical_candidates:
+            return self.merge_results_rrf(
+                {
+                    "vector": self._best_per_artifact(vector_candidates),
+                    "lexical": self._best_per_artifact(lexical_candidates),
+                },
+                limit=limit,
+                key_by_artifact=True
+            )
+
+        candidates = vector_candidates or lexical_candidates
+        return [
+            MergedResult(
+                result=candidate,
+                rrf_score=1.0 / (candidate.rank + 1),
+                collections=[candidate.collection]
+            )
+            for candidate in self._best_per_artifact(candidates)[:limit]
+        ]
+
+    @staticmethod
+    def _best_per_artifact(candidates: List[SearchResult]) -> List[SearchResult]:
+        """Keep the best-ranked hit per artifact (input must be sorted best first)."""
+        seen_artifacts = set()
+        best = []
+        for candidate in candidates:
+            if candidate.artifact_id in seen_artifacts:
+                continue
+            seen_artifacts.add(candidate.artifact_id)
+            best.append(candidate)
+        return best
+
+    @staticmethod
+    def build_where_filter(
+        context_filter: Optional[str] = None,
+        min_importance: Optional[float] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Translate recall filters into a Chroma `where` clause.
+
+        Dates are compared against the numeric ts_epoch field at day
+        granularity: date_from is inclusive from 00:00 UTC, date_to is
+        inclusive through the end of that day. Unparseable dates are ignored.
+        Undated items (ts_epoch == UNDATED_TS_EPOCH) pass date filters.
+
+        Args:
+            context_filter: Exact context type
+            min_importance: Minimum importance (inclusive)
+            date_from: ISO date lower bound (e.g., "2026-01-01")
+            date_to: ISO date upper bound (e.g., "2026-12-31")
+
+        Returns:
+            Chroma where dict, or None if no filters apply
+        """
+        conditions: List[Dict[str, Any]] = []
+
+        if context_filter:
+            conditions.append({"context": context_filter})
+
+        if min_importance is not None:
+            conditions.append({"importance": {"$gte": float(min_importance)}})
+
+        if date_from:
+            from_epoch = to_epoch_seconds(date_from[:10])
+            if from_epoch is not None:
+                # UNDATED_TS_EPOCH sorts below every date, so only the lower bound needs it
+                conditions.append({"$or": [
+                    {"ts_epoch": {"$gte": from_epoch}},
+                    {"ts_epoch": UNDATED_TS_EPOCH},
+                ]})
+            else:
+                logger.warning(f"Ignoring unparseable date_from: {date_from}")
+
+        if date_to:
+            to_epoch = to_epoch_seconds(date_to[:10])
+            if to_epoch is not None:
+                conditions.append({"ts_epoch": {"$lt": to_epoch + 86400}})
+            else:
+                logger.warning(f"Ignoring unparseable date_to: {date_to}")
+
+        if not conditions:
+            return None
+        if len(conditions) == 1:
+            return conditions[0]
+        return {"$and": conditions}
+
+    def resolve_search_mode(self, query: str, search_mode: str) -> str:
+        """
+        V10: Resolve the effective search mode for a query.
+
+        Lexical needs the BM25 index; "auto" sends identifier-like queries
+        down the embedding-free path and everything else to hybrid.
+
+        Returns:
+            "lexical", "semantic" or "hybrid"
+        """
+        if search_mode == "auto":
+            search_mode = "lexical" if looks_like_identifier(query) else "hybrid"
+        if not (self.lexical_index and self.lexical_index.is_ready):
+            search_mode = "semantic"
+        return search_mode
+
     async def hybrid_search_v5(
         self,
         query: str,
@@ -549,6 +917,11 @@ class RetrievalService:
         min_importance: Optional[float] = None,
         date_from: Optional[str] = None,
         date_to: Optional[str] = None,
+        graph_depth: int = 1,
+        include_edges: bool = False,
+        search_mode: str = "hybrid",
+        on_stage: Optional[StageCallback] = None,
+        query_embedding: Optional[List[float]] = None,
     ) -> V4SearchResult:
         """
         V6 hybrid search over content and chunks collections.
@@ -567,143 +940,57 @@ class RetrievalService:
             min_importance: Filter by minimum importance
             date_from: Filter results after this ISO date (e.g., "2026-01-01")
             date_to: Filter results before this ISO date (e.g., "2026-12-31")
+            graph_depth: V10 graph expansion hops (1-3, needs the graph cache)
+            include_edges: V10 fetch entity edges alongside entities
+            search_mode: V10 "hybrid" (vector + BM25 via RRF), "semantic" (vector
+                only), "lexical" (BM25 only, no embedding call) or "auto"
+                (lexical for identifier-like queries, else hybrid)
+            on_stage: V10 async callback for streamed recall; receives "primary"
+                as soon as results are merged, then "related", "entities" and
+                "edges" as graph enrichment completes
+            query_embedding: V10 precomputed query embedding (shared with
+                event search by the caller); generated here when omitted
 
         Returns:
             V4SearchResult with primary_results, related_context, entities
         """
         try:
-            # Generate query embedding
-            query_embedding = self.embedding_service.generate_embedding(query)
-
-            # Search both V6 collections: content (small docs) and chunks (large docs)
-            content_col = get_content_collection(self.chroma_client)
-            chunks_col = get_chunks_collection(self.chroma_client)
-
-            # Build where filter for content collection
-            where_filter = {}
-            if context_filter:
-                where_filter["context"] = context_filter
-
-            # Fetch from both collections and merge by distance
-            fetch_limit = limit * 2 if min_importance else limit
-
-            # Search content collection (small/unchunked documents)
-            content_results = content_col.query(
-                query_embeddings=[query_embedding],
-                n_results=fetch_limit,
-                where=where_filter if where_filter else None,
-                include=["documents", "metadatas", "distances"]
+            # V10: Filters run inside Chroma on numeric metadata (chunks carry
+            # their parent's context/importance/ts_epoch), so no over-fetch
+            where_filter = self.build_where_filter(
+                context_filter=context_filter,
+                min_importance=min_importance,
+                date_from=date_from,
+                date_to=date_to
             )
 
-            # Search chunks collection (chunks of large documents)
-            # No context filter on chunks - they inherit from parent content
-            chunk_results = chunks_col.query(
-                query_embeddings=[query_embedding],
-                n_results=fetch_limit,
-                include=["documents", "metadatas", "distances"]
-            )
+            search_mode = self.resolve_search_mode(query, search_mode)
 
-            # Merge results from both collections by distance (lower = better)
-            merged_candidates = []
-
-            # Add content results
-            content_ids = content_results.get("ids", [[]])[0]
-            content_docs = content_results.get("documents", [[]])[0]
-            content_metas = content_results.get("metadatas", [[]])[0]
-            content_dists = content_results.get("distances", [[]])[0]
-
-            for id, doc, metadata, distance in zip(
-                content_ids, content_docs, content_metas, content_dists
-            ):
-                merged_candidates.append({
-                    "id": id,
-                    "doc": doc,
-                    "metadata": metadata or {},
-                    "distance": distance,
-                    "collection": "content",
-                    "is_chunk": False,
-                    "artifact_id": id
-                })
-
-            # Add chunk results
-            chunk_ids = chunk_results.get("ids", [[]])[0]
-            chunk_docs = chunk_results.get("documents", [[]])[0]
-            chunk_metas = chunk_results.get("metadatas", [[]])[0]
-            chunk_dists = chunk_results.get("distances", [[]])[0]
-
-            for id, doc, metadata, distance in zip(
-                chunk_ids, chunk_docs, chunk_metas, chunk_dists
-            ):
-                # Extract parent content_id from chunk metadata
-                content_id = (metadata or {}).get("content_id", id.split("::")[0])
-                merged_candidates.append({
-                    "id": id,
-                    "doc": doc,
-                    "metadata": metadata or {},
-                    "distance": distance,
-                    "collection": "chunks",
-                    "is_chunk": True,
-                    "artifact_id": content_id
-                })
-
-            # Sort by distance (ascending - lower is better)
-            merged_candidates.sort(key=lambda x: x["distance"])
-
-            # Deduplicate by artifact_id (keep best match per document)
-            seen_artifacts = set()
-            primary_results = []
-
-            for rank, candidate in enumerate(merged_candidates):
-                # Skip if we've already included this document
-                artifact_id = candidate["artifact_id"]
-                if artifact_id in seen_artifacts:
-                    continue
-
-                # Filter by importance if specified
-                if min_importance is not None:
-                    doc_importance = candidate["metadata"].get("importance", 0.5)
-                    if doc_importance < min_importance:
-                        continue
-
-                # V7.3: Filter by date range if specified
-                if date_from or date_to:
-                    # Get document timestamp from metadata (ts or ingested_at)
-                    doc_ts = candidate["metadata"].get("ts") or candidate["metadata"].get("ingested_at")
-                    if doc_ts:
-                        try:
-                            # Parse document timestamp (supports ISO format)
-                            doc_date = doc_ts[:10] if len(doc_ts) >= 10 else doc_ts  # Extract YYYY-MM-DD
-                            if date_from and doc_date < date_from:
-                                continue
-                            if date_to and doc_date > date_to:
-                                continue
-                        except (TypeError, ValueError):
-                            # If date parsing fails, include the document
-                            pass
-
-                seen_artifacts.add(artifact_id)
-
-                primary_results.append(MergedResult(
-                    result=SearchResult(
-                        id=candidate["id"],
-                        content=candidate["doc"],
-                        metadata=candidate["metadata"],
-                        collection=candidate["collection"],
-                        rank=rank,
-                        distance=candidate["distance"],
-                        is_chunk=candidate["is_chunk"],
-                        artifact_id=artifact_id
-                    ),
-                    rrf_score=1.0 / (rank + 1),
-                    collections=[candidate["collection"]]
-                ))
+            lexical_candidates: List[SearchResult] = []
+            if search_mode in ("lexical", "hybrid"):
+                lexical_candidates = self._lexical_candidates(query, limit, where_filter)
+                # An identifier query with no lexical hit may still match semantically
+                if search_mode == "lexical" and not lexical_candidates:
+                    search_mode = "hybrid"
+
+            vector_candidates: List[SearchResult] = []
+            if search_mode in ("semantic", "hybrid"):
+                if query_embedding is None:
+                    query_embedding = self.embedding_service.generate_embedding(query)
+                vector_candidates = self._vector_candidates([query_embedding], limit, where_filter)[0]
+
+            primary_results = self._rank_primary_results(vector_candidates, lexical_candidates, limit)
 
-                if len(primary_results) >= limit:
-                    break
+            if on_stage:
+                await self._emit_stage(
+                    on_stage, "primary", V4SearchResult(primary_results=primary_results).to_dict()["primary_results"]
+                )
 
             # Graph expansion if enabled
             related_context = []
             entities = []
+            edges = []
+            partial = []
 
             if expand and primary_results and self.pg_client:
                 # V7.3: Two-phase retrieval - use more seeds and collect candidate artifacts
@@ -721,9 +1008,9 @@ class RetrievalService:
                 if seed_event_ids:
                     category_filter = graph_filters.get("categories") if graph_filters else None
                     edge_type_filter = graph_filters.get("edge_types") if graph_filters else None  # V9
-                    related_context, entities = await self._perform_graph_expansion(
+                    related_context, entities, edges, partial = await self._perform_graph_expansion(
                         primary_results=seed_results,
-                        depth=1,
+                        depth=graph_depth,
                         budget=graph_budget,
                         category_filter=category_filter,
                         include_entities=include_entities,
@@ -731,7 +1018,9 @@ class RetrievalService:
                         query_embedding=query_embedding,  # V7.3: Pass for triplet scoring
                         use_triplet_scoring=True,  # V9: Re-enabled with embedding cache
                         candidate_artifact_uids=candidate_artifact_uids if candidate_artifact_uids else None,
-                        edge_types=edge_type_filter  # V9: Edge type filter
+                        edge_types=edge_type_filter,  # V9: Edge type filter
+                        include_edges=include_edges,
+                        on_stage=on_stage
                     )
 
             return V4SearchResult(
@@ -741,14 +1030,165 @@ class RetrievalService:
                 expand_options={
                     "graph_expand": expand,
                     "v5_mode": True,
-                    "collections": ["content", "chunks"]
-                }
+                    "collections": ["content", "chunks"],
+                    "search_mode": search_mode
+                },
+                edges=edges,
+                partial=partial
             )
 
         except Exception as e:
             logger.error(f"V5 hybrid search failed: {e}")
             raise RetrievalError(f"Failed to perform V5 hybrid search: {e}")
 
+    async def hybrid_search_batch(
+        self,
+        queries: List[str],
+        limit: int = 10,
+        expand: bool = True,
+        graph_budget: int = 10,
+        graph_filters: Optional[Dict] = None,
+        include_entities: bool = False,
+        context_filter: Optional[str] = None,
+        min_importance: Optional[float] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        graph_depth: int = 1,
+        include_edges: bool = False,
+        query_embeddings: Optional[List[List[float]]] = None,
+    ) -> BatchSearchResult:
+        """
+        V10: Hybrid search for several related queries at once.
+
+        All queries are embedded in one API call and each collection gets one
+        multi-vector query. Graph expansion runs once from the union of every
+        query's seeds; the shared pool of related events is then re-ranked per
+        query by triplet score. Evidence, entities and edges are fetched once
+        for the whole batch, and entities/edges are returned at batch level.
+
+        Args:
+            queries: Search query texts
+            query_embeddings: Precomputed embeddings, one per query (optional)
+            (remaining arguments as for hybrid_search_v5)
+
+        Returns:
+            BatchSearchResult with one V4SearchResult per query (same order)
+        """
+        try:
+            where_filter = self.build_where_filter(
+                context_filter=context_filter,
+                min_importance=min_importance,
+                date_from=date_from,
+                date_to=date_to
+            )
+
+            if query_embeddings is None:
+                query_embeddings = self.embedding_service.generate_embeddings_batch(queries)
+            vector_candidates = self._vector_candidates(query_embeddings, limit, where_filter)
+
+            lexical_available = bool(self.lexical_index and self.lexical_index.is_ready)
+            primary_by_query = [
+                self._rank_primary_results(
+                    candidates,
+                    self._lexical_candidates(query, limit, where_filter) if lexical_available else [],
+                    limit
+                )
+                for query, candidates in zip(queries, vector_candidates)
+            ]
+
+            related_by_query: List[List[RelatedContextItem]] = [[] for _ in queries]
+            entities: List[EntityInfo] = []
+            edges: List[Dict[str, Any]] = []
+            partial: List[str] = []
+
+            if expand and self.pg_client and any(primary_by_query):
+                # Shared seed set: top 3 of every query, one lookup
+                seed_results = [r for primary in primary_by_query for r in primary[:3]]
+                seed_event_ids = await self._get_seed_events(seed_results)
+
+                candidate_artifact_uids = []
+                for primary in primary_by_query:
+                    for result in primary:
+                        artifact_uid = result.result.metadata.get("artifact_uid")
+                        if artifact_uid and artifact_uid not in candidate_artifact_uids:
+                            candidate_artifact_uids.append(artifact_uid)
+
+                if seed_event_ids:
+                    try:
+                        pool = await self._expand_related_events(
+                            seed_event_ids=seed_event_ids,
+                            depth=graph_depth,
+                            budget=min(graph_budget * 2 * len(queries), 100),
+                            category_filter=graph_filters.get("categories") if graph_filters else None,
+                            candidate_artifact_uids=candidate_artifact_uids or None,
+                            edge_types=graph_filters.get("edge_types") if graph_filters else None
+                        )
+
+                        events_by_query = []
+                        for embedding in query_embeddings:
+                            scored = await self._score_triplets(
+                                events=[dict(event) for event in pool],
+                                query_embedding=embedding,
+                                event_weight=1.5
+                            )
+                            events_by_query.append(scored[:graph_budget])
+
+                        selected_ids: List[UUID] = []
+                        for events in events_by_query:
+                            for event in events:
+                                event_id = UUID(event["event_id"]) if isinstance(event["event_id"], str) else event["event_id"]
+                                if event_id not in selected_ids:
+                                    selected_ids.append(event_id)
+
+                        enrichment_event_ids = (seed_event_ids + selected_ids)[:50]
+                        calls = {"evidence": self._fetch_evidence_for_events(selected_ids)}
+                        if include_entities:
+                            calls["entities"] = self._fetch_entities_for_events(enrichment_event_ids)
+                        if include_edges:
+                            calls["edges"] = self._fetch_edges_for_events(
+                                enrichment_event_ids, graph_filters.get("edge_types") if graph_filters else None
+                            )
+                        enrichment, partial = await gather_with_timeouts(
+                            calls,
+                            timeout=self.enrichment_timeout,
+                            defaults={"evidence": {}, "entities": [], "edges": []}
+                        )
+
+                        related_by_query = [
+                            self._build_related_context(events, enrichment["evidence"])
+                            for events in events_by_query
+                        ]
+                        entities = enrichment.get("entities", [])
+                        edges = enrichment.get("edges", [])
+
+                        logger.info(
+                            f"Batch graph expansion: {len(queries)} queries, "
+                            f"{len(seed_event_ids)} shared seeds -> pool of {len(pool)} events"
+                        )
+                    except Exception as e:
+                        logger.error(f"Batch graph expansion failed: {e}")
+                        partial = ["graph_expansion"]
+
+            results = [
+                V4SearchResult(
+                    primary_results=primary,
+                    related_context=related,
+                    expand_options={
+                        "graph_expand": expand,
+                        "v5_mode": True,
+                        "collections": ["content", "chunks"],
+                        "search_mode": "hybrid" if lexical_available else "semantic"
+                    }
+                )
+                for primary, related in zip(primary_by_query, related_by_query)
+            ]
+
+            return BatchSearchResult(results=results, entities=entities, edges=edges, partial=partial)
+
+        except Exception as e:
+            logger.error(f"Batch hybrid search failed: {e}")
+            raise RetrievalError(f"Failed to perform batch hybrid search: {e}")
+
     async def _fetch_evidence_for_events(
         self,
         event_ids: List[UUID]
@@ -762,15 +1202,15 @@ class RetrievalService:
         if not self.pg_client or not event_ids:
             return {}
 
-        placeholders = ", ".join(f"${i+1}" for i in range(len(event_ids)))
-        sql = f"""
+        # V10: Array parameter keeps the SQL text fixed (cached prepared statement)
+        sql = """
         SELECT event_id, quote, artifact_uid, start_char, end_char, chunk_id
         FROM event_evidence
-        WHERE event_id IN ({placeholders})
+        WHERE event_id = ANY($1::uuid[])
         ORDER BY event_id, start_char
         """
 
-        rows = await self.pg_client.fetch_all(sql, *event_ids)
+        rows = await self.pg_client.fetch_all(sql, list(event_ids))
         out: Dict[UUID, List[Dict[str, Any]]] = {}
         for row in rows:
             eid = row["event_id"]
@@ -793,12 +1233,11 @@ class RetrievalService:
         if not self.pg_client or not event_ids:
             return []
 
-        placeholders = ", ".join(f"${i+1}" for i in range(len(event_ids)))
-        sql = f"""
+        sql = """
         WITH evs AS (
           SELECT event_id, artifact_uid, revision_id
           FROM semantic_event
-          WHERE event_id IN ({placeholders})
+          WHERE event_id = ANY($1::uuid[])
         ),
         rel_entities AS (
           SELECT ea.entity_id, evs.artifact_uid, evs.revision_id
@@ -837,7 +1276,7 @@ class RetrievalService:
         ORDER BY COALESCE(mc.mention_count, 0) DESC, e.canonical_name ASC
         """
 
-        rows = await self.pg_client.fetch_all(sql, *event_ids)
+        rows = await self.pg_client.fetch_all(sql, list(event_ids))
         entities: List[EntityInfo] = []
         for row in rows:
             entities.append(EntityInfo(
@@ -851,6 +1290,69 @@ class RetrievalService:
             ))
         return entities
 
+    async def _fetch_edges_for_events(
+        self,
+        event_ids: List[UUID],
+        edge_types: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch entity_edge rows touching the entities of the given events.
+
+        Returns:
+            List of edge dicts (strongest first, max 50)
+        """
+        if not self.pg_client or not event_ids:
+            return []
+
+        params: List[Any] = [list(event_ids)]
+
+        edge_type_clause = ""
+        if edge_types:
+            edge_type_clause = "AND ee.relationship_type = ANY($2::text[])"
+            params.append(list(edge_types))
+
+        sql = f"""
+        WITH ents AS (
+          SELECT DISTINCT entity_id
+          FROM entity_event_index
+          WHERE event_id = ANY($1::uuid[])
+        )
+        SELECT
+            ee.edge_id,
+            ee.relationship_type,
+            ee.relationship_name,
+            ee.confidence,
+            ee.evidence_quote,
+            e1.canonical_name AS source_name,
+            e1.entity_type AS source_type,
+            e2.canonical_name AS target_name,
+            e2.entity_type AS target_type
+        FROM entity_edge ee
+        JOIN entity e1 ON e1.entity_id = ee.source_entity_id
+        JOIN entity e2 ON e2.entity_id = ee.target_entity_id
+        WHERE (ee.source_entity_id IN (SELECT entity_id FROM ents)
+               OR ee.target_entity_id IN (SELECT entity_id FROM ents))
+        {edge_type_clause}
+        ORDER BY ee.confidence DESC
+        LIMIT 50
+        """
+
+        rows = await self.pg_client.fetch_all(sql, *params)
+        return [
+            {
+                "edge_id": str(row["edge_id"]),
+                "source": row["source_name"],
+                "source_type": row["source_type"],
+                "target": row["target_name"],
+                "target_type": row["target_type"],
+                "type": row["relationship_type"],
+                "name": row["relationship_name"],
+                "confidence": float(row["confidence"]) if row["confidence"] else None,
+                "evidence": row["evidence_quote"]
+            }
+            for row in rows
+        ]
+
     async def _expand_from_events_sql(
         self,
         seed_event_ids: List[UUID],
@@ -865,6 +1367,8 @@ class RetrievalService:
         V6 graph expansion via SQL (no AGE dependency).
         V7.3: Added candidate_artifact_uids for two-phase retrieval optimization.
         V9: Added edge_types for relationship filtering.
+        V10: Reads the materialized entity_event_index instead of joining
+        semantic_event against event_actor/event_subject per recall.
 
         Args:
             seed_event_ids: Event IDs to expand from
@@ -879,10 +1383,9 @@ class RetrievalService:
         if not self.pg_client or not seed_event_ids:
             return []
 
-        # Build placeholders for seed event IDs
-        seed_placeholders = ", ".join(f"${i+1}" for i in range(len(seed_event_ids)))
-        params = list(seed_event_ids)
-        param_offset = len(seed_event_ids)
+        # V10: Array parameters - the SQL text depends only on which filters
+        # are present (at most 8 variants), never on list sizes or budget
+        params: List[Any] = [list(seed_event_ids), budget]
 
         # Build optional clauses
         category_clause = ""
@@ -890,38 +1393,31 @@ class RetrievalService:
 
         # Category filter
         if category_filter:
-            cat_placeholders = ", ".join(f"${param_offset+i+1}" for i in range(len(category_filter)))
-            category_clause = f"AND se.category IN ({cat_placeholders})"
-            params.extend(category_filter)
-            param_offset += len(category_filter)
+            params.append(list(category_filter))
+            category_clause = f"AND eei.category = ANY(${len(params)}::text[])"
 
         # V7.3: Two-phase artifact filter
         if candidate_artifact_uids:
-            art_placeholders = ", ".join(f"${param_offset+i+1}" for i in range(len(candidate_artifact_uids)))
-            artifact_clause = f"AND se.artifact_uid IN ({art_placeholders})"
-            params.extend(candidate_artifact_uids)
-            param_offset += len(candidate_artifact_uids)
+            params.append(list(candidate_artifact_uids))
+            artifact_clause = f"AND eei.artifact_uid = ANY(${len(params)}::text[])"
             logger.info(f"Two-phase filter: restricting to {len(candidate_artifact_uids)} candidate artifacts")
 
         # V9: Edge type filter
         edge_type_clause = ""
         if edge_types:
-            edge_placeholders = ", ".join(f"${param_offset+i+1}" for i in range(len(edge_types)))
-            edge_type_clause = f"AND ee.relationship_type IN ({edge_placeholders})"
-            params.extend(edge_types)
-            param_offset += len(edge_types)
+            params.append(list(edge_types))
+            edge_type_clause = f"AND ee.relationship_type = ANY(${len(params)}::text[])"
             logger.info(f"Edge type filter: restricting to {edge_types}")
 
+        # V10: Both hops go through entity_event_index (entity_id / event_id
+        # index lookups); semantic_event and entity are joined only for the
+        # final budget-limited rows.
         sql = f"""
         WITH seed_entities AS (
             -- Get entities (actors and subjects) from seed events
-            SELECT DISTINCT entity_id, 'actor' AS role
-            FROM event_actor
-            WHERE event_id IN ({seed_placeholders})
-            UNION
-            SELECT DISTINCT entity_id, 'subject' AS role
-            FROM event_subject
-            WHERE event_id IN ({seed_placeholders})
+            SELECT DISTINCT entity_id
+            FROM entity_event_index
+            WHERE event_id = ANY($1::uuid[])
         ),
         -- V8: Get entities connected via explicit edges
         -- V9: With optional edge type filtering
@@ -948,29 +1444,17 @@ class RetrievalService:
         ),
         connected_events AS (
             -- Find events that share these entities (excluding seeds)
-            SELECT DISTINCT
-                se.event_id,
-                se.artifact_uid,
-                se.revision_id,
-                se.category,
-                se.narrative,
-                se.event_time,
-                se.confidence,
-                se.embedding,  -- V9: Cached embedding for triplet scoring
-                e.canonical_name AS connecting_entity,
+            SELECT
+                eei.event_id,
+                eei.entity_id,
                 CASE
-                    WHEN ea.event_id IS NOT NULL AND ace.connection_source = 'seed' THEN 'same_actor'
-                    WHEN es.event_id IS NOT NULL AND ace.connection_source = 'seed' THEN 'same_subject'
-                    WHEN ea.event_id IS NOT NULL THEN 'edge:' || ace.connection_source
-                    WHEN es.event_id IS NOT NULL THEN 'edge:' || ace.connection_source
+                    WHEN ace.connection_source = 'seed' AND eei.role = 'actor' THEN 'same_actor'
+                    WHEN ace.connection_source = 'seed' THEN 'same_subject'
+                    ELSE 'edge:' || ace.connection_source
                 END AS connection_type
-            FROM semantic_event se
-            JOIN all_connected_entities ace ON 1=1
-            LEFT JOIN event_actor ea ON ea.event_id = se.event_id AND ea.entity_id = ace.entity_id
-            LEFT JOIN event_subject es ON es.event_id = se.event_id AND es.entity_id = ace.entity_id
-            JOIN entity e ON e.entity_id = ace.entity_id
-            WHERE (ea.event_id IS NOT NULL OR es.event_id IS NOT NULL)
-              AND se.event_id NOT IN ({seed_placeholders})
+            FROM all_connected_entities ace
+            JOIN entity_event_index eei ON eei.entity_id = ace.entity_id
+            WHERE eei.event_id <> ALL($1::uuid[])
               {category_clause}
               {artifact_clause}
         ),
@@ -978,14 +1462,7 @@ class RetrievalService:
             -- Deduplicate and rank by connection type (actor > subject > edge)
             SELECT DISTINCT ON (event_id)
                 event_id,
-                artifact_uid,
-                revision_id,
-                category,
-                narrative,
-                event_time,
-                confidence,
-                embedding,  -- V9: Cached embedding for triplet scoring
-                connecting_entity,
+                entity_id,
                 connection_type
             FROM connected_events
             ORDER BY event_id,
@@ -994,13 +1471,35 @@ class RetrievalService:
                     WHEN connection_type = 'same_subject' THEN 2
                     ELSE 3
                 END
+        ),
+        limited AS (
+            SELECT * FROM ranked
+            LIMIT $2
         )
-        SELECT * FROM ranked
-        LIMIT {budget}
+        SELECT
+            se.event_id,
+            se.artifact_uid,
+            se.revision_id,
+            se.category,
+            se.narrative,
+            se.event_time,
+            se.confidence,
+            se.embedding,  -- V9: Cached embedding for triplet scoring
+            e.canonical_name AS connecting_entity,
+            e.name_embedding AS connecting_entity_embedding,  -- V10: Cached name embedding
+            r.connection_type
+        FROM limited r
+        JOIN semantic_event se ON se.event_id = r.event_id
+        JOIN entity e ON e.entity_id = r.entity_id
         """
 
         try:
+            t_start = time.perf_counter()
             rows = await self.pg_client.fetch_all(sql, *params)
+            logger.info(
+                f"SQL graph expansion: {len(rows)} events from {len(seed_event_ids)} seeds "
+                f"in {(time.perf_counter() - t_start) * 1000:.0f}ms"
+            )
             return [
                 {
                     "event_id": row["event_id"],
@@ -1011,7 +1510,8 @@ class RetrievalService:
                     "event_time": row["event_time"],
                     "confidence": row["confidence"],
                     "reason": f"{row['connection_type']}:{row['connecting_entity']}",
-                    "embedding": row.get("embedding")  # V9: Cached embedding for triplet scoring
+                    "embedding": row.get("embedding"),  # V9: Cached embedding for triplet scoring
+                    "entity_embedding": row.get("connecting_entity_embedding")  # V10
                 }
                 for row in rows
             ]
@@ -1019,6 +1519,101 @@ class RetrievalService:
             logger.error(f"SQL graph expansion failed: {e}")
             return []
 
+    async def _expand_from_graph_cache(
+        self,
+        seed_event_ids: List[UUID],
+        depth: int = 1,
+        budget: int = 10,
+        category_filter: Optional[List[str]] = None,
+        candidate_artifact_uids: Optional[List[str]] = None,
+        edge_types: Optional[List[str]] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find related events via BFS over the in-memory graph cache (V10).
+
+        The BFS runs in memory; Postgres is hit once to hydrate the chosen
+        events. Events deleted since the last cache rebuild drop out here.
+
+        Args:
+            seed_event_ids: Event IDs to expand from
+            depth: Number of hops (1-3)
+            budget: Maximum related events to return
+            category_filter: Event categories to include
+            candidate_artifact_uids: Only return events from these artifacts
+            edge_types: Only expand via these relationship types
+
+        Returns:
+            Related event dicts in the same shape as _expand_from_events_sql,
+            or None if the cache failed (caller falls back to SQL)
+        """
+        try:
+            t_start = time.perf_counter()
+            hits = self.graph_cache.expand(
+                seed_event_ids=seed_event_ids,
+                depth=max(1, min(depth, 3)),
+                budget=budget,
+                category_filter=category_filter,
+                candidate_artifact_uids=candidate_artifact_uids,
+                edge_types=edge_types
+            )
+            bfs_us = (time.perf_counter() - t_start) * 1_000_000
+
+            events = await self._hydrate_graph_hits(hits)
+            logger.info(
+                f"Graph cache expansion: {len(events)} events from {len(seed_event_ids)} seeds, "
+                f"depth={depth} (bfs={bfs_us:.0f}us, total={(time.perf_counter() - t_start) * 1000:.0f}ms)"
+            )
+            return events
+        except Exception as e:
+            logger.warning(f"Graph cache expansion failed, falling back to SQL: {e}")
+            return None
+
+    async def _hydrate_graph_hits(self, hits: List[GraphExpansionHit]) -> List[Dict[str, Any]]:
+        """Load event and connecting-entity rows for graph cache hits, preserving order."""
+        if not hits:
+            return []
+
+        rows = await self.pg_client.fetch_all(
+            """
+            SELECT
+                se.event_id,
+                se.artifact_uid,
+                se.revision_id,
+                se.category,
+                se.narrative,
+                se.event_time,
+                se.confidence,
+                se.embedding,
+                e.canonical_name AS connecting_entity,
+                e.name_embedding AS connecting_entity_embedding,
+                h.connection_type
+            FROM unnest($1::uuid[], $2::uuid[], $3::text[])
+                WITH ORDINALITY AS h(event_id, entity_id, connection_type, ord)
+            JOIN semantic_event se ON se.event_id = h.event_id
+            JOIN entity e ON e.entity_id = h.entity_id
+            ORDER BY h.ord
+            """,
+            [hit.event_id for hit in hits],
+            [hit.entity_id for hit in hits],
+            [hit.connection_type for hit in hits]
+        )
+
+        return [
+            {
+                "event_id": row["event_id"],
+                "artifact_uid": row["artifact_uid"],
+                "revision_id": row["revision_id"],
+                "category": row["category"],
+                "narrative": row["narrative"],
+                "event_time": row["event_time"],
+                "confidence": row["confidence"],
+                "reason": f"{row['connection_type']}:{row['connecting_entity']}",
+                "embedding": row.get("embedding"),
+                "entity_embedding": row.get("connecting_entity_embedding")
+            }
+            for row in rows
+        ]
+
     async def _get_seed_events(
         self,
         results: List[MergedResult]
@@ -1037,52 +1632,39 @@ class RetrievalService:
         if not self.pg_client:
             return []
 
-        seed_events = []
-
+        # V10: One round trip for all results (batch recall seeds from many queries)
+        artifact_ids = []
         for result in results:
-            try:
-                # Get artifact_id from result
-                artifact_id = result.result.artifact_id or result.result.id
-                if "::" in artifact_id:
-                    artifact_id = artifact_id.split("::")[0]
-
-                # Look up artifact_uid from artifact_revision
-                revision = await self.pg_client.fetch_one(
-                    """
-                    SELECT artifact_uid, revision_id
-                    FROM artifact_revision
-                    WHERE artifact_id = $1 AND is_latest = true
-                    LIMIT 1
-                    """,
-                    artifact_id
-                )
-
-                if not revision:
-                    continue
+            artifact_id = result.result.artifact_id or result.result.id
+            if "::" in artifact_id:
+                artifact_id = artifact_id.split("::")[0]
+            if artifact_id not in artifact_ids:
+                artifact_ids.append(artifact_id)
 
-                artifact_uid = revision["artifact_uid"]
-                revision_id = revision["revision_id"]
+        if not artifact_ids:
+            return []
 
-                # Get events for this artifact revision
-                events = await self.pg_client.fetch_all(
-                    """
+        try:
+            # Latest revision per artifact, then up to 10 events from each
+            rows = await self.pg_client.fetch_all(
+                """
+                SELECT se.event_id
+                FROM artifact_revision ar
+                CROSS JOIN LATERAL (
                     SELECT event_id FROM semantic_event
-                    WHERE artifact_uid = $1 AND revision_id = $2
+                    WHERE artifact_uid = ar.artifact_uid AND revision_id = ar.revision_id
                     LIMIT 10
-                    """,
-                    artifact_uid,
-                    revision_id
-                )
-
-                for event in events:
-                    seed_events.append(event["event_id"])
-
-            except Exception as e:
-                logger.warning(f"Failed to get seed events for result: {e}")
-                continue
+                ) se
+                WHERE ar.artifact_id = ANY($1::text[]) AND ar.is_latest = true
+                """,
+                artifact_ids
+            )
+        except Exception as e:
+            logger.warning(f"Failed to get seed events: {e}")
+            return []
 
         # Deduplicate
-        return list(set(seed_events))
+        return list({row["event_id"] for row in rows})
 
     async def get_artifact_uid_for_chunk(
         self,
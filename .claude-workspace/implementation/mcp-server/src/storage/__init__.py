@@ -7,7 +7,13 @@ from storage.collections import (
     get_chunks_collection,
     get_content_by_id,
     get_v5_chunks_by_content,
+    get_v5_chunk_neighbors,
+    neighbor_chunk_metadata,
     delete_v5_content_cascade,
+    to_epoch_seconds,
+    build_filter_metadata,
+    sync_chunk_filter_metadata,
+    backfill_filter_metadata,
 )
 
 __all__ = [
@@ -20,5 +26,11 @@ __all__ = [
     "get_chunks_collection",
     "get_content_by_id",
     "get_v5_chunks_by_content",
+    "get_v5_chunk_neighbors",
+    "neighbor_chunk_metadata",
     "delete_v5_content_cascade",
+    "to_epoch_seconds",
+    "build_filter_metadata",
+    "sync_chunk_filter_metadata",
+    "backfill_filter_metadata",
 ]
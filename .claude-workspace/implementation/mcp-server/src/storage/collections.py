@@ -1,7 +1,8 @@
 """ChromaDB collection management and schemas."""
 
 import logging
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Any, Tuple, Callable
 from chromadb import HttpClient, Collection
 from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
 
@@ -154,6 +155,102 @@ def get_v5_chunks_by_content(client: HttpClient, content_id: str) -> List[Dict[s
         return []
 
 
+def neighbor_chunk_metadata(chunk_ids: List[str], position: int) -> Dict[str, str]:
+    """
+    Neighbor pointers stored on each chunk (V10).
+
+    Chunk IDs embed a content hash, so neighbors cannot be derived from the
+    index alone; storing them lets recall fetch ±1 chunks with one get(ids=...).
+    Chroma metadata cannot hold None, so first/last chunks omit the missing side.
+
+    Args:
+        chunk_ids: All chunk IDs of the content item, in chunk_index order
+        position: Index of the chunk being written
+
+    Returns:
+        Dict with prev_chunk_id and/or next_chunk_id
+    """
+    neighbors = {}
+    if position > 0:
+        neighbors["prev_chunk_id"] = chunk_ids[position - 1]
+    if position < len(chunk_ids) - 1:
+        neighbors["next_chunk_id"] = chunk_ids[position + 1]
+    return neighbors
+
+
+def get_v5_chunk_neighbors(
+    client: HttpClient,
+    chunk_hits: List[Tuple[str, Dict[str, Any]]]
+) -> Dict[str, Dict[str, Optional[Dict[str, Any]]]]:
+    """
+    Fetch the ±1 neighbors of several chunk hits (V10).
+
+    Chunks written with neighbor pointers are fetched together with one
+    get(ids=[...]). Chunks written before V10 fall back to a single filtered
+    get on (content_id, chunk_index ± 1), so only neighbor chunks are
+    transferred rather than every chunk of the document.
+
+    Args:
+        client: ChromaDB client
+        chunk_hits: (chunk_id, metadata) for each chunk to expand
+
+    Returns:
+        chunk_id -> {"prev": chunk dict or None, "next": chunk dict or None},
+        where chunk dicts have chunk_id, content, metadata
+    """
+    collection = get_chunks_collection(client)
+    neighbors = {chunk_id: {"prev": None, "next": None} for chunk_id, _ in chunk_hits}
+
+    # A neighbor can serve two hits (e.g., hits 3 and 5 both need chunk 4)
+    wanted: Dict[str, List[Tuple[str, str]]] = {}  # neighbor chunk_id -> [(hit chunk_id, side)]
+    legacy: Dict[Tuple[str, int], List[Tuple[str, str]]] = {}  # (content_id, index) -> [(hit, side)]
+    for chunk_id, metadata in chunk_hits:
+        metadata = metadata or {}
+        if "prev_chunk_id" in metadata or "next_chunk_id" in metadata:
+            if metadata.get("prev_chunk_id"):
+                wanted.setdefault(metadata["prev_chunk_id"], []).append((chunk_id, "prev"))
+            if metadata.get("next_chunk_id"):
+                wanted.setdefault(metadata["next_chunk_id"], []).append((chunk_id, "next"))
+        elif metadata.get("content_id") is not None and metadata.get("chunk_index") is not None:
+            content_id, index = metadata["content_id"], int(metadata["chunk_index"])
+            if index > 0:
+                legacy.setdefault((content_id, index - 1), []).append((chunk_id, "prev"))
+            legacy.setdefault((content_id, index + 1), []).append((chunk_id, "next"))
+
+    def assign(results: Dict[str, Any], lookup) -> None:
+        for neighbor_id, content, metadata in zip(
+            results.get("ids", []), results.get("documents", []), results.get("metadatas", [])
+        ):
+            for hit_id, side in lookup(neighbor_id, metadata or {}) or []:
+                neighbors[hit_id][side] = {"chunk_id": neighbor_id, "content": content, "metadata": metadata}
+
+    try:
+        if wanted:
+            results = collection.get(ids=list(wanted), include=["documents", "metadatas"])
+            assign(results, lambda neighbor_id, _: wanted.get(neighbor_id))
+
+        if legacy:
+            by_content: Dict[str, List[int]] = {}
+            for content_id, index in legacy:
+                by_content.setdefault(content_id, []).append(index)
+            clauses = [
+                {"$and": [{"content_id": content_id}, {"chunk_index": {"$in": indexes}}]}
+                for content_id, indexes in by_content.items()
+            ]
+            results = collection.get(
+                where=clauses[0] if len(clauses) == 1 else {"$or": clauses},
+                include=["documents", "metadatas"]
+            )
+            assign(results, lambda _, metadata: legacy.get(
+                (metadata.get("content_id"), metadata.get("chunk_index"))
+            ))
+
+    except Exception as e:
+        logger.error(f"Failed to get neighbor chunks: {e}")
+
+    return neighbors
+
+
 def delete_v5_content_cascade(client: HttpClient, content_id: str) -> Dict[str, int]:
     """
     Delete content and all associated chunks from V5 collections.
@@ -187,3 +284,187 @@ def delete_v5_content_cascade(client: HttpClient, content_id: str) -> Dict[str,
         logger.error(f"Failed to delete V5 chunks for content {content_id}: {e}")
 
     return deleted
+
+
+# =============================================================================
+# V10 FILTER METADATA - Recall filters pushed into Chroma `where`
+# =============================================================================
+
+# Metadata copied from content onto its chunks so both collections can be
+# filtered by the same `where` clause
+CHUNK_FILTER_FIELDS = ("context", "importance", "ts_epoch")
+
+# Importance of content stored without one (recall has always assumed 0.5)
+DEFAULT_IMPORTANCE = 0.5
+
+# ts_epoch of content with no parseable ts/ingested_at. Date filters keep
+# these items, as recall did before the filters moved into Chroma.
+UNDATED_TS_EPOCH = -1
+
+
+def to_epoch_seconds(value: Optional[str]) -> Optional[int]:
+    """
+    Convert an ISO date or datetime string to epoch seconds (UTC).
+
+    Accepts "YYYY-MM-DD" and full ISO timestamps (with or without "Z").
+    Naive timestamps are treated as UTC.
+
+    Args:
+        value: ISO date/datetime string
+
+    Returns:
+        Epoch seconds, or None if missing or unparseable
+    """
+    if not value or not isinstance(value, str):
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = datetime.strptime(value.strip()[:10], "%Y-%m-%d")
+        except ValueError:
+            return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+
+    return int(parsed.timestamp())
+
+
+def build_filter_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the filterable metadata subset for a content item.
+
+    Derives ts_epoch from the document date ("ts") falling back to
+    "ingested_at", matching the timestamp recall has always filtered on.
+    importance and ts_epoch are always set (DEFAULT_IMPORTANCE and
+    UNDATED_TS_EPOCH when missing) so `where` clauses never drop an item
+    for lacking them.
+
+    Args:
+        metadata: Content metadata
+
+    Returns:
+        Dict with importance, ts_epoch and context (if set)
+    """
+    filter_meta: Dict[str, Any] = {}
+
+    if metadata.get("context"):
+        filter_meta["context"] = metadata["context"]
+
+    importance = metadata.get("importance")
+    filter_meta["importance"] = float(importance) if importance is not None else DEFAULT_IMPORTANCE
+
+    ts_epoch = to_epoch_seconds(metadata.get("ts")) or to_epoch_seconds(metadata.get("ingested_at"))
+    filter_meta["ts_epoch"] = ts_epoch if ts_epoch is not None else UNDATED_TS_EPOCH
+
+    return filter_meta
+
+
+def sync_chunk_filter_metadata(
+    client: HttpClient,
+    content_ids: List[str],
+    filter_meta_by_content: Dict[str, Dict[str, Any]]
+) -> int:
+    """
+    Copy filter metadata from content items onto their chunks.
+
+    Args:
+        client: ChromaDB client
+        content_ids: Content IDs whose chunks should be updated
+        filter_meta_by_content: content_id -> filter metadata
+
+    Returns:
+        Number of chunks updated
+    """
+    if not content_ids:
+        return 0
+
+    collection = get_chunks_collection(client)
+    where = {"content_id": content_ids[0]} if len(content_ids) == 1 else {"content_id": {"$in": content_ids}}
+    results = collection.get(where=where, include=["metadatas"])
+
+    chunk_ids = []
+    chunk_metas = []
+    for chunk_id, metadata in zip(results.get("ids", []), results.get("metadatas", [])):
+        filter_meta = filter_meta_by_content.get((metadata or {}).get("content_id"))
+        if filter_meta:
+            chunk_ids.append(chunk_id)
+            chunk_metas.append({**(metadata or {}), **filter_meta})
+
+    if chunk_ids:
+        collection.update(ids=chunk_ids, metadatas=chunk_metas)
+
+    return len(chunk_ids)
+
+
+def backfill_filter_metadata(
+    client: HttpClient,
+    batch_size: int = 500,
+    on_update: Optional[Callable[[List[str], List[Dict[str, Any]], Dict[str, Dict[str, Any]]], None]] = None
+) -> Dict[str, int]:
+    """
+    Add importance/ts_epoch to content stored before V10 and copy filter fields to chunks.
+
+    Pages through the content collection; items that already have both
+    fields (every item, undated ones included, once backfilled) are skipped,
+    so re-running only reads metadata. Blocking - run it off the event loop.
+
+    Args:
+        client: ChromaDB client
+        batch_size: Content items per page
+        on_update: Called per page with (content_ids, content metadatas,
+            content_id -> chunk filter metadata) after Chroma is updated,
+            so in-process copies can apply the same change
+
+    Returns:
+        Dict with counts of updated content items and chunks
+    """
+    updated = {"content": 0, "chunks": 0}
+    collection = get_content_collection(client)
+    offset = 0
+
+    while True:
+        results = collection.get(include=["metadatas"], limit=batch_size, offset=offset)
+        ids = results.get("ids", [])
+        if not ids:
+            break
+
+        update_ids = []
+        update_metas = []
+        chunk_filter_meta: Dict[str, Dict[str, Any]] = {}
+
+        for content_id, metadata in zip(ids, results.get("metadatas", [])):
+            metadata = metadata or {}
+            if "ts_epoch" in metadata and "importance" in metadata:
+                continue
+
+            filter_meta = build_filter_metadata(metadata)
+            update_ids.append(content_id)
+            update_metas.append({**metadata, **filter_meta})
+            if metadata.get("is_chunked"):
+                chunk_filter_meta[content_id] = filter_meta
+
+        if update_ids:
+            collection.update(ids=update_ids, metadatas=update_metas)
+            updated["content"] += len(update_ids)
+
+        if chunk_filter_meta:
+            updated["chunks"] += sync_chunk_filter_metadata(
+                client, list(chunk_filter_meta), chunk_filter_meta
+            )
+
+        if update_ids and on_update:
+            on_update(update_ids, update_metas, chunk_filter_meta)
+
+        if len(ids) < batch_size:
+            break
+        offset += batch_size
+
+    if updated["content"]:
+        logger.info(
+            f"Backfilled filter metadata for {updated['content']} content items "
+            f"and {updated['chunks']} chunks"
+        )
+    return updated
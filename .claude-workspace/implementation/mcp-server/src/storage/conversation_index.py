@@ -0,0 +1,227 @@
+"""
+Conversation turn index in Postgres (V10).
+
+Maps (conversation_id, turn_index) -> art_ id so recall can page through a
+conversation by primary key and fetch only the requested window from
+Chroma by ID, instead of loading and sorting every turn.
+
+Cursors are opaque strings of the form "after:<turn_index>" (forward
+paging) or "before:<turn_index>" (backward paging from the tail).
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from storage.collections import get_content_collection
+
+
+logger = logging.getLogger("mcp-memory.conversation_index")
+
+
+async def record_turn(
+    pg_client,
+    conversation_id: str,
+    turn_index: int,
+    artifact_id: str,
+    role: Optional[str] = None
+) -> None:
+    """
+    Insert or replace one turn.
+
+    Identical turn text in two conversations shares one art_ id, so the
+    index, not Chroma metadata, is authoritative for conversation membership.
+    """
+    await pg_client.execute(
+        """
+        INSERT INTO conversation_turn (conversation_id, turn_index, artifact_id, role)
+        VALUES ($1, $2, $3, $4)
+        ON CONFLICT (conversation_id, turn_index)
+        DO UPDATE SET artifact_id = EXCLUDED.artifact_id, role = EXCLUDED.role
+        """,
+        conversation_id,
+        turn_index,
+        artifact_id,
+        role
+    )
+
+
+async def record_turns(pg_client, turns: List[Tuple[str, int, str, Optional[str]]]) -> None:
+    """Insert (conversation_id, turn_index, artifact_id, role) rows, keeping existing ones."""
+    if not turns:
+        return
+    async with pg_client.acquire() as conn:
+        await conn.executemany(
+            """
+            INSERT INTO conversation_turn (conversation_id, turn_index, artifact_id, role)
+            VALUES ($1, $2, $3, $4)
+            ON CONFLICT (conversation_id, turn_index) DO NOTHING
+            """,
+            turns
+        )
+
+
+async def delete_turns_for_artifact(pg_client, artifact_id: str) -> None:
+    """Remove every turn that points at a forgotten art_ id."""
+    await pg_client.execute(
+        "DELETE FROM conversation_turn WHERE artifact_id = $1",
+        artifact_id
+    )
+
+
+def parse_cursor(cursor: str) -> Tuple[str, int]:
+    """
+    Parse "after:<n>" / "before:<n>".
+
+    Raises:
+        ValueError: Malformed cursor
+    """
+    direction, _, value = (cursor or "").partition(":")
+    if direction not in ("after", "before") or not value.lstrip("-").isdigit():
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return direction, int(value)
+
+
+async def fetch_turn_window(
+    pg_client,
+    conversation_id: str,
+    limit: int,
+    tail: bool = False,
+    from_turn: Optional[int] = None,
+    to_turn: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    One page of turns, read from the (conversation_id, turn_index) primary key.
+
+    Args:
+        pg_client: Postgres client
+        conversation_id: Conversation to read
+        limit: Page size
+        tail: Start from the most recent turns instead of the first
+        from_turn: Inclusive lower turn_index bound
+        to_turn: Inclusive upper turn_index bound
+        cursor: Continue from a previous page's next_cursor (overrides tail)
+
+    Returns:
+        Tuple of (rows with turn_index/artifact_id/role in ascending turn
+        order, next_cursor or None when there are no more turns)
+
+    Raises:
+        ValueError: Malformed cursor
+    """
+    conditions = ["conversation_id = $1"]
+    params: List[Any] = [conversation_id]
+
+    def bound(op: str, value: int) -> None:
+        params.append(value)
+        conditions.append(f"turn_index {op} ${len(params)}")
+
+    descending = tail
+    if cursor:
+        direction, position = parse_cursor(cursor)
+        descending = direction == "before"
+        bound("<" if descending else ">", position)
+    if from_turn is not None:
+        bound(">=", from_turn)
+    if to_turn is not None:
+        bound("<=", to_turn)
+
+    params.append(limit + 1)  # One extra row tells us whether another page exists
+    rows = await pg_client.fetch_all(
+        f"""
+        SELECT turn_index, artifact_id, role
+        FROM conversation_turn
+        WHERE {' AND '.join(conditions)}
+        ORDER BY turn_index {'DESC' if descending else 'ASC'}
+        LIMIT ${len(params)}
+        """,
+        *params
+    )
+
+    rows = [dict(row) for row in rows]
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if descending:
+        rows.reverse()
+
+    next_cursor = None
+    if has_more and rows:
+        next_cursor = f"before:{rows[0]['turn_index']}" if descending else f"after:{rows[-1]['turn_index']}"
+
+    return rows, next_cursor
+
+
+def window_turns(
+    turns: List[Dict[str, Any]],
+    limit: int,
+    tail: bool = False,
+    from_turn: Optional[int] = None,
+    to_turn: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    fetch_turn_window() semantics over an in-memory turn list sorted by
+    turn_index (used when Postgres is unavailable).
+    """
+    descending = tail
+    if cursor:
+        direction, position = parse_cursor(cursor)
+        descending = direction == "before"
+        turns = [t for t in turns if (t["turn_index"] < position if descending else t["turn_index"] > position)]
+    if from_turn is not None:
+        turns = [t for t in turns if t["turn_index"] >= from_turn]
+    if to_turn is not None:
+        turns = [t for t in turns if t["turn_index"] <= to_turn]
+
+    has_more = len(turns) > limit
+    page = turns[-limit:] if descending else turns[:limit]
+
+    next_cursor = None
+    if has_more and page:
+        next_cursor = f"before:{page[0]['turn_index']}" if descending else f"after:{page[-1]['turn_index']}"
+    return page, next_cursor
+
+
+async def backfill_from_chroma(pg_client, chroma_client, page_size: int = 500) -> int:
+    """
+    Index conversation turns missing from the turn index.
+
+    Covers turns stored before the index existed, turns remembered while
+    Postgres was unavailable and an interrupted earlier backfill. Existing
+    rows are kept (ON CONFLICT DO NOTHING), so every run is a safe full
+    pass; Chroma pages are read off the event loop.
+
+    Returns:
+        Number of turns found in Chroma (already indexed ones included)
+    """
+    collection = get_content_collection(chroma_client)
+    indexed = 0
+    offset = 0
+    while True:
+        page = await asyncio.to_thread(
+            collection.get,
+            where={"context": "conversation"},
+            include=["metadatas"],
+            limit=page_size,
+            offset=offset
+        )
+        ids = page.get("ids", [])
+        if not ids:
+            break
+
+        rows = [
+            (meta["conversation_id"], int(meta["turn_index"]), artifact_id, meta.get("role"))
+            for artifact_id, meta in zip(ids, page.get("metadatas", []))
+            if meta and meta.get("conversation_id") is not None and meta.get("turn_index") is not None
+        ]
+        await record_turns(pg_client, rows)
+        indexed += len(rows)
+
+        if len(ids) < page_size:
+            break
+        offset += page_size
+
+    if indexed:
+        logger.info(f"Conversation turn index checked against {indexed} turns in Chroma")
+    return indexed
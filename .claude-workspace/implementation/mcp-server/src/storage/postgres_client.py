@@ -6,7 +6,8 @@ Uses asyncpg for async operations and psycopg2 for sync fallback.
 
 import asyncio
 import logging
-from typing import Optional, List, Dict, Any, Tuple
+import math
+from typing import Optional, List, Dict, Any, Callable, Tuple
 from contextlib import asynccontextmanager
 import asyncpg
 import psycopg2
@@ -15,6 +16,20 @@ from psycopg2.pool import SimpleConnectionPool
 
 logger = logging.getLogger("postgres_client")
 
+# Distinct statement texts tracked for stats; beyond this, new texts are only
+# counted (a sign of SQL built per input size). Texts are keyed by hash and
+# keep a 120-char sample, so the table stays around 3 MB when full.
+MAX_TRACKED_STATEMENTS = 10000
+STATEMENT_SAMPLE_CHARS = 120
+
+# Texts beyond MAX_TRACKED_STATEMENTS set one bit each in a fixed 128 KB
+# bitmap: a set bit counts as a repeat, and the distinct count is estimated
+# from the share of set bits (linear counting)
+UNTRACKED_STATEMENT_BITS = 1 << 20
+
+# set_config(..., is_local => true) is SET LOCAL with bind parameters
+SET_LOCAL_SQL = "SELECT set_config($1, $2, true)"
+
 
 class PostgresClient:
     """Async Postgres client with connection pooling."""
@@ -24,7 +39,8 @@ class PostgresClient:
         dsn: str,
         min_pool_size: int = 2,
         max_pool_size: int = 10,
-        command_timeout: float = 60.0
+        command_timeout: float = 60.0,
+        statement_cache_size: int = 100
     ):
         """
         Initialize Postgres client.
@@ -34,14 +50,23 @@ class PostgresClient:
             min_pool_size: Minimum pool connections
             max_pool_size: Maximum pool connections
             command_timeout: Query timeout in seconds
+            statement_cache_size: asyncpg prepared statement cache size per connection
         """
         self.dsn = dsn
         self.min_pool_size = min_pool_size
         self.max_pool_size = max_pool_size
         self.command_timeout = command_timeout
+        self.statement_cache_size = statement_cache_size
         self._pool: Optional[asyncpg.Pool] = None
         self._sync_pool: Optional[SimpleConnectionPool] = None
 
+        # V10: Statement text usage (see statement_stats): hash(sql) -> [count, sample]
+        self._statement_counts: Dict[int, List[Any]] = {}
+        self._statement_executions = 0
+        self._statement_repeats = 0
+        self._untracked_bitmap = bytearray(UNTRACKED_STATEMENT_BITS // 8)
+        self._untracked_bits_set = 0
+
     async def connect(self) -> None:
         """Create async connection pool."""
         if self._pool is not None:
@@ -53,7 +78,8 @@ class PostgresClient:
                 self.dsn,
                 min_size=self.min_pool_size,
                 max_size=self.max_pool_size,
-                command_timeout=self.command_timeout
+                command_timeout=self.command_timeout,
+                statement_cache_size=self.statement_cache_size
             )
             logger.info(f"Postgres async pool created: {self.min_pool_size}-{self.max_pool_size} connections")
         except Exception as e:
@@ -117,6 +143,7 @@ class PostgresClient:
         Returns:
             Status string (e.g., "INSERT 0 1")
         """
+        self._record_statement(query)
         async with self.acquire() as conn:
             return await conn.execute(query, *args, timeout=timeout or self.command_timeout)
 
@@ -124,7 +151,8 @@ class PostgresClient:
         self,
         query: str,
         *args,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        settings: Optional[Dict[str, str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Fetch all rows as list of dicts.
@@ -133,12 +161,23 @@ class PostgresClient:
             query: SQL query with $1, $2, ... placeholders
             *args: Query parameters
             timeout: Optional query timeout
+            settings: V10 session settings (e.g. hnsw.ef_search) applied with
+                SET LOCAL semantics in a transaction around the query only
 
         Returns:
             List of row dicts
         """
+        self._record_statement(query)
         async with self.acquire() as conn:
-            rows = await conn.fetch(query, *args, timeout=timeout or self.command_timeout)
+            if not settings:
+                rows = await conn.fetch(query, *args, timeout=timeout or self.command_timeout)
+                return [dict(row) for row in rows]
+
+            async with conn.transaction():
+                for name, value in settings.items():
+                    self._record_statement(SET_LOCAL_SQL)
+                    await conn.execute(SET_LOCAL_SQL, name, value)
+                rows = await conn.fetch(query, *args, timeout=timeout or self.command_timeout)
             return [dict(row) for row in rows]
 
     async def fetch_one(
@@ -158,6 +197,7 @@ class PostgresClient:
         Returns:
             Row dict or None
         """
+        self._record_statement(query)
         async with self.acquire() as conn:
             row = await conn.fetchrow(query, *args, timeout=timeout or self.command_timeout)
             return dict(row) if row else None
@@ -179,6 +219,7 @@ class PostgresClient:
         Returns:
             Single value or None
         """
+        self._record_statement(query)
         async with self.acquire() as conn:
             return await conn.fetchval(query, *args, timeout=timeout or self.command_timeout)
 
@@ -195,8 +236,100 @@ class PostgresClient:
         async with self.acquire() as conn:
             async with conn.transaction():
                 for query, args in queries:
+                    self._record_statement(query)
                     await conn.execute(query, *args)
 
+    async def listen(self, channel: str, callback: Callable[[str], None]) -> asyncpg.Connection:
+        """
+        V10: LISTEN on a channel over a dedicated connection.
+
+        The connection is outside the pool (a pooled connection would be
+        handed to other queries while listening). The caller owns it and
+        closes it when done.
+
+        Args:
+            channel: NOTIFY channel name
+            callback: Called with each notification payload (on the event loop)
+
+        Returns:
+            The listening connection
+        """
+        conn = await asyncpg.connect(self.dsn)
+        try:
+            await conn.add_listener(channel, lambda _conn, _pid, _channel, payload: callback(payload))
+        except Exception:
+            await conn.close()
+            raise
+        logger.info(f"Listening on channel '{channel}'")
+        return conn
+
+    def _record_statement(self, query: str) -> None:
+        """Count a statement execution by SQL text."""
+        self._statement_executions += 1
+
+        key = hash(query)
+        entry = self._statement_counts.get(key)
+        if entry is not None:
+            entry[0] += 1
+            self._statement_repeats += 1
+        elif len(self._statement_counts) < MAX_TRACKED_STATEMENTS:
+            self._statement_counts[key] = [1, " ".join(query.split())[:STATEMENT_SAMPLE_CHARS]]
+        else:
+            bit = key % UNTRACKED_STATEMENT_BITS
+            byte, mask = bit >> 3, 1 << (bit & 7)
+            if self._untracked_bitmap[byte] & mask:
+                self._statement_repeats += 1
+            else:
+                self._untracked_bitmap[byte] |= mask
+                self._untracked_bits_set += 1
+
+    def _untracked_distinct(self) -> int:
+        """Linear-counting estimate of distinct texts beyond MAX_TRACKED_STATEMENTS."""
+        empty = UNTRACKED_STATEMENT_BITS - self._untracked_bits_set
+        if empty == 0:
+            return UNTRACKED_STATEMENT_BITS
+        return round(-UNTRACKED_STATEMENT_BITS * math.log(empty / UNTRACKED_STATEMENT_BITS))
+
+    def statement_stats(self, top: int = 5) -> Dict[str, Any]:
+        """
+        Report how often queries run through this client repeat the same SQL text.
+
+        sql_text_repeat_rate is the share of executions whose exact text this
+        process had already run - not the asyncpg prepared statement cache
+        hit rate, which is per connection and not exposed. It is an upper
+        bound on that hit rate: a rate near 100% with distinct_statements well
+        under statement_cache_size means each connection prepares a handful
+        of statements and then reuses them, while distinct_statements above
+        it (cache_overflow) means SQL built per input size is evicting plans.
+        Queries run on connections from acquire() directly are not counted.
+
+        Past MAX_TRACKED_STATEMENTS distinct texts (tracking_overflowed),
+        further texts are tracked approximately: distinct_statements becomes
+        an estimate and top_statements only covers the tracked texts.
+
+        Args:
+            top: Number of most-executed statements to include
+
+        Returns:
+            Stats dict
+        """
+        executions = self._statement_executions
+        distinct = len(self._statement_counts) + self._untracked_distinct()
+        most_used = sorted(self._statement_counts.values(), key=lambda entry: entry[0], reverse=True)[:top]
+
+        return {
+            "executions": executions,
+            "distinct_statements": distinct,
+            "sql_text_repeat_rate": round(self._statement_repeats / executions, 4) if executions else 0.0,
+            "statement_cache_size": self.statement_cache_size,
+            "cache_overflow": distinct > self.statement_cache_size,
+            "tracking_overflowed": self._untracked_bits_set > 0,
+            "top_statements": [
+                {"sql": sample, "executions": count}
+                for count, sample in most_used
+            ],
+        }
+
     def execute_sync(self, query: str, params: Optional[tuple] = None) -> Any:
         """
         Execute a query synchronously (fallback for worker).
@@ -295,7 +428,8 @@ class PostgresClient:
                     "status": "healthy",
                     "pool_size": self._pool.get_size(),
                     "pool_free": self._pool.get_size() - self._pool.get_idle_size(),
-                    "pool_max": self.max_pool_size
+                    "pool_max": self.max_pool_size,
+                    "statements": self.statement_stats(top=0)
                 }
             else:
                 return {
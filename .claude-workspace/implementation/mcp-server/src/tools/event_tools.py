@@ -50,6 +50,173 @@ EVENT_CATEGORIES = [
 ]
 
 
+# Columns returned for every event, with source metadata from artifact_revision.
+# V10: Explicit list - e.* would also ship the embedding and narrative_tsv.
+# Note: Only reference columns that exist in artifact_revision schema
+_EVENT_SELECT = """
+    SELECT e.event_id, e.artifact_uid, e.revision_id, e.category, e.event_time,
+           e.narrative, e.subject_json, e.actors_json, e.confidence, e.created_at,
+           ar.artifact_type as source_artifact_type,
+           ar.source_system as source_source_system,
+           ar.source_id as source_source_id,
+           ar.source_ts as source_ts,
+           ar.ingested_at as source_ingested_at
+"""
+
+# Must match the expression of idx_semantic_event_embedding_hnsw for the
+# planner to use the index
+_HALFVEC_EMBEDDING = "(e.embedding::halfvec(3072))"
+
+# pgvector's default hnsw.ef_search; an HNSW scan returns at most ef_search
+# rows, so the ANN branch raises it to its candidate count when larger
+HNSW_DEFAULT_EF_SEARCH = 40
+
+
+def _any_terms_query(query: str) -> str:
+    """
+    websearch_to_tsquery text matching any of the query's terms.
+
+    Queries often contain extra terms not present in the narrative (e.g.,
+    "API delivery") while still matching the core event ("security audit risk").
+    """
+    tokens = [t for t in re.findall(r"[A-Za-z]+", query) if len(t) >= 3]
+    tokens = tokens[:12]  # cap to keep tsquery reasonable
+    return " OR ".join(tokens) if tokens else query
+
+
+def _text_match_sql(params: List[Any], query: str) -> tuple:
+    """
+    V10: Full-text match and relevance order over the stored narrative_tsv.
+
+    Events matching any query term qualify; ts_rank_cd against the full
+    (AND) query is zero unless every term is covered, so AND-matches rank
+    above OR-matches in the same pass.
+
+    Returns:
+        Tuple of (tsquery FROM items, WHERE predicate, ORDER BY expressions)
+    """
+    params.append(query)
+    all_param = len(params)
+    params.append(_any_terms_query(query))
+    any_param = len(params)
+    return (
+        [
+            f"websearch_to_tsquery('english', ${all_param}) q_all",
+            f"websearch_to_tsquery('english', ${any_param}) q_any",
+        ],
+        "e.narrative_tsv @@ q_any",
+        "ts_rank_cd(e.narrative_tsv, q_all) DESC, ts_rank_cd(e.narrative_tsv, q_any) DESC",
+    )
+
+
+async def _fts_search(
+    pg_client,
+    filter_clauses: List[str],
+    params: List[Any],
+    query: Optional[str],
+    limit: int
+) -> List[Dict[str, Any]]:
+    """Full-text event search ranked by relevance (newest first without a query)."""
+    query_params = list(params)
+    from_items = ""
+    text_clause = ""
+    order_by = "e.event_time DESC NULLS LAST, e.created_at DESC"
+    if query:
+        tsqueries, predicate, rank_order = _text_match_sql(query_params, query)
+        from_items = " ".join(f"CROSS JOIN {item}" for item in tsqueries)
+        text_clause = f"AND {predicate}"
+        order_by = f"{rank_order}, {order_by}"
+
+    query_params.append(limit)
+    sql = " ".join([_EVENT_SELECT, f"""
+        FROM semantic_event e
+        {from_items}
+        LEFT JOIN artifact_revision ar ON e.artifact_uid = ar.artifact_uid AND e.revision_id = ar.revision_id
+        WHERE 1=1
+    """] + filter_clauses + [
+        text_clause,
+        f"ORDER BY {order_by}",
+        f"LIMIT ${len(query_params)}",
+    ])
+    return await pg_client.fetch_all(sql, *query_params)
+
+
+def _fused_search_sql(
+    filter_clauses: List[str],
+    params: List[Any],
+    query: Optional[str],
+    query_embedding: List[float],
+    limit: int,
+    rrf_constant: int
+) -> tuple:
+    """
+    Build the single-statement ANN + FTS search fused by RRF (V10).
+
+    Each branch ranks its own top candidates (the ANN branch walks the HNSW
+    index with the structured filters applied), then every event scores
+    sum(1 / (k + rank)) over the branches that returned it.
+
+    Returns:
+        Tuple of (sql, params, settings), where settings sets hnsw.ef_search
+        to at least the ANN candidate count for the statement's transaction
+    """
+    filters = " ".join(filter_clauses)
+    candidates = max(limit * 2, 20)
+
+    params.append("[" + ",".join(str(x) for x in query_embedding) + "]")
+    embedding_param = f"${len(params)}::halfvec(3072)"
+    params.append(candidates)
+    candidates_param = f"${len(params)}"
+
+    branches = [f"""
+        ann AS (
+            SELECT event_id, row_number() OVER (ORDER BY distance) AS rank
+            FROM (
+                SELECT e.event_id, {_HALFVEC_EMBEDDING} <=> {embedding_param} AS distance
+                FROM semantic_event e
+                WHERE e.embedding IS NOT NULL {filters}
+                ORDER BY {_HALFVEC_EMBEDDING} <=> {embedding_param}
+                LIMIT {candidates_param}
+            ) nearest
+        )
+    """]
+    ranked = ["SELECT event_id, rank FROM ann"]
+
+    if query:
+        tsqueries, predicate, rank_order = _text_match_sql(params, query)
+        branches.append(f"""
+        fts AS (
+            SELECT e.event_id, row_number() OVER (ORDER BY {rank_order}) AS rank
+            FROM semantic_event e, {", ".join(tsqueries)}
+            WHERE {predicate} {filters}
+            ORDER BY {rank_order}
+            LIMIT {candidates_param}
+        )
+        """)
+        ranked.append("SELECT event_id, rank FROM fts")
+
+    params.append(rrf_constant)
+    rrf_param = f"${len(params)}"
+    params.append(limit)
+
+    sql = f"""
+        WITH {",".join(branches)},
+        fused AS (
+            SELECT event_id, SUM(1.0 / ({rrf_param} + rank)) AS rrf_score
+            FROM ({" UNION ALL ".join(ranked)}) ranked
+            GROUP BY event_id
+        )
+        {_EVENT_SELECT}, f.rrf_score
+        FROM fused f
+        JOIN semantic_event e ON e.event_id = f.event_id
+        LEFT JOIN artifact_revision ar ON e.artifact_uid = ar.artifact_uid AND e.revision_id = ar.revision_id
+        ORDER BY f.rrf_score DESC, e.event_time DESC NULLS LAST
+        LIMIT ${len(params)}
+    """
+    settings = {"hnsw.ef_search": str(max(candidates, HNSW_DEFAULT_EF_SEARCH))}
+    return sql, params, settings
+
+
 async def event_search(
     pg_client,
     query: Optional[str] = None,
@@ -58,11 +225,18 @@ async def event_search(
     time_from: Optional[str] = None,
     time_to: Optional[str] = None,
     artifact_uid: Optional[str] = None,
-    include_evidence: bool = True
+    include_evidence: bool = True,
+    query_embedding: Optional[List[float]] = None,
+    rrf_constant: int = 60
 ) -> dict:
     """
     Search semantic events with structured filters.
 
+    V10: When query_embedding is given (the recall's own query embedding),
+    events are ranked by approximate nearest-neighbour search on the
+    narrative embedding, fused with the full-text matches by RRF in the
+    same SQL statement. Without it, search is full-text only.
+
     Args:
         pg_client: Postgres client instance
         query: Full-text search on narrative (optional)
@@ -72,6 +246,8 @@ async def event_search(
         time_to: Filter events before this time (ISO8601)
         artifact_uid: Filter to specific artifact
         include_evidence: Include evidence quotes
+        query_embedding: V10 query embedding enabling vector mode (optional)
+        rrf_constant: V10 RRF k for fusing vector and full-text ranks
 
     Returns:
         Dict with events list and metadata
@@ -91,146 +267,68 @@ async def event_search(
                 "details": {"valid_categories": EVENT_CATEGORIES}
             }
 
-        # Build query - join with artifact_revision for source metadata
-        # Note: Only reference columns that exist in artifact_revision schema
-        query_parts = ["""
-            SELECT e.*,
-                   ar.artifact_type as source_artifact_type,
-                   ar.source_system as source_source_system,
-                   ar.source_id as source_source_id,
-                   ar.source_ts as source_ts,
-                   ar.ingested_at as source_ingested_at
-            FROM semantic_event e
-            LEFT JOIN artifact_revision ar ON e.artifact_uid = ar.artifact_uid AND e.revision_id = ar.revision_id
-            WHERE 1=1
-        """]
+        # Structured filters, shared by every search strategy below
+        filter_clauses = []
         params = []
-        param_idx = 1
-
         filters_applied = {}
 
         if category:
-            query_parts.append(f"AND e.category = ${param_idx}")
             params.append(category)
-            param_idx += 1
+            filter_clauses.append(f"AND e.category = ${len(params)}")
             filters_applied["category"] = category
 
         if time_from:
             parsed_time_from = parse_iso8601(time_from)
             if parsed_time_from:
-                query_parts.append(f"AND e.event_time >= ${param_idx}")
                 params.append(parsed_time_from)
-                param_idx += 1
+                filter_clauses.append(f"AND e.event_time >= ${len(params)}")
                 filters_applied["time_from"] = time_from
 
         if time_to:
             parsed_time_to = parse_iso8601(time_to)
             if parsed_time_to:
-                query_parts.append(f"AND e.event_time <= ${param_idx}")
                 params.append(parsed_time_to)
-                param_idx += 1
+                filter_clauses.append(f"AND e.event_time <= ${len(params)}")
                 filters_applied["time_to"] = time_to
 
         if artifact_uid:
-            query_parts.append(f"AND e.artifact_uid = ${param_idx}")
             params.append(artifact_uid)
-            param_idx += 1
+            filter_clauses.append(f"AND e.artifact_uid = ${len(params)}")
             filters_applied["artifact_uid"] = artifact_uid
 
         if query:
-            # Use plainto_tsquery for safe full-text search (prevents SQL injection)
-            query_parts.append(f"AND to_tsvector('english', e.narrative) @@ plainto_tsquery('english', ${param_idx})")
-            params.append(query)
-            param_idx += 1
             filters_applied["query"] = query
 
-        # Order and limit
-        query_parts.append("ORDER BY e.event_time DESC NULLS LAST, e.created_at DESC")
-        query_parts.append(f"LIMIT ${param_idx}")
-        params.append(limit)
-
-        # Execute query (primary: AND semantics via plainto_tsquery)
-        sql = " ".join(query_parts)
-        events = await pg_client.fetch_all(sql, *params)
+        events = None
+        search_mode = "fts" if query else "filter"
 
-        # Fallback: if query returns nothing, retry with OR semantics to improve recall.
-        # This helps queries that contain extra terms not present in the narrative (e.g., "API delivery")
-        # while still matching the core event ("security audit risk").
-        if query and not events:
+        # V10: Vector mode - ANN over the halfvec HNSW index, RRF-fused with FTS
+        if query_embedding is not None:
             try:
-                # Extract safe tokens and build a websearch query with OR.
-                tokens = [t for t in re.findall(r"[A-Za-z]+", query) if len(t) >= 3]
-                tokens = tokens[:12]  # cap to keep tsquery reasonable
-                if tokens:
-                    or_query = " OR ".join(tokens)
-
-                    # Rebuild query using websearch_to_tsquery for safer parsing.
-                    # Note: Only reference columns that exist in artifact_revision schema
-                    query_parts_or = ["""
-                        SELECT e.*,
-                               ar.artifact_type as source_artifact_type,
-                               ar.source_system as source_source_system,
-                               ar.source_id as source_source_id,
-                               ar.source_ts as source_ts,
-                               ar.ingested_at as source_ingested_at
-                        FROM semantic_event e
-                        LEFT JOIN artifact_revision ar ON e.artifact_uid = ar.artifact_uid AND e.revision_id = ar.revision_id
-                        WHERE 1=1
-                    """]
-                    params_or = []
-                    param_idx_or = 1
-
-                    # Reapply the same non-query filters
-                    if category:
-                        query_parts_or.append(f"AND e.category = ${param_idx_or}")
-                        params_or.append(category)
-                        param_idx_or += 1
-                    if time_from:
-                        parsed_time_from = parse_iso8601(time_from)
-                        if parsed_time_from:
-                            query_parts_or.append(f"AND e.event_time >= ${param_idx_or}")
-                            params_or.append(parsed_time_from)
-                            param_idx_or += 1
-                    if time_to:
-                        parsed_time_to = parse_iso8601(time_to)
-                        if parsed_time_to:
-                            query_parts_or.append(f"AND e.event_time <= ${param_idx_or}")
-                            params_or.append(parsed_time_to)
-                            param_idx_or += 1
-                    if artifact_uid:
-                        query_parts_or.append(f"AND e.artifact_uid = ${param_idx_or}")
-                        params_or.append(artifact_uid)
-                        param_idx_or += 1
-
-                    query_parts_or.append(
-                        f"AND to_tsvector('english', e.narrative) @@ websearch_to_tsquery('english', ${param_idx_or})"
-                    )
-                    params_or.append(or_query)
-                    param_idx_or += 1
-
-                    query_parts_or.append("ORDER BY e.event_time DESC NULLS LAST, e.created_at DESC")
-                    query_parts_or.append(f"LIMIT ${param_idx_or}")
-                    params_or.append(limit)
-
-                    sql_or = " ".join(query_parts_or)
-                    events = await pg_client.fetch_all(sql_or, *params_or)
-            except Exception as _:
-                # If fallback fails, keep original empty set.
-                pass
+                sql, vector_params, settings = _fused_search_sql(
+                    filter_clauses, list(params), query, query_embedding, limit, rrf_constant
+                )
+                events = await pg_client.fetch_all(sql, *vector_params, settings=settings)
+                search_mode = "hybrid" if query else "vector"
+            except Exception as e:
+                logger.warning(f"event_search vector mode failed, using full-text only: {e}")
+                events = None
+
+        if events is None:
+            events = await _fts_search(pg_client, filter_clauses, params, query, limit)
 
         # Batch fetch evidence if requested (avoids N+1 query)
         evidence_map = {}
         if include_evidence and events:
             event_ids = [event["event_id"] for event in events]
-            # Generate parameterized placeholders for IN clause
-            placeholders = ", ".join(f"${i+1}" for i in range(len(event_ids)))
-            evidence_sql = f"""
+            # Array parameter keeps the SQL text fixed (cached prepared statement)
+            evidence_sql = """
             SELECT event_id, evidence_id, quote, start_char, end_char, chunk_id
             FROM event_evidence
-            WHERE event_id IN ({placeholders})
+            WHERE event_id = ANY($1::uuid[])
             ORDER BY event_id, start_char
             """
-            evidence_rows = await pg_client.fetch_all(evidence_sql, *event_ids)
+            evidence_rows = await pg_client.fetch_all(evidence_sql, event_ids)
 
             # Group evidence by event_id
             for ev in evidence_rows:
@@ -280,7 +378,8 @@ async def event_search(
         return {
             "events": formatted_events,
             "total": len(formatted_events),
-            "filters_applied": filters_applied
+            "filters_applied": filters_applied,
+            "search_mode": search_mode
         }
 
     except Exception as e:
@@ -307,14 +406,7 @@ async def event_get(
     """
     try:
         # Fetch event with source metadata
-        # Note: Only reference columns that exist in artifact_revision schema
-        event_sql = """
-            SELECT e.*,
-                   ar.artifact_type as source_artifact_type,
-                   ar.source_system as source_source_system,
-                   ar.source_id as source_source_id,
-                   ar.source_ts as source_ts,
-                   ar.ingested_at as source_ingested_at
+        event_sql = _EVENT_SELECT + """
             FROM semantic_event e
             LEFT JOIN artifact_revision ar ON e.artifact_uid = ar.artifact_uid AND e.revision_id = ar.revision_id
             WHERE e.event_id = $1
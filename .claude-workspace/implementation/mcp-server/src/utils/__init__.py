@@ -10,6 +10,9 @@ from utils.errors import (
     NotFoundError
 )
 from utils.logging import setup_logging, StructuredLogger
+from utils.concurrency import gather_with_timeouts
+from utils.progress import ProgressStream
+from utils.snippets import extract_snippet, shape_result
 
 __all__ = [
     "MCPMemoryError",
@@ -21,4 +24,8 @@ __all__ = [
     "NotFoundError",
     "setup_logging",
     "StructuredLogger",
+    "gather_with_timeouts",
+    "ProgressStream",
+    "extract_snippet",
+    "shape_result",
 ]
@@ -0,0 +1,85 @@
+"""Concurrent enrichment helpers for MCP Memory Server."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Dict, List, Tuple
+
+
+logger = logging.getLogger("mcp-memory.concurrency")
+
+
+async def gather_with_timeouts(
+    calls: Dict[str, Awaitable[Any]],
+    timeout: float,
+    defaults: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Run independent awaitables concurrently, each bounded by a timeout.
+
+    A call that times out or raises is replaced by its default, so callers
+    get partial results instead of failing the whole request.
+
+    Args:
+        calls: Name -> awaitable
+        timeout: Per-call timeout in seconds
+        defaults: Name -> value used when the call fails or times out
+
+    Returns:
+        Tuple of (results by name, names of calls that failed or timed out)
+    """
+    names = list(calls)
+    outcomes = await asyncio.gather(
+        *(asyncio.wait_for(calls[name], timeout) for name in names),
+        return_exceptions=True
+    )
+
+    results: Dict[str, Any] = {}
+    failed: List[str] = []
+    for name, outcome in zip(names, outcomes):
+        if isinstance(outcome, BaseException):
+            if isinstance(outcome, asyncio.TimeoutError):
+                logger.warning(f"Enrichment '{name}' timed out after {timeout:.1f}s")
+            else:
+                logger.warning(f"Enrichment '{name}' failed: {outcome}")
+            results[name] = defaults.get(name)
+            failed.append(name)
+        else:
+            results[name] = outcome
+
+    return results, failed
+
+
+class RateLimiter:
+    """
+    V10: Spaces out async calls to stay under a requests-per-minute budget.
+
+    One instance is shared by everything that calls the same API in a
+    process, so concurrent jobs and chunks draw from the same budget.
+    A budget of 0 (or less) disables limiting.
+    """
+
+    def __init__(self, requests_per_minute: int):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Allowed calls per minute (<= 0 = unlimited)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next call is allowed."""
+        if self.interval <= 0:
+            return
+
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,80 @@
+"""Progressive (streamed) tool responses for MCP Memory Server."""
+
+import json
+import logging
+import time
+from typing import Any, Dict, Optional
+
+
+logger = logging.getLogger("mcp-memory.progress")
+
+
+class ProgressStream:
+    """
+    Emits partial tool results as MCP progress notifications.
+
+    Each stage is sent as one progress message whose `message` is a JSON
+    object: {"stage": <name>, "elapsed_ms": <float>, "data": <payload>}.
+    Over the streamable-HTTP transport these reach the client while the tool
+    call is still running. Clients that did not send a progress token get no
+    notifications and simply receive the final result.
+
+    Timing is tracked independently of delivery, so time-to-first-result is
+    measurable even when nothing is streamed.
+    """
+
+    def __init__(self, ctx: Optional[Any] = None, total_stages: Optional[int] = None):
+        """
+        Args:
+            ctx: FastMCP Context for the current request (None disables sending)
+            total_stages: Expected number of stages, reported as progress total
+        """
+        self.ctx = ctx
+        self.total_stages = total_stages
+        self.stages_sent = 0
+        self._t_start = time.perf_counter()
+        self.first_result_ms: Optional[float] = None
+        self.stage_ms: Dict[str, float] = {}
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._t_start) * 1000
+
+    async def emit(self, stage: str, data: Any) -> None:
+        """
+        Record a stage and send it to the client.
+
+        Delivery failures are logged and never fail the tool call.
+
+        Args:
+            stage: Stage name ("primary", "related", "entities", "edges")
+            data: JSON-serializable payload for the stage
+        """
+        elapsed = self.elapsed_ms()
+        self.stage_ms[stage] = round(elapsed, 1)
+        if self.first_result_ms is None:
+            self.first_result_ms = round(elapsed, 1)
+        self.stages_sent += 1
+
+        if self.ctx is None:
+            return
+
+        try:
+            message = json.dumps(
+                {"stage": stage, "elapsed_ms": round(elapsed, 1), "data": data},
+                default=str
+            )
+            await self.ctx.report_progress(
+                progress=self.stages_sent,
+                total=self.total_stages,
+                message=message
+            )
+        except Exception as e:
+            logger.warning(f"Failed to stream stage '{stage}': {e}")
+
+    def timings(self) -> Dict[str, Any]:
+        """Per-stage and total timings (ms) for the response."""
+        return {
+            "first_result_ms": self.first_result_ms,
+            "stages_ms": dict(self.stage_ms),
+            "total_ms": round(self.elapsed_ms(), 1),
+        }
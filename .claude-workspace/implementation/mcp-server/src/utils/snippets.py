@@ -0,0 +1,146 @@
+"""Snippet extraction and field projection for recall responses."""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+
+# Rough size of a token for budgeting windows without a tokenizer round trip
+CHARS_PER_TOKEN = 4
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:[._\-][a-z0-9]+)*")
+_SENTENCE_RE = re.compile(r"[^.!?\n]+(?:[.!?]+|\n+|$)")
+_STOPWORDS = frozenset(
+    "a an and are as at be by did do does for from has have how i in is it of on or "
+    "the this that to was were what when where which who why will with".split()
+)
+
+
+def _terms(text: str) -> List[str]:
+    return [t for t in _WORD_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def extract_snippet(text: str, query: Optional[str], max_tokens: int) -> Dict[str, Any]:
+    """
+    Best-matching window of whole sentences within a token budget.
+
+    Sentences are scored by how many distinct query terms they contain (with
+    a small bonus for repeats). The window grows from the best sentence
+    towards its highest-scoring neighbours until the budget is used. Without
+    a query, or with no matching sentence, the window starts at the top.
+
+    Args:
+        text: Full document or chunk text
+        query: Search query (optional)
+        max_tokens: Window budget in tokens (approximate, 4 chars per token)
+
+    Returns:
+        {"text", "start_char", "end_char", "truncated"} with offsets into text
+    """
+    text = text or ""
+    budget = max(1, max_tokens) * CHARS_PER_TOKEN
+    if len(text) <= budget:
+        return {"text": text, "start_char": 0, "end_char": len(text), "truncated": False}
+
+    spans = [(m.start(), m.end()) for m in _SENTENCE_RE.finditer(text) if m.group().strip()]
+    if not spans:
+        spans = [(0, len(text))]
+
+    query_terms = set(_terms(query or ""))
+    scores = []
+    for start, end in spans:
+        terms = _terms(text[start:end])
+        hits = [t for t in terms if t in query_terms]
+        scores.append(len(set(hits)) + 0.1 * len(hits))
+
+    best = max(range(len(spans)), key=lambda i: (scores[i], -i)) if query_terms else 0
+    lo = hi = best
+
+    # Grow towards the better neighbour while the next sentence still fits
+    while True:
+        candidates = []
+        if lo > 0 and spans[hi][1] - spans[lo - 1][0] <= budget:
+            candidates.append((scores[lo - 1], "left"))
+        if hi < len(spans) - 1 and spans[hi + 1][1] - spans[lo][0] <= budget:
+            candidates.append((scores[hi + 1], "right"))
+        if not candidates:
+            break
+        # Prefer higher score; on ties, read forward
+        _, side = max(candidates, key=lambda c: (c[0], c[1] == "right"))
+        if side == "left":
+            lo -= 1
+        else:
+            hi += 1
+
+    start, end = spans[lo][0], spans[hi][1]
+    if end - start > budget:
+        # A single sentence longer than the budget: centre on the first query term
+        anchor = start
+        lowered = text[start:end].lower()
+        for term in query_terms:
+            pos = lowered.find(term)
+            if pos >= 0:
+                anchor = start + pos
+                break
+        start = max(start, min(anchor - budget // 4, end - budget))
+        end = start + budget
+
+    return {
+        "text": text[start:end].strip(),
+        "start_char": start,
+        "end_char": end,
+        "truncated": True,
+    }
+
+
+def project_metadata(metadata: Optional[Dict[str, Any]], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Keep only the requested metadata keys (all keys when fields is None)."""
+    if metadata is None:
+        return {}
+    if fields is None:
+        return metadata
+    return {key: metadata[key] for key in fields if key in metadata}
+
+
+def shape_result(
+    result: Dict[str, Any],
+    query: Optional[str] = None,
+    snippet_tokens: Optional[int] = None,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Apply snippet and field projection to one recall result in place.
+
+    Chunk hits report snippet offsets in parent-document coordinates using
+    the chunk's start_char metadata.
+
+    Args:
+        result: Result dict with "content" and "metadata"
+        query: Search query used to pick the window
+        snippet_tokens: Window budget; None keeps the full content
+        fields: Metadata keys to keep; None keeps all
+
+    Returns:
+        The same dict
+    """
+    metadata = result.get("metadata") or {}
+
+    if snippet_tokens and result.get("content"):
+        snippet = extract_snippet(result["content"], query, snippet_tokens)
+        offset = metadata.get("start_char", 0) if result.get("collection") == "chunks" else 0
+        result["content"] = snippet["text"]
+        result["snippet"] = {
+            "start_char": snippet["start_char"] + (offset or 0),
+            "end_char": snippet["end_char"] + (offset or 0),
+            "truncated": snippet["truncated"],
+        }
+
+    if "metadata" in result:
+        result["metadata"] = project_metadata(metadata, fields)
+
+    return result
+
+
+def payload_bytes(payload: Any) -> int:
+    """Serialized JSON size of a response, for logging."""
+    return len(json.dumps(payload, default=str).encode("utf-8"))
@@ -6,11 +6,19 @@ Job types:
 
 Polls Postgres for PENDING jobs, claims them atomically, processes using LLM,
 and writes results back to Postgres. Graph expansion uses SQL joins (no AGE).
+
+V10: Workers LISTEN for new-job notifications and wake immediately; polling
+is only a slow safety net (WORKER_IDLE_POLL_MS). Up to WORKER_CONCURRENCY
+jobs run concurrently per process. Jobs are
+LLM-bound, so the blocking OpenAI/ChromaDB clients run in worker threads
+while the event loop keeps other jobs (and their pooled Postgres
+connections) moving.
 """
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Set, Tuple
 from uuid import UUID, uuid4
 import httpx
 
@@ -18,13 +26,18 @@ from config import Config
 from storage.postgres_client import PostgresClient
 from storage.chroma_client import ChromaClientManager
 from services.event_extraction_service import EventExtractionService
+from services.extraction_cache import ExtractionCache
+from services.merge_decision_cache import MergeDecisionCache
+from services.entity_name_index import EntityNameIndex
 from services.job_queue_service import JobQueueService
 from services.entity_resolution_service import (
     EntityResolutionService,
+    EntityResolutionResult,
     ExtractedEntity,
     ContextClues
 )
 from services.embedding_service import EmbeddingService
+from utils.concurrency import RateLimiter
 
 logger = logging.getLogger("event_worker")
 
@@ -43,7 +56,17 @@ class EventWorker:
         self.config = config
         self.worker_id = config.worker_id or f"worker-{uuid4().hex[:8]}"
         self.poll_interval_ms = config.poll_interval_ms
+        self.concurrency = max(1, config.worker_concurrency)
+        self.job_notify_enabled = config.job_notify_enabled
+        self.idle_poll_ms = config.worker_idle_poll_ms
+        self.chunk_concurrency = max(1, config.extraction_chunk_concurrency)
         self.running = False
+        self._in_flight: Set[asyncio.Task] = set()
+
+        # V10: Set by job notifications; the poll loop waits on it when idle
+        self._wakeup = asyncio.Event()
+        self._listen_conn = None
+        self._backfill_task: Optional[asyncio.Task] = None
         self.enable_v4 = enable_v4
 
         # Initialize services (will connect in run())
@@ -60,11 +83,11 @@ class EventWorker:
         """Initialize all services."""
         logger.info("Initializing worker services...")
 
-        # Postgres client
+        # Postgres client (V10: one spare connection per in-flight job plus the poller)
         self.pg_client = PostgresClient(
             dsn=self.config.events_db_dsn,
             min_pool_size=self.config.postgres_pool_min,
-            max_pool_size=self.config.postgres_pool_max
+            max_pool_size=max(self.config.postgres_pool_max, self.concurrency + 1)
         )
         await self.pg_client.connect()
 
@@ -87,14 +110,24 @@ class EventWorker:
 
         logger.info("  ChromaDB: OK")
 
-        # Event extraction service
+        # V10: Prompt A result cache; long-unused entries are dropped (never by
+        # prompt version, so mixed-version workers keep each other's entries)
+        extraction_cache = None
+        if self.config.extraction_cache_enabled:
+            extraction_cache = ExtractionCache(self.pg_client)
+            await extraction_cache.prune_idle(self.config.extraction_cache_max_idle_days)
+
+        # Event extraction service (V10: one rate limiter for all in-flight jobs)
         self.extraction_service = EventExtractionService(
             api_key=self.config.openai_api_key,
             model=self.config.openai_event_model,
             temperature=0.0,
-            timeout=60
+            timeout=60,
+            rate_limiter=RateLimiter(self.config.openai_requests_per_minute),
+            cache=extraction_cache,
+            local_canonicalization=self.config.local_canonicalization_enabled
         )
-        logger.info("  Event Extraction Service: OK")
+        logger.info(f"  Event Extraction Service: OK (cache {'on' if extraction_cache else 'off'})")
 
         # Job queue service
         self.job_service = JobQueueService(
@@ -113,6 +146,22 @@ class EventWorker:
             )
             logger.info("  Embedding Service: OK")
 
+            # V10: Merge decision cache; expired decisions are dropped
+            decision_cache = None
+            if self.config.merge_decision_cache_enabled:
+                decision_cache = MergeDecisionCache(self.pg_client, self.config.merge_decision_cache_ttl_days)
+                await decision_cache.prune_expired()
+
+            # V10: In-memory names and aliases, kept current by NOTIFY
+            name_index = None
+            if self.config.entity_name_index_enabled:
+                name_index = EntityNameIndex(self.pg_client)
+                try:
+                    await name_index.start()
+                except Exception as e:
+                    logger.warning(f"  Entity name index unavailable, exact matches use Postgres: {e}")
+                    name_index = None
+
             # Entity resolution service
             self.entity_resolution_service = EntityResolutionService(
                 pg_client=self.pg_client,
@@ -120,9 +169,14 @@ class EventWorker:
                 openai_api_key=self.config.openai_api_key,
                 similarity_threshold=0.85,
                 max_candidates=5,
-                model=getattr(self.config, 'openai_entity_model', 'gpt-4o-mini')
+                model=getattr(self.config, 'openai_entity_model', 'gpt-4o-mini'),
+                decision_cache=decision_cache,
+                name_index=name_index
+            )
+            logger.info(
+                f"  Entity Resolution Service: OK (decision cache {'on' if decision_cache else 'off'}, "
+                f"name index {'on' if name_index else 'off'})"
             )
-            logger.info("  Entity Resolution Service: OK")
 
         logger.info("Worker services initialized")
 
@@ -130,6 +184,17 @@ class EventWorker:
         """Shutdown all services."""
         logger.info("Shutting down worker services...")
 
+        if self._backfill_task:
+            self._backfill_task.cancel()
+            try:
+                await self._backfill_task
+            except asyncio.CancelledError:
+                pass
+            self._backfill_task = None
+
+        if self.entity_resolution_service and self.entity_resolution_service.name_index:
+            await self.entity_resolution_service.name_index.stop()
+
         if self.pg_client:
             await self.pg_client.close()
 
@@ -139,38 +204,155 @@ class EventWorker:
         """Run worker main loop."""
         await self.initialize()
 
+        # V10: Fill entity.name_embedding for entities created before migration
+        # 010, alongside job processing rather than before it
+        if self.entity_resolution_service:
+            self._backfill_task = asyncio.create_task(self._backfill_name_embeddings())
+
         self.running = True
-        logger.info(f"Worker {self.worker_id} started. Polling every {self.poll_interval_ms}ms")
+        logger.info(f"Worker {self.worker_id} started. Concurrency {self.concurrency}")
+
+        try:
+            await self.run_jobs()
+        except KeyboardInterrupt:
+            logger.info("Worker interrupted")
+        finally:
+            await self.shutdown()
+
+    async def _backfill_name_embeddings(self) -> None:
+        """Background entity name embedding backfill (failures are logged)."""
+        try:
+            await self.entity_resolution_service.backfill_name_embeddings()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Entity name embedding backfill failed: {e}")
+
+    async def run_jobs(self) -> None:
+        """
+        V10: Keep up to `concurrency` jobs in flight until stopped.
+
+        Each claim fills every free slot with one UPDATE ... RETURNING.
+        Claims again as soon as a slot is free and only waits when the queue
+        is empty (or claiming failed): until a job notification arrives, or
+        for one poll interval. In-flight jobs are drained on exit.
+        """
+        slots = asyncio.Semaphore(self.concurrency)
+
+        # Blocking client calls (Chroma, embeddings, entity resolution) go
+        # through asyncio.to_thread (the default executor); size it so every
+        # in-flight job gets a thread. LLM extraction uses the async client.
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=self.concurrency + 4, thread_name_prefix="worker-io")
+        )
+
+        if self.job_notify_enabled:
+            await self._start_listening()
 
         try:
             while self.running:
+                await slots.acquire()
+                if not self.running:
+                    slots.release()
+                    break
+
+                # Take every other free slot too. Tasks holding a slot are
+                # always in _in_flight, so these acquires never block.
+                free = 1
+                while free < self.concurrency - len(self._in_flight):
+                    await slots.acquire()
+                    free += 1
+
+                # Cleared before claiming, so a notification that arrives
+                # after an empty claim still wakes the wait below
+                self._wakeup.clear()
                 try:
-                    await self.process_one_job()
+                    jobs = await self._claim_jobs(free)
                 except Exception as e:
-                    logger.error(f"Error processing job: {e}", exc_info=True)
+                    logger.error(f"Error claiming jobs: {e}", exc_info=True)
+                    jobs = []
 
-                # Sleep until next poll
-                await asyncio.sleep(self.poll_interval_ms / 1000.0)
+                for _ in range(free - len(jobs)):
+                    slots.release()
 
-        except KeyboardInterrupt:
-            logger.info("Worker interrupted")
+                if not jobs:
+                    await self._wait_for_work()
+                    continue
+
+                for job in jobs:
+                    task = asyncio.create_task(self._run_job(job, slots))
+                    self._in_flight.add(task)
+                    task.add_done_callback(self._in_flight.discard)
         finally:
-            await self.shutdown()
+            if self._in_flight:
+                logger.info(f"Waiting for {len(self._in_flight)} in-flight jobs")
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+            await self._stop_listening()
 
-    async def process_one_job(self) -> None:
-        """Process one job from the queue (V3 compatible)."""
-        # Try to claim an extract_events job first
-        # NOTE (V4): claim_job() historically claimed ANY pending job, including graph_upsert.
-        # We must claim extract_events explicitly to avoid stealing graph_upsert jobs.
-        job = await self.job_service.claim_job_by_type(self.worker_id, "extract_events")
+    async def _start_listening(self) -> None:
+        """LISTEN for new jobs; on failure the worker keeps polling at poll_interval_ms."""
+        try:
+            self._listen_conn = await self.job_service.listen_for_jobs(self._on_job_notification)
+        except Exception as e:
+            self._listen_conn = None
+            logger.warning(f"Job notifications unavailable, polling every {self.poll_interval_ms}ms: {e}")
+
+    async def _stop_listening(self) -> None:
+        if self._listen_conn is not None:
+            try:
+                await self._listen_conn.close()
+            except Exception as e:
+                logger.warning(f"Failed to close job listener: {e}")
+            self._listen_conn = None
+
+    def _on_job_notification(self, job_type: str) -> None:
+        if job_type == "extract_events":
+            self._wakeup.set()
+
+    async def _wait_for_work(self) -> None:
+        """Wait for a job notification or the poll interval, whichever comes first."""
+        if self._listen_conn is not None and self._listen_conn.is_closed():
+            logger.warning("Job listener connection lost, reconnecting")
+            self._listen_conn = None
+            await self._start_listening()
 
-        if job:
+        interval_ms = self.idle_poll_ms if self._listen_conn is not None else self.poll_interval_ms
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=interval_ms / 1000.0)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run_job(self, job: Dict[str, Any], slots: asyncio.Semaphore) -> None:
+        """Process one claimed job and free its slot."""
+        try:
             await self._process_extract_events_job(job)
-            return
+        except Exception as e:
+            logger.error(f"Error processing job: {e}", exc_info=True)
+        finally:
+            slots.release()
 
+    async def _claim_jobs(self, n: int) -> List[Dict[str, Any]]:
+        """Claim up to n extract_events jobs."""
+        # NOTE (V4): claim_job() historically claimed ANY pending job, including graph_upsert.
+        # We must claim extract_events explicitly to avoid stealing graph_upsert jobs.
         # V6: graph_upsert jobs are disabled - graph expansion uses Postgres SQL joins
         # Legacy graph_upsert jobs in queue will be ignored and eventually expire
-        pass
+        return await self.job_service.claim_jobs(self.worker_id, "extract_events", n)
+
+    async def process_one_job(self) -> bool:
+        """
+        Process one job from the queue (V3 compatible).
+
+        Returns:
+            True if a job was claimed and processed
+        """
+        jobs = await self._claim_jobs(1)
+
+        if jobs:
+            await self._process_extract_events_job(jobs[0])
+            return True
+
+        return False
 
     async def _process_extract_events_job(self, job: Dict[str, Any]) -> None:
         """Process an extract_events job."""
@@ -244,18 +426,12 @@ class EventWorker:
         chunk_texts: List[Tuple]
     ) -> None:
         """V3 extraction: events only."""
-        chunk_events = []
-        for chunk_text, chunk_index, chunk_id, start_char in chunk_texts:
-            events = self.extraction_service.extract_from_chunk(
-                chunk_text=chunk_text,
-                chunk_index=chunk_index,
-                chunk_id=chunk_id,
-                start_char=start_char
-            )
-            chunk_events.append(events)
+        # V10: Chunks are extracted concurrently, results come back in chunk order
+        results = await self.extraction_service.extract_chunks_v4(chunk_texts, self.chunk_concurrency)
+        chunk_events = [events for events, _, _ in results]
 
-        # Canonicalize events across chunks (Prompt B)
-        canonical_events = self.extraction_service.canonicalize_events(chunk_events)
+        # Canonicalize events across chunks (V10: locally; Prompt B only for ambiguous clusters)
+        canonical_events = await self.extraction_service.canonicalize_events_async(chunk_events)
 
         # Validate events
         valid_events = [
@@ -282,23 +458,14 @@ class EventWorker:
         doc_title: str
     ) -> None:
         """V8 extraction: events + entities + relationships with resolution."""
-        chunk_events = []
-        chunk_entities = []
-        chunk_relationships = []
-
-        for chunk_text, chunk_index, chunk_id, start_char in chunk_texts:
-            events, entities, relationships = self.extraction_service.extract_from_chunk_v4(
-                chunk_text=chunk_text,
-                chunk_index=chunk_index,
-                chunk_id=chunk_id,
-                start_char=start_char
-            )
-            chunk_events.append(events)
-            chunk_entities.append(entities)
-            chunk_relationships.append(relationships)
+        # V10: Chunks are extracted concurrently, results come back in chunk order
+        results = await self.extraction_service.extract_chunks_v4(chunk_texts, self.chunk_concurrency)
+        chunk_events = [events for events, _, _ in results]
+        chunk_entities = [entities for _, entities, _ in results]
+        chunk_relationships = [relationships for _, _, relationships in results]
 
-        # Canonicalize events across chunks (Prompt B)
-        canonical_events = self.extraction_service.canonicalize_events(chunk_events)
+        # Canonicalize events across chunks (V10: locally; Prompt B only for ambiguous clusters)
+        canonical_events = await self.extraction_service.canonicalize_events_async(chunk_events)
 
         # Validate events
         valid_events = [
@@ -320,27 +487,27 @@ class EventWorker:
         #
         # Keys are lowercased strings (canonical_suggestion, surface_form, aliases_in_doc).
         entity_map: Dict[str, UUID] = {}
+        extracted_entities: List[ExtractedEntity] = []
         for entity_dict in deduped_entities:
             try:
-                extracted = ExtractedEntity.from_dict(entity_dict)
-                result = await self.entity_resolution_service.resolve_extracted_entity(
-                    extracted=extracted,
-                    artifact_uid=artifact_uid,
-                    revision_id=revision_id,
-                    doc_title=doc_title
-                )
-                # Canonical suggestion
-                if extracted.canonical_suggestion:
-                    entity_map[extracted.canonical_suggestion.lower()] = result.entity_id
-                # Surface form
-                if extracted.surface_form:
-                    entity_map[extracted.surface_form.lower()] = result.entity_id
-                # Aliases observed in doc/chunk
-                for alias in extracted.aliases_in_doc or []:
-                    if alias:
-                        entity_map[alias.lower()] = result.entity_id
+                extracted_entities.append(ExtractedEntity.from_dict(entity_dict))
             except Exception as e:
-                logger.warning(f"Entity resolution failed for '{entity_dict.get('surface_form')}': {e}")
+                logger.warning(f"Invalid extracted entity '{entity_dict.get('surface_form')}': {e}")
+
+        results = await self._resolve_entities(extracted_entities, artifact_uid, revision_id, doc_title)
+        for extracted, result in zip(extracted_entities, results):
+            if result is None:
+                continue
+            # Canonical suggestion
+            if extracted.canonical_suggestion:
+                entity_map[extracted.canonical_suggestion.lower()] = result.entity_id
+            # Surface form
+            if extracted.surface_form:
+                entity_map[extracted.surface_form.lower()] = result.entity_id
+            # Aliases observed in doc/chunk
+            for alias in extracted.aliases_in_doc or []:
+                if alias:
+                    entity_map[alias.lower()] = result.entity_id
 
         # Build entity-event mapping
         entity_event_map: Dict[str, List[Dict[str, Any]]] = {}
@@ -375,7 +542,9 @@ class EventWorker:
         if self.embedding_service and valid_events:
             narratives = [e.get("narrative", "") for e in valid_events]
             try:
-                embeddings = self.embedding_service.generate_embeddings_batch(narratives)
+                embeddings = await asyncio.to_thread(
+                    self.embedding_service.generate_embeddings_batch, narratives
+                )
                 event_embeddings = embeddings
                 logger.info(f"Generated {len(embeddings)} narrative embeddings for triplet cache")
             except Exception as e:
@@ -384,20 +553,8 @@ class EventWorker:
         else:
             event_embeddings = [None] * len(valid_events)
 
-        # Write events with entity relationships
-        # V6: graph_upsert disabled - expansion uses Postgres joins (no AGE)
-        await self.job_service.write_events_atomic_v4(
-            artifact_uid=artifact_uid,
-            revision_id=revision_id,
-            extraction_run_id=job_id,
-            events=valid_events,
-            entity_event_map=entity_event_map,
-            enqueue_graph_upsert=False,  # V6: AGE graph removed
-            event_embeddings=event_embeddings  # V9: Cache for triplet scoring
-        )
-
-        # V8: Store explicit edges between entities
-        edges_stored = 0
+        # V8: Explicit edges between resolved entities
+        edges = []
         for rel in deduped_relationships:
             source_name = rel.get("source_entity", "").lower()
             target_name = rel.get("target_entity", "").lower()
@@ -407,36 +564,72 @@ class EventWorker:
             target_id = entity_map.get(target_name)
 
             if source_id and target_id and source_id != target_id:
-                try:
-                    await self.pg_client.execute(
-                        """
-                        INSERT INTO entity_edge (
-                            source_entity_id, target_entity_id, relationship_type,
-                            artifact_uid, revision_id, confidence, evidence_quote
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-                        ON CONFLICT (source_entity_id, target_entity_id, relationship_type, artifact_uid)
-                        DO UPDATE SET
-                            confidence = GREATEST(entity_edge.confidence, EXCLUDED.confidence),
-                            evidence_quote = COALESCE(EXCLUDED.evidence_quote, entity_edge.evidence_quote)
-                        """,
-                        source_id,
-                        target_id,
-                        rel.get("relationship_type", "RELATES_TO"),
-                        artifact_uid,
-                        revision_id,
-                        rel.get("confidence", 0.8),
-                        rel.get("evidence_quote")
-                    )
-                    edges_stored += 1
-                except Exception as e:
-                    logger.warning(f"Failed to store edge {source_name} -> {target_name}: {e}")
+                edges.append({
+                    "source_entity_id": source_id,
+                    "target_entity_id": target_id,
+                    "relationship_type": rel.get("relationship_type", "RELATES_TO"),
+                    "confidence": rel.get("confidence", 0.8),
+                    "evidence_quote": rel.get("evidence_quote")
+                })
             else:
                 if not source_id:
                     logger.debug(f"Edge source entity not found: {source_name}")
                 if not target_id:
                     logger.debug(f"Edge target entity not found: {target_name}")
 
-        logger.info(f"Stored {edges_stored} explicit edges (V8)")
+        # Write events with entity relationships
+        # V6: graph_upsert disabled - expansion uses Postgres joins (no AGE)
+        # V10: Edges are written in the same transaction
+        await self.job_service.write_events_atomic_v4(
+            artifact_uid=artifact_uid,
+            revision_id=revision_id,
+            extraction_run_id=job_id,
+            events=valid_events,
+            entity_event_map=entity_event_map,
+            enqueue_graph_upsert=False,  # V6: AGE graph removed
+            event_embeddings=event_embeddings,  # V9: Cache for triplet scoring
+            edges=edges
+        )
+
+    async def _resolve_entities(
+        self,
+        extracted_entities: List[ExtractedEntity],
+        artifact_uid: str,
+        revision_id: str,
+        doc_title: str
+    ) -> List[Optional[EntityResolutionResult]]:
+        """
+        V10: Resolve a document's entities with the set-based batch path.
+
+        Falls back to resolving one entity at a time if the batch fails, so
+        a single bad entity only loses that entity.
+
+        Returns:
+            One result per entity (None where resolution failed)
+        """
+        try:
+            return await self.entity_resolution_service.resolve_entities_batch(
+                entities=extracted_entities,
+                artifact_uid=artifact_uid,
+                revision_id=revision_id,
+                doc_title=doc_title
+            )
+        except Exception as e:
+            logger.warning(f"Batch entity resolution failed, resolving one at a time: {e}")
+
+        results: List[Optional[EntityResolutionResult]] = []
+        for extracted in extracted_entities:
+            try:
+                results.append(await self.entity_resolution_service.resolve_extracted_entity(
+                    extracted=extracted,
+                    artifact_uid=artifact_uid,
+                    revision_id=revision_id,
+                    doc_title=doc_title
+                ))
+            except Exception as e:
+                logger.warning(f"Entity resolution failed for '{extracted.surface_form}': {e}")
+                results.append(None)
+        return results
 
     async def _mark_job_failed(self, job_id: UUID, error: Exception) -> None:
         """Mark a job as failed with appropriate retry logic."""
@@ -471,7 +664,7 @@ class EventWorker:
         client = self.chroma_manager.get_client()
         from storage.collections import get_content_by_id
 
-        result = get_content_by_id(client, artifact_id)
+        result = await asyncio.to_thread(get_content_by_id, client, artifact_id)
         if result and result.get("content"):
             return result["content"]
 
@@ -495,7 +688,7 @@ class EventWorker:
         client = self.chroma_manager.get_client()
         from storage.collections import get_v5_chunks_by_content
 
-        chunks = get_v5_chunks_by_content(client, artifact_id)
+        chunks = await asyncio.to_thread(get_v5_chunks_by_content, client, artifact_id)
 
         if len(chunks) != chunk_count:
             logger.warning(f"Expected {chunk_count} chunks, found {len(chunks)}")
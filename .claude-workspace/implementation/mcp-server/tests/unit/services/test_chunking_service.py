@@ -264,6 +264,23 @@ def test_expand_neighbors_invalid_index(chunking_service, sample_chunks):
     assert result == ""
 
 
+def test_expand_neighbors_window_only(chunking_service, sample_chunks):
+    """Test expansion works from just the target and its neighbors (V10)."""
+    from dataclasses import replace
+
+    # Chunks 40-42 of a long document, fetched by ID without the rest
+    window = [replace(c, chunk_index=c.chunk_index + 40) for c in sample_chunks]
+
+    result = chunking_service.expand_chunk_neighbors(
+        artifact_id="art_test123",
+        chunk_index=41,
+        all_chunks=window
+    )
+
+    assert result.count("[CHUNK BOUNDARY]") == 2
+    assert "Third chunk" in result
+
+
 def test_expand_neighbors_empty_chunks(chunking_service):
     """Test expanding with empty chunk list."""
     result = chunking_service.expand_chunk_neighbors(
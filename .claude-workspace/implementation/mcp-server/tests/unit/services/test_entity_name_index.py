@@ -0,0 +1,126 @@
+"""Unit tests for the in-memory entity name index - V10."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from services.entity_name_index import ENTITY_NAMES_CHANNEL, EntityNameIndex
+
+ALICE, ALICE_2, BOB = uuid4(), uuid4(), uuid4()
+
+
+def _pg(entities=(), aliases=()):
+    """pg whose listen() captures the callback and returns an open connection."""
+    pg = MagicMock()
+    conn = MagicMock()
+    conn.is_closed = MagicMock(return_value=False)
+    conn.close = AsyncMock()
+    pg.conn = conn
+
+    async def listen(channel, callback):
+        pg.callback = callback
+        return conn
+
+    async def fetch_all(sql, *params):
+        return list(aliases) if "entity_alias" in sql else list(entities)
+
+    pg.listen = AsyncMock(side_effect=listen)
+    pg.fetch_all = AsyncMock(side_effect=fetch_all)
+    return pg
+
+
+def _name(entity_id, name, canonical=None, entity_type="person", old_name=None):
+    return json.dumps({"kind": "name", "entity_id": str(entity_id), "entity_type": entity_type,
+                       "name": name, "canonical_name": canonical or name.title(), "old_name": old_name})
+
+
+def _alias(entity_id, name, entity_type="person"):
+    return json.dumps({"kind": "alias", "entity_id": str(entity_id), "entity_type": entity_type, "name": name})
+
+
+def test_load_names_and_aliases():
+    """Test canonical names win, the oldest entity wins a name, shared aliases are ambiguous."""
+    pg = _pg(
+        entities=[
+            {"entity_id": ALICE, "entity_type": "person", "canonical_name": "Alice Chen", "normalized_name": "alice chen"},
+            {"entity_id": ALICE_2, "entity_type": "person", "canonical_name": "Alice Chen", "normalized_name": "alice chen"},
+            {"entity_id": BOB, "entity_type": "person", "canonical_name": "Bob", "normalized_name": "bob"},
+        ],
+        aliases=[
+            {"entity_id": ALICE, "entity_type": "person", "normalized_alias": "ac"},
+            {"entity_id": ALICE, "entity_type": "person", "normalized_alias": "al"},
+            {"entity_id": BOB, "entity_type": "person", "normalized_alias": "al"},
+            {"entity_id": BOB, "entity_type": "person", "normalized_alias": "alice chen"},
+        ]
+    )
+    index = EntityNameIndex(pg)
+
+    assert index.lookup("person", "alice chen") is None  # not loaded yet
+    asyncio.run(index.start())
+
+    assert pg.listen.call_args.args[0] == ENTITY_NAMES_CHANNEL
+    assert index.lookup("person", "alice chen") == (ALICE, "Alice Chen")
+    assert index.lookup("person", "ac") == (ALICE, "Alice Chen")
+    assert index.lookup("person", "al") is None
+    assert index.lookup("org", "alice chen") is None
+    assert index.stats()["hits"] == 2
+
+
+def test_notifications_keep_index_current():
+    """Test new names, aliases and renames from other workers are applied."""
+    pg = _pg()
+    index = EntityNameIndex(pg)
+    asyncio.run(index.start())
+
+    pg.callback(_name(ALICE, "alex"))
+    pg.callback(_alias(ALICE, "ac"))
+    assert index.lookup("person", "ac") == (ALICE, "Alex")
+
+    pg.callback(_name(ALICE, "alex chen", "Alex Chen", old_name="alex"))
+    assert index.lookup("person", "alex") is None
+    assert index.lookup("person", "alex chen") == (ALICE, "Alex Chen")
+    assert index.lookup("person", "ac") == (ALICE, "Alex Chen")
+
+    pg.callback("not json")
+    assert index.ready
+
+
+def test_notifications_during_load_are_replayed():
+    """Test a name published while the dictionary loads is not lost."""
+    pg = _pg()
+
+    async def fetch_all(sql, *params):
+        if "entity_alias" not in sql:
+            pg.callback(_name(BOB, "bob"))
+        return []
+
+    pg.fetch_all = AsyncMock(side_effect=fetch_all)
+    index = EntityNameIndex(pg)
+    asyncio.run(index.start())
+
+    assert index.lookup("person", "bob") == (BOB, "Bob")
+
+
+def test_lost_listener_reloads():
+    """Test a closed listening connection stops lookups until the reload succeeds."""
+    pg = _pg(entities=[
+        {"entity_id": BOB, "entity_type": "person", "canonical_name": "Bob", "normalized_name": "bob"}
+    ])
+    index = EntityNameIndex(pg)
+    asyncio.run(index.start())
+    pg.conn.is_closed.return_value = True
+    pg.listen.side_effect = OSError("connection refused")
+
+    assert asyncio.run(index.ensure_current()) is False
+    assert index.lookup("person", "bob") is None
+
+    async def listen(channel, callback):
+        pg.conn.is_closed.return_value = False
+        return pg.conn
+
+    pg.listen.side_effect = listen
+    index._listen_conn = pg.conn
+    pg.conn.is_closed.return_value = True
+    assert asyncio.run(index.ensure_current()) is True
+    assert index.lookup("person", "bob") == (BOB, "Bob")
@@ -0,0 +1,292 @@
+"""Unit tests for batch entity resolution - V10."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from services.entity_resolution_service import (
+    ContextClues,
+    EntityResolutionService,
+    ExtractedEntity,
+    MergeDecision,
+)
+
+
+def _extracted(name, entity_type="person", aliases=None, role=None):
+    return ExtractedEntity(
+        surface_form=name,
+        canonical_suggestion=name,
+        entity_type=entity_type,
+        context_clues=ContextClues(role=role),
+        aliases_in_doc=aliases or [],
+        start_char=0,
+        end_char=len(name)
+    )
+
+
+def _entity_row(name, entity_type="person", distance=None, idx=None):
+    row = {
+        "entity_id": uuid4(), "entity_type": entity_type, "canonical_name": name,
+        "normalized_name": name.lower(), "role": None, "organization": None, "email": None,
+        "first_seen_artifact_uid": "uid_old", "first_seen_revision_id": "rev_old", "needs_review": False,
+    }
+    if distance is not None:
+        row.update(distance=distance, idx=idx)
+    return row
+
+
+def _service(exact_rows=(), candidate_rows=(), embeddings=None, decision="different"):
+    """Service over a mocked pg; embeddings maps text -> vector (default orthogonal vectors)."""
+    pg = MagicMock()
+
+    async def fetch_all(sql, *params):
+        if "DISTINCT ON" in sql:
+            return [{"key_name": row["normalized_name"], **row} for row in exact_rows]
+        return list(candidate_rows)
+
+    pg.fetch_all = AsyncMock(side_effect=fetch_all)
+    pg.fetch_one = AsyncMock(return_value={"canonical_name": "x"})
+    pg.execute = AsyncMock()
+    pg.transaction = AsyncMock()
+
+    embedding_service = MagicMock()
+    vectors = embeddings or {}
+
+    def embed_batch(texts):
+        return [
+            vectors.get(text.split(",")[0], [float(k == n) for k in range(len(texts))])
+            for n, text in enumerate(texts)
+        ]
+
+    embedding_service.generate_embeddings_batch = MagicMock(side_effect=embed_batch)
+
+    service = EntityResolutionService(pg, embedding_service, openai_client=MagicMock())
+    service.confirm_merge_with_llm = AsyncMock(
+        return_value=MergeDecision(decision=decision, canonical_name="Alice Chen", reason="test")
+    )
+    return service, pg, embedding_service
+
+
+def test_batch_uses_set_based_round_trips():
+    """Test one exact query, one embedding call, one candidate query, multi-row writes."""
+    existing = _entity_row("Bob")
+    service, pg, embedding_service = _service(exact_rows=[existing])
+
+    results = asyncio.run(service.resolve_entities_batch(
+        [_extracted("Bob"), _extracted("Carol", aliases=["C."]), _extracted("Dave", entity_type="org")],
+        "uid_1", "rev_1"
+    ))
+
+    assert pg.fetch_all.await_count == 2
+    embedding_service.generate_embeddings_batch.assert_called_once()
+    # Context and name embeddings for the two new entities in the same call
+    assert len(embedding_service.generate_embeddings_batch.call_args.args[0]) == 4
+
+    assert results[0].entity_id == existing["entity_id"] and not results[0].is_new
+    assert results[1].is_new and results[2].is_new
+
+    entity_sql, *entity_params = pg.execute.call_args.args
+    assert "unnest" in entity_sql
+    assert entity_params[2] == ["Carol", "Dave"]
+
+    (alias_sql, alias_params), (mention_sql, mention_params) = pg.transaction.call_args.args[0]
+    assert "entity_alias" in alias_sql and alias_params[1] == ["C."]
+    assert "entity_mention" in mention_sql
+    assert mention_params[1] == [r.entity_id for r in results]
+
+
+def test_batch_merges_with_db_candidate():
+    """Test a confirmed candidate is merged and the surface form becomes an alias."""
+    candidate = _entity_row("Alice C.", distance=0.05, idx=1)
+    service, pg, _ = _service(candidate_rows=[candidate], decision="same")
+
+    [result] = asyncio.run(service.resolve_entities_batch([_extracted("Alice Chen")], "uid_1", "rev_1"))
+
+    assert result.entity_id == candidate["entity_id"]
+    assert result.merged_from == candidate["entity_id"]
+    service.confirm_merge_with_llm.assert_awaited_once()
+    pg.execute.assert_awaited()  # merge_entity renames to the longer name
+    assert "UPDATE entity" in pg.execute.call_args.args[0]
+
+
+def test_batch_earlier_new_entity_is_candidate_for_later_one():
+    """Test an entity created earlier in the batch is confirmed against, as in sequential resolution."""
+    same = [1.0, 0.0, 0.0]
+    service, _, _ = _service(
+        embeddings={"Alice Chen": same, "A. Chen": [0.99, 0.01, 0.0]},
+        decision="same"
+    )
+
+    first, second = asyncio.run(service.resolve_entities_batch(
+        [_extracted("Alice Chen"), _extracted("A. Chen")], "uid_1", "rev_1"
+    ))
+
+    assert first.is_new
+    assert second.entity_id == first.entity_id
+    kwargs = service.confirm_merge_with_llm.call_args.kwargs
+    assert kwargs["entity_b_name"] == "Alice Chen"
+
+
+def test_batch_uncertain_creates_flagged_entity():
+    """Test an uncertain decision creates a needs_review entity and a POSSIBLY_SAME pair."""
+    candidate = _entity_row("Alice", distance=0.1, idx=1)
+    service, pg, _ = _service(candidate_rows=[candidate], decision="uncertain")
+
+    [result] = asyncio.run(service.resolve_entities_batch([_extracted("Alice Chen")], "uid_1", "rev_1"))
+
+    assert result.is_new
+    assert result.uncertain_match == candidate["entity_id"]
+    assert pg.execute.call_args.args[11] == [True]
+    [(new_id, existing_id, _, _)] = service.get_uncertain_pairs()
+    assert (new_id, existing_id) == (result.entity_id, candidate["entity_id"])
+
+
+def test_batch_same_name_follows_first():
+    """Test repeated (type, normalized name) entities resolve to the first one."""
+    service, pg, embedding_service = _service()
+
+    first, second = asyncio.run(service.resolve_entities_batch(
+        [_extracted("Alice Chen"), _extracted("alice  chen")], "uid_1", "rev_1"
+    ))
+
+    assert second.entity_id == first.entity_id and not second.is_new
+    assert len(embedding_service.generate_embeddings_batch.call_args.args[0]) == 2
+    assert len(pg.transaction.call_args.args[0][-1][1][0]) == 2  # both mentions recorded
+
+
+def test_cached_merge_decision_skips_llm():
+    """Test a cached decision for the same candidate, name and context is reused."""
+    candidate = _entity_row("Alex Chen", distance=0.05, idx=1)
+    service, _, _ = _service(candidate_rows=[candidate])
+    service.decision_cache = MagicMock()
+    service.decision_cache.get = AsyncMock(return_value={
+        "decision": "same", "canonical_name": "Alex Chen", "reason": "cached", "confidence": 0.9
+    })
+    service.decision_cache.put = AsyncMock()
+    service.decision_cache.invalidate = AsyncMock()
+
+    results = asyncio.run(service.resolve_entities_batch([_extracted("Alex")], "uid_1", "rev_1"))
+
+    assert results[0].entity_id == candidate["entity_id"]
+    service.confirm_merge_with_llm.assert_not_called()
+    entity_id, normalized_name, _ = service.decision_cache.get.call_args.args
+    assert (entity_id, normalized_name) == (candidate["entity_id"], "alex")
+
+
+def test_llm_merge_decision_is_cached():
+    """Test a fresh LLM decision is offered to the cache."""
+    candidate = _entity_row("Alex Chen", distance=0.05, idx=1)
+    service, _, _ = _service(candidate_rows=[candidate], decision="same")
+    service.confirm_merge_with_llm.return_value.confidence = 0.95
+    service.decision_cache = MagicMock()
+    service.decision_cache.get = AsyncMock(return_value=None)
+    service.decision_cache.put = AsyncMock()
+    service.decision_cache.invalidate = AsyncMock()
+
+    asyncio.run(service.resolve_entities_batch([_extracted("Alex")], "uid_1", "rev_1"))
+
+    service.confirm_merge_with_llm.assert_awaited_once()
+    kwargs = service.decision_cache.put.call_args.kwargs
+    assert (kwargs["decision"], kwargs["confidence"]) == ("same", 0.95)
+
+
+def test_rename_by_merge_invalidates_decisions():
+    """Test decisions made against an entity are dropped when a merge renames it."""
+    service, pg, _ = _service()
+    pg.fetch_one = AsyncMock(return_value={"canonical_name": "Alex"})
+    service.generate_name_embedding = AsyncMock(return_value=None)
+    service.decision_cache = MagicMock()
+    service.decision_cache.invalidate = AsyncMock()
+    entity_id = uuid4()
+
+    asyncio.run(service.merge_entity("Alex", entity_id, "Alex"))
+    service.decision_cache.invalidate.assert_not_called()
+
+    asyncio.run(service.merge_entity("Alex Chen", entity_id, "Alex Chen"))
+    service.decision_cache.invalidate.assert_awaited_once_with(entity_id)
+
+
+def test_name_index_hits_skip_exact_query():
+    """Test names and aliases known to the name index resolve without an exact-match query."""
+    service, pg, embedding_service = _service()
+    alice = uuid4()
+    service.name_index = MagicMock()
+    service.name_index.ensure_current = AsyncMock(return_value=True)
+    service.name_index.lookup = MagicMock(return_value=(alice, "Alice Chen"))
+
+    results = asyncio.run(service.resolve_entities_batch([_extracted("Alice"), _extracted("A. Chen")], "uid_1", "rev_1"))
+
+    assert [r.entity_id for r in results] == [alice, alice]
+    assert results[0].canonical_name == "Alice Chen"
+    pg.fetch_all.assert_not_called()
+    embedding_service.generate_embeddings_batch.assert_not_called()
+
+
+def test_name_index_misses_fall_back_to_postgres():
+    """Test only the names the index does not know are queried."""
+    existing = _entity_row("Bob")
+    service, pg, _ = _service(exact_rows=[existing])
+    service.name_index = MagicMock()
+    service.name_index.ensure_current = AsyncMock(return_value=True)
+    service.name_index.lookup = MagicMock(side_effect=lambda t, n: (uuid4(), "Carol") if n == "carol" else None)
+
+    results = asyncio.run(service.resolve_entities_batch([_extracted("Bob"), _extracted("Carol")], "uid_1", "rev_1"))
+
+    assert results[0].entity_id == existing["entity_id"]
+    exact_sql, types, names = pg.fetch_all.call_args_list[0].args
+    assert "DISTINCT ON" in exact_sql and names == ["bob"]
+
+
+def test_name_embedding_backfill_skips_bad_rows():
+    """Test blank names and failed embeddings are skipped per row and the walk moves past them."""
+    service, pg, embedding_service = _service()
+    rows = [
+        {"entity_id": uuid4(), "canonical_name": " ", "created_at": 1},
+        {"entity_id": uuid4(), "canonical_name": "Alice", "created_at": 2},
+        {"entity_id": uuid4(), "canonical_name": "Bob", "created_at": 3},
+    ]
+    pg.fetch_all = AsyncMock(side_effect=[rows, []])
+    conn = MagicMock()
+    conn.executemany = AsyncMock()
+
+    class _Acquire:
+        async def __aenter__(self):
+            return conn
+
+        async def __aexit__(self, *exc):
+            return False
+
+    pg.acquire = MagicMock(return_value=_Acquire())
+    # Batch returns too few vectors, then Bob fails on his own
+    embedding_service.generate_embeddings_batch = MagicMock(return_value=[[1.0, 0.0]])
+
+    def embed(text):
+        if text == "Bob":
+            raise ValueError("boom")
+        return [0.0, 1.0]
+
+    embedding_service.generate_embedding = MagicMock(side_effect=embed)
+
+    updated = asyncio.run(service.backfill_name_embeddings(batch_size=3))
+
+    assert updated == 1
+    embedding_service.generate_embeddings_batch.assert_called_once_with(["Alice", "Bob"])
+    assert conn.executemany.await_args.args[1] == [("[0.0,1.0]", rows[1]["entity_id"])]
+    # The next page starts after the last row seen, not at the skipped ones
+    assert pg.fetch_all.await_args_list[1].args[2:] == (3, rows[2]["entity_id"])
+
+
+def test_exact_match_resolves_alias_without_name_index():
+    """Test the Postgres exact match finds aliases too, keyed by the queried name."""
+    existing = _entity_row("Alice Chen")
+    service, pg, embedding_service = _service()
+    pg.fetch_all = AsyncMock(return_value=[{"key_name": "a. chen", **existing}])
+    assert service.name_index is None
+
+    results = asyncio.run(service.resolve_entities_batch([_extracted("A. Chen")], "uid_1", "rev_1"))
+
+    assert results[0].entity_id == existing["entity_id"]
+    assert results[0].canonical_name == "Alice Chen"
+    exact_sql = pg.fetch_all.call_args.args[0]
+    assert "entity_alias" in exact_sql
+    embedding_service.generate_embeddings_batch.assert_not_called()
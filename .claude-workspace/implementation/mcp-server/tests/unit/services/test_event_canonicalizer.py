@@ -0,0 +1,116 @@
+"""Unit tests for local event canonicalization - V10."""
+
+from services.event_canonicalizer import (
+    ALIAS,
+    DIFFERENT,
+    SAME,
+    compare_names,
+    merge_events,
+    plan_canonicalization,
+)
+
+
+def _event(narrative, chunk, category="Decision", subject="pricing", actors=("Alice Chen",),
+           confidence=0.8, event_time=None, start=0):
+    return {
+        "category": category,
+        "narrative": narrative,
+        "event_time": event_time,
+        "subject": {"type": "project", "ref": subject},
+        "actors": [{"ref": actor, "role": "owner"} for actor in actors],
+        "confidence": confidence,
+        "evidence": [{"chunk_id": f"chunk_{chunk}", "start_char": start, "end_char": start + 10, "quote": "q"}],
+    }
+
+
+def test_compare_names():
+    """Test names are equal, aliases (token subset) or different."""
+    assert compare_names("alice chen", "alice chen") == SAME
+    assert compare_names("alice", "alice chen") == ALIAS
+    assert compare_names("", "alice chen") == ALIAS
+    assert compare_names("alice chen", "bob smith") == DIFFERENT
+
+
+def test_merge_events_like_prompt_b():
+    """Test the highest confidence wins, evidence is unioned and the most specific time kept."""
+    a = _event("Team chose freemium pricing", 0, confidence=0.7, event_time="2024-03-15")
+    b = _event("Team chose freemium pricing.", 1, confidence=0.9, event_time="2024-03-15T14:30:00Z", start=40)
+    b["actors"].append({"ref": "Bob", "role": "contributor"})
+
+    merged = merge_events([a, b])
+
+    assert merged["narrative"] == "Team chose freemium pricing."
+    assert merged["confidence"] == 0.9
+    assert merged["event_time"] == "2024-03-15T14:30:00Z"
+    assert [e["chunk_id"] for e in merged["evidence"]] == ["chunk_0", "chunk_1"]
+    assert [a["ref"] for a in merged["actors"]] == ["Alice Chen", "Bob"]
+    # Inputs are untouched
+    assert len(a["evidence"]) == 1
+
+
+def test_plan_merges_clear_duplicates_without_llm():
+    """Test the same event seen in overlapping chunks is merged locally."""
+    chunk_events = [
+        [_event("Team decided to adopt freemium pricing for launch", 0),
+         _event("Bob deployed the billing service", 0, category="Execution", subject="billing", actors=("Bob",))],
+        [_event("Team decided to adopt freemium pricing for launch.", 1, start=200)],
+    ]
+
+    plan = plan_canonicalization(chunk_events)
+
+    assert plan.ambiguous == []
+    assert plan.input_events == 3
+    assert plan.merged == 1
+    assert len(plan.events) == 2
+    assert len(plan.events[0]["evidence"]) == 2
+
+
+def test_plan_sends_only_ambiguous_clusters():
+    """Test paraphrases and alias actors across chunks are left to Prompt B."""
+    chunk_events = [
+        [_event("Alice decided the launch uses freemium pricing", 0),
+         _event("Security audit found an XSS issue", 0, category="Risk", subject="auth")],
+        [_event("Freemium pricing was chosen for the launch", 1, actors=("Alice",)),
+         _event("Security audit found an XSS issue in checkout", 1, category="Risk", subject="checkout")],
+    ]
+
+    plan = plan_canonicalization(chunk_events)
+
+    # Grouped by cluster
+    assert [e["narrative"] for e in plan.ambiguous] == [
+        "Alice decided the launch uses freemium pricing",
+        "Freemium pricing was chosen for the launch",
+        "Security audit found an XSS issue",
+        "Security audit found an XSS issue in checkout",
+    ]
+    assert plan.ambiguous_chunks == 2
+    assert plan.events == []
+
+
+def test_plan_never_defers_single_chunk_documents():
+    """Test overlapping events within one chunk are never sent to the LLM."""
+    chunk_events = [[
+        _event("Alice decided the launch uses freemium pricing", 0),
+        _event("Freemium pricing was chosen for the launch", 0, actors=("Alice",)),
+    ]]
+
+    plan = plan_canonicalization(chunk_events)
+
+    assert plan.ambiguous == []
+    assert len(plan.events) == 2
+
+
+def test_plan_keeps_different_categories_and_dates_apart():
+    """Test identical narratives in other categories or on other days are not merged."""
+    chunk_events = [
+        [_event("Weekly pricing sync with Alice", 0, category="Meeting", event_time="2024-03-01")],
+        [_event("Weekly pricing sync with Alice", 1, category="Meeting", event_time="2024-03-08"),
+         _event("Weekly pricing sync with Alice", 1, category="Collaboration")],
+    ]
+
+    plan = plan_canonicalization(chunk_events)
+
+    assert plan.merged == 0
+    # Same words on different dates is for the LLM to judge
+    assert len(plan.ambiguous) == 2
+    assert [e["category"] for e in plan.events] == ["Collaboration"]
@@ -0,0 +1,218 @@
+"""Unit tests for parallel, cached chunk extraction - V10."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.event_extraction_service import EventExtractionService, PROMPT_A_VERSION
+from services.extraction_cache import content_hash
+
+
+def _response(payload):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(payload)))])
+
+
+def _service(delays=None, fail_on=None):
+    """Service whose async client answers Prompt A with the chunk index, slowest chunk first."""
+    service = EventExtractionService(api_key="test-key")
+    stats = {"active": 0, "peak": 0}
+
+    async def create(**kwargs):
+        prompt = kwargs["messages"][1]["content"]
+        chunk_index = int(prompt.split("Chunk Index: ")[1].split()[0])
+        stats["active"] += 1
+        stats["peak"] = max(stats["peak"], stats["active"])
+        await asyncio.sleep((delays or {}).get(chunk_index, 0.01))
+        stats["active"] -= 1
+        if chunk_index == fail_on:
+            raise RuntimeError("LLM unavailable")
+        return _response({
+            "events": [{"narrative": f"event {chunk_index}", "evidence": [{"start_char": 0, "end_char": 5}]}],
+            "entities_mentioned": [{"surface_form": f"E{chunk_index}", "start_char": 1, "end_char": 2}],
+            "relationships": [],
+        })
+
+    service.async_client = MagicMock()
+    service.async_client.chat.completions.create = AsyncMock(side_effect=create)
+    return service, stats
+
+
+def _chunks(n):
+    return [(f"text {i}", i, f"chunk_{i}", i * 100) for i in range(n)]
+
+
+def test_extract_chunks_keeps_chunk_order():
+    """Test results come back in chunk order even when later chunks finish first."""
+    service, _ = _service(delays={0: 0.08, 1: 0.04, 2: 0.0})
+
+    results = asyncio.run(service.extract_chunks_v4(_chunks(3), max_concurrency=3))
+
+    assert [events[0]["narrative"] for events, _, _ in results] == ["event 0", "event 1", "event 2"]
+    # Offsets are rebased onto the full artifact per chunk
+    events, entities, _ = results[2]
+    assert events[0]["evidence"][0] == {"start_char": 200, "end_char": 205, "chunk_id": "chunk_2"}
+    assert entities[0]["start_char"] == 201
+    assert entities[0]["chunk_id"] == "chunk_2"
+
+
+def test_extract_chunks_respects_concurrency_cap():
+    """Test no more than max_concurrency chunks are in flight."""
+    service, stats = _service()
+
+    results = asyncio.run(service.extract_chunks_v4(_chunks(10), max_concurrency=3))
+
+    assert len(results) == 10
+    assert stats["peak"] == 3
+
+
+def test_extract_chunks_waits_on_rate_limiter():
+    """Test every completion goes through the shared rate limiter."""
+    service, _ = _service()
+    service.rate_limiter = MagicMock()
+    service.rate_limiter.acquire = AsyncMock()
+
+    asyncio.run(service.extract_chunks_v4(_chunks(4), max_concurrency=2))
+
+    assert service.rate_limiter.acquire.await_count == 4
+
+
+def test_extract_chunks_raises_first_failure():
+    """Test a failing chunk fails the whole extraction."""
+    service, _ = _service(fail_on=1)
+
+    with pytest.raises(RuntimeError, match="LLM unavailable"):
+        asyncio.run(service.extract_chunks_v4(_chunks(4), max_concurrency=4))
+
+
+def test_canonicalize_events_async_skips_empty():
+    """Test no completion is made when no chunk produced events."""
+    service, _ = _service()
+
+    assert asyncio.run(service.canonicalize_events_async([[], []])) == []
+    service.async_client.chat.completions.create.assert_not_called()
+
+
+def test_extract_chunks_serves_cached_chunks():
+    """Test cached chunks skip the LLM and are rebased onto their own chunk."""
+    service, _ = _service()
+    cached_result = {
+        "events": [{"narrative": "cached", "evidence": [{"start_char": 1, "end_char": 4}]}],
+        "entities_mentioned": [],
+        "relationships": [],
+    }
+    service.cache = MagicMock()
+    service.cache.get_many = AsyncMock(return_value={content_hash("text 1"): cached_result})
+    service.cache.put_many = AsyncMock()
+
+    results = asyncio.run(service.extract_chunks_v4(_chunks(3), max_concurrency=3))
+
+    assert service.async_client.chat.completions.create.await_count == 2
+    assert results[1][0][0]["narrative"] == "cached"
+    assert results[1][0][0]["evidence"][0] == {"start_char": 101, "end_char": 104, "chunk_id": "chunk_1"}
+    # The cached copy itself keeps chunk-relative offsets
+    assert cached_result["events"][0]["evidence"][0]["start_char"] == 1
+
+    stored, model, version = service.cache.put_many.call_args.args
+    assert set(stored) == {content_hash("text 0"), content_hash("text 2")}
+    assert stored[content_hash("text 0")]["events"][0]["evidence"][0]["start_char"] == 0
+    assert version == PROMPT_A_VERSION
+    service.cache.record.assert_called_once_with(hits=1, misses=2)
+
+
+def test_extract_chunks_identical_chunks_share_a_completion():
+    """Test repeated chunk text is extracted once and rebased per occurrence."""
+    service, _ = _service()
+    chunks = [("same text", 0, "chunk_0", 0), ("same text", 1, "chunk_1", 500)]
+
+    results = asyncio.run(service.extract_chunks_v4(chunks, max_concurrency=2))
+
+    assert service.async_client.chat.completions.create.await_count == 1
+    assert results[0][0][0]["evidence"][0]["start_char"] == 0
+    assert results[1][0][0]["evidence"][0]["start_char"] == 500
+    assert results[1][0][0]["evidence"][0]["chunk_id"] == "chunk_1"
+
+
+def _canonicalizing_service():
+    """Service whose Prompt B answers with the first event it was sent."""
+    service = EventExtractionService(api_key="test-key")
+
+    async def create(**kwargs):
+        events = json.loads(kwargs["messages"][1]["content"].split("artifact:\n\n")[1].split("\n\nDeduplicate")[0])
+        return _response({"events": events[:1]})
+
+    service.async_client = MagicMock()
+    service.async_client.chat.completions.create = AsyncMock(side_effect=create)
+    return service
+
+
+def _event(narrative, chunk, actors=("Alice Chen",)):
+    return {
+        "category": "Decision",
+        "narrative": narrative,
+        "subject": {"type": "project", "ref": "pricing"},
+        "actors": [{"ref": actor, "role": "owner"} for actor in actors],
+        "confidence": 0.8,
+        "evidence": [{"chunk_id": f"chunk_{chunk}", "start_char": chunk * 100, "end_char": chunk * 100 + 10}],
+    }
+
+
+def test_canonicalize_events_async_skips_prompt_b_for_clear_duplicates():
+    """Test no completion is made when every overlap is a clear duplicate."""
+    service = _canonicalizing_service()
+    chunk_events = [[_event("Team chose freemium pricing", 0)], [_event("Team chose freemium pricing", 1)]]
+
+    events = asyncio.run(service.canonicalize_events_async(chunk_events))
+
+    assert len(events) == 1
+    assert len(events[0]["evidence"]) == 2
+    service.async_client.chat.completions.create.assert_not_called()
+    assert (service.prompt_b_calls, service.prompt_b_calls_saved) == (0, 1)
+
+
+def test_canonicalize_events_async_sends_only_ambiguous_events():
+    """Test Prompt B only sees the ambiguous cluster; settled events pass through."""
+    service = _canonicalizing_service()
+    distinct = dict(_event("Bob deployed billing", 0, actors=("Bob",)), category="Execution")
+    chunk_events = [
+        [_event("Alice decided the launch uses freemium pricing", 0), distinct],
+        [_event("Freemium pricing was chosen for the launch", 1, actors=("Alice",))],
+    ]
+
+    events = asyncio.run(service.canonicalize_events_async(chunk_events))
+
+    prompt = service.async_client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+    assert "from 2 chunks" in prompt
+    assert "Bob deployed billing" not in prompt
+    assert [e["narrative"] for e in events] == [
+        "Bob deployed billing", "Alice decided the launch uses freemium pricing"
+    ]
+    assert service.prompt_b_calls == 1
+
+
+def test_canonicalize_events_async_without_local_pass_sends_everything():
+    """Test disabling local canonicalization restores the single full Prompt B call."""
+    service = _canonicalizing_service()
+    service.local_canonicalization = False
+    chunk_events = [[_event("Team chose freemium pricing", 0)], [_event("Team chose freemium pricing", 1)]]
+
+    events = asyncio.run(service.canonicalize_events_async(chunk_events))
+
+    assert len(events) == 1
+    assert service.async_client.chat.completions.create.await_count == 1
+
+
+def test_extract_chunks_counts_distinct_cached_texts():
+    """Test cache stats count a repeated cached text once, like the table's hit_count."""
+    service, _ = _service()
+    cached_result = {"events": [], "entities_mentioned": [], "relationships": []}
+    service.cache = MagicMock()
+    service.cache.get_many = AsyncMock(return_value={content_hash("same text"): cached_result})
+    service.cache.put_many = AsyncMock()
+    chunks = [("same text", 0, "chunk_0", 0), ("same text", 1, "chunk_1", 500)]
+
+    asyncio.run(service.extract_chunks_v4(chunks, max_concurrency=2))
+
+    service.cache.record.assert_called_once_with(hits=1, misses=0)
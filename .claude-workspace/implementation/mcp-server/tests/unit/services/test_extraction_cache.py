@@ -0,0 +1,82 @@
+"""Unit tests for the extraction result cache - V10."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from services.extraction_cache import (
+    ExtractionCache,
+    content_hash,
+    extraction_cache_stats,
+    prompt_version,
+)
+
+
+def test_keys_are_stable_hashes():
+    """Test content hashes match chunk metadata and prompt versions track template text."""
+    assert content_hash("hello") == "2cf24dba5fb0a30e26e83b2ac5b9e29e1b161e5c1fa7425e73043362938b9824"
+    assert prompt_version("system", "user") == prompt_version("system", "user")
+    assert prompt_version("system", "user") != prompt_version("system", "user v2")
+
+
+def test_get_many_counts_hits_in_lookup():
+    """Test lookups bump hit_count in the same statement and parse results."""
+    pg = MagicMock()
+    pg.fetch_all = AsyncMock(return_value=[{"content_hash": "h1", "result": json.dumps({"events": []})}])
+
+    found = asyncio.run(ExtractionCache(pg).get_many(["h1", "h2", "h1"], "gpt-4o-mini", "v1"))
+
+    sql, hashes, model, version = pg.fetch_all.call_args.args
+    assert sql.strip().startswith("UPDATE extraction_cache") and "RETURNING" in sql
+    assert sorted(hashes) == ["h1", "h2"]
+    assert (model, version) == ("gpt-4o-mini", "v1")
+    assert found == {"h1": {"events": []}}
+
+
+def test_cache_errors_are_misses():
+    """Test a failing cache never fails extraction."""
+    pg = MagicMock()
+    pg.fetch_all = AsyncMock(side_effect=RuntimeError("relation does not exist"))
+    pg.execute = AsyncMock(side_effect=RuntimeError("relation does not exist"))
+    cache = ExtractionCache(pg)
+
+    assert asyncio.run(cache.get_many(["h1"], "m", "v1")) == {}
+    asyncio.run(cache.put_many({"h1": {"events": []}}, "m", "v1"))
+
+
+def test_put_many_is_one_insert():
+    """Test misses are stored with one multi-row insert that keeps the first writer."""
+    pg = MagicMock()
+    pg.execute = AsyncMock()
+
+    asyncio.run(ExtractionCache(pg).put_many({"h1": {"events": [1]}, "h2": {"events": []}}, "m", "v1"))
+
+    sql, hashes, results, model, version = pg.execute.call_args.args
+    assert "unnest" in sql and "DO NOTHING" in sql
+    assert hashes == ["h1", "h2"]
+    assert json.loads(results[0]) == {"events": [1]}
+
+
+def test_hit_rate_stats():
+    """Test in-process and table-wide hit rates."""
+    cache = ExtractionCache(MagicMock())
+    assert cache.stats()["hit_rate"] is None
+    cache.record(hits=3, misses=1)
+    assert cache.stats() == {"hits": 3, "misses": 1, "hit_rate": 0.75}
+
+    pg = MagicMock()
+    pg.fetch_one = AsyncMock(return_value={"entries": 10, "hits": 30})
+    assert asyncio.run(extraction_cache_stats(pg)) == {"entries": 10, "hits": 30, "hit_rate": 0.75}
+
+
+def test_prune_idle_is_age_based():
+    """Test pruning removes long-unused entries of any prompt version, not other versions."""
+    pg = MagicMock()
+    pg.fetch_val = AsyncMock(return_value=4)
+
+    assert asyncio.run(ExtractionCache(pg).prune_idle(90)) == 4
+
+    sql, days = pg.fetch_val.call_args.args
+    assert "COALESCE(last_hit_at, created_at)" in sql
+    assert "prompt_version" not in sql
+    assert days == 90
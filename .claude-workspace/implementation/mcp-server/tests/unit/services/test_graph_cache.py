@@ -0,0 +1,174 @@
+"""Unit tests for GraphCache - V10."""
+
+import pytest
+from uuid import uuid4
+
+from services.graph_cache import CSRAdjacency, GraphCache
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+@pytest.fixture
+def ids():
+    """Named entity and event UUIDs."""
+    return {name: uuid4() for name in [
+        "alice", "bob", "carol", "acme",
+        "e_seed", "e_alice", "e_bob_subject", "e_carol", "e_far",
+    ]}
+
+
+def _event_row(ids, entity, event, role, category="Decision", artifact="uid_a"):
+    return {
+        "entity_id": ids[entity],
+        "event_id": ids[event],
+        "role": role,
+        "artifact_uid": artifact,
+        "category": category,
+    }
+
+
+@pytest.fixture
+def graph(ids):
+    """
+    Graph:
+        e_seed        : alice (actor), bob (subject)
+        e_alice       : alice (actor)
+        e_bob_subject : bob (subject)
+        e_carol       : carol (actor)      carol -MANAGES- alice
+        e_far         : acme (subject)     e_carol also has acme (subject)
+    """
+    cache = GraphCache()
+    cache.load(
+        event_rows=[
+            _event_row(ids, "alice", "e_seed", "actor"),
+            _event_row(ids, "bob", "e_seed", "subject"),
+            _event_row(ids, "alice", "e_alice", "actor"),
+            _event_row(ids, "bob", "e_bob_subject", "subject", category="Commitment"),
+            _event_row(ids, "carol", "e_carol", "actor", artifact="uid_b"),
+            _event_row(ids, "acme", "e_carol", "subject", artifact="uid_b"),
+            _event_row(ids, "acme", "e_far", "subject"),
+        ],
+        edge_rows=[{
+            "source_entity_id": ids["carol"],
+            "target_entity_id": ids["alice"],
+            "relationship_type": "MANAGES",
+        }],
+    )
+    return cache
+
+
+# ============================================================================
+# CSR Tests
+# ============================================================================
+
+def test_csr_neighbors():
+    """Test CSR adjacency groups edges by source node."""
+    csr = CSRAdjacency(3, [(2, 0, 7), (0, 1, 1), (0, 2, 2)])
+
+    assert sorted(csr.neighbors(0)) == [(1, 1), (2, 2)]
+    assert csr.neighbors(1) == []
+    assert csr.neighbors(2) == [(0, 7)]
+    assert csr.neighbors(5) == []
+    assert csr.num_edges == 3
+
+
+# ============================================================================
+# Expansion Tests
+# ============================================================================
+
+def test_expand_single_hop_ranks_actor_subject_edge(graph, ids):
+    """Test hop 1 matches SQL expansion ranking."""
+    hits = graph.expand([ids["e_seed"]], depth=1, budget=10)
+
+    assert [(h.event_id, h.connection_type) for h in hits] == [
+        (ids["e_alice"], "same_actor"),
+        (ids["e_bob_subject"], "same_subject"),
+        (ids["e_carol"], "edge:MANAGES"),
+    ]
+    assert all(h.hop == 1 for h in hits)
+
+
+def test_expand_multi_hop(graph, ids):
+    """Test depth 2 reaches events two entities away."""
+    hits = graph.expand([ids["e_seed"]], depth=2, budget=10)
+
+    far = [h for h in hits if h.event_id == ids["e_far"]]
+    assert len(far) == 1
+    assert far[0].hop == 2
+    assert far[0].entity_id == ids["acme"]
+
+
+def test_expand_respects_budgets(graph, ids):
+    """Test total and per-hop budgets."""
+    assert len(graph.expand([ids["e_seed"]], depth=2, budget=2)) == 2
+
+    hits = graph.expand([ids["e_seed"]], depth=2, budget=10, hop_budget=1)
+    assert [h.hop for h in hits] == [1]  # e_alice only; its entities are exhausted
+
+
+def test_expand_filters(graph, ids):
+    """Test category, artifact and edge type filters."""
+    hits = graph.expand([ids["e_seed"]], category_filter=["Commitment"])
+    assert [h.event_id for h in hits] == [ids["e_bob_subject"]]
+
+    hits = graph.expand([ids["e_seed"]], candidate_artifact_uids=["uid_b"])
+    assert [h.event_id for h in hits] == [ids["e_carol"]]
+
+    hits = graph.expand([ids["e_seed"]], edge_types=["DECIDED"])
+    assert ids["e_carol"] not in [h.event_id for h in hits]
+
+
+def test_load_with_more_artifacts_than_label_range():
+    """Test relationship labels stay in range when there are more than 65,536 artifacts."""
+    carol, alice = uuid4(), uuid4()
+    events = [uuid4() for _ in range(70000)]
+    cache = GraphCache()
+    cache.load(
+        event_rows=[
+            {"entity_id": carol if i == 0 else alice, "event_id": event, "role": "actor",
+             "artifact_uid": f"uid_{i}", "category": "Decision"}
+            for i, event in enumerate(events)
+        ],
+        edge_rows=[{"source_entity_id": carol, "target_entity_id": alice, "relationship_type": "MANAGES"}],
+    )
+
+    assert cache.is_ready
+    hits = cache.expand([events[0]], budget=1)
+    assert hits[0].connection_type == "edge:MANAGES"
+
+
+def test_expand_unknown_seed(graph):
+    """Test seeds not in the cache produce no hits."""
+    assert graph.expand([uuid4()]) == []
+
+
+def test_apply_adds_delta_edges_once(graph, ids):
+    """Test incremental rows are visible and duplicates are skipped."""
+    new_event = uuid4()
+    rows = [{
+        "entity_id": ids["alice"],
+        "event_id": new_event,
+        "role": "actor",
+        "artifact_uid": "uid_c",
+        "category": "Decision",
+    }]
+
+    assert graph.apply(rows, []) == 1
+    assert graph.apply(rows, []) == 0
+    assert graph.apply([_event_row(ids, "alice", "e_alice", "actor")], []) == 0
+
+    hits = graph.expand([ids["e_seed"]], budget=10)
+    assert new_event in [h.event_id for h in hits]
+
+
+def test_stats_reports_footprint(graph):
+    """Test stats include edge counts and bytes per million edges."""
+    stats = graph.stats()
+
+    assert stats["entities"] == 4
+    assert stats["events"] == 5
+    assert stats["edges"] == 8
+    assert stats["bytes"] > 0
+    assert stats["bytes_per_million_edges"] > 0
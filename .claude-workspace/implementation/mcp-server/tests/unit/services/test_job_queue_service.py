@@ -0,0 +1,233 @@
+"""Unit tests for JobQueueService - V10 job notifications, batch claims and bulk writes."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from services.job_queue_service import JobQueueService, JOB_NOTIFY_CHANNEL
+
+
+def test_enqueue_job_notifies_in_same_statement():
+    """Test enqueue inserts and notifies in one round trip, only for new rows."""
+    pg = MagicMock()
+    pg.fetch_val = AsyncMock(return_value="job-1")
+
+    job_id = asyncio.run(JobQueueService(pg, max_attempts=3).enqueue_job("uid_a", "rev_1"))
+
+    assert job_id == "job-1"
+    sql, *params = pg.fetch_val.call_args.args
+    assert "pg_notify($5, $3) FROM inserted" in sql
+    assert params == ["uid_a", "rev_1", "extract_events", 3, JOB_NOTIFY_CHANNEL]
+
+
+def test_listen_for_jobs_uses_job_channel():
+    """Test workers subscribe to the job channel."""
+    pg = MagicMock()
+    pg.listen = AsyncMock(return_value="conn")
+    callback = MagicMock()
+
+    conn = asyncio.run(JobQueueService(pg).listen_for_jobs(callback))
+
+    assert conn == "conn"
+    pg.listen.assert_awaited_once_with(JOB_NOTIFY_CHANNEL, callback)
+
+
+def test_claim_jobs_is_one_update_returning():
+    """Test a batch claim is a single UPDATE ... RETURNING, oldest job first."""
+    pg = MagicMock()
+    pg.fetch_all = AsyncMock(return_value=[
+        {"job_id": "j2", "artifact_uid": "uid_b", "revision_id": "r", "attempts": 1,
+         "created_at": datetime(2026, 1, 2)},
+        {"job_id": "j1", "artifact_uid": "uid_a", "revision_id": "r", "attempts": 2,
+         "created_at": datetime(2026, 1, 1)},
+    ])
+
+    jobs = asyncio.run(JobQueueService(pg).claim_jobs("worker-1", "extract_events", 8))
+
+    sql, *params = pg.fetch_all.call_args.args
+    assert sql.strip().startswith("UPDATE event_jobs")
+    assert "FOR UPDATE SKIP LOCKED" in sql and "RETURNING" in sql
+    assert params == ["worker-1", "extract_events", 8]
+    assert [j["job_id"] for j in jobs] == ["j1", "j2"]
+    assert jobs[0]["attempts"] == 2
+
+
+def test_claim_job_by_type_claims_one():
+    """Test the single-job API delegates to claim_jobs."""
+    pg = MagicMock()
+    pg.fetch_all = AsyncMock(return_value=[])
+
+    assert asyncio.run(JobQueueService(pg).claim_job_by_type("worker-1")) is None
+    assert pg.fetch_all.call_args.args[1:] == ("worker-1", "extract_events", 1)
+
+
+class _Conn:
+    """Connection stand-in recording bulk calls inside a transaction."""
+
+    def __init__(self):
+        self.execute = AsyncMock()
+        self.executemany = AsyncMock()
+        self.copy_records_to_table = AsyncMock()
+        self.fetchval = AsyncMock()
+
+    def transaction(self):
+        conn = self
+
+        class _Tx:
+            async def __aenter__(self):
+                return conn
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Tx()
+
+
+def _pg_with_conn(conn):
+    pg = MagicMock()
+
+    class _Acquire:
+        async def __aenter__(self):
+            return conn
+
+        async def __aexit__(self, *exc):
+            return False
+
+    pg.acquire = MagicMock(return_value=_Acquire())
+    return pg
+
+
+def _event(i):
+    return {
+        "category": "Decision", "narrative": f"event {i}", "event_time": "2026-01-01T00:00:00Z",
+        "subject": {"type": "project", "ref": "Apollo"}, "actors": [{"ref": "Alice", "role": "owner"}],
+        "confidence": 0.9,
+        "evidence": [{"chunk_id": "c0", "start_char": 0, "end_char": 5, "quote": "q"}],
+    }
+
+
+def test_write_events_atomic_v4_bulk_statements():
+    """Test events, child rows and edges are a handful of bulk statements in one transaction."""
+    conn = _Conn()
+    alice, apollo = uuid4(), uuid4()
+    events = [_event(i) for i in range(3)]
+    entity_event_map = {
+        str(i): [
+            {"entity_id": alice, "role": "contributor", "is_actor": True},
+            {"entity_id": alice, "role": "owner", "is_actor": True},
+            {"entity_id": apollo, "is_actor": False},
+        ]
+        for i in range(3)
+    }
+    edges = [{"source_entity_id": alice, "target_entity_id": apollo, "relationship_type": "OWNS"}]
+
+    asyncio.run(JobQueueService(_pg_with_conn(conn)).write_events_atomic_v4(
+        "uid_a", "rev_1", uuid4(), events,
+        entity_event_map=entity_event_map, event_embeddings=[[0.1, 0.2], None, None], edges=edges
+    ))
+
+    conn.execute.assert_awaited_once()  # the delete
+    event_sql, event_rows = conn.executemany.await_args_list[0].args
+    assert "INSERT INTO semantic_event" in event_sql
+    assert len(event_rows) == 3
+    assert event_rows[0][-1] == "[0.1,0.2]" and event_rows[1][-1] is None
+    event_ids = [row[0] for row in event_rows]
+    assert len(set(event_ids)) == 3
+
+    copies = {call.args[0]: call.kwargs["records"] for call in conn.copy_records_to_table.await_args_list}
+    assert [row[1] for row in copies["event_evidence"]] == event_ids
+    # Duplicate actor collapses to the last role, as the ON CONFLICT upsert did
+    assert copies["event_actor"] == [(event_id, alice, "owner") for event_id in event_ids]
+    assert copies["event_subject"] == [(event_id, apollo) for event_id in event_ids]
+    assert len(copies["entity_event_index"]) == 6
+
+    edge_sql, edge_rows = conn.executemany.await_args_list[1].args
+    assert "INSERT INTO entity_edge" in edge_sql
+    assert edge_rows == [(alice, apollo, "OWNS", "uid_a", "rev_1", 0.8, None)]
+
+
+def test_write_events_atomic_empty_result_only_deletes():
+    """Test an extraction with no events just clears the revision."""
+    conn = _Conn()
+
+    asyncio.run(JobQueueService(_pg_with_conn(conn)).write_events_atomic("uid_a", "rev_1", uuid4(), []))
+
+    conn.execute.assert_awaited_once()
+    conn.executemany.assert_not_called()
+    conn.copy_records_to_table.assert_not_called()
+
+
+def test_write_events_atomic_v4_drops_invalid_edges():
+    """Test edges with a bad type or confidence are dropped instead of failing the event write."""
+    conn = _Conn()
+    alice, apollo = uuid4(), uuid4()
+    edges = [
+        {"source_entity_id": alice, "target_entity_id": apollo, "relationship_type": "OWNS", "confidence": "0.9"},
+        {"source_entity_id": alice, "target_entity_id": apollo, "relationship_type": None},
+        {"source_entity_id": alice, "target_entity_id": apollo, "relationship_type": "MANAGES", "confidence": "high"},
+        {"source_entity_id": alice, "target_entity_id": apollo, "relationship_type": "LEADS", "confidence": 1.5},
+    ]
+
+    asyncio.run(JobQueueService(_pg_with_conn(conn)).write_events_atomic_v4(
+        "uid_a", "rev_1", uuid4(), [_event(0)], edges=edges
+    ))
+
+    edge_sql, edge_rows = conn.executemany.await_args_list[-1].args
+    assert "INSERT INTO entity_edge" in edge_sql
+    assert edge_rows == [(alice, apollo, "OWNS", "uid_a", "rev_1", 0.9, None)]
+
+
+def test_write_events_atomic_v4_index_rows_per_entity():
+    """Test each actor/subject gets one entity_event_index row with its role, category and time."""
+    conn = _Conn()
+    alice, bob, apollo = uuid4(), uuid4(), uuid4()
+    event = {**_event(0), "category": "Commitment"}
+    entity_event_map = {"0": [
+        {"entity_id": alice, "role": "owner", "is_actor": True},
+        {"entity_id": alice, "role": "reviewer", "is_actor": True},
+        {"entity_id": bob, "role": "contributor", "is_actor": True},
+        {"entity_id": apollo, "is_actor": False},
+    ]}
+
+    asyncio.run(JobQueueService(_pg_with_conn(conn)).write_events_atomic_v4(
+        "uid_a", "rev_1", uuid4(), [event], entity_event_map=entity_event_map
+    ))
+
+    event_id = conn.executemany.await_args_list[0].args[1][0][0]
+    copies = {call.args[0]: call.kwargs for call in conn.copy_records_to_table.await_args_list}
+    index = copies["entity_event_index"]
+    assert index["columns"] == ["entity_id", "event_id", "role", "artifact_uid", "category", "event_time"]
+    event_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert index["records"] == [
+        (alice, event_id, "actor", "uid_a", "Commitment", event_time),
+        (bob, event_id, "actor", "uid_a", "Commitment", event_time),
+        (apollo, event_id, "subject", "uid_a", "Commitment", event_time),
+    ]
+
+
+def test_delete_artifact_data_removes_index_rows():
+    """Test forget's cleanup deletes entity_event_index rows along with the events."""
+    pg = MagicMock()
+    event_ids = [uuid4(), uuid4()]
+    pg.fetch_all = AsyncMock(return_value=[{"event_id": event_id} for event_id in event_ids])
+    pg.execute = AsyncMock()
+
+    deleted = asyncio.run(JobQueueService(pg).delete_artifact_data("uid_a"))
+
+    assert deleted == 2
+    statements = {call.args[0]: call.args[1] for call in pg.execute.await_args_list}
+    assert statements["DELETE FROM entity_event_index WHERE artifact_uid = $1"] == "uid_a"
+    assert statements["DELETE FROM semantic_event WHERE event_id = ANY($1::uuid[])"] == event_ids
+    assert statements["DELETE FROM event_jobs WHERE artifact_uid = $1"] == "uid_a"
+
+
+def test_delete_artifact_data_without_events():
+    """Test an artifact with no events still clears mentions, revisions and jobs."""
+    pg = MagicMock()
+    pg.fetch_all = AsyncMock(return_value=[])
+    pg.execute = AsyncMock()
+
+    assert asyncio.run(JobQueueService(pg).delete_artifact_data("uid_a")) == 0
+    tables = [call.args[0].split()[2] for call in pg.execute.await_args_list]
+    assert tables == ["entity_mention", "artifact_revision", "event_jobs"]
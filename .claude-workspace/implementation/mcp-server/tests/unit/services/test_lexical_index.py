@@ -0,0 +1,127 @@
+"""Unit tests for LexicalIndex - V10."""
+
+import pytest
+
+from services.lexical_index import BM25Index, LexicalIndex, looks_like_identifier, tokenize
+
+
+# ============================================================================
+# Tokenizer Tests
+# ============================================================================
+
+def test_tokenize_keeps_identifiers_and_parts():
+    """Test identifiers are indexed whole and split into parts."""
+    tokens = tokenize("See JIRA-1234 and art_ab12.")
+
+    assert "jira-1234" in tokens
+    assert "jira" in tokens and "1234" in tokens
+    assert "art_ab12" in tokens
+    assert "see" in tokens
+
+
+def test_looks_like_identifier():
+    """Test the auto-mode heuristic."""
+    assert looks_like_identifier("JIRA-1234")
+    assert looks_like_identifier("art_abc123")
+    assert looks_like_identifier('"Alice Chen"')
+    assert not looks_like_identifier("what did Alice decide")
+    assert not looks_like_identifier("")
+
+
+# ============================================================================
+# BM25 Tests
+# ============================================================================
+
+@pytest.fixture
+def index():
+    idx = BM25Index()
+    idx.upsert(
+        ["a", "b", "c"],
+        [
+            "Release blocked by JIRA-1234 until QA signs off",
+            "Quarterly planning meeting about the release roadmap",
+            "Lunch menu",
+        ],
+        [{"context": "note"}, {"context": "meeting"}, {"context": "note", "source_id": "MENU-7"}],
+    )
+    return idx
+
+
+def test_bm25_ranks_exact_identifier_first(index):
+    """Test the document containing the identifier ranks first."""
+    hits = index.query("JIRA-1234", n_results=3)
+
+    assert [h["id"] for h in hits] == ["a"]
+    assert hits[0]["score"] > 0
+
+
+def test_bm25_rare_terms_weigh_more(index):
+    """Test IDF favours the rarer query term."""
+    hits = index.query("release roadmap", n_results=3)
+
+    assert [h["id"] for h in hits][0] == "b"
+    assert {h["id"] for h in hits} == {"a", "b"}
+
+
+def test_bm25_indexes_metadata_fields(index):
+    """Test source_id in metadata is searchable."""
+    assert [h["id"] for h in index.query("MENU-7", n_results=3)] == ["c"]
+
+
+def test_bm25_where_filter(index):
+    """Test metadata filters apply to lexical hits."""
+    hits = index.query("release", n_results=3, where={"context": "meeting"})
+
+    assert [h["id"] for h in hits] == ["b"]
+
+
+def test_bm25_upsert_and_delete_update_postings(index):
+    """Test replaced and deleted documents leave no stale postings."""
+    index.upsert(["a"], ["Nothing to see"], [{}])
+    assert index.query("JIRA-1234", n_results=3) == []
+
+    assert index.delete(["b", "missing"]) == 1
+    assert index.query("roadmap", n_results=3) == []
+    assert len(index) == 2
+
+    index.upsert(["d"], ["roadmap again"], [{}])
+    assert [h["id"] for h in index.query("roadmap", n_results=3)] == ["d"]
+
+
+# ============================================================================
+# LexicalIndex Tests
+# ============================================================================
+
+def test_delete_content_cascades_to_chunks():
+    """Test forget removes a content item and its chunks."""
+    lexical = LexicalIndex()
+    lexical.is_ready = True
+    lexical.upsert("content", ["art_1"], ["parent"], [{}])
+    lexical.upsert("chunks", ["art_1::chunk::000::x", "art_2::chunk::000::y"], ["one", "two"],
+                   [{"content_id": "art_1"}, {"content_id": "art_2"}])
+
+    assert lexical.delete_content("art_1") == {"content": 1, "chunks": 1}
+    assert lexical.stats()["chunks"]["documents"] == 1
+
+
+def test_update_chunk_metadata_refilters():
+    """Test chunk metadata updates are visible to where filters."""
+    lexical = LexicalIndex()
+    lexical.is_ready = True
+    lexical.upsert("chunks", ["art_1::chunk::000::x"], ["budget review"], [{"content_id": "art_1", "importance": 0.2}])
+
+    lexical.update_chunk_metadata("art_1", {"importance": 0.9})
+
+    hits = lexical.query("chunks", "budget", 5, where={"importance": {"$gte": 0.5}})
+    assert [h["id"] for h in hits] == ["art_1::chunk::000::x"]
+
+
+def test_bm25_tracks_chunks_by_content_id():
+    """Test chunk lookups by content_id follow re-upserts and deletes."""
+    index = BM25Index()
+    index.upsert(["c0", "c1"], ["one", "two"], [{"content_id": "art_1"}, {"content_id": "art_1"}])
+    index.upsert(["c1"], ["two"], [{"content_id": "art_2"}])
+    index.delete(["c0"])
+
+    assert index.ids_for_content("art_1") == []
+    assert index.ids_for_content("art_2") == ["c1"]
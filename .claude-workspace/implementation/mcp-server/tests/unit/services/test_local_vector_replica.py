@@ -0,0 +1,199 @@
+"""Unit tests for LocalVectorReplica - V10."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from services.local_vector_replica import LocalVectorIndex, LocalVectorReplica, matches_where
+
+
+DIMS = 4
+
+
+def _vec(*values):
+    return list(values) + [0.0] * (DIMS - len(values))
+
+
+# ============================================================================
+# Where Filter Tests
+# ============================================================================
+
+def test_matches_where_operators():
+    """Test the operators recall uses."""
+    meta = {"context": "meeting", "importance": 0.7, "ts_epoch": 100}
+
+    assert matches_where(meta, None)
+    assert matches_where(meta, {"context": "meeting"})
+    assert not matches_where(meta, {"context": "email"})
+    assert matches_where(meta, {"importance": {"$gte": 0.7}})
+    assert not matches_where(meta, {"importance": {"$gt": 0.7}})
+    assert matches_where(meta, {"$and": [{"ts_epoch": {"$gte": 50}}, {"ts_epoch": {"$lt": 101}}]})
+    assert matches_where(meta, {"$or": [{"context": "email"}, {"context": {"$in": ["meeting"]}}]})
+
+
+def test_matches_where_missing_field():
+    """Test conditions on missing fields do not match (except negations)."""
+    assert not matches_where({}, {"importance": {"$gte": 0.0}})
+    assert matches_where({}, {"context": {"$ne": "email"}})
+
+
+# ============================================================================
+# Index Tests
+# ============================================================================
+
+@pytest.fixture
+def index():
+    idx = LocalVectorIndex(DIMS, use_hnsw=False)
+    idx.upsert(
+        ["a", "b", "c"],
+        [_vec(1, 0), _vec(0, 1), _vec(1, 1)],
+        ["doc a", "doc b", "doc c"],
+        [{"importance": 0.9}, {"importance": 0.2}, {"importance": 0.5}],
+    )
+    return idx
+
+
+def test_index_query_orders_by_cosine_distance(index):
+    """Test nearest items come first with cosine distances."""
+    hits = index.query(_vec(1, 0), n_results=3)
+
+    assert [h["id"] for h in hits] == ["a", "c", "b"]
+    assert hits[0]["distance"] == pytest.approx(0.0, abs=1e-6)
+    assert hits[2]["distance"] == pytest.approx(1.0, abs=1e-6)
+
+
+def test_index_query_with_filter(index):
+    """Test where filters restrict candidates before top-k."""
+    hits = index.query(_vec(1, 0), n_results=1, where={"importance": {"$lte": 0.5}})
+
+    assert [h["id"] for h in hits] == ["c"]
+
+
+def test_index_upsert_replaces_and_delete_removes(index):
+    """Test upsert of an existing ID replaces it and delete hides it."""
+    index.upsert(["b"], [_vec(1, 0)], ["doc b2"], [{"importance": 0.2}])
+    assert index.query(_vec(1, 0), n_results=1)[0]["id"] in ("a", "b")
+
+    assert index.delete(["a", "missing"]) == 1
+    hits = index.query(_vec(1, 0), n_results=3)
+    assert [h["id"] for h in hits][0] == "b"
+    assert "a" not in [h["id"] for h in hits]
+    assert len(index) == 2
+
+
+def test_index_grows_capacity_geometrically():
+    """Test one-item upserts reallocate the vector matrix O(log n) times, not per call."""
+    idx = LocalVectorIndex(DIMS, use_hnsw=False)
+    reallocations, buffer = 0, idx._vectors
+    for i in range(100):
+        idx.upsert([f"id_{i}"], [_vec(1, i)], [f"doc {i}"], [{}])
+        if idx._vectors is not buffer:
+            reallocations, buffer = reallocations + 1, idx._vectors
+
+    assert reallocations <= 8
+    assert idx.query(_vec(1, 99), n_results=1)[0]["id"] == "id_99"
+
+
+def test_index_tracks_chunks_by_content_id():
+    """Test the content_id map follows upserts, metadata changes and deletes."""
+    idx = LocalVectorIndex(DIMS, use_hnsw=False)
+    idx.upsert(["c0", "c1", "d0"], [_vec(1, 0)] * 3, ["a", "b", "c"],
+               [{"content_id": "art_1"}, {"content_id": "art_1"}, {"content_id": "art_2"}])
+    idx.update_metadata(["c1"], [{"content_id": "art_2"}])
+    idx.delete(["d0"])
+
+    assert idx.ids_for_content("art_1") == ["c0"]
+    assert idx.ids_for_content("art_2") == ["c1"]
+    assert idx.ids_for_content("art_3") == []
+
+
+# ============================================================================
+# Replica Tests
+# ============================================================================
+
+def _fake_collection(ids, embeddings, documents, metadatas):
+    collection = MagicMock()
+
+    def get(ids=None, include=None, limit=None, offset=0, where=None):
+        selected = list(range(len(all_ids)))
+        if ids is not None:
+            selected = [all_ids.index(i) for i in ids if i in all_ids]
+        if limit is not None:
+            selected = selected[offset:offset + limit]
+        return {
+            "ids": [all_ids[i] for i in selected],
+            "embeddings": [embeddings[i] for i in selected],
+            "documents": [documents[i] for i in selected],
+            "metadatas": [metadatas[i] for i in selected],
+        }
+
+    all_ids = list(ids)
+    collection.get.side_effect = get
+    return collection
+
+
+@pytest.fixture
+def chroma():
+    content = _fake_collection(
+        ["art_1", "art_2"],
+        [_vec(1, 0), _vec(0, 1)],
+        ["one", "two"],
+        [{"context": "note"}, {"context": "meeting", "is_chunked": True}],
+    )
+    chunks = _fake_collection(
+        ["art_2::chunk::000::x"],
+        [_vec(0, 1)],
+        ["two part"],
+        [{"content_id": "art_2"}],
+    )
+    with patch("storage.collections.get_content_collection", return_value=content), \
+         patch("storage.collections.get_chunks_collection", return_value=chunks):
+        yield content, chunks
+
+
+def test_replica_warm_and_query_shape(chroma):
+    """Test warm-up loads both collections and query mirrors Chroma's shape."""
+    replica = LocalVectorReplica(dimensions=DIMS, use_hnsw=False)
+    counts = replica.warm_from_chroma(MagicMock(), page_size=1)
+
+    assert counts == {"content": 2, "chunks": 1}
+    result = replica.query("content", _vec(0, 1), n_results=5, where={"context": "meeting"})
+    assert result["ids"] == [["art_2"]]
+    assert result["documents"] == [["two"]]
+    assert len(result["distances"][0]) == 1
+
+
+def test_replica_delete_content_cascades(chroma):
+    """Test forget removes the content item and its chunks."""
+    replica = LocalVectorReplica(dimensions=DIMS, use_hnsw=False)
+    replica.warm_from_chroma(MagicMock())
+
+    assert replica.delete_content("art_2") == {"content": 1, "chunks": 1}
+
+
+def test_replica_consistency_check_and_repair(chroma):
+    """Test drift is reported and repaired from Chroma."""
+    replica = LocalVectorReplica(dimensions=DIMS, use_hnsw=False)
+    replica.warm_from_chroma(MagicMock())
+    replica.indexes["content"].delete(["art_1"])
+    replica.upsert("content", ["art_stale"], [_vec(1, 1)], ["stale"], [{}])
+
+    report = replica.check_consistency(MagicMock())
+    assert report["content"]["missing"] == 1
+    assert report["content"]["extra"] == 1
+    assert report["content"]["consistent"] is False
+    assert report["chunks"]["consistent"] is True
+
+    replica.reconcile(MagicMock())
+    assert sorted(replica.indexes["content"].ids) == ["art_1", "art_2"]
+
+
+def test_replica_snapshot_round_trip(chroma, tmp_path):
+    """Test snapshot save/load restores items."""
+    replica = LocalVectorReplica(dimensions=DIMS, use_hnsw=False)
+    replica.warm_from_chroma(MagicMock())
+    path = str(tmp_path / "replica.npz")
+    replica.save_snapshot(path)
+
+    restored = LocalVectorReplica(dimensions=DIMS, use_hnsw=False)
+    assert restored.load_snapshot(path) == {"content": 2, "chunks": 1}
+    assert restored.query("content", _vec(1, 0), n_results=1)["ids"] == [["art_1"]]
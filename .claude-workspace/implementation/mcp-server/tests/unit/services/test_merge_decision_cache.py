@@ -0,0 +1,76 @@
+"""Unit tests for the entity merge decision cache - V10."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+from services.merge_decision_cache import (
+    MergeDecisionCache,
+    context_hash,
+    merge_decision_cache_stats,
+)
+
+
+def test_context_hash_tracks_clues_and_model():
+    """Test the hash ignores case and spacing but not the clues or model."""
+    base = context_hash("person", "Engineer", "Acme", None, "gpt-4o-mini")
+    assert base == context_hash("person", " engineer", "ACME", "", "gpt-4o-mini")
+    assert base != context_hash("person", "Engineer", "Globex", None, "gpt-4o-mini")
+    assert base != context_hash("person", "Engineer", "Acme", None, "gpt-4o")
+
+
+def test_get_counts_hits_in_lookup():
+    """Test lookups skip expired rows and bump hit_count in the same statement."""
+    pg = MagicMock()
+    pg.fetch_one = AsyncMock(side_effect=[
+        {"decision": "same", "canonical_name": "Alex Chen", "reason": "r", "confidence": 0.9},
+        None,
+    ])
+    cache = MergeDecisionCache(pg)
+    entity_id = uuid4()
+
+    assert asyncio.run(cache.get(entity_id, "alex", "h"))["decision"] == "same"
+    assert asyncio.run(cache.get(entity_id, "alex", "h2")) is None
+
+    sql = pg.fetch_one.call_args.args[0]
+    assert sql.strip().startswith("UPDATE entity_merge_decision") and "expires_at > now()" in sql
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_put_stores_only_confident_decisions():
+    """Test uncertain and low-confidence decisions are not cached."""
+    pg = MagicMock()
+    pg.execute = AsyncMock()
+    cache = MergeDecisionCache(pg, ttl_days=7)
+    entity_id = uuid4()
+
+    asyncio.run(cache.put(entity_id, "alex", "h", "uncertain", "Alex", "r", 0.95))
+    asyncio.run(cache.put(entity_id, "alex", "h", "same", "Alex Chen", "r", 0.5))
+    pg.execute.assert_not_called()
+
+    asyncio.run(cache.put(entity_id, "alex", "h", "different", "Alex", "r", 0.9))
+    args = pg.execute.call_args.args
+    assert "ON CONFLICT" in args[0]
+    assert args[1:] == (entity_id, "alex", "h", "different", "Alex", "r", 0.9, 7)
+
+
+def test_cache_errors_are_misses():
+    """Test a failing cache never fails resolution."""
+    pg = MagicMock()
+    pg.fetch_one = AsyncMock(side_effect=RuntimeError("relation does not exist"))
+    pg.execute = AsyncMock(side_effect=RuntimeError("relation does not exist"))
+    cache = MergeDecisionCache(pg)
+
+    assert asyncio.run(cache.get(uuid4(), "alex", "h")) is None
+    asyncio.run(cache.put(uuid4(), "alex", "h", "same", "Alex Chen", "r", 0.9))
+    asyncio.run(cache.invalidate(uuid4()))
+
+
+def test_calls_avoided_per_1k_documents():
+    """Test table-wide hits are reported per thousand documents."""
+    pg = MagicMock()
+    pg.fetch_one = AsyncMock(return_value={"entries": 40, "hits": 25, "documents": 500})
+
+    stats = asyncio.run(merge_decision_cache_stats(pg))
+
+    assert stats == {"entries": 40, "llm_calls_avoided": 25, "avoided_per_1k_documents": 50.0}
@@ -1,7 +1,9 @@
 """Unit tests for RetrievalService - V6."""
 
+import asyncio
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
+from uuid import uuid4
 
 from services.retrieval_service import RetrievalService
 from storage.models import SearchResult, MergedResult
@@ -212,7 +214,246 @@ def test_deduplicate_empty_list(retrieval_service):
     assert deduplicated == []
 
 
+# ============================================================================
+# Where Filter Tests (V10)
+# ============================================================================
+
+def test_build_where_filter_no_filters():
+    """Test no where clause when no filters are set."""
+    assert RetrievalService.build_where_filter() is None
+
+
+def test_build_where_filter_explicit_zero_importance():
+    """Test min_importance=0.0 is a filter, not a missing one."""
+    assert RetrievalService.build_where_filter(min_importance=0.0) == {"importance": {"$gte": 0.0}}
+
+
+def test_build_where_filter_single_condition():
+    """Test a single filter is returned without $and."""
+    where = RetrievalService.build_where_filter(min_importance=0.7)
+
+    assert where == {"importance": {"$gte": 0.7}}
+
+
+def test_build_where_filter_date_range_is_inclusive():
+    """Test date range covers the whole of date_to and keeps undated items."""
+    where = RetrievalService.build_where_filter(
+        context_filter="meeting",
+        date_from="2026-01-01",
+        date_to="2026-01-31"
+    )
+
+    assert where == {"$and": [
+        {"context": "meeting"},
+        {"$or": [{"ts_epoch": {"$gte": 1767225600}}, {"ts_epoch": -1}]},
+        {"ts_epoch": {"$lt": 1769904000}},
+    ]}
+
+
+def test_build_where_filter_ignores_bad_date():
+    """Test unparseable dates are dropped rather than failing the search."""
+    where = RetrievalService.build_where_filter(date_from="last tuesday", min_importance=0.5)
+
+    assert where == {"importance": {"$gte": 0.5}}
+
+
+# ============================================================================
+# Lexical / Hybrid Search Tests (V10)
+# ============================================================================
+
+def _lexical_service(lexical_index):
+    """RetrievalService with mocked Chroma returning one vector hit per collection."""
+    embedding_service = Mock()
+    embedding_service.generate_embedding.return_value = [0.1, 0.2]
+    chroma_client = MagicMock()
+    collection = chroma_client.get_or_create_collection.return_value
+    collection.query.return_value = {
+        "ids": [["art_semantic"]],
+        "documents": [["roadmap planning notes"]],
+        "metadatas": [[{}]],
+        "distances": [[0.2]],
+    }
+    service = RetrievalService(
+        embedding_service, Mock(), chroma_client, lexical_index=lexical_index
+    )
+    return service, embedding_service
+
+
+@pytest.fixture
+def lexical_index():
+    from services.lexical_index import LexicalIndex
+
+    index = LexicalIndex()
+    index.is_ready = True
+    index.upsert("content", ["art_ticket"], ["Fix login bug"], [{"source_id": "JIRA-1234"}])
+    index.upsert("content", ["art_semantic"], ["roadmap planning notes"], [{}])
+    return index
+
+
+def test_lexical_mode_skips_embedding(lexical_index):
+    """Test lexical-only search does not call the embedding API."""
+    service, embedding_service = _lexical_service(lexical_index)
+
+    result = asyncio.run(service.hybrid_search_v5("JIRA-1234", expand=False, search_mode="lexical"))
+
+    embedding_service.generate_embedding.assert_not_called()
+    assert [r.result.id for r in result.primary_results] == ["art_ticket"]
+    assert result.expand_options["search_mode"] == "lexical"
+
+
+def test_auto_mode_routes_identifier_queries(lexical_index):
+    """Test auto uses lexical for identifiers and hybrid for natural language."""
+    service, embedding_service = _lexical_service(lexical_index)
+
+    result = asyncio.run(service.hybrid_search_v5("JIRA-1234", expand=False, search_mode="auto"))
+    assert result.expand_options["search_mode"] == "lexical"
+    embedding_service.generate_embedding.assert_not_called()
+
+    result = asyncio.run(service.hybrid_search_v5("roadmap planning", expand=False, search_mode="auto"))
+    assert result.expand_options["search_mode"] == "hybrid"
+
+
+def test_hybrid_mode_fuses_with_rrf(lexical_index):
+    """Test an artifact found by both vector and BM25 outranks single-list hits."""
+    service, _ = _lexical_service(lexical_index)
+
+    result = asyncio.run(service.hybrid_search_v5("roadmap planning bug", expand=False, search_mode="hybrid"))
+
+    ids = [r.result.id for r in result.primary_results]
+    assert ids[0] == "art_semantic"
+    assert "art_ticket" in ids
+    assert sorted(result.primary_results[0].collections) == ["lexical", "vector"]
+
+
+def test_lexical_unavailable_falls_back_to_semantic():
+    """Test search degrades to vector-only without a lexical index."""
+    service, embedding_service = _lexical_service(None)
+
+    result = asyncio.run(service.hybrid_search_v5("JIRA-1234", expand=False, search_mode="lexical"))
+
+    embedding_service.generate_embedding.assert_called_once()
+    assert result.expand_options["search_mode"] == "semantic"
+
+
+def test_on_stage_receives_primary_results(lexical_index):
+    """Test streamed search reports primary hits before returning."""
+    service, _ = _lexical_service(lexical_index)
+    stages = []
+
+    async def on_stage(stage, payload):
+        stages.append((stage, [r["id"] for r in payload]))
+
+    asyncio.run(service.hybrid_search_v5("JIRA-1234", expand=False, search_mode="lexical", on_stage=on_stage))
+
+    assert stages == [("primary", ["art_ticket"])]
+
+
+# ============================================================================
+# Batch Search Tests (V10)
+# ============================================================================
+
+def test_hybrid_search_batch_shares_embedding_and_query():
+    """Test a batch makes one embedding call and one query per collection."""
+    embedding_service = Mock()
+    embedding_service.generate_embeddings_batch.return_value = [[1.0, 0.0], [0.0, 1.0]]
+    chroma_client = MagicMock()
+    collection = chroma_client.get_or_create_collection.return_value
+    collection.query.return_value = {
+        "ids": [["art_a", "art_b"], ["art_b"]],
+        "documents": [["doc a", "doc b"], ["doc b"]],
+        "metadatas": [[{}, {}], [{}]],
+        "distances": [[0.1, 0.3], [0.2]],
+    }
+    service = RetrievalService(embedding_service, Mock(), chroma_client)
+
+    batch = asyncio.run(service.hybrid_search_batch(["first", "second"], limit=5, expand=False))
+
+    embedding_service.generate_embeddings_batch.assert_called_once_with(["first", "second"])
+    embedding_service.generate_embedding.assert_not_called()
+    assert collection.query.call_count == 2  # content + chunks, both queries each
+    assert collection.query.call_args.kwargs["query_embeddings"] == [[1.0, 0.0], [0.0, 1.0]]
+    assert [[r.result.id for r in res.primary_results] for res in batch.results] == [
+        ["art_a", "art_b"],
+        ["art_b"],
+    ]
+
+
 # Legacy tests removed in V6.1:
 # - Collection search tests (_search_collection deleted)
 # - Hybrid search tests (hybrid_search deleted)
 # - Neighbor expansion tests (_expand_neighbors deleted)
+
+
+def test_precomputed_query_embedding_is_reused(lexical_index):
+    """Test a caller-supplied embedding skips the embedding call."""
+    service, embedding_service = _lexical_service(lexical_index)
+
+    result = asyncio.run(service.hybrid_search_v5(
+        "roadmap planning", expand=False, search_mode="hybrid", query_embedding=[0.3, 0.4]
+    ))
+
+    embedding_service.generate_embedding.assert_not_called()
+    assert result.primary_results
+
+
+# ============================================================================
+# SQL Graph Expansion Tests (V10)
+# ============================================================================
+
+def _sql_service():
+    pg_client = MagicMock()
+    pg_client.fetch_all = AsyncMock(return_value=[])
+    return RetrievalService(Mock(), Mock(), MagicMock(), pg_client=pg_client), pg_client
+
+
+def test_expand_from_events_sql_binds_lists_as_arrays():
+    """Test seeds, budget and filters are bound parameters, so the SQL text is size-independent."""
+    service, pg_client = _sql_service()
+    seeds = [uuid4(), uuid4(), uuid4()]
+
+    asyncio.run(service._expand_from_events_sql(
+        seeds, budget=7, category_filter=["Decision"],
+        candidate_artifact_uids=["uid_a", "uid_b"], edge_types=["MANAGES"]
+    ))
+    sql, *params = pg_client.fetch_all.call_args.args
+
+    assert params == [seeds, 7, ["Decision"], ["uid_a", "uid_b"], ["MANAGES"]]
+    assert "event_id = ANY($1::uuid[])" in sql and "<> ALL($1::uuid[])" in sql
+    assert "LIMIT $2" in sql
+    assert "eei.category = ANY($3::text[])" in sql
+    assert "eei.artifact_uid = ANY($4::text[])" in sql
+    assert "ee.relationship_type = ANY($5::text[])" in sql
+
+    asyncio.run(service._expand_from_events_sql(seeds[:1], budget=3, category_filter=["Decision"]))
+    short_sql, *short_params = pg_client.fetch_all.call_args.args
+
+    assert short_params == [seeds[:1], 3, ["Decision"]]
+    assert "$4" not in short_sql
+
+
+def test_expand_from_events_sql_text_ignores_sizes():
+    """Test different seed counts and budgets reuse one statement text."""
+    service, pg_client = _sql_service()
+
+    asyncio.run(service._expand_from_events_sql([uuid4()], budget=5))
+    asyncio.run(service._expand_from_events_sql([uuid4() for _ in range(20)], budget=50))
+
+    first, second = (call.args[0] for call in pg_client.fetch_all.call_args_list)
+    assert first == second
+
+
+def test_fetch_edges_for_events_binds_arrays():
+    """Test edge enrichment passes event IDs and edge types as array parameters."""
+    service, pg_client = _sql_service()
+    event_ids = [uuid4(), uuid4()]
+
+    asyncio.run(service._fetch_edges_for_events(event_ids, ["OWNS"]))
+    sql, *params = pg_client.fetch_all.call_args.args
+
+    assert params == [event_ids, ["OWNS"]]
+    assert "event_id = ANY($1::uuid[])" in sql
+    assert "ee.relationship_type = ANY($2::text[])" in sql
+    assert "LIMIT 50" in sql
+
+    asyncio.run(service._fetch_edges_for_events(event_ids))
+    assert pg_client.fetch_all.call_args.args[1:] == (event_ids,)
@@ -0,0 +1,133 @@
+"""Unit tests for collection filter metadata helpers."""
+
+from unittest.mock import MagicMock
+
+from storage.collections import (
+    to_epoch_seconds,
+    build_filter_metadata,
+    backfill_filter_metadata,
+    neighbor_chunk_metadata,
+    UNDATED_TS_EPOCH,
+    get_v5_chunk_neighbors,
+)
+
+
+def test_to_epoch_seconds_date_only():
+    """Test plain dates are treated as midnight UTC."""
+    assert to_epoch_seconds("2026-01-01") == 1767225600
+
+
+def test_to_epoch_seconds_iso_timestamp():
+    """Test ISO timestamps with Z suffix and offsets."""
+    assert to_epoch_seconds("2026-01-01T00:01:00Z") == 1767225660
+    assert to_epoch_seconds("2026-01-01T01:00:00+01:00") == 1767225600
+    assert to_epoch_seconds("2026-01-01T00:00:00.123456") == 1767225600
+
+
+def test_to_epoch_seconds_invalid():
+    """Test missing or unparseable values return None."""
+    assert to_epoch_seconds(None) is None
+    assert to_epoch_seconds("") is None
+    assert to_epoch_seconds("not a date") is None
+
+
+def test_build_filter_metadata_prefers_document_date():
+    """Test ts takes precedence over ingested_at."""
+    meta = build_filter_metadata({
+        "context": "meeting",
+        "importance": 0.8,
+        "ts": "2026-01-01",
+        "ingested_at": "2026-03-01T10:00:00Z",
+        "title": "Standup",
+    })
+
+    assert meta == {"context": "meeting", "importance": 0.8, "ts_epoch": 1767225600}
+
+
+def test_build_filter_metadata_falls_back_to_ingested_at():
+    """Test ingested_at is used when no document date is set."""
+    meta = build_filter_metadata({"importance": 0.5, "ingested_at": "2026-01-01T00:00:00Z"})
+
+    assert meta == {"importance": 0.5, "ts_epoch": 1767225600}
+
+
+def test_build_filter_metadata_defaults():
+    """Test missing importance and timestamps get the values recall has always assumed."""
+    meta = build_filter_metadata({"context": "note", "ts": "someday"})
+
+    assert meta == {"context": "note", "importance": 0.5, "ts_epoch": UNDATED_TS_EPOCH}
+
+
+def test_backfill_filter_metadata_skips_backfilled_items():
+    """Test only items missing a field are updated, undated ones included, and mirrored via on_update."""
+    client = MagicMock()
+    collection = client.get_or_create_collection.return_value
+    collection.get.return_value = {
+        "ids": ["done", "undated", "old"],
+        "metadatas": [
+            {"importance": 0.9, "ts_epoch": UNDATED_TS_EPOCH},
+            {"context": "note"},
+            {"ts": "2026-01-01", "importance": 0.7},
+        ],
+    }
+    pages = []
+
+    updated = backfill_filter_metadata(client, on_update=lambda *page: pages.append(page))
+
+    assert updated == {"content": 2, "chunks": 0}
+    update = collection.update.call_args.kwargs
+    assert update["ids"] == ["undated", "old"]
+    assert update["metadatas"][0] == {"context": "note", "importance": 0.5, "ts_epoch": UNDATED_TS_EPOCH}
+    assert update["metadatas"][1]["ts_epoch"] == 1767225600
+    assert pages == [(update["ids"], update["metadatas"], {})]
+
+
+def test_neighbor_chunk_metadata_ends():
+    """Test first/last chunks only point inward."""
+    ids = ["c0", "c1", "c2"]
+
+    assert neighbor_chunk_metadata(ids, 0) == {"next_chunk_id": "c1"}
+    assert neighbor_chunk_metadata(ids, 1) == {"prev_chunk_id": "c0", "next_chunk_id": "c2"}
+    assert neighbor_chunk_metadata(ids, 2) == {"prev_chunk_id": "c1"}
+
+
+def test_get_v5_chunk_neighbors_by_id():
+    """Test neighbors come from one get(ids=...) shared by adjacent hits."""
+    client = MagicMock()
+    collection = client.get_or_create_collection.return_value
+    collection.get.return_value = {
+        "ids": ["c4"],
+        "documents": ["four"],
+        "metadatas": [{"chunk_index": 4}],
+    }
+
+    neighbors = get_v5_chunk_neighbors(client, [
+        ("c3", {"next_chunk_id": "c4", "prev_chunk_id": "c2"}),
+        ("c5", {"prev_chunk_id": "c4"}),
+    ])
+
+    collection.get.assert_called_once()
+    assert sorted(collection.get.call_args.kwargs["ids"]) == ["c2", "c4"]
+    assert neighbors["c3"]["next"]["content"] == "four"
+    assert neighbors["c3"]["prev"] is None
+    assert neighbors["c5"]["prev"]["chunk_id"] == "c4"
+
+
+def test_get_v5_chunk_neighbors_legacy_filter():
+    """Test chunks without pointers fetch only their neighbors by index."""
+    client = MagicMock()
+    collection = client.get_or_create_collection.return_value
+    collection.get.return_value = {
+        "ids": ["art_1::chunk::000::a", "art_1::chunk::002::c"],
+        "documents": ["zero", "two"],
+        "metadatas": [{"content_id": "art_1", "chunk_index": 0}, {"content_id": "art_1", "chunk_index": 2}],
+    }
+
+    neighbors = get_v5_chunk_neighbors(client, [
+        ("art_1::chunk::001::b", {"content_id": "art_1", "chunk_index": 1}),
+    ])
+
+    where = collection.get.call_args.kwargs["where"]
+    assert where == {"$and": [{"content_id": "art_1"}, {"chunk_index": {"$in": [0, 2]}}]}
+    assert neighbors["art_1::chunk::001::b"]["prev"]["content"] == "zero"
+    assert neighbors["art_1::chunk::001::b"]["next"]["content"] == "two"
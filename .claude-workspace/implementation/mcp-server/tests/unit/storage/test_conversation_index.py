@@ -0,0 +1,132 @@
+"""Unit tests for the conversation turn index - V10."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from storage.conversation_index import (
+    parse_cursor,
+    fetch_turn_window,
+    window_turns,
+    backfill_from_chroma,
+)
+
+
+def _turns(n):
+    return [{"id": f"art_{i}", "turn_index": i} for i in range(n)]
+
+
+def _pg_rows(indexes):
+    pg = MagicMock()
+    pg.fetch_all = AsyncMock(return_value=[
+        {"turn_index": i, "artifact_id": f"art_{i}", "role": "user"} for i in indexes
+    ])
+    return pg
+
+
+def test_parse_cursor():
+    """Test valid cursors parse and malformed ones raise."""
+    assert parse_cursor("after:4") == ("after", 4)
+    assert parse_cursor("before:10") == ("before", 10)
+    for bad in ("", "after", "after:x", "sideways:3"):
+        with pytest.raises(ValueError):
+            parse_cursor(bad)
+
+
+def test_window_turns_head_and_cursor():
+    """Test forward paging returns the first page and continues after it."""
+    page, cursor = window_turns(_turns(5), 2)
+    assert [t["turn_index"] for t in page] == [0, 1]
+    assert cursor == "after:1"
+
+    page, cursor = window_turns(_turns(5), 2, cursor="after:3")
+    assert [t["turn_index"] for t in page] == [4]
+    assert cursor is None
+
+
+def test_window_turns_tail_pages_backwards():
+    """Test tail returns the latest turns in ascending order."""
+    page, cursor = window_turns(_turns(5), 2, tail=True)
+    assert [t["turn_index"] for t in page] == [3, 4]
+    assert cursor == "before:3"
+
+    page, cursor = window_turns(_turns(5), 2, cursor=cursor)
+    assert [t["turn_index"] for t in page] == [1, 2]
+
+
+def test_window_turns_range():
+    """Test from_turn/to_turn bound the window."""
+    page, cursor = window_turns(_turns(10), 10, from_turn=3, to_turn=5)
+    assert [t["turn_index"] for t in page] == [3, 4, 5]
+    assert cursor is None
+
+
+def test_fetch_turn_window_forward():
+    """Test the PK range query and the extra row used for has_more."""
+    pg = _pg_rows([0, 1, 2])
+
+    rows, cursor = asyncio.run(fetch_turn_window(pg, "conv_1", 2))
+
+    sql, *params = pg.fetch_all.call_args.args
+    assert "ORDER BY turn_index ASC" in sql
+    assert params == ["conv_1", 3]
+    assert [r["turn_index"] for r in rows] == [0, 1]
+    assert cursor == "after:1"
+
+
+def test_fetch_turn_window_tail_with_bounds():
+    """Test tail reads descending and returns rows in ascending order."""
+    pg = _pg_rows([9, 8])
+
+    rows, cursor = asyncio.run(fetch_turn_window(pg, "conv_1", 5, tail=True, from_turn=2))
+
+    sql, *params = pg.fetch_all.call_args.args
+    assert "ORDER BY turn_index DESC" in sql
+    assert "turn_index >= $2" in sql
+    assert params == ["conv_1", 2, 6]
+    assert [r["turn_index"] for r in rows] == [8, 9]
+    assert cursor is None
+
+
+def test_fetch_turn_window_cursor_overrides_tail():
+    """Test an after: cursor pages forward even with tail set."""
+    pg = _pg_rows([])
+
+    asyncio.run(fetch_turn_window(pg, "conv_1", 5, tail=True, cursor="after:7"))
+
+    sql, *params = pg.fetch_all.call_args.args
+    assert "turn_index > $2" in sql
+    assert "ASC" in sql
+    assert params == ["conv_1", 7, 6]
+
+
+def test_backfill_fills_gaps_in_populated_index():
+    """Test every run pages Chroma and inserts without overwriting existing turns."""
+    pg = MagicMock()
+    conn = MagicMock()
+    conn.executemany = AsyncMock()
+
+    class _Acquire:
+        async def __aenter__(self):
+            return conn
+
+        async def __aexit__(self, *exc):
+            return False
+
+    pg.acquire = MagicMock(return_value=_Acquire())
+    chroma = MagicMock()
+    chroma.get_or_create_collection.return_value.get.return_value = {
+        "ids": ["art_1", "art_2", "art_3"],
+        "metadatas": [
+            {"conversation_id": "conv_1", "turn_index": 0, "role": "user"},
+            {"conversation_id": "conv_1", "turn_index": "1"},
+            {"title": "not a turn"},
+        ],
+    }
+
+    assert asyncio.run(backfill_from_chroma(pg, chroma)) == 2
+
+    sql, rows = conn.executemany.await_args.args
+    assert "ON CONFLICT (conversation_id, turn_index) DO NOTHING" in sql
+    assert rows == [("conv_1", 0, "art_1", "user"), ("conv_1", 1, "art_2", None)]
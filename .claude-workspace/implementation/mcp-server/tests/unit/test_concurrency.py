@@ -0,0 +1,83 @@
+"""Unit tests for concurrency helpers."""
+
+import asyncio
+
+from utils.concurrency import gather_with_timeouts, RateLimiter
+
+
+async def _value(value, delay=0.0):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def _fail():
+    raise RuntimeError("boom")
+
+
+def test_gather_with_timeouts_all_succeed():
+    """Test results are returned by name."""
+    results, failed = asyncio.run(gather_with_timeouts(
+        {"a": _value(1), "b": _value(2)},
+        timeout=1.0,
+        defaults={}
+    ))
+
+    assert results == {"a": 1, "b": 2}
+    assert failed == []
+
+
+def test_gather_with_timeouts_partial_results():
+    """Test failures and timeouts fall back to defaults without failing the rest."""
+    results, failed = asyncio.run(gather_with_timeouts(
+        {"ok": _value("x"), "slow": _value("y", delay=1.0), "broken": _fail()},
+        timeout=0.05,
+        defaults={"slow": [], "broken": {}}
+    ))
+
+    assert results == {"ok": "x", "slow": [], "broken": {}}
+    assert sorted(failed) == ["broken", "slow"]
+
+
+def test_gather_with_timeouts_runs_concurrently():
+    """Test total latency is the slowest call, not the sum."""
+    loop_time = {}
+
+    async def run():
+        start = asyncio.get_running_loop().time()
+        await gather_with_timeouts(
+            {f"c{i}": _value(i, delay=0.1) for i in range(5)},
+            timeout=1.0,
+            defaults={}
+        )
+        loop_time["elapsed"] = asyncio.get_running_loop().time() - start
+
+    asyncio.run(run())
+
+    assert loop_time["elapsed"] < 0.3
+
+
+def test_rate_limiter_spaces_calls():
+    """Test calls beyond the budget wait for their slot."""
+    limiter = RateLimiter(requests_per_minute=1200)  # one call per 50ms
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+        return loop.time() - start
+
+    assert asyncio.run(run()) >= 0.14
+
+
+def test_rate_limiter_unlimited():
+    """Test a zero budget never waits."""
+    limiter = RateLimiter(requests_per_minute=0)
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(100):
+            await limiter.acquire()
+        return loop.time() - start
+
+    assert asyncio.run(run()) < 0.05
@@ -75,6 +75,30 @@ def test_load_config_defaults(monkeypatch):
     assert config.mcp_port == 3000
     assert config.log_level == "INFO"
     assert config.rrf_constant == 60
+    assert config.graph_cache_enabled is True
+    assert config.graph_cache_refresh_seconds == 30
+    assert config.lexical_index_enabled is False
+    assert config.worker_concurrency == 1
+    assert config.job_notify_enabled is True
+    assert config.worker_idle_poll_ms == 30000
+    assert config.extraction_chunk_concurrency == 4
+    assert config.openai_requests_per_minute == 0
+    assert config.extraction_cache_enabled is True
+    assert config.extraction_cache_max_idle_days == 90
+    assert config.local_canonicalization_enabled is True
+    assert config.merge_decision_cache_enabled is True
+    assert config.merge_decision_cache_ttl_days == 30
+    assert config.entity_name_index_enabled is True
+
+
+def test_load_config_graph_cache_disabled(monkeypatch):
+    """Test GRAPH_CACHE_ENABLED=false disables the graph cache."""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
+    monkeypatch.setenv("GRAPH_CACHE_ENABLED", "false")
+
+    config = load_config()
+
+    assert config.graph_cache_enabled is False
 
 
 # ============================================================================
@@ -147,3 +171,35 @@ def test_validate_config_case_insensitive_log_level(test_config):
     """Test validate_config handles lowercase log levels."""
     test_config.log_level = "info"
     validate_config(test_config)  # Should not raise (uppercase check)
+
+
+def test_validate_config_worker_concurrency(test_config):
+    """Test WORKER_CONCURRENCY must be at least 1."""
+    test_config.worker_concurrency = 0
+
+    with pytest.raises(ValueError, match="WORKER_CONCURRENCY"):
+        validate_config(test_config)
+
+
+def test_validate_config_extraction_chunk_concurrency(test_config):
+    """Test EXTRACTION_CHUNK_CONCURRENCY must be at least 1."""
+    test_config.extraction_chunk_concurrency = 0
+
+    with pytest.raises(ValueError, match="EXTRACTION_CHUNK_CONCURRENCY"):
+        validate_config(test_config)
+
+
+def test_validate_config_merge_decision_cache_ttl(test_config):
+    """Test MERGE_DECISION_CACHE_TTL_DAYS must be at least 1."""
+    test_config.merge_decision_cache_ttl_days = 0
+
+    with pytest.raises(ValueError, match="MERGE_DECISION_CACHE_TTL_DAYS"):
+        validate_config(test_config)
+
+
+def test_validate_config_extraction_cache_max_idle_days(test_config):
+    """Test EXTRACTION_CACHE_MAX_IDLE_DAYS must be at least 1."""
+    test_config.extraction_cache_max_idle_days = 0
+
+    with pytest.raises(ValueError, match="EXTRACTION_CACHE_MAX_IDLE_DAYS"):
+        validate_config(test_config)
@@ -0,0 +1,49 @@
+"""Unit tests for progressive (streamed) responses."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+from utils.progress import ProgressStream
+
+
+def test_progress_stream_sends_json_stages():
+    """Test each stage is sent as a numbered progress message."""
+    ctx = Mock()
+    ctx.report_progress = AsyncMock()
+    stream = ProgressStream(ctx, total_stages=2)
+
+    asyncio.run(stream.emit("primary", [{"id": "art_1"}]))
+    asyncio.run(stream.emit("related", []))
+
+    first = ctx.report_progress.await_args_list[0].kwargs
+    assert first["progress"] == 1
+    assert first["total"] == 2
+    message = json.loads(first["message"])
+    assert message["stage"] == "primary"
+    assert message["data"] == [{"id": "art_1"}]
+    assert ctx.report_progress.await_args_list[1].kwargs["progress"] == 2
+
+
+def test_progress_stream_records_first_result_without_ctx():
+    """Test timings are tracked even when nothing can be sent."""
+    stream = ProgressStream(None)
+
+    asyncio.run(stream.emit("primary", []))
+    asyncio.run(stream.emit("entities", []))
+    timings = stream.timings()
+
+    assert timings["first_result_ms"] == timings["stages_ms"]["primary"]
+    assert set(timings["stages_ms"]) == {"primary", "entities"}
+    assert timings["total_ms"] >= timings["first_result_ms"]
+
+
+def test_progress_stream_swallows_send_errors():
+    """Test a failed notification does not fail the tool call."""
+    ctx = Mock()
+    ctx.report_progress = AsyncMock(side_effect=RuntimeError("closed"))
+    stream = ProgressStream(ctx)
+
+    asyncio.run(stream.emit("primary", []))
+
+    assert stream.first_result_ms is not None
@@ -0,0 +1,70 @@
+"""Unit tests for snippet extraction and field projection."""
+
+from utils.snippets import extract_snippet, payload_bytes, project_metadata, shape_result
+
+
+LONG_TEXT = (
+    "The team met on Monday. Lunch options were discussed at length. "
+    "Alice decided the launch date is March 3. Bob will confirm vendor contracts. "
+    "Parking is available in lot B. The next meeting is on Friday."
+)
+
+
+def test_short_text_is_returned_whole():
+    """Test text within budget is not truncated."""
+    snippet = extract_snippet("Short note.", "note", max_tokens=50)
+
+    assert snippet == {"text": "Short note.", "start_char": 0, "end_char": 11, "truncated": False}
+
+
+def test_snippet_picks_best_matching_sentence():
+    """Test the window centres on the sentence matching the query."""
+    snippet = extract_snippet(LONG_TEXT, "when is the launch date?", max_tokens=16)
+
+    assert "launch date is March 3" in snippet["text"]
+    assert "Parking" not in snippet["text"]
+    assert snippet["truncated"] is True
+    assert LONG_TEXT[snippet["start_char"]:snippet["end_char"]].strip() == snippet["text"]
+
+
+def test_snippet_without_query_starts_at_top():
+    """Test no query gives the leading window."""
+    snippet = extract_snippet(LONG_TEXT, None, max_tokens=10)
+
+    assert snippet["start_char"] == 0
+    assert snippet["text"].startswith("The team met on Monday.")
+
+
+def test_snippet_truncates_long_sentence_within_budget():
+    """Test a single sentence longer than the budget is cut to size."""
+    text = "word " * 200 + "needle " + "word " * 200
+    snippet = extract_snippet(text, "needle", max_tokens=20)
+
+    assert len(snippet["text"]) <= 80
+    assert "needle" in snippet["text"]
+
+
+def test_project_metadata():
+    """Test metadata projection keeps only requested keys."""
+    metadata = {"title": "T", "context": "note", "content_hash": "abc"}
+
+    assert project_metadata(metadata, ["title", "missing"]) == {"title": "T"}
+    assert project_metadata(metadata, None) is metadata
+
+
+def test_shape_result_uses_chunk_offsets_and_shrinks_payload():
+    """Test chunk snippets report parent offsets and shrink the response."""
+    result = {
+        "id": "art_1::chunk::001::abcd1234",
+        "content": LONG_TEXT,
+        "metadata": {"start_char": 1000, "title": "Notes", "content_hash": "x" * 64},
+        "collection": "chunks",
+    }
+    before = payload_bytes(result)
+
+    shape_result(result, query="vendor contracts", snippet_tokens=16, fields=["title"])
+
+    assert "vendor contracts" in result["content"]
+    assert result["snippet"]["start_char"] >= 1000
+    assert result["metadata"] == {"title": "Notes"}
+    assert payload_bytes(result) < before
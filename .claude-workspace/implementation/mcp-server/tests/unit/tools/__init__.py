@@ -0,0 +1 @@
+"""Tool unit tests package."""
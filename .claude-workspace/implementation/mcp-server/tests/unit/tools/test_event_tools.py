@@ -0,0 +1,91 @@
+"""Unit tests for event search - V10 vector and full-text modes."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from tools.event_tools import event_search
+
+
+def _pg(rows=None, side_effect=None):
+    pg = MagicMock()
+    pg.fetch_all = AsyncMock(return_value=rows or [], side_effect=side_effect)
+    return pg
+
+
+def test_vector_mode_fuses_ann_and_fts_in_one_query():
+    """Test the embedding enables one RRF-fused statement over both branches."""
+    pg = _pg()
+
+    result = asyncio.run(event_search(
+        pg, query="launch risk", category="Decision", include_evidence=False,
+        query_embedding=[0.5, -0.25], rrf_constant=60, limit=5
+    ))
+
+    assert pg.fetch_all.await_count == 1
+    sql, *params = pg.fetch_all.call_args.args
+    assert "(e.embedding::halfvec(3072)) <=> $2::halfvec(3072)" in sql
+    assert "fts AS" in sql and "UNION ALL" in sql
+    assert params == ["Decision", "[0.5,-0.25]", 20, "launch risk", "launch OR risk", 60, 5]
+    assert result["search_mode"] == "hybrid"
+
+
+def test_vector_mode_raises_ef_search_to_candidate_count():
+    """Test the ANN branch never asks HNSW for more rows than ef_search allows."""
+    pg = _pg()
+
+    asyncio.run(event_search(pg, include_evidence=False, query_embedding=[1.0], limit=5))
+    assert pg.fetch_all.call_args.kwargs["settings"] == {"hnsw.ef_search": "40"}
+
+    asyncio.run(event_search(pg, include_evidence=False, query_embedding=[1.0], limit=100))
+    sql, *params = pg.fetch_all.call_args.args
+    assert params[1] == 200  # candidates
+    assert pg.fetch_all.call_args.kwargs["settings"] == {"hnsw.ef_search": "200"}
+
+
+def test_vector_mode_without_query_is_ann_only():
+    """Test an embedding without query text skips the full-text branch."""
+    pg = _pg()
+
+    result = asyncio.run(event_search(pg, include_evidence=False, query_embedding=[1.0]))
+
+    sql = pg.fetch_all.call_args.args[0]
+    assert "fts AS" not in sql
+    assert result["search_mode"] == "vector"
+
+
+def test_vector_mode_failure_falls_back_to_fts():
+    """Test a failed vector query (e.g. old pgvector) degrades to full-text."""
+    pg = _pg(side_effect=[Exception("type halfvec does not exist"), []])
+
+    result = asyncio.run(event_search(pg, query="launch risk", include_evidence=False, query_embedding=[1.0]))
+
+    assert pg.fetch_all.await_count == 2
+    assert "halfvec" not in pg.fetch_all.call_args.args[0]
+    assert result["search_mode"] == "fts"
+    assert result["events"] == []
+
+
+def test_fts_ranks_and_matches_above_or_matches_in_one_statement():
+    """Test full-text search is one ranked query over narrative_tsv, even on a miss."""
+    pg = _pg()
+
+    asyncio.run(event_search(pg, query="security audit API", include_evidence=False, limit=5))
+
+    assert pg.fetch_all.await_count == 1
+    sql, *params = pg.fetch_all.call_args.args
+    assert "e.narrative_tsv @@ q_any" in sql
+    assert "to_tsvector" not in sql
+    assert sql.index("ts_rank_cd(e.narrative_tsv, q_all)") < sql.index("ts_rank_cd(e.narrative_tsv, q_any)")
+    assert params == ["security audit API", "security OR audit OR API", 5]
+
+
+def test_filter_only_search_orders_by_time():
+    """Test searches without query text keep newest-first order."""
+    pg = _pg()
+
+    asyncio.run(event_search(pg, category="Decision", include_evidence=False))
+
+    sql, *params = pg.fetch_all.call_args.args
+    assert "ts_rank_cd" not in sql
+    assert "ORDER BY e.event_time DESC NULLS LAST" in sql
+    assert params == ["Decision", 20]
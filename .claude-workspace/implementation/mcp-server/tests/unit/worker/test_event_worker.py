@@ -0,0 +1,155 @@
+"""Unit tests for EventWorker job scheduling - V10."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from worker.event_worker import EventWorker
+
+
+def _worker(test_config, jobs, concurrency):
+    test_config.worker_concurrency = concurrency
+    test_config.poll_interval_ms = 10
+    test_config.job_notify_enabled = False
+    worker = EventWorker(test_config)
+    queue = list(jobs)
+
+    async def claim(worker_id, job_type, n):
+        if not queue:
+            worker.running = False
+            return []
+        claimed = queue[:n]
+        del queue[:n]
+        return claimed
+
+    worker.job_service = MagicMock()
+    worker.job_service.claim_jobs = AsyncMock(side_effect=claim)
+    return worker
+
+
+def _tracking_processor(worker, delay=0.05):
+    stats = {"active": 0, "peak": 0, "done": []}
+
+    async def process(job):
+        stats["active"] += 1
+        stats["peak"] = max(stats["peak"], stats["active"])
+        await asyncio.sleep(delay)
+        stats["active"] -= 1
+        stats["done"].append(job["job_id"])
+
+    worker._process_extract_events_job = process
+    return stats
+
+
+def test_run_jobs_keeps_n_jobs_in_flight(test_config):
+    """Test jobs run concurrently up to WORKER_CONCURRENCY and all finish."""
+    worker = _worker(test_config, [{"job_id": i} for i in range(8)], concurrency=4)
+    stats = _tracking_processor(worker)
+
+    async def run():
+        worker.running = True
+        start = asyncio.get_running_loop().time()
+        await worker.run_jobs()
+        return asyncio.get_running_loop().time() - start
+
+    elapsed = asyncio.run(run())
+
+    assert sorted(stats["done"]) == list(range(8))
+    assert stats["peak"] == 4
+    assert elapsed < 8 * 0.05
+    # The first claim fills all four slots in one statement
+    assert worker.job_service.claim_jobs.call_args_list[0].args[2] == 4
+
+
+def test_run_jobs_concurrency_one_is_sequential(test_config):
+    """Test the default of one job at a time."""
+    worker = _worker(test_config, [{"job_id": i} for i in range(3)], concurrency=1)
+    stats = _tracking_processor(worker, delay=0.01)
+
+    worker.running = True
+    asyncio.run(worker.run_jobs())
+
+    assert stats["done"] == [0, 1, 2]
+    assert stats["peak"] == 1
+
+
+def test_run_jobs_survives_failing_job(test_config):
+    """Test one failing job does not stop the loop or leak its slot."""
+    worker = _worker(test_config, [{"job_id": i} for i in range(3)], concurrency=1)
+    done = []
+
+    async def process(job):
+        if job["job_id"] == 0:
+            raise RuntimeError("boom")
+        done.append(job["job_id"])
+
+    worker._process_extract_events_job = process
+    worker.running = True
+    asyncio.run(worker.run_jobs())
+
+    assert done == [1, 2]
+
+
+def test_notification_wakes_idle_worker(test_config):
+    """Test a NOTIFY wakes the worker well before the idle poll interval."""
+    test_config.job_notify_enabled = True
+    test_config.worker_idle_poll_ms = 5000
+    worker = EventWorker(test_config)
+    queue = []
+    claims = []
+    processed = []
+
+    async def claim(worker_id, job_type, n):
+        claims.append(n)
+        claimed = queue[:n]
+        del queue[:n]
+        return claimed
+
+    async def process(job):
+        processed.append(job["job_id"])
+        worker.running = False
+
+    listener = MagicMock()
+    listener.is_closed.return_value = False
+    listener.close = AsyncMock()
+    callbacks = []
+
+    async def listen(callback):
+        callbacks.append(callback)
+        return listener
+
+    worker.job_service = MagicMock()
+    worker.job_service.claim_jobs = AsyncMock(side_effect=claim)
+    worker.job_service.listen_for_jobs = AsyncMock(side_effect=listen)
+    worker._process_extract_events_job = process
+
+    async def enqueue_later():
+        await asyncio.sleep(0.05)
+        queue.append({"job_id": "job-1"})
+        callbacks[0]("extract_events")
+
+    async def run():
+        worker.running = True
+        start = asyncio.get_running_loop().time()
+        await asyncio.gather(worker.run_jobs(), enqueue_later())
+        return asyncio.get_running_loop().time() - start
+
+    elapsed = asyncio.run(run())
+
+    assert processed == ["job-1"]
+    assert len(claims) == 2
+    assert elapsed < 1.0
+    listener.close.assert_awaited_once()
+
+
+def test_listen_failure_falls_back_to_polling(test_config):
+    """Test workers keep polling at POLL_INTERVAL_MS when LISTEN is unavailable."""
+    worker = _worker(test_config, [{"job_id": 0}], concurrency=1)
+    worker.job_notify_enabled = True
+    worker.job_service.listen_for_jobs = AsyncMock(side_effect=OSError("no listen"))
+    stats = _tracking_processor(worker, delay=0)
+
+    worker.running = True
+    asyncio.run(worker.run_jobs())
+
+    assert stats["done"] == [0]
+    assert worker._listen_conn is None